@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare per-call argument binding with the precompiled `ArgumentBinder`.
+
+Before a tool function runs, MCPServer pre-parses JSON-in-a-string arguments,
+validates them against the tool's argument model and turns the model back into
+keyword arguments. The per-call version rebuilt its field lookups on every call,
+tried `json.loads` on every string aimed at a non-`str` field and walked every
+field again to build the keyword arguments. `ArgumentBinder` works all of that
+out once per tool. Both are timed for functions with 1, 10 and 50 parameters.
+
+Usage:
+    uv run python scripts/benchmarks/argument_binding.py
+    uv run python scripts/benchmarks/argument_binding.py --number 20000
+"""
+
+import argparse
+import inspect
+import json
+import timeit
+from typing import Any
+
+from mcp.server.mcpserver.utilities.func_metadata import ArgumentBinder, FuncMetadata, func_metadata
+
+# Parameter types cycled through, with a typical argument for each
+PARAMETERS: list[tuple[Any, Any]] = [
+    (str, "some text"),
+    (int, 42),
+    (list[str], ["a", "b", "c"]),
+    (float | None, "1.5"),
+    (dict[str, int], {"x": 1}),
+]
+
+
+def make_function(params: int) -> tuple[Any, dict[str, Any]]:
+    """A function taking `params` keyword arguments, and arguments to call it with."""
+
+    def fn(**kwargs: Any) -> int:
+        return len(kwargs)
+
+    fn.__signature__ = inspect.Signature(  # pyright: ignore[reportFunctionMemberAccess]
+        [
+            inspect.Parameter(f"p{i}", inspect.Parameter.KEYWORD_ONLY, annotation=PARAMETERS[i % len(PARAMETERS)][0])
+            for i in range(params)
+        ]
+    )
+    return fn, {f"p{i}": PARAMETERS[i % len(PARAMETERS)][1] for i in range(params)}
+
+
+def per_call_bind(meta: FuncMetadata, data: dict[str, Any]) -> dict[str, Any]:
+    """Argument binding as it was done before `ArgumentBinder`."""
+    new_data = data.copy()
+    key_to_field_info = {}
+    for field_name, field_info in meta.arg_model.model_fields.items():
+        key_to_field_info[field_name] = field_info
+        if field_info.alias:
+            key_to_field_info[field_info.alias] = field_info
+    for data_key, data_value in data.items():
+        field_info = key_to_field_info[data_key]
+        if isinstance(data_value, str) and field_info.annotation is not str:
+            try:
+                pre_parsed = json.loads(data_value)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(pre_parsed, str | int | float):
+                continue
+            new_data[data_key] = pre_parsed
+    return meta.arg_model.model_validate(new_data).model_dump_one_level()
+
+
+def time_per_call(func: Any, number: int) -> float:
+    """Return the best-of-5 time for one call, in microseconds."""
+    return min(timeit.Timer(func).repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=5000, help="calls per timing run")
+    args = parser.parse_args()
+
+    print(f"{'parameters':<12}{'per call (us)':>15}{'binder (us)':>15}{'speedup':>10}")
+    for params in (1, 10, 50):
+        fn, arguments = make_function(params)
+        meta = func_metadata(fn)
+        binder = ArgumentBinder(meta.arg_model)
+        assert per_call_bind(meta, arguments) == binder.bind(arguments)
+
+        before = time_per_call(lambda: per_call_bind(meta, arguments), args.number)
+        after = time_per_call(lambda: binder.bind(arguments), args.number)
+        print(f"{params:<12}{before:>15.2f}{after:>15.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
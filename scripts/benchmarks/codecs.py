@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Compare wire codecs on realistic MCP traffic.
+
+Each codec encodes and decodes the same set of messages: a handshake, a
+`tools/list` response with many tools, small and multi-MB `tools/call` results,
+and a burst of progress notifications. The default `JSONCodec` is compared with
+a codec built on the standard library `json` module and, when it is installed,
+one built on `orjson`.
+
+Usage:
+    uv run python scripts/benchmarks/codecs.py
+    uv run python scripts/benchmarks/codecs.py --number 50
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+from mcp import types
+from mcp.shared.codec import Codec, JSONCodec
+
+
+class StdlibJSONCodec(Codec):
+    def encode(self, message: types.JSONRPCMessage) -> bytes:
+        data = message.model_dump(by_alias=True, mode="json", exclude_none=True)
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes | str) -> types.JSONRPCMessage:
+        return types.jsonrpc_message_adapter.validate_python(json.loads(data), by_name=False)
+
+
+def orjson_codec() -> Codec | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    class OrjsonCodec(Codec):
+        def encode(self, message: types.JSONRPCMessage) -> bytes:
+            return orjson.dumps(message.model_dump(by_alias=True, mode="json", exclude_none=True))
+
+        def decode(self, data: bytes | str) -> types.JSONRPCMessage:
+            return types.jsonrpc_message_adapter.validate_python(orjson.loads(data), by_name=False)
+
+    return OrjsonCodec()
+
+
+def response(request_id: int, result: types.Result) -> types.JSONRPCResponse:
+    return types.JSONRPCResponse(
+        jsonrpc="2.0", id=request_id, result=result.model_dump(by_alias=True, mode="json", exclude_none=True)
+    )
+
+
+def traffic() -> dict[str, list[types.JSONRPCMessage]]:
+    initialize = types.JSONRPCRequest(
+        jsonrpc="2.0",
+        id=0,
+        method="initialize",
+        params={
+            "protocolVersion": types.LATEST_PROTOCOL_VERSION,
+            "capabilities": {"roots": {"listChanged": True}, "sampling": {}},
+            "clientInfo": {"name": "bench", "version": "1.0.0"},
+        },
+    )
+    tools = [
+        types.Tool(
+            name=f"tool_{i}",
+            description="Look up records matching a query. " * 4,
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"},
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+                    "filters": {"type": "object", "additionalProperties": {"type": "string"}},
+                },
+                "required": ["query"],
+            },
+        )
+        for i in range(200)
+    ]
+    rows: list[dict[str, Any]] = [
+        {"id": i, "name": f"row {i}", "score": i * 0.5, "tags": ["a", "b", "c"], "active": i % 2 == 0}
+        for i in range(20_000)
+    ]
+    return {
+        "initialize": [initialize],
+        "tools/list (200 tools)": [response(1, types.ListToolsResult(tools=tools))],
+        "tools/call (small)": [
+            types.JSONRPCRequest(
+                jsonrpc="2.0", id=2, method="tools/call", params={"name": "tool_1", "arguments": {"query": "mcp"}}
+            ),
+            response(2, types.CallToolResult(content=[types.TextContent(type="text", text="42 results")])),
+        ],
+        "tools/call (multi-MB structured)": [
+            response(3, types.CallToolResult(content=[], structured_content={"rows": rows})),
+        ],
+        "progress x100": [
+            types.JSONRPCNotification(
+                jsonrpc="2.0",
+                method="notifications/progress",
+                params={"progressToken": 3, "progress": float(i), "total": 100.0},
+            )
+            for i in range(100)
+        ],
+    }
+
+
+def time_ms(fn: Any, number: int) -> float:
+    return min(timeit.repeat(fn, repeat=5, number=number)) / number * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20, help="iterations per timing run")
+    args = parser.parse_args()
+
+    codecs: dict[str, Codec] = {"pydantic (default)": JSONCodec(), "stdlib json": StdlibJSONCodec()}
+    if (orjson := orjson_codec()) is not None:
+        codecs["orjson"] = orjson
+
+    for scenario, messages in traffic().items():
+        wire = [JSONCodec().encode(message) for message in messages]
+        size_kb = sum(len(data) for data in wire) / 1024
+        print(f"\n{scenario} ({size_kb:,.1f} KiB)")
+        print(f"{'codec':<22}{'encode (ms)':>14}{'decode (ms)':>14}")
+        for name, codec in codecs.items():
+            encode = time_ms(lambda codec=codec: [codec.encode(message) for message in messages], args.number)
+            decode = time_ms(lambda codec=codec: [codec.decode(data) for data in wire], args.number)
+            print(f"{name:<22}{encode:>14.3f}{decode:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
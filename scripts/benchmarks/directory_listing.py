@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Time reads of a recursive `DirectoryResource` against listing the tree on every read.
+
+A `DirectoryResource` used to `rglob` the whole tree on every read, stat each entry to
+keep only files, and encode the listing with `indent=2`. It now lists the tree once
+into an index; later reads stat each directory and list again only those that
+changed, and pages filtered by a pattern are served from the index.
+
+Usage:
+    uv run python scripts/benchmarks/directory_listing.py
+    uv run python scripts/benchmarks/directory_listing.py --directories 5000 --files-per-directory 100
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.mcpserver.resources import DirectoryResource
+
+
+async def read_by_globbing(path: Path) -> str:
+    """Reading the listing as `DirectoryResource` did before it kept an index."""
+
+    def list_files() -> list[Path]:
+        return list(path.rglob("*"))
+
+    files = await anyio.to_thread.run_sync(list_files)
+    return json.dumps({"files": [str(f.relative_to(path)) for f in files if f.is_file()]}, indent=2)
+
+
+async def timed(read: Callable[[], Awaitable[str]]) -> float:
+    start = time.perf_counter()
+    await read()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--directories", type=int, default=1000, help="directories in the tree")
+    parser.add_argument("--files-per-directory", type=int, default=50, help="files in each directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        for d in range(args.directories):
+            subdirectory = root / f"d{d // 100}" / f"d{d}"
+            subdirectory.mkdir(parents=True)
+            for f in range(args.files_per_directory):
+                (subdirectory / f"f{f}.{'py' if f % 10 == 0 else 'txt'}").touch()
+        resource = DirectoryResource(uri="dir://tree", path=root, recursive=True)
+
+        print(f"{args.directories * args.files_per_directory} files in {args.directories} directories")
+        print(f"{'read':<32}{'time (s)':>10}")
+        rows = [
+            ("glob every read", lambda: read_by_globbing(root)),
+            ("indexed, first read", resource.read),
+            ("indexed, unchanged", resource.read),
+        ]
+        for name, read in rows:
+            print(f"{name:<32}{await timed(read):>10.3f}")
+
+        (root / "d0" / "d0" / "new.py").touch()
+        print(f"{'indexed, one file added':<32}{await timed(resource.read):>10.3f}")
+        page = await timed(lambda: resource.read_page(limit=100, pattern="*.py"))
+        print(f"{'indexed, page of 100 *.py':<32}{page:>10.3f}")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
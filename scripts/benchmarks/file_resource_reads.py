@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare peak memory of serving a binary `FileResource` read whole with serving it mapped.
+
+A binary file used to be read whole with `Path.read_bytes`, then base64-encoded into
+a bytes object and decoded into the blob string: three copies of the data alive at
+once. A resource with `use_mmap=True` hands the server a view of the mapped file,
+which `_base64_encode` encodes chunk by chunk into one buffer. Python allocations
+are traced with `tracemalloc`; the mapped file's pages belong to the page cache, so
+they do not count, just as they would not count against a worker's heap.
+
+Usage:
+    uv run python scripts/benchmarks/file_resource_reads.py
+    uv run python scripts/benchmarks/file_resource_reads.py --size-mb 200
+"""
+
+import argparse
+import base64
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.lowlevel.server import _base64_encode  # pyright: ignore[reportPrivateUsage]
+from mcp.server.mcpserver.resources import FileResource
+
+
+async def read_whole(path: Path) -> str:
+    """Reading and encoding as the server did before mapped reads."""
+    data = await anyio.to_thread.run_sync(path.read_bytes)
+    return base64.b64encode(data).decode()
+
+
+async def read_mapped(path: Path) -> str:
+    content = await FileResource(uri=path.as_uri(), path=path, is_binary=True, use_mmap=True).read()
+    assert not isinstance(content, str)
+    return _base64_encode(content)
+
+
+async def measure(read: Callable[[Path], Awaitable[str]], path: Path) -> tuple[float, float]:
+    """Return the peak traced memory in MB and the time taken in seconds."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    blob = await read(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del blob
+    return peak / 1e6, elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=64, help="size of the file served")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "artifact.bin"
+        with path.open("wb") as f:
+            for _ in range(args.size_mb):
+                f.write(bytes(range(256)) * 4096)
+
+        assert await read_whole(path) == await read_mapped(path)
+        print(f"{'read':<8}{'peak (MB)':>12}{'time (s)':>10}")
+        for name, read in (("whole", read_whole), ("mapped", read_mapped)):
+            peak, elapsed = await measure(read, path)
+            print(f"{name:<8}{peak:>12.1f}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
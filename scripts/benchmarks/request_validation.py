@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Measure per-message validation cost of the request and notification adapters.
+
+Every request and notification type is validated through two adapters: a plain
+union adapter (how `mcp.types` validated messages before the unions were tagged)
+and the `method`-discriminated adapter that `mcp.types` exposes today.
+
+Usage:
+    uv run python scripts/benchmarks/request_validation.py
+    uv run python scripts/benchmarks/request_validation.py --number 20000
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from mcp import types
+
+
+def client_requests() -> list[types.ClientRequest]:
+    return [
+        types.PingRequest(),
+        types.InitializeRequest(
+            params=types.InitializeRequestParams(
+                protocol_version=types.LATEST_PROTOCOL_VERSION,
+                capabilities=types.ClientCapabilities(roots=types.RootsCapability(list_changed=True)),
+                client_info=types.Implementation(name="bench", version="1.0.0"),
+            )
+        ),
+        types.CompleteRequest(
+            params=types.CompleteRequestParams(
+                ref=types.PromptReference(name="greeting"),
+                argument=types.CompletionArgument(name="name", value="Al"),
+            )
+        ),
+        types.SetLevelRequest(params=types.SetLevelRequestParams(level="info")),
+        types.GetPromptRequest(params=types.GetPromptRequestParams(name="greeting", arguments={"name": "Alice"})),
+        types.ListPromptsRequest(),
+        types.ListResourcesRequest(params=types.PaginatedRequestParams(cursor="abc")),
+        types.ListResourceTemplatesRequest(),
+        types.ReadResourceRequest(params=types.ReadResourceRequestParams(uri="file:///tmp/data.txt")),
+        types.SubscribeRequest(params=types.SubscribeRequestParams(uri="file:///tmp/data.txt")),
+        types.UnsubscribeRequest(params=types.UnsubscribeRequestParams(uri="file:///tmp/data.txt")),
+        types.CallToolRequest(
+            params=types.CallToolRequestParams(name="search", arguments={"query": "mcp", "limit": 10, "tags": ["a"]})
+        ),
+        types.ListToolsRequest(),
+        types.GetTaskRequest(params=types.GetTaskRequestParams(task_id="task-1")),
+        types.GetTaskPayloadRequest(params=types.GetTaskPayloadRequestParams(task_id="task-1")),
+        types.ListTasksRequest(),
+        types.CancelTaskRequest(params=types.CancelTaskRequestParams(task_id="task-1")),
+    ]
+
+
+def server_requests() -> list[types.ServerRequest]:
+    return [
+        types.PingRequest(),
+        types.CreateMessageRequest(
+            params=types.CreateMessageRequestParams(
+                messages=[types.SamplingMessage(role="user", content=types.TextContent(type="text", text="Hello"))],
+                max_tokens=100,
+            )
+        ),
+        types.ListRootsRequest(),
+        types.ElicitRequest(
+            params=types.ElicitRequestFormParams(
+                message="Your name?",
+                requested_schema={"type": "object", "properties": {"name": {"type": "string"}}},
+            )
+        ),
+        types.GetTaskRequest(params=types.GetTaskRequestParams(task_id="task-1")),
+        types.GetTaskPayloadRequest(params=types.GetTaskPayloadRequestParams(task_id="task-1")),
+        types.ListTasksRequest(),
+        types.CancelTaskRequest(params=types.CancelTaskRequestParams(task_id="task-1")),
+    ]
+
+
+def client_notifications() -> list[types.ClientNotification]:
+    return [
+        types.CancelledNotification(params=types.CancelledNotificationParams(request_id=1)),
+        types.ProgressNotification(params=types.ProgressNotificationParams(progress_token=1, progress=0.5)),
+        types.InitializedNotification(),
+        types.RootsListChangedNotification(),
+    ]
+
+
+def server_notifications() -> list[types.ServerNotification]:
+    return [
+        types.CancelledNotification(params=types.CancelledNotificationParams(request_id=1)),
+        types.ProgressNotification(params=types.ProgressNotificationParams(progress_token=1, progress=0.5)),
+        types.LoggingMessageNotification(params=types.LoggingMessageNotificationParams(level="info", data="hi")),
+        types.ResourceUpdatedNotification(params=types.ResourceUpdatedNotificationParams(uri="file:///tmp/x")),
+        types.ResourceListChangedNotification(),
+        types.ToolListChangedNotification(),
+        types.PromptListChangedNotification(),
+    ]
+
+
+def time_per_message(adapter: TypeAdapter[Any], payload: dict[str, Any], number: int) -> float:
+    """Return the best-of-5 validation time for one message, in microseconds."""
+    timer = timeit.Timer(lambda: adapter.validate_python(payload, by_name=False))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def run_group(title: str, messages: list[Any], union: Any, tagged: TypeAdapter[Any], number: int) -> None:
+    plain: TypeAdapter[Any] = TypeAdapter(union)
+    print(f"\n{title}")
+    print(f"{'method':<40}{'plain (us)':>12}{'tagged (us)':>13}{'speedup':>10}")
+    for message in messages:
+        payload = message.model_dump(by_alias=True, mode="json", exclude_none=True)
+        before = time_per_message(plain, payload, number)
+        after = time_per_message(tagged, payload, number)
+        print(f"{payload['method']:<40}{before:>12.2f}{after:>13.2f}{before / after:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=5000, help="validations per timing run")
+    args = parser.parse_args()
+
+    run_group("ClientRequest", client_requests(), types.ClientRequest, types.client_request_adapter, args.number)
+    run_group("ServerRequest", server_requests(), types.ServerRequest, types.server_request_adapter, args.number)
+    run_group(
+        "ClientNotification",
+        client_notifications(),
+        types.ClientNotification,
+        types.client_notification_adapter,
+        args.number,
+    )
+    run_group(
+        "ServerNotification",
+        server_notifications(),
+        types.ServerNotification,
+        types.server_notification_adapter,
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare a linear scan over resource templates with `UriTemplateRouter`.
+
+`ResourceManager.get_resource` used to try every template in turn, and each
+template rebuilt its regex from `uri_template` and matched it on every call.
+Beyond the few hundred patterns `re` caches, that meant compiling a regex per
+template per lookup. The router splits each template at `/` once and walks a trie
+of segments instead. Both are timed with 10, 1000 and 10000 templates that share
+a scheme, for a URI matching the last template added and for a URI matching none.
+
+Usage:
+    uv run python scripts/benchmarks/resource_template_routing.py
+    uv run python scripts/benchmarks/resource_template_routing.py --number 50
+"""
+
+import argparse
+import re
+import timeit
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import unquote
+
+from mcp.server.mcpserver.resources.uri_template import UriTemplate, UriTemplateRouter
+
+
+def per_call_match(uri_template: str, uri: str) -> dict[str, Any] | None:
+    """Template matching as `ResourceTemplate.matches` did it before the router."""
+    pattern = uri_template.replace("{", "(?P<").replace("}", ">[^/]+)")
+    match = re.match(f"^{pattern}$", uri)
+    if match:
+        return {key: unquote(value) for key, value in match.groupdict().items()}
+    return None
+
+
+def linear_scan(templates: list[str], uri: str) -> dict[str, Any] | None:
+    for template in templates:
+        if (params := per_call_match(template, uri)) is not None:
+            return params
+    return None
+
+
+def make_templates(count: int) -> list[str]:
+    """Templates of a few shapes, all under one scheme, as a large server might expose."""
+    shapes = ["api://tenants/{tenant}/collection{i}/{item}", "api://collection{i}/{item}/versions/{version}"]
+    return [shapes[i % len(shapes)].replace("{i}", str(i)) for i in range(count)]
+
+
+def time_per_call(func: Callable[[], Any], number: int) -> float:
+    """Return the best-of-5 time for one call, in microseconds."""
+    return min(timeit.Timer(func).repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=5, help="lookups per timing run")
+    args = parser.parse_args()
+
+    print(f"{'templates':<11}{'lookup':<8}{'linear (us)':>14}{'router (us)':>14}{'speedup':>10}")
+    for count in (10, 1000, 10000):
+        templates = make_templates(count)
+        router: UriTemplateRouter[str] = UriTemplateRouter()
+        for template in templates:
+            router.add(UriTemplate(template), template)
+
+        last = templates[-1].replace("{tenant}", "acme").replace("{item}", "42").replace("{version}", "3")
+        for lookup, uri in (("hit", last), ("miss", "api://unknown/42")):
+            routed = router.match(uri)
+            assert (routed[1] if routed else None) == linear_scan(templates, uri)
+
+            before = time_per_call(lambda: linear_scan(templates, uri), args.number)
+            after = time_per_call(lambda: router.match(uri), args.number)
+            print(f"{count:<11}{lookup:<8}{before:>14.1f}{after:>14.1f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
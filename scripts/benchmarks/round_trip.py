@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Measure request/response round-trip overhead over the in-memory transport.
+
+A client connected to a low-level server with `Client(server)` sends `ping` and
+`tools/call` requests, first one at a time and then with many in flight at
+once. Both ends run in the same process, so the numbers are dominated by the
+session machinery (request bookkeeping, serialization, validation, and response
+routing) rather than by any I/O.
+
+Usage:
+    uv run python scripts/benchmarks/round_trip.py
+    uv run python scripts/benchmarks/round_trip.py --requests 20000 --concurrency 200
+"""
+
+import argparse
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+from mcp import Client, types
+from mcp.server.lowlevel import Server
+
+
+def echo_server() -> Server:
+    server = Server("bench")
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [types.Tool(name="echo", input_schema={"type": "object"})]
+
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text=str(arguments.get("text", "")))]
+
+    return server
+
+
+async def measure(send: Callable[[], Awaitable[object]], requests: int, concurrency: int) -> float:
+    """Send `requests` requests with up to `concurrency` in flight; return microseconds per request."""
+    per_worker, remainder = divmod(requests, concurrency)
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            await send()
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for i in range(concurrency):
+            tg.start_soon(worker, per_worker + (i < remainder))
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def run(requests: int, concurrency: int) -> None:
+    async with Client(echo_server()) as client:
+        call = types.CallToolRequest(params=types.CallToolRequestParams(name="echo", arguments={"text": "hello"}))
+
+        async def ping() -> object:
+            return await client.session.send_request(types.PingRequest(), types.EmptyResult)
+
+        async def call_tool() -> object:
+            return await client.session.send_request(call, types.CallToolResult)
+
+        # Warm up adapters and caches before timing anything.
+        await measure(ping, 200, 1)
+        await measure(call_tool, 200, 1)
+
+        print(f"{'request':<12}{'in flight':>10}{'us/request':>13}{'requests/s':>13}")
+        for name, send in (("ping", ping), ("tools/call", call_tool)):
+            for in_flight in (1, concurrency):
+                elapsed = await measure(send, requests, in_flight)
+                print(f"{name:<12}{in_flight:>10}{elapsed:>13.1f}{1e6 / elapsed:>13.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per measurement")
+    parser.add_argument("--concurrency", type=int, default=100, help="requests in flight for the concurrent runs")
+    args = parser.parse_args()
+
+    anyio.run(run, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
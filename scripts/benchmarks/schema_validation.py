@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare `jsonschema.validate` with a validator compiled once per schema.
+
+The low-level server validates every `tools/call` against the tool's input and
+output schemas. `jsonschema.validate` checks the schema and builds a validator
+on each call; `mcp.shared.schema_validation` does that once per tool definition.
+Both are timed on a small flat schema and on deeply nested ones.
+
+Usage:
+    uv run python scripts/benchmarks/schema_validation.py
+    uv run python scripts/benchmarks/schema_validation.py --number 5000 --depth 12
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+import jsonschema
+
+from mcp.shared.schema_validation import compile_schema, validate
+
+
+def small_case() -> tuple[dict[str, Any], dict[str, Any]]:
+    schema = {
+        "type": "object",
+        "properties": {"a": {"type": "number"}, "b": {"type": "number"}},
+        "required": ["a", "b"],
+        "additionalProperties": False,
+    }
+    return schema, {"a": 1, "b": 2}
+
+
+def nested_case(depth: int, width: int) -> tuple[dict[str, Any], dict[str, Any]]:
+    """An object nested `depth` levels deep, with `width` typed fields and a `$defs` reference per level."""
+    schema: dict[str, Any] = {"type": "object", "properties": {"leaf": {"$ref": "#/$defs/leaf"}}}
+    instance: dict[str, Any] = {"leaf": {"id": 1, "tags": ["x"]}}
+    for level in range(depth):
+        properties: dict[str, Any] = {f"field_{i}": {"type": "string", "maxLength": 64} for i in range(width)}
+        properties["child"] = schema
+        schema = {"type": "object", "properties": properties, "required": ["child"]}
+        instance = {**{f"field_{i}": f"value {level}" for i in range(width)}, "child": instance}
+    schema["$defs"] = {
+        "leaf": {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "tags": {"type": "array", "items": {"type": "string"}}},
+            "required": ["id"],
+        }
+    }
+    return schema, instance
+
+
+def time_per_call(func: Any, number: int) -> float:
+    """Return the best-of-5 time for one call, in microseconds."""
+    return min(timeit.Timer(func).repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=1000, help="validations per timing run")
+    parser.add_argument("--depth", type=int, default=8, help="nesting depth of the deepest schema")
+    args = parser.parse_args()
+
+    cases = {"small": small_case()}
+    for depth in sorted({2, args.depth // 2, args.depth}):
+        cases[f"nested depth={depth}"] = nested_case(depth, width=8)
+
+    print(f"{'schema':<22}{'validate (us)':>15}{'compiled (us)':>15}{'speedup':>10}")
+    for name, (schema, instance) in cases.items():
+        validator = compile_schema(schema)
+        before = time_per_call(lambda: jsonschema.validate(instance, schema), args.number)
+        after = time_per_call(lambda: validate(validator, instance), args.number)
+        print(f"{name:<22}{before:>15.1f}{after:>15.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,150 @@
-from .client.client import Client
-from .client.session import ClientSession
-from .client.session_group import ClientSessionGroup
-from .client.stdio import StdioServerParameters, stdio_client
-from .server.session import ServerSession
-from .server.stdio import stdio_server
-from .shared.exceptions import MCPError, UrlElicitationRequiredError
-from .types import (
-    CallToolRequest,
-    ClientCapabilities,
-    ClientNotification,
-    ClientRequest,
-    ClientResult,
-    CompleteRequest,
-    CreateMessageRequest,
-    CreateMessageResult,
-    CreateMessageResultWithTools,
-    ErrorData,
-    GetPromptRequest,
-    GetPromptResult,
-    Implementation,
-    IncludeContext,
-    InitializedNotification,
-    InitializeRequest,
-    InitializeResult,
-    JSONRPCError,
-    JSONRPCRequest,
-    JSONRPCResponse,
-    ListPromptsRequest,
-    ListPromptsResult,
-    ListResourcesRequest,
-    ListResourcesResult,
-    ListToolsResult,
-    LoggingLevel,
-    LoggingMessageNotification,
-    Notification,
-    PingRequest,
-    ProgressNotification,
-    PromptsCapability,
-    ReadResourceRequest,
-    ReadResourceResult,
-    Resource,
-    ResourcesCapability,
-    ResourceUpdatedNotification,
-    RootsCapability,
-    SamplingCapability,
-    SamplingContent,
-    SamplingContextCapability,
-    SamplingMessage,
-    SamplingMessageContentBlock,
-    SamplingToolsCapability,
-    ServerCapabilities,
-    ServerNotification,
-    ServerRequest,
-    ServerResult,
-    SetLevelRequest,
-    StopReason,
-    SubscribeRequest,
-    Tool,
-    ToolChoice,
-    ToolResultContent,
-    ToolsCapability,
-    ToolUseContent,
-    UnsubscribeRequest,
-)
-from .types import Role as SamplingRole
+"""Model Context Protocol SDK.
+
+Exports are resolved lazily on first access, so `import mcp` (and importing any
+submodule, which imports this package first) stays cheap for processes that only
+need part of the SDK, such as stdio servers spawned by a host.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client.client import Client
+    from .client.session import ClientSession
+    from .client.session_group import ClientSessionGroup
+    from .client.stdio import StdioServerParameters, stdio_client
+    from .server.session import ServerSession
+    from .server.stdio import stdio_server
+    from .shared.exceptions import MCPError, UrlElicitationRequiredError
+    from .types import (
+        CallToolRequest,
+        ClientCapabilities,
+        ClientNotification,
+        ClientRequest,
+        ClientResult,
+        CompleteRequest,
+        CreateMessageRequest,
+        CreateMessageResult,
+        CreateMessageResultWithTools,
+        ErrorData,
+        GetPromptRequest,
+        GetPromptResult,
+        Implementation,
+        IncludeContext,
+        InitializedNotification,
+        InitializeRequest,
+        InitializeResult,
+        JSONRPCError,
+        JSONRPCRequest,
+        JSONRPCResponse,
+        ListPromptsRequest,
+        ListPromptsResult,
+        ListResourcesRequest,
+        ListResourcesResult,
+        ListToolsResult,
+        LoggingLevel,
+        LoggingMessageNotification,
+        Notification,
+        PingRequest,
+        ProgressNotification,
+        PromptsCapability,
+        ReadResourceRequest,
+        ReadResourceResult,
+        Resource,
+        ResourcesCapability,
+        ResourceUpdatedNotification,
+        RootsCapability,
+        SamplingCapability,
+        SamplingContent,
+        SamplingContextCapability,
+        SamplingMessage,
+        SamplingMessageContentBlock,
+        SamplingToolsCapability,
+        ServerCapabilities,
+        ServerNotification,
+        ServerRequest,
+        ServerResult,
+        SetLevelRequest,
+        StopReason,
+        SubscribeRequest,
+        Tool,
+        ToolChoice,
+        ToolResultContent,
+        ToolsCapability,
+        ToolUseContent,
+        UnsubscribeRequest,
+    )
+    from .types import Role as SamplingRole
+
+# Maps each export to the module that defines it and its name there
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "Client": ("mcp.client.client", "Client"),
+    "ClientSession": ("mcp.client.session", "ClientSession"),
+    "ClientSessionGroup": ("mcp.client.session_group", "ClientSessionGroup"),
+    "StdioServerParameters": ("mcp.client.stdio", "StdioServerParameters"),
+    "stdio_client": ("mcp.client.stdio", "stdio_client"),
+    "ServerSession": ("mcp.server.session", "ServerSession"),
+    "stdio_server": ("mcp.server.stdio", "stdio_server"),
+    "MCPError": ("mcp.shared.exceptions", "MCPError"),
+    "UrlElicitationRequiredError": ("mcp.shared.exceptions", "UrlElicitationRequiredError"),
+    "SamplingRole": ("mcp.types", "Role"),
+    "CallToolRequest": ("mcp.types", "CallToolRequest"),
+    "ClientCapabilities": ("mcp.types", "ClientCapabilities"),
+    "ClientNotification": ("mcp.types", "ClientNotification"),
+    "ClientRequest": ("mcp.types", "ClientRequest"),
+    "ClientResult": ("mcp.types", "ClientResult"),
+    "CompleteRequest": ("mcp.types", "CompleteRequest"),
+    "CreateMessageRequest": ("mcp.types", "CreateMessageRequest"),
+    "CreateMessageResult": ("mcp.types", "CreateMessageResult"),
+    "CreateMessageResultWithTools": ("mcp.types", "CreateMessageResultWithTools"),
+    "ErrorData": ("mcp.types", "ErrorData"),
+    "GetPromptRequest": ("mcp.types", "GetPromptRequest"),
+    "GetPromptResult": ("mcp.types", "GetPromptResult"),
+    "Implementation": ("mcp.types", "Implementation"),
+    "IncludeContext": ("mcp.types", "IncludeContext"),
+    "InitializedNotification": ("mcp.types", "InitializedNotification"),
+    "InitializeRequest": ("mcp.types", "InitializeRequest"),
+    "InitializeResult": ("mcp.types", "InitializeResult"),
+    "JSONRPCError": ("mcp.types", "JSONRPCError"),
+    "JSONRPCRequest": ("mcp.types", "JSONRPCRequest"),
+    "JSONRPCResponse": ("mcp.types", "JSONRPCResponse"),
+    "ListPromptsRequest": ("mcp.types", "ListPromptsRequest"),
+    "ListPromptsResult": ("mcp.types", "ListPromptsResult"),
+    "ListResourcesRequest": ("mcp.types", "ListResourcesRequest"),
+    "ListResourcesResult": ("mcp.types", "ListResourcesResult"),
+    "ListToolsResult": ("mcp.types", "ListToolsResult"),
+    "LoggingLevel": ("mcp.types", "LoggingLevel"),
+    "LoggingMessageNotification": ("mcp.types", "LoggingMessageNotification"),
+    "Notification": ("mcp.types", "Notification"),
+    "PingRequest": ("mcp.types", "PingRequest"),
+    "ProgressNotification": ("mcp.types", "ProgressNotification"),
+    "PromptsCapability": ("mcp.types", "PromptsCapability"),
+    "ReadResourceRequest": ("mcp.types", "ReadResourceRequest"),
+    "ReadResourceResult": ("mcp.types", "ReadResourceResult"),
+    "Resource": ("mcp.types", "Resource"),
+    "ResourcesCapability": ("mcp.types", "ResourcesCapability"),
+    "ResourceUpdatedNotification": ("mcp.types", "ResourceUpdatedNotification"),
+    "RootsCapability": ("mcp.types", "RootsCapability"),
+    "SamplingCapability": ("mcp.types", "SamplingCapability"),
+    "SamplingContent": ("mcp.types", "SamplingContent"),
+    "SamplingContextCapability": ("mcp.types", "SamplingContextCapability"),
+    "SamplingMessage": ("mcp.types", "SamplingMessage"),
+    "SamplingMessageContentBlock": ("mcp.types", "SamplingMessageContentBlock"),
+    "SamplingToolsCapability": ("mcp.types", "SamplingToolsCapability"),
+    "ServerCapabilities": ("mcp.types", "ServerCapabilities"),
+    "ServerNotification": ("mcp.types", "ServerNotification"),
+    "ServerRequest": ("mcp.types", "ServerRequest"),
+    "ServerResult": ("mcp.types", "ServerResult"),
+    "SetLevelRequest": ("mcp.types", "SetLevelRequest"),
+    "StopReason": ("mcp.types", "StopReason"),
+    "SubscribeRequest": ("mcp.types", "SubscribeRequest"),
+    "Tool": ("mcp.types", "Tool"),
+    "ToolChoice": ("mcp.types", "ToolChoice"),
+    "ToolResultContent": ("mcp.types", "ToolResultContent"),
+    "ToolsCapability": ("mcp.types", "ToolsCapability"),
+    "ToolUseContent": ("mcp.types", "ToolUseContent"),
+    "UnsubscribeRequest": ("mcp.types", "UnsubscribeRequest"),
+}
 
 __all__ = [
     "CallToolRequest",
@@ -133,3 +214,12 @@ __all__ = [
     "stdio_client",
     "stdio_server",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = getattr(import_module(module_name), attr)
+    globals()[name] = value
+    return value
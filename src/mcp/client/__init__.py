@@ -1,8 +1,29 @@
 """MCP Client module."""
 
-from mcp.client._transport import Transport
-from mcp.client.client import Client
-from mcp.client.context import ClientRequestContext
-from mcp.client.session import ClientSession
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp.client._transport import Transport
+    from mcp.client.client import Client
+    from mcp.client.context import ClientRequestContext
+    from mcp.client.session import ClientSession
+
+# Resolved on first access so importing a transport such as `mcp.client.stdio`
+# does not pull in `Client` and the in-process server it can wrap.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Client": "mcp.client.client",
+    "ClientRequestContext": "mcp.client.context",
+    "ClientSession": "mcp.client.session",
+    "Transport": "mcp.client._transport",
+}
 
 __all__ = ["Client", "ClientRequestContext", "ClientSession", "Transport"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
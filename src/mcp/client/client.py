@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from contextlib import AsyncExitStack
 from dataclasses import KW_ONLY, dataclass, field
 from typing import Any
 
 from mcp.client._memory import InMemoryTransport
 from mcp.client._transport import Transport
-from mcp.client.session import ClientSession, ElicitationFnT, ListRootsFnT, LoggingFnT, MessageHandlerFnT, SamplingFnT
+from mcp.client.session import (
+    DEFAULT_MAX_CONCURRENT_SERVER_REQUESTS,
+    DEFAULT_MAX_QUEUED_NOTIFICATIONS,
+    ClientSession,
+    ElicitationFnT,
+    ListRootsFnT,
+    LoggingFnT,
+    MessageHandlerFnT,
+    SamplingFnT,
+)
 from mcp.client.streamable_http import streamable_http_client
 from mcp.server import Server
 from mcp.server.mcpserver import MCPServer
+from mcp.shared.notification_queue import NotificationOverflowPolicy
+from mcp.shared.resource_ranges import DEFAULT_CHUNK_SIZE
 from mcp.shared.session import ProgressFnT
 from mcp.types import (
     CallToolResult,
@@ -95,6 +107,18 @@ class Client:
     elicitation_callback: ElicitationFnT | None = None
     """Callback for handling elicitation requests."""
 
+    max_concurrent_server_requests: int | None = DEFAULT_MAX_CONCURRENT_SERVER_REQUESTS
+    """How many server-initiated requests (sampling, elicitation, ...) may be handled at once, or None for no limit."""
+
+    max_queued_notifications: int | None = DEFAULT_MAX_QUEUED_NOTIFICATIONS
+    """How many notifications may wait for their callbacks, or None to run callbacks in the receive loop.
+
+    Requests and errors passed to `message_handler` wait in the same queue, so it sees every message in order.
+    """
+
+    notification_overflow: NotificationOverflowPolicy = "block"
+    """What to do with a notification that arrives while the notification queue is full."""
+
     _session: ClientSession | None = field(init=False, default=None)
     _exit_stack: AsyncExitStack | None = field(init=False, default=None)
     _transport: Transport = field(init=False)
@@ -126,6 +150,9 @@ class Client:
                     message_handler=self.message_handler,
                     client_info=self.client_info,
                     elicitation_callback=self.elicitation_callback,
+                    max_concurrent_server_requests=self.max_concurrent_server_requests,
+                    max_queued_notifications=self.max_queued_notifications,
+                    notification_overflow=self.notification_overflow,
                 )
             )
 
@@ -212,6 +239,22 @@ class Client:
         """
         return await self.session.read_resource(uri, meta=meta)
 
+    def read_resource_chunks(
+        self, uri: str, chunk_size: int = DEFAULT_CHUNK_SIZE, *, meta: RequestParamsMeta | None = None
+    ) -> AsyncIterator[str | bytes]:
+        """Read a resource a chunk at a time, with bounded memory.
+
+        Args:
+            uri: The URI of the resource to read.
+            chunk_size: The most bytes, or characters of text, to request at once.
+            meta: Additional metadata for each request
+
+        Returns:
+            An async iterator of text and decoded binary chunks. Servers that cannot read
+            part of a resource return it whole, as one chunk.
+        """
+        return self.session.read_resource_chunks(uri, chunk_size, meta=meta)
+
     async def subscribe_resource(self, uri: str, *, meta: RequestParamsMeta | None = None) -> EmptyResult:
         """Subscribe to resource updates."""
         return await self.session.subscribe_resource(uri, meta=meta)
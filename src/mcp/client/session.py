@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import base64
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, Protocol
 
+import anyio.abc
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import TypeAdapter
@@ -12,12 +15,18 @@ from mcp.client.experimental import ExperimentalClientFeatures
 from mcp.client.experimental.task_handlers import ExperimentalTaskHandlers
 from mcp.shared._context import RequestContext
 from mcp.shared.message import SessionMessage
+from mcp.shared.notification_queue import NotificationOverflowPolicy
+from mcp.shared.resource_ranges import DEFAULT_CHUNK_SIZE, RESOURCE_RANGE_META_KEY, returned_range
+from mcp.shared.schema_validation import ToolValidators
 from mcp.shared.session import BaseSession, ProgressFnT, RequestResponder
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types._types import RequestParamsMeta
 
 DEFAULT_CLIENT_INFO = types.Implementation(name="mcp", version="0.1.0")
 
+DEFAULT_MAX_CONCURRENT_SERVER_REQUESTS = 16
+DEFAULT_MAX_QUEUED_NOTIFICATIONS = 100
+
 logger = logging.getLogger("client")
 
 
@@ -98,6 +107,15 @@ async def _default_logging_callback(
 ClientResponse: TypeAdapter[types.ClientResult | types.ErrorData] = TypeAdapter(types.ClientResult | types.ErrorData)
 
 
+class _ToolsRefresh:
+    """A refresh of the output schema cache that concurrent tool calls wait on, and how it ended."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.completed = False
+        self.error: Exception | None = None
+
+
 class ClientSession(
     BaseSession[
         types.ClientRequest,
@@ -121,8 +139,19 @@ class ClientSession(
         *,
         sampling_capabilities: types.SamplingCapability | None = None,
         experimental_task_handlers: ExperimentalTaskHandlers | None = None,
+        max_concurrent_server_requests: int | None = DEFAULT_MAX_CONCURRENT_SERVER_REQUESTS,
+        max_queued_notifications: int | None = DEFAULT_MAX_QUEUED_NOTIFICATIONS,
+        notification_overflow: NotificationOverflowPolicy = "block",
     ) -> None:
-        super().__init__(read_stream, write_stream, read_timeout_seconds=read_timeout_seconds)
+        if max_concurrent_server_requests is not None and max_concurrent_server_requests < 1:
+            raise ValueError("max_concurrent_server_requests must be at least 1")
+        super().__init__(
+            read_stream,
+            write_stream,
+            read_timeout_seconds=read_timeout_seconds,
+            max_queued_notifications=max_queued_notifications,
+            notification_overflow=notification_overflow,
+        )
         self._client_info = client_info or DEFAULT_CLIENT_INFO
         self._sampling_callback = sampling_callback or _default_sampling_callback
         self._sampling_capabilities = sampling_capabilities
@@ -130,13 +159,20 @@ class ClientSession(
         self._list_roots_callback = list_roots_callback or _default_list_roots_callback
         self._logging_callback = logging_callback or _default_logging_callback
         self._message_handler = message_handler or _default_message_handler
-        self._tool_output_schemas: dict[str, dict[str, Any] | None] = {}
+        # Tool definitions with their compiled output-schema validators, keyed by tool name
+        self._tool_output_schemas: dict[str, ToolValidators] = {}
+        self._tools_refresh: _ToolsRefresh | None = None
         self._server_capabilities: types.ServerCapabilities | None = None
         self._experimental_features: ExperimentalClientFeatures | None = None
 
         # Experimental: Task handlers (use defaults if not provided)
         self._task_handlers = experimental_task_handlers or ExperimentalTaskHandlers()
 
+        # Bounds how many server-initiated requests (sampling, elicitation, ...) run their callbacks at once
+        self._server_request_limiter: anyio.CapacityLimiter | None = None
+        if max_concurrent_server_requests is not None:
+            self._server_request_limiter = anyio.CapacityLimiter(max_concurrent_server_requests)
+
     @property
     def _receive_request_adapter(self) -> TypeAdapter[types.ServerRequest]:
         return types.server_request_adapter
@@ -279,6 +315,43 @@ class ClientSession(
             types.ReadResourceResult,
         )
 
+    async def read_resource_chunks(
+        self, uri: str, chunk_size: int = DEFAULT_CHUNK_SIZE, *, meta: RequestParamsMeta | None = None
+    ) -> AsyncIterator[str | bytes]:
+        """Read a resource a range at a time, yielding text and decoded binary chunks in order.
+
+        Each `resources/read` request asks for the next `chunk_size` bytes, or characters
+        of text, so only one chunk is held at a time. A server that does not support
+        ranged reads returns the whole content, which is yielded as one chunk.
+
+        Raises:
+            RuntimeError: If the server returns a malformed range.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        offset = 0
+        while True:
+            request_meta: RequestParamsMeta = {**(meta or {})}
+            request_meta[RESOURCE_RANGE_META_KEY] = {"offset": offset, "length": chunk_size}
+            result = await self.read_resource(uri, meta=request_meta)
+            more = False
+            for content in result.contents:
+                try:
+                    returned = returned_range(content.meta)
+                except ValueError as e:
+                    raise RuntimeError(f"{e} returned by the server for {uri}") from None
+                if isinstance(content, types.TextResourceContents):
+                    chunk: str | bytes = content.text
+                else:
+                    chunk = base64.b64decode(content.blob)
+                if chunk:
+                    yield chunk
+                if returned is not None and returned.length == chunk_size:
+                    more = more or returned.total is None or offset + chunk_size < returned.total
+            if not more:
+                return
+            offset += chunk_size
+
     async def subscribe_resource(self, uri: str, *, meta: RequestParamsMeta | None = None) -> types.EmptyResult:
         """Send a resources/subscribe request."""
         return await self.send_request(
@@ -322,28 +395,59 @@ class ClientSession(
         """Validate the structured content of a tool result against its output schema."""
         if name not in self._tool_output_schemas:
             # refresh output schema cache
-            await self.list_tools()
+            await self._refresh_tools()
 
-        output_schema = None
-        if name in self._tool_output_schemas:
-            output_schema = self._tool_output_schemas.get(name)
-        else:
+        validators = self._tool_output_schemas.get(name)
+        if validators is None:
             logger.warning(f"Tool {name} not listed by server, cannot validate any structured content")
 
-        if output_schema is not None:
-            from jsonschema import SchemaError, ValidationError, validate
+        elif validators.tool.output_schema is not None:
+            from jsonschema import SchemaError, ValidationError
 
             if result.structured_content is None:
                 raise RuntimeError(
                     f"Tool {name} has an output schema but did not return structured content"
                 )  # pragma: no cover
             try:
-                validate(result.structured_content, output_schema)
+                validators.validate_output(result.structured_content)
             except ValidationError as e:
                 raise RuntimeError(f"Invalid structured content returned by tool {name}: {e}")
             except SchemaError as e:  # pragma: no cover
                 raise RuntimeError(f"Invalid schema for tool {name}: {e}")  # pragma: no cover
 
+    async def _refresh_tools(self) -> None:
+        """List every tool, following pagination cursors, to refresh the output schema cache.
+
+        Concurrent callers share a single refresh instead of each sending their own
+        `tools/list` requests. If the refresh fails, every caller sharing it raises its
+        error; if the caller running it is cancelled, one of the others runs it again.
+        """
+        while (refresh := self._tools_refresh) is not None:
+            await refresh.done.wait()
+            if refresh.error is not None:
+                raise refresh.error
+            if refresh.completed:
+                return
+
+        refresh = self._tools_refresh = _ToolsRefresh()
+        try:
+            cursors_seen: set[str] = set()
+            params: types.PaginatedRequestParams | None = None
+            while True:
+                result = await self.list_tools(params=params)
+                cursor = result.next_cursor
+                if cursor is None or cursor in cursors_seen:
+                    break
+                cursors_seen.add(cursor)
+                params = types.PaginatedRequestParams(cursor=cursor)
+            refresh.completed = True
+        except Exception as e:
+            refresh.error = e
+            raise
+        finally:
+            refresh.done.set()
+            self._tools_refresh = None
+
     async def list_prompts(self, *, params: types.PaginatedRequestParams | None = None) -> types.ListPromptsResult:
         """Send a prompts/list request.
 
@@ -401,7 +505,10 @@ class ClientSession(
         # Cache tool output schemas for future validation
         # Note: don't clear the cache, as we may be using a cursor
         for tool in result.tools:
-            self._tool_output_schemas[tool.name] = tool.output_schema
+            validators = self._tool_output_schemas.get(tool.name)
+            # Keep the compiled validator unless the definition changed
+            if validators is None or validators.tool != tool:
+                self._tool_output_schemas[tool.name] = ToolValidators(tool)
 
         return result
 
@@ -410,51 +517,75 @@ class ClientSession(
         await self.send_notification(types.RootsListChangedNotification())
 
     async def _received_request(self, responder: RequestResponder[types.ServerRequest, types.ClientResult]) -> None:
+        if isinstance(responder.request, types.PingRequest):  # pragma: no cover
+            with responder:
+                return await responder.respond(types.EmptyResult())
+
+        # Callbacks such as sampling can take seconds, so each request runs in its own task and the
+        # receive loop keeps delivering responses and notifications meanwhile. The task enters the
+        # responder before `start` returns, which tells the receive loop the request is being handled.
+        await self._task_group.start(self._handle_server_request, responder)
+
+    async def _handle_server_request(
+        self,
+        responder: RequestResponder[types.ServerRequest, types.ClientResult],
+        *,
+        task_status: anyio.abc.TaskStatus[None] = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        with responder:
+            task_status.started()
+            try:
+                if self._server_request_limiter is None:
+                    await self._respond_to_server_request(responder)
+                else:
+                    async with self._server_request_limiter:
+                        await self._respond_to_server_request(responder)
+            except Exception:
+                # Answer the same way the receive loop does when handling a request fails
+                logger.warning("Failed to handle server request", exc_info=True)
+                if not responder._completed:  # type: ignore[reportPrivateUsage]
+                    await responder.respond(
+                        types.ErrorData(code=types.INVALID_PARAMS, message="Invalid request parameters", data="")
+                    )
+
+    async def _respond_to_server_request(
+        self, responder: RequestResponder[types.ServerRequest, types.ClientResult]
+    ) -> None:
         ctx = RequestContext[ClientSession](request_id=responder.request_id, meta=responder.request_meta, session=self)
 
         # Delegate to experimental task handler if applicable
         if self._task_handlers.handles_request(responder.request):
-            with responder:
-                await self._task_handlers.handle_request(ctx, responder)
-            return None
+            await self._task_handlers.handle_request(ctx, responder)
+            return
 
         # Core request handling
         match responder.request:
             case types.CreateMessageRequest(params=params):
-                with responder:
-                    # Check if this is a task-augmented request
-                    if params.task is not None:
-                        response = await self._task_handlers.augmented_sampling(ctx, params, params.task)
-                    else:
-                        response = await self._sampling_callback(ctx, params)
-                    client_response = ClientResponse.validate_python(response)
-                    await responder.respond(client_response)
+                # Check if this is a task-augmented request
+                if params.task is not None:
+                    response = await self._task_handlers.augmented_sampling(ctx, params, params.task)
+                else:
+                    response = await self._sampling_callback(ctx, params)
+                client_response = ClientResponse.validate_python(response)
+                await responder.respond(client_response)
 
             case types.ElicitRequest(params=params):
-                with responder:
-                    # Check if this is a task-augmented request
-                    if params.task is not None:
-                        response = await self._task_handlers.augmented_elicitation(ctx, params, params.task)
-                    else:
-                        response = await self._elicitation_callback(ctx, params)
-                    client_response = ClientResponse.validate_python(response)
-                    await responder.respond(client_response)
+                # Check if this is a task-augmented request
+                if params.task is not None:
+                    response = await self._task_handlers.augmented_elicitation(ctx, params, params.task)
+                else:
+                    response = await self._elicitation_callback(ctx, params)
+                client_response = ClientResponse.validate_python(response)
+                await responder.respond(client_response)
 
             case types.ListRootsRequest():
-                with responder:
-                    response = await self._list_roots_callback(ctx)
-                    client_response = ClientResponse.validate_python(response)
-                    await responder.respond(client_response)
-
-            case types.PingRequest():  # pragma: no cover
-                with responder:
-                    return await responder.respond(types.EmptyResult())
+                response = await self._list_roots_callback(ctx)
+                client_response = ClientResponse.validate_python(response)
+                await responder.respond(client_response)
 
             case _:  # pragma: no cover
                 pass  # Task requests handled above by _task_handlers
 
-        return None
-
     async def _handle_incoming(
         self,
         req: RequestResponder[types.ServerRequest, types.ClientResult] | types.ServerNotification | Exception,
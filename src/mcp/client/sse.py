@@ -11,8 +11,8 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import aconnect_sse
 from httpx_sse._exceptions import SSEError
 
-from mcp import types
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -36,6 +36,7 @@ async def sse_client(
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
     on_session_created: Callable[[str], None] | None = None,
+    codec: Codec = DEFAULT_CODEC,
 ):
     """Client transport for SSE.
 
@@ -49,6 +50,7 @@ async def sse_client(
         sse_read_timeout: Timeout for SSE read operations (in seconds).
         auth: Optional HTTPX authentication handler.
         on_session_created: Optional callback invoked with the session ID when received.
+        codec: Codec used to encode and decode messages on the wire.
     """
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
@@ -106,10 +108,8 @@ async def sse_client(
                                         if not sse.data:
                                             continue
                                         try:
-                                            message = types.jsonrpc_message_adapter.validate_json(
-                                                sse.data, by_name=False
-                                            )
-                                            logger.debug(f"Received server message: {message}")
+                                            message = codec.decode(sse.data)
+                                            logger.debug("Received server message: %s", message)
                                         except Exception as exc:  # pragma: no cover
                                             logger.exception("Error parsing server message")  # pragma: no cover
                                             await read_stream_writer.send(exc)  # pragma: no cover
@@ -132,14 +132,11 @@ async def sse_client(
                         try:
                             async with write_stream_reader:
                                 async for session_message in write_stream_reader:
-                                    logger.debug(f"Sending client message: {session_message}")
+                                    logger.debug("Sending client message: %s", session_message)
                                     response = await client.post(
                                         endpoint_url,
-                                        json=session_message.message.model_dump(
-                                            by_alias=True,
-                                            mode="json",
-                                            exclude_none=True,
-                                        ),
+                                        content=codec.encode_session_message(session_message),
+                                        headers={"Content-Type": "application/json"},
                                     )
                                     response.raise_for_status()
                                     logger.debug(f"Client message sent successfully: {response.status_code}")
@@ -1,3 +1,4 @@
+import codecs
 import logging
 import os
 import sys
@@ -12,7 +13,6 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from anyio.streams.text import TextReceiveStream
 from pydantic import BaseModel, Field
 
-from mcp import types
 from mcp.os.posix.utilities import terminate_posix_process_tree
 from mcp.os.win32.utilities import (
     FallbackProcess,
@@ -20,6 +20,7 @@ from mcp.os.win32.utilities import (
     get_windows_executable_command,
     terminate_windows_process_tree,
 )
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -102,7 +103,7 @@ class StdioServerParameters(BaseModel):
 
 
 @asynccontextmanager
-async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stderr):
+async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stderr, codec: Codec = DEFAULT_CODEC):
     """Client transport for stdio: this will connect to a server by spawning a
     process and communicating with it over stdin/stdout.
     """
@@ -150,7 +151,7 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
 
                     for line in lines:
                         try:
-                            message = types.jsonrpc_message_adapter.validate_json(line, by_name=False)
+                            message = codec.decode(line)
                         except Exception as exc:  # pragma: no cover
                             logger.exception("Failed to parse JSONRPC message from server")
                             await read_stream_writer.send(exc)
@@ -161,19 +162,19 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
         except anyio.ClosedResourceError:  # pragma: lax no cover
             await anyio.lowlevel.checkpoint()
 
+    # Codecs encode to UTF-8, which is sent as it is unless the server reads another encoding
+    utf8 = codecs.lookup(server.encoding).name == "utf-8"
+
     async def stdin_writer():
         assert process.stdin, "Opened process is missing stdin"
 
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await process.stdin.send(
-                        (json + "\n").encode(
-                            encoding=server.encoding,
-                            errors=server.encoding_error_handler,
-                        )
-                    )
+                    line = codec.encode_session_message(session_message) + b"\n"
+                    if not utf8:
+                        line = line.decode().encode(encoding=server.encoding, errors=server.encoding_error_handler)
+                    await process.stdin.send(line)
         except anyio.ClosedResourceError:  # pragma: no cover
             await anyio.lowlevel.checkpoint()
 
@@ -13,12 +13,13 @@ import httpx
 from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from httpx_sse import EventSource, ServerSentEvent, aconnect_sse
-from pydantic import ValidationError
 
 from mcp.client._transport import TransportStreams
 from mcp.shared._httpx_utils import create_mcp_http_client
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import ClientMessageMetadata, SessionMessage
 from mcp.types import (
+    INTERNAL_ERROR,
     INVALID_REQUEST,
     PARSE_ERROR,
     ErrorData,
@@ -29,7 +30,6 @@ from mcp.types import (
     JSONRPCRequest,
     JSONRPCResponse,
     RequestId,
-    jsonrpc_message_adapter,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +48,9 @@ LAST_EVENT_ID = "last-event-id"
 DEFAULT_RECONNECTION_DELAY_MS = 1000  # 1 second fallback when server doesn't provide retry
 MAX_RECONNECTION_ATTEMPTS = 2  # Max retry attempts before giving up
 
+# Batching defaults
+DEFAULT_MAX_BATCH_SIZE = 50  # Max messages coalesced into one batch POST
+
 
 class StreamableHTTPError(Exception):
     """Base exception for StreamableHTTP transport errors."""
@@ -71,13 +74,28 @@ class RequestContext:
 class StreamableHTTPTransport:
     """StreamableHTTP client transport implementation."""
 
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        codec: Codec = DEFAULT_CODEC,
+        batch_window: float | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
         """Initialize the StreamableHTTP transport.
 
         Args:
             url: The endpoint URL.
+            codec: Codec used to encode and decode messages on the wire.
+            batch_window: If set, messages queued within this many seconds of each other
+                are coalesced into one JSON-RPC batch POST. Disabled by default.
+            max_batch_size: The most messages sent in a single batch.
         """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
         self.url = url
+        self.codec = codec
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
         self.session_id: str | None = None
         self.protocol_version: str | None = None
 
@@ -106,6 +124,17 @@ class StreamableHTTPTransport:
         """Check if the message is an initialized notification."""
         return isinstance(message, JSONRPCNotification) and message.method == "notifications/initialized"
 
+    def _is_batchable(self, session_message: SessionMessage) -> bool:
+        """Check if the message may be coalesced into a batch POST.
+
+        The initialization handshake and resumption requests are always sent on their own.
+        """
+        message = session_message.message
+        metadata = session_message.metadata
+        if isinstance(metadata, ClientMessageMetadata) and metadata.resumption_token:
+            return False
+        return not (self._is_initialization_request(message) or self._is_initialized_notification(message))
+
     def _maybe_extract_session_id_from_response(self, response: httpx.Response) -> None:
         """Extract and store session ID from response headers."""
         new_session_id = response.headers.get(MCP_SESSION_ID)
@@ -142,8 +171,8 @@ class StreamableHTTPTransport:
                     await resumption_callback(sse.id)
                 return False
             try:
-                message = jsonrpc_message_adapter.validate_json(sse.data, by_name=False)
-                logger.debug(f"SSE message: {message}")
+                message = self.codec.decode(sse.data)
+                logger.debug("SSE message: %s", message)
 
                 # Extract protocol version from initialization response
                 if is_initialization:
@@ -259,7 +288,7 @@ class StreamableHTTPTransport:
         async with ctx.client.stream(
             "POST",
             self.url,
-            json=message.model_dump(by_alias=True, mode="json", exclude_none=True),
+            content=self.codec.encode_session_message(ctx.session_message),
             headers=headers,
         ) as response:
             if response.status_code == 202:
@@ -293,6 +322,67 @@ class StreamableHTTPTransport:
                     error_msg = SessionMessage(JSONRPCError(jsonrpc="2.0", id=message.id, error=error_data))
                     await ctx.read_stream_writer.send(error_msg)
 
+    async def _handle_batch_post_request(
+        self,
+        client: httpx.AsyncClient,
+        batch: list[SessionMessage],
+        read_stream_writer: StreamWriter,
+    ) -> None:
+        """POST several messages as one JSON-RPC batch and route the responses.
+
+        Requests the server does not answer get an error response, so callers never wait on
+        a batch that failed as a whole.
+        """
+        request_ids = [m.message.id for m in batch if isinstance(m.message, JSONRPCRequest)]
+        answered: set[RequestId] = set()
+
+        async def route(message: JSONRPCMessage) -> None:
+            if isinstance(message, JSONRPCResponse | JSONRPCError):
+                answered.add(message.id)
+            await read_stream_writer.send(SessionMessage(message))
+
+        async def fail_unanswered(code: int, message: str) -> None:
+            for request_id in request_ids:
+                if request_id not in answered:
+                    error_data = ErrorData(code=code, message=message)
+                    await read_stream_writer.send(
+                        SessionMessage(JSONRPCError(jsonrpc="2.0", id=request_id, error=error_data))
+                    )
+
+        content = self.codec.encode_batch([self.codec.encode_session_message(m) for m in batch])
+        async with client.stream("POST", self.url, content=content, headers=self._prepare_headers()) as response:
+            if response.status_code == 202:
+                logger.debug("Received 202 Accepted")
+                return
+
+            if response.status_code == 404:  # pragma: no cover
+                await fail_unanswered(INVALID_REQUEST, "Session terminated")
+                return
+
+            if response.is_error:  # pragma: no cover
+                await fail_unanswered(INTERNAL_ERROR, f"Batch request failed with HTTP {response.status_code}")
+                return
+
+            content_type = response.headers.get("content-type", "").lower()
+            try:
+                if content_type.startswith("application/json"):
+                    for message in self.codec.decode_batch(await response.aread()):
+                        await route(message)
+                elif content_type.startswith("text/event-stream"):  # pragma: no branch
+                    async for sse in EventSource(response).aiter_sse():  # pragma: no branch
+                        if sse.event != "message" or not sse.data:  # pragma: no cover
+                            continue
+                        await route(self.codec.decode(sse.data))
+                        if answered.issuperset(request_ids):
+                            await response.aclose()
+                            break
+            except (httpx.StreamError, ValueError) as exc:  # pragma: no cover
+                logger.exception("Error parsing batch response")
+                await fail_unanswered(PARSE_ERROR, f"Failed to parse batch response: {exc}")
+                return
+
+        await fail_unanswered(INTERNAL_ERROR, "No response received for batched request")
+
     async def _handle_json_response(
         self,
         response: httpx.Response,
@@ -304,7 +394,7 @@ class StreamableHTTPTransport:
         """Handle JSON response from the server."""
         try:
             content = await response.aread()
-            message = jsonrpc_message_adapter.validate_json(content, by_name=False)
+            message = self.codec.decode(content)
 
             # Extract protocol version from initialization response
             if is_initialization:
@@ -312,7 +402,7 @@ class StreamableHTTPTransport:
 
             session_message = SessionMessage(message)
             await read_stream_writer.send(session_message)
-        except (httpx.StreamError, ValidationError) as exc:
+        except (httpx.StreamError, ValueError) as exc:
             logger.exception("Error parsing JSON response")
             error_data = ErrorData(code=PARSE_ERROR, message=f"Failed to parse JSON response: {exc}")
             error_msg = SessionMessage(JSONRPCError(jsonrpc="2.0", id=request_id, error=error_data))
@@ -432,44 +522,72 @@ class StreamableHTTPTransport:
         tg: TaskGroup,
     ) -> None:
         """Handle writing requests to the server."""
-        try:
-            async with write_stream_reader:
-                async for session_message in write_stream_reader:
-                    message = session_message.message
-                    metadata = (
-                        session_message.metadata
-                        if isinstance(session_message.metadata, ClientMessageMetadata)
-                        else None
-                    )
 
-                    # Check if this is a resumption request
-                    is_resumption = bool(metadata and metadata.resumption_token)
+        async def send_message(session_message: SessionMessage) -> None:
+            message = session_message.message
+            metadata = session_message.metadata if isinstance(session_message.metadata, ClientMessageMetadata) else None
 
-                    logger.debug(f"Sending client message: {message}")
+            # Check if this is a resumption request
+            is_resumption = bool(metadata and metadata.resumption_token)
 
-                    # Handle initialized notification
-                    if self._is_initialized_notification(message):
-                        start_get_stream()
+            logger.debug("Sending client message: %s", message)
 
-                    ctx = RequestContext(
-                        client=client,
-                        session_id=self.session_id,
-                        session_message=session_message,
-                        metadata=metadata,
-                        read_stream_writer=read_stream_writer,
-                    )
+            # Handle initialized notification
+            if self._is_initialized_notification(message):
+                start_get_stream()
+
+            ctx = RequestContext(
+                client=client,
+                session_id=self.session_id,
+                session_message=session_message,
+                metadata=metadata,
+                read_stream_writer=read_stream_writer,
+            )
+
+            async def handle_request_async():
+                if is_resumption:
+                    await self._handle_resumption_request(ctx)
+                else:
+                    await self._handle_post_request(ctx)
 
-                    async def handle_request_async():
-                        if is_resumption:
-                            await self._handle_resumption_request(ctx)
-                        else:
-                            await self._handle_post_request(ctx)
+            # If this is a request, start a new task to handle it
+            if isinstance(message, JSONRPCRequest):
+                tg.start_soon(handle_request_async)
+            else:
+                await handle_request_async()
 
-                    # If this is a request, start a new task to handle it
-                    if isinstance(message, JSONRPCRequest):
-                        tg.start_soon(handle_request_async)
-                    else:
-                        await handle_request_async()
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    if self.batch_window is None or not self._is_batchable(session_message):
+                        await send_message(session_message)
+                        continue
+
+                    # Give concurrent senders the window to queue up, then drain whatever is
+                    # waiting without blocking. Senders block on the unbuffered write stream,
+                    # so nothing is lost to a cancelled receive.
+                    await anyio.sleep(self.batch_window)
+                    batch = [session_message]
+                    deferred: SessionMessage | None = None
+                    while len(batch) < self.max_batch_size:
+                        try:
+                            queued = write_stream_reader.receive_nowait()
+                        except (anyio.WouldBlock, anyio.EndOfStream):
+                            break
+                        if not self._is_batchable(queued):  # pragma: no cover
+                            deferred = queued
+                            break
+                        batch.append(queued)
+
+                    if len(batch) == 1:
+                        await send_message(session_message)
+                    elif any(isinstance(m.message, JSONRPCRequest) for m in batch):
+                        tg.start_soon(self._handle_batch_post_request, client, batch, read_stream_writer)
+                    else:  # pragma: no cover
+                        await self._handle_batch_post_request(client, batch, read_stream_writer)
+
+                    if deferred is not None:  # pragma: no cover
+                        await send_message(deferred)
 
         except Exception:  # pragma: lax no cover
             logger.exception("Error in post_writer")
@@ -508,6 +626,9 @@ async def streamable_http_client(
     *,
     http_client: httpx.AsyncClient | None = None,
     terminate_on_close: bool = True,
+    codec: Codec = DEFAULT_CODEC,
+    batch_window: float | None = None,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
 ) -> AsyncGenerator[TransportStreams, None]:
     """Client transport for StreamableHTTP.
 
@@ -517,6 +638,12 @@ async def streamable_http_client(
             client with recommended MCP timeouts will be created. To configure headers,
             authentication, or other HTTP settings, create an httpx.AsyncClient and pass it here.
         terminate_on_close: If True, send a DELETE request to terminate the session when the context exits.
+        codec: Codec used to encode and decode messages on the wire.
+        batch_window: If set, messages sent within this many seconds of each other are
+            coalesced into one JSON-RPC batch POST, trading a little latency for fewer round
+            trips when many calls are made at once. The server must support batches.
+        max_batch_size: The most messages coalesced into one batch POST when `batch_window`
+            is set.
 
     Yields:
         Tuple containing:
@@ -537,7 +664,7 @@ async def streamable_http_client(
         # Create default client with recommended MCP timeouts
         client = create_mcp_http_client()
 
-    transport = StreamableHTTPTransport(url)
+    transport = StreamableHTTPTransport(url, codec, batch_window, max_batch_size)
 
     async with anyio.create_task_group() as tg:
         try:
@@ -1,20 +1,19 @@
-import json
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from pydantic import ValidationError
 from websockets.asyncio.client import connect as ws_connect
 from websockets.typing import Subprotocol
 
-from mcp import types
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import SessionMessage
 
 
 @asynccontextmanager
 async def websocket_client(
     url: str,
+    codec: Codec = DEFAULT_CODEC,
 ) -> AsyncGenerator[
     tuple[MemoryObjectReceiveStream[SessionMessage | Exception], MemoryObjectSendStream[SessionMessage]],
     None,
@@ -51,10 +50,10 @@ async def websocket_client(
             async with read_stream_writer:
                 async for raw_text in ws:
                     try:
-                        message = types.jsonrpc_message_adapter.validate_json(raw_text, by_name=False)
+                        message = codec.decode(raw_text)
                         session_message = SessionMessage(message)
                         await read_stream_writer.send(session_message)
-                    except ValidationError as exc:  # pragma: no cover
+                    except ValueError as exc:  # pragma: no cover
                         # If JSON parse or model validation fails, send the exception
                         await read_stream_writer.send(exc)
 
@@ -64,9 +63,8 @@ async def websocket_client(
             """
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    # Convert to a dict, then to JSON
-                    msg_dict = session_message.message.model_dump(by_alias=True, mode="json", exclude_none=True)
-                    await ws.send(json.dumps(msg_dict))
+                    # Sent as a text frame without decoding the UTF-8 bytes first
+                    await ws.send(codec.encode_session_message(session_message), text=True)
 
         async with anyio.create_task_group() as tg:
             # Start reader and writer tasks
@@ -1,5 +1,26 @@
-from .lowlevel import NotificationOptions, Server
-from .mcpserver import MCPServer
-from .models import InitializationOptions
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .lowlevel import NotificationOptions, Server
+    from .mcpserver import MCPServer
+    from .models import InitializationOptions
+
+# Resolved on first access so importing a transport such as `mcp.server.stdio`
+# does not pull in MCPServer and its HTTP dependencies.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Server": "mcp.server.lowlevel",
+    "NotificationOptions": "mcp.server.lowlevel",
+    "MCPServer": "mcp.server.mcpserver",
+    "InitializationOptions": "mcp.server.models",
+}
 
 __all__ = ["Server", "MCPServer", "NotificationOptions", "InitializationOptions"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -150,6 +150,7 @@ class TaskResultHandler:
                 original_id = message.original_request_id
                 if original_id is not None:
                     self._pending_requests[original_id] = message.resolver
+                    session.add_response_route(original_id, self)
 
             logger.debug("Delivering queued message for task %s: %s", task_id, message.type)
 
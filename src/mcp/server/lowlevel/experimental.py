@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from mcp.server.experimental.task_support import TaskSupport
 from mcp.server.lowlevel.func_inspection import create_call_wrapper
@@ -16,6 +16,7 @@ from mcp.shared.experimental.tasks.helpers import cancel_task
 from mcp.shared.experimental.tasks.in_memory_task_store import InMemoryTaskStore
 from mcp.shared.experimental.tasks.message_queue import InMemoryTaskMessageQueue, TaskMessageQueue
 from mcp.shared.experimental.tasks.store import TaskStore
+from mcp.shared.message import EncodedResult
 from mcp.types import (
     INVALID_PARAMS,
     CancelTaskRequest,
@@ -51,7 +52,7 @@ class ExperimentalHandlers:
     def __init__(
         self,
         server: Server,
-        request_handlers: dict[type, Callable[..., Awaitable[ServerResult]]],
+        request_handlers: dict[type, Callable[..., Awaitable[ServerResult | EncodedResult[Any]]]],
         notification_handlers: dict[type, Callable[..., Awaitable[None]]],
     ):
         self._server = server
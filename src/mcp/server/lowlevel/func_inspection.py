@@ -1,6 +1,7 @@
 import inspect
+import types
 from collections.abc import Callable
-from typing import Any, TypeVar, get_type_hints
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -15,6 +16,9 @@ def create_call_wrapper(func: Callable[..., R], request_type: type[T]) -> Callab
     1. Positional-only parameter typed as request_type (no default): func(req)
     2. Positional/keyword parameter typed as request_type (no default): func(**{param_name: req})
     3. No request parameter or parameter with default: func()
+
+    A parameter typed `request_type | None` counts as typed `request_type`, for handlers
+    the server also calls without a request, as it does to refresh its cache of tools.
     """
     try:
         sig = inspect.signature(func)
@@ -26,7 +30,7 @@ def create_call_wrapper(func: Callable[..., R], request_type: type[T]) -> Callab
     for param_name, param in sig.parameters.items():
         if param.kind == inspect.Parameter.POSITIONAL_ONLY:
             param_type = type_hints.get(param_name)
-            if param_type == request_type:  # pragma: no branch
+            if _is_request_type(param_type, request_type):  # pragma: no branch
                 # Check if it has a default - if so, treat as old style
                 if param.default is not inspect.Parameter.empty:  # pragma: no cover
                     return lambda _: func()
@@ -37,7 +41,7 @@ def create_call_wrapper(func: Callable[..., R], request_type: type[T]) -> Callab
     for param_name, param in sig.parameters.items():
         if param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):  # pragma: no branch
             param_type = type_hints.get(param_name)
-            if param_type == request_type:
+            if _is_request_type(param_type, request_type):
                 # Check if it has a default - if so, treat as old style
                 if param.default is not inspect.Parameter.empty:  # pragma: no cover
                     return lambda _: func()
@@ -51,3 +55,10 @@ def create_call_wrapper(func: Callable[..., R], request_type: type[T]) -> Callab
 
     # No request parameter found - use old style
     return lambda _: func()
+
+
+def _is_request_type(param_type: Any, request_type: type[Any]) -> bool:
+    if param_type == request_type:
+        return True
+    optional = get_origin(param_type) in (Union, types.UnionType)
+    return optional and set(get_args(param_type)) == {request_type, type(None)}
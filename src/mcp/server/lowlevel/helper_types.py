@@ -6,6 +6,7 @@ from typing import Any
 class ReadResourceContents:
     """Contents returned from a read_resource call."""
 
-    content: str | bytes
+    content: str | bytes | memoryview
+    """Text, or binary data; a memoryview lets large data, e.g. a mapped file, be encoded without copying it first."""
     mime_type: str | None = None
     meta: dict[str, Any] | None = None
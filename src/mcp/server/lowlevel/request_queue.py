@@ -0,0 +1,50 @@
+"""Metrics for the bounded request queue of `Server.run`."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestQueueMetrics:
+    """Counters for requests waiting on a server's `max_concurrent_requests` limit.
+
+    One instance is shared by every session the server runs, so the gauges are
+    process-wide totals for that server.
+    """
+
+    queued: int = 0
+    """Requests currently waiting for a free slot."""
+
+    running: int = 0
+    """Requests currently being handled."""
+
+    max_queued: int = 0
+    """The deepest the queue has been."""
+
+    dispatched: int = 0
+    """Requests that have left the queue."""
+
+    rejected: int = 0
+    """Requests rejected with `SERVER_BUSY` because the queue was full."""
+
+    total_wait_time: float = 0.0
+    """Seconds dispatched requests spent waiting in the queue, summed."""
+
+    max_wait_time: float = 0.0
+    """The longest a single request waited, in seconds."""
+
+    @property
+    def average_wait_time(self) -> float:
+        """Mean seconds a dispatched request spent in the queue."""
+        return self.total_wait_time / self.dispatched if self.dispatched else 0.0
+
+    def record_enqueued(self) -> None:
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+
+    def record_dispatched(self, wait_time: float) -> None:
+        self.queued -= 1
+        self.dispatched += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
@@ -66,7 +66,7 @@ messages from the client.
 
 from __future__ import annotations
 
-import base64
+import binascii
 import contextvars
 import json
 import logging
@@ -74,40 +74,49 @@ import warnings
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 from importlib.metadata import version as importlib_version
-from typing import Any, Generic, TypeAlias, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeAlias, cast
 
 import anyio
-import jsonschema
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from starlette.applications import Starlette
-from starlette.middleware import Middleware
-from starlette.middleware.authentication import AuthenticationMiddleware
-from starlette.routing import Mount, Route
 from typing_extensions import TypeVar
 
 from mcp import types
-from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
-from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend, RequireAuthMiddleware
-from mcp.server.auth.provider import OAuthAuthorizationServerProvider, TokenVerifier
-from mcp.server.auth.routes import build_resource_metadata_url, create_auth_routes, create_protected_resource_routes
-from mcp.server.auth.settings import AuthSettings
 from mcp.server.context import ServerRequestContext
 from mcp.server.experimental.request_context import Experimental
 from mcp.server.lowlevel.experimental import ExperimentalHandlers
 from mcp.server.lowlevel.func_inspection import create_call_wrapper
 from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.lowlevel.request_queue import RequestQueueMetrics
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
-from mcp.server.streamable_http import EventStore
-from mcp.server.streamable_http_manager import StreamableHTTPASGIApp, StreamableHTTPSessionManager
-from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.exceptions import MCPError, UrlElicitationRequiredError
-from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.message import EncodedResult, ServerMessageMetadata, SessionMessage
+from mcp.shared.schema_validation import ToolValidators
 from mcp.shared.session import RequestResponder
 from mcp.shared.tool_name_validation import validate_and_warn_tool_name
 
+if TYPE_CHECKING:
+    # The HTTP stack (starlette, auth, streamable HTTP) is only imported once an HTTP app
+    # is built, so stdio servers do not pay for it at startup.
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+
+    from mcp.server.auth.provider import OAuthAuthorizationServerProvider, TokenVerifier
+    from mcp.server.auth.settings import AuthSettings
+    from mcp.server.streamable_http import EventStore
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from mcp.server.transport_security import TransportSecuritySettings
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_QUEUED_REQUESTS = 100
+DEFAULT_TOOL_CACHE_MISS_TTL = 5.0
+# Bounds memory when clients call many distinct unlisted tool names
+_MAX_TOOL_CACHE_MISSES = 1024
+# Bytes of a blob base64-encoded at a time; a multiple of 3, so chunks encode without padding
+_BASE64_CHUNK_SIZE = 3 * 256 * 1024
+
 LifespanResultT = TypeVar("LifespanResultT", default=Any)
 RequestT = TypeVar("RequestT", default=Any)
 
@@ -127,6 +136,15 @@ class NotificationOptions:
         self.tools_changed = tools_changed
 
 
+class _ToolCacheRefresh:
+    """A refresh of the tool cache that concurrent cache misses wait on, and how it ended."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.completed = False
+        self.error: Exception | None = None
+
+
 @asynccontextmanager
 async def lifespan(_: Server[LifespanResultT, RequestT]) -> AsyncIterator[dict[str, Any]]:
     """Default lifespan context manager that does nothing.
@@ -154,7 +172,28 @@ class Server(Generic[LifespanResultT, RequestT]):
             [Server[LifespanResultT, RequestT]],
             AbstractAsyncContextManager[LifespanResultT],
         ] = lifespan,
+        max_concurrent_requests: int | None = None,
+        max_queued_requests: int = DEFAULT_MAX_QUEUED_REQUESTS,
+        tool_cache_miss_ttl: float = DEFAULT_TOOL_CACHE_MISS_TTL,
     ):
+        """Create a low-level MCP server.
+
+        Args:
+            max_concurrent_requests: The most requests each session handles at once. Further
+                requests wait in a queue of up to `max_queued_requests`; once that is full,
+                new requests are rejected with a `SERVER_BUSY` error the client may retry.
+                Responses and notifications from the client are always read, so requests
+                waiting on the client (sampling, elicitation) can finish. None (the default)
+                handles every request as soon as it arrives.
+            max_queued_requests: How many requests per session may wait for a slot.
+            tool_cache_miss_ttl: Seconds a tool name that is missing from the tool list is
+                remembered as missing, so calls to it do not list every tool again. Listing
+                tools or `invalidate_tool_cache` forgets it sooner; 0 disables the cache.
+        """
+        if max_concurrent_requests is not None and max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        if max_queued_requests < 0:
+            raise ValueError("max_queued_requests must not be negative")
         self.name = name
         self.version = version
         self.title = title
@@ -163,11 +202,20 @@ class Server(Generic[LifespanResultT, RequestT]):
         self.website_url = website_url
         self.icons = icons
         self.lifespan = lifespan
-        self.request_handlers: dict[type, Callable[..., Awaitable[types.ServerResult]]] = {
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_queued_requests = max_queued_requests
+        self.request_metrics = RequestQueueMetrics()
+        self.request_handlers: dict[type, Callable[..., Awaitable[types.ServerResult | EncodedResult[Any]]]] = {
             types.PingRequest: _ping_handler,
         }
         self.notification_handlers: dict[type, Callable[..., Awaitable[None]]] = {}
+        self.tool_cache_miss_ttl = tool_cache_miss_ttl
         self._tool_cache: dict[str, types.Tool] = {}
+        self._tool_cache_misses: dict[str, float] = {}
+        self._tool_cache_refresh: _ToolCacheRefresh | None = None
+        self._tool_validators: dict[str, ToolValidators] = {}
+        self._listed_tools: EncodedResult[types.ListToolsResult] | None = None
+        self._resource_updated_callbacks: list[Callable[[str], None]] = []
         self._experimental_handlers: ExperimentalHandlers | None = None
         self._session_manager: StreamableHTTPSessionManager | None = None
         logger.debug("Initializing server %r", name)
@@ -281,7 +329,10 @@ class Server(Generic[LifespanResultT, RequestT]):
     def list_prompts(self):
         def decorator(
             func: Callable[[], Awaitable[list[types.Prompt]]]
-            | Callable[[types.ListPromptsRequest], Awaitable[types.ListPromptsResult]],
+            | Callable[
+                [types.ListPromptsRequest],
+                Awaitable[types.ListPromptsResult | EncodedResult[types.ListPromptsResult]],
+            ],
         ):
             logger.debug("Registering handler for PromptListRequest")
 
@@ -290,7 +341,7 @@ class Server(Generic[LifespanResultT, RequestT]):
             async def handler(req: types.ListPromptsRequest):
                 result = await wrapper(req)
                 # Handle both old style (list[Prompt]) and new style (ListPromptsResult)
-                if isinstance(result, types.ListPromptsResult):
+                if isinstance(result, types.ListPromptsResult | EncodedResult):
                     return result
                 else:
                     # Old style returns list[Prompt]
@@ -319,7 +370,10 @@ class Server(Generic[LifespanResultT, RequestT]):
     def list_resources(self):
         def decorator(
             func: Callable[[], Awaitable[list[types.Resource]]]
-            | Callable[[types.ListResourcesRequest], Awaitable[types.ListResourcesResult]],
+            | Callable[
+                [types.ListResourcesRequest],
+                Awaitable[types.ListResourcesResult | EncodedResult[types.ListResourcesResult]],
+            ],
         ):
             logger.debug("Registering handler for ListResourcesRequest")
 
@@ -328,7 +382,7 @@ class Server(Generic[LifespanResultT, RequestT]):
             async def handler(req: types.ListResourcesRequest):
                 result = await wrapper(req)
                 # Handle both old style (list[Resource]) and new style (ListResourcesResult)
-                if isinstance(result, types.ListResourcesResult):
+                if isinstance(result, types.ListResourcesResult | EncodedResult):
                     return result
                 else:
                     # Old style returns list[Resource]
@@ -340,12 +394,25 @@ class Server(Generic[LifespanResultT, RequestT]):
         return decorator
 
     def list_resource_templates(self):
-        def decorator(func: Callable[[], Awaitable[list[types.ResourceTemplate]]]):
+        def decorator(
+            func: Callable[[], Awaitable[list[types.ResourceTemplate]]]
+            | Callable[
+                [types.ListResourceTemplatesRequest],
+                Awaitable[types.ListResourceTemplatesResult | EncodedResult[types.ListResourceTemplatesResult]],
+            ],
+        ):
             logger.debug("Registering handler for ListResourceTemplatesRequest")
 
-            async def handler(_: Any):
-                templates = await func()
-                return types.ListResourceTemplatesResult(resource_templates=templates)
+            wrapper = create_call_wrapper(func, types.ListResourceTemplatesRequest)
+
+            async def handler(req: types.ListResourceTemplatesRequest):
+                result = await wrapper(req)
+                # Handle both old style (list[ResourceTemplate]) and new style (ListResourceTemplatesResult)
+                if isinstance(result, types.ListResourceTemplatesResult | EncodedResult):
+                    return result
+                else:
+                    # Old style returns list[ResourceTemplate]
+                    return types.ListResourceTemplatesResult(resource_templates=result)
 
             self.request_handlers[types.ListResourceTemplatesRequest] = handler
             return func
@@ -361,7 +428,9 @@ class Server(Generic[LifespanResultT, RequestT]):
             async def handler(req: types.ReadResourceRequest):
                 result = await func(req.params.uri)
 
-                def create_content(data: str | bytes, mime_type: str | None, meta: dict[str, Any] | None = None):
+                def create_content(
+                    data: str | bytes | memoryview, mime_type: str | None, meta: dict[str, Any] | None = None
+                ):
                     # Note: ResourceContents uses Field(alias="_meta"), so we must use the alias key
                     meta_kwargs: dict[str, Any] = {"_meta": meta} if meta is not None else {}
                     match data:
@@ -372,10 +441,10 @@ class Server(Generic[LifespanResultT, RequestT]):
                                 mime_type=mime_type or "text/plain",
                                 **meta_kwargs,
                             )
-                        case bytes() as data:  # pragma: no branch
+                        case bytes() | memoryview() as data:  # pragma: no branch
                             return types.BlobResourceContents(
                                 uri=req.params.uri,
-                                blob=base64.b64encode(data).decode(),
+                                blob=_base64_encode(data),
                                 mime_type=mime_type or "application/octet-stream",
                                 **meta_kwargs,
                             )
@@ -449,7 +518,10 @@ class Server(Generic[LifespanResultT, RequestT]):
     def list_tools(self):
         def decorator(
             func: Callable[[], Awaitable[list[types.Tool]]]
-            | Callable[[types.ListToolsRequest], Awaitable[types.ListToolsResult]],
+            | Callable[
+                [types.ListToolsRequest],
+                Awaitable[types.ListToolsResult | EncodedResult[types.ListToolsResult]],
+            ],
         ):
             logger.debug("Registering handler for ListToolsRequest")
 
@@ -459,19 +531,26 @@ class Server(Generic[LifespanResultT, RequestT]):
                 result = await wrapper(req)
 
                 # Handle both old style (list[Tool]) and new style (ListToolsResult)
-                if isinstance(result, types.ListToolsResult):
+                if isinstance(result, EncodedResult):
+                    # A snapshot served before has already refreshed the tool cache
+                    if result is not self._listed_tools:
+                        self._listed_tools = result
+                        for tool in result.result.tools:
+                            self._cache_tool(tool)
+                    return result
+                elif isinstance(result, types.ListToolsResult):
                     # Refresh the tool cache with returned tools
                     for tool in result.tools:
-                        validate_and_warn_tool_name(tool.name)
-                        self._tool_cache[tool.name] = tool
+                        self._cache_tool(tool)
                     return result
                 else:
                     # Old style returns list[Tool]
                     # Clear and refresh the entire tool cache
                     self._tool_cache.clear()
                     for tool in result:
-                        validate_and_warn_tool_name(tool.name)
-                        self._tool_cache[tool.name] = tool
+                        self._cache_tool(tool)
+                    for name in self._tool_validators.keys() - self._tool_cache.keys():
+                        del self._tool_validators[name]
                     return types.ListToolsResult(tools=result)
 
             self.request_handlers[types.ListToolsRequest] = handler
@@ -479,6 +558,18 @@ class Server(Generic[LifespanResultT, RequestT]):
 
         return decorator
 
+    def _cache_tool(self, tool: types.Tool) -> None:
+        validate_and_warn_tool_name(tool.name)
+        self._tool_cache[tool.name] = tool
+        self._tool_cache_misses.pop(tool.name, None)
+        # Keep the compiled validators across refreshes unless the definition actually changed
+        validators = self._tool_validators.get(tool.name)
+        if validators is not None and validators.tool is not tool:
+            if validators.tool == tool:
+                validators.tool = tool
+            else:
+                del self._tool_validators[tool.name]
+
     def _make_error_result(self, error_message: str) -> types.CallToolResult:
         """Create a CallToolResult with an error."""
         return types.CallToolResult(
@@ -489,12 +580,20 @@ class Server(Generic[LifespanResultT, RequestT]):
     async def _get_cached_tool_definition(self, tool_name: str) -> types.Tool | None:
         """Get tool definition from cache, refreshing if necessary.
 
+        Concurrent misses share one refresh, and a name that is still missing afterwards
+        is not looked up again for `tool_cache_miss_ttl` seconds.
+
         Returns the Tool object if found, None otherwise.
         """
-        if tool_name not in self._tool_cache:
-            if types.ListToolsRequest in self.request_handlers:
+        if tool_name not in self._tool_cache and types.ListToolsRequest in self.request_handlers:
+            expires_at = self._tool_cache_misses.get(tool_name)
+            if expires_at is None or expires_at <= anyio.current_time():
                 logger.debug("Tool cache miss for %s, refreshing cache", tool_name)
-                await self.request_handlers[types.ListToolsRequest](None)
+                await self._refresh_tool_cache()
+                if tool_name not in self._tool_cache and self.tool_cache_miss_ttl > 0:
+                    if len(self._tool_cache_misses) >= _MAX_TOOL_CACHE_MISSES:
+                        self._tool_cache_misses.clear()
+                    self._tool_cache_misses[tool_name] = anyio.current_time() + self.tool_cache_miss_ttl
 
         tool = self._tool_cache.get(tool_name)
         if tool is None:
@@ -502,6 +601,53 @@ class Server(Generic[LifespanResultT, RequestT]):
 
         return tool
 
+    async def _refresh_tool_cache(self) -> None:
+        """List the tools to refresh the cache, or wait for the refresh already running.
+
+        A refresh whose caller was cancelled is run again by one of the callers waiting on it.
+
+        Raises:
+            Exception: Whatever listing the tools raised, in every caller sharing the refresh.
+        """
+        while (refresh := self._tool_cache_refresh) is not None:
+            await refresh.done.wait()
+            if refresh.error is not None:
+                raise refresh.error
+            if refresh.completed:
+                return
+
+        refresh = self._tool_cache_refresh = _ToolCacheRefresh()
+        try:
+            await self.request_handlers[types.ListToolsRequest](None)
+            refresh.completed = True
+        except Exception as e:
+            refresh.error = e
+            raise
+        finally:
+            refresh.done.set()
+            self._tool_cache_refresh = None
+
+    def invalidate_tool_cache(self) -> None:
+        """Forget cached tool definitions, so the next tool call lists tools again.
+
+        Call this when the set of tools changes. `ServerSession.send_tool_list_changed`
+        does so for sessions run by this server.
+        """
+        self._tool_cache.clear()
+        self._tool_cache_misses.clear()
+        self._listed_tools = None
+
+    def add_resource_updated_callback(self, callback: Callable[[str], None]) -> None:
+        """Register a callback run with the URI whenever a session of this server sends `resources/updated`."""
+        self._resource_updated_callbacks.append(callback)
+
+    def _get_tool_validators(self, tool: types.Tool) -> ToolValidators:
+        """Get the compiled schema validators for a tool, rebuilding them if its definition changed."""
+        validators = self._tool_validators.get(tool.name)
+        if validators is None or validators.tool is not tool:
+            validators = self._tool_validators[tool.name] = ToolValidators(tool)
+        return validators
+
     def call_tool(self, *, validate_input: bool = True):
         """Register a tool call handler.
 
@@ -532,6 +678,8 @@ class Server(Generic[LifespanResultT, RequestT]):
             logger.debug("Registering handler for CallToolRequest")
 
             async def handler(req: types.CallToolRequest):
+                import jsonschema
+
                 try:
                     tool_name = req.params.name
                     arguments = req.params.arguments or {}
@@ -540,7 +688,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                     # input validation
                     if validate_input and tool:
                         try:
-                            jsonschema.validate(instance=arguments, schema=tool.input_schema)
+                            self._get_tool_validators(tool).validate_input(arguments)
                         except jsonschema.ValidationError as e:
                             return self._make_error_result(f"Input validation error: {e.message}")
 
@@ -577,7 +725,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                             )
                         else:
                             try:
-                                jsonschema.validate(instance=maybe_structured_content, schema=tool.output_schema)
+                                self._get_tool_validators(tool).validate_output(maybe_structured_content)
                             except jsonschema.ValidationError as e:
                                 return self._make_error_result(f"Output validation error: {e.message}")
 
@@ -673,12 +821,20 @@ class Server(Generic[LifespanResultT, RequestT]):
                 )
             )
 
+            session.add_tool_list_changed_callback(self.invalidate_tool_cache)
+            for callback in self._resource_updated_callbacks:
+                session.add_resource_updated_callback(callback)
+
             # Configure task support for this session if enabled
             task_support = self._experimental_handlers.task_support if self._experimental_handlers else None
             if task_support is not None:
                 task_support.configure_session(session)
                 await stack.enter_async_context(task_support.run())
 
+            if self.max_concurrent_requests is not None:
+                await self._run_bounded(session, lifespan_context, raise_exceptions, self.max_concurrent_requests)
+                return
+
             async with anyio.create_task_group() as tg:
                 async for message in session.incoming_messages:
                     logger.debug("Received message: %s", message)
@@ -691,6 +847,56 @@ class Server(Generic[LifespanResultT, RequestT]):
                         raise_exceptions,
                     )
 
+    async def _run_bounded(
+        self,
+        session: ServerSession,
+        lifespan_context: LifespanResultT,
+        raise_exceptions: bool,
+        max_concurrent_requests: int,
+    ) -> None:
+        """Handle requests with a fixed pool of workers fed by a bounded queue.
+
+        A request that finds the queue full is rejected with `SERVER_BUSY` rather than
+        waited on: this loop must keep reading, as responses to the server's own requests
+        (sampling, elicitation) arrive through it too, and handlers waiting on them hold
+        their slots. Notifications skip the queue; they are cheap and include cancellations.
+        A request cancelled while queued is answered at once and skipped by the workers.
+        """
+        metrics = self.request_metrics
+        queue_writer, queue_reader = anyio.create_memory_object_stream[
+            tuple[RequestResponder[types.ClientRequest, types.ServerResult], float]
+        ](self.max_queued_requests)
+
+        async def worker() -> None:
+            async for message, enqueued_at in queue_reader:
+                metrics.record_dispatched(anyio.current_time() - enqueued_at)
+                if message.cancelled:
+                    continue
+                metrics.running += 1
+                try:
+                    await self._handle_message(message, session, lifespan_context, raise_exceptions)
+                finally:
+                    metrics.running -= 1
+
+        async with anyio.create_task_group() as tg, queue_reader:
+            for _ in range(max_concurrent_requests):
+                tg.start_soon(worker)
+
+            async with queue_writer:
+                async for message in session.incoming_messages:
+                    logger.debug("Received message: %s", message)
+
+                    if isinstance(message, RequestResponder):
+                        try:
+                            queue_writer.send_nowait((message, anyio.current_time()))
+                        except anyio.WouldBlock:
+                            metrics.rejected += 1
+                            tg.start_soon(_reject_busy, message)
+                        else:
+                            metrics.record_enqueued()
+                    else:
+                        tg.start_soon(self._handle_message, message, session, lifespan_context, raise_exceptions)
+
     async def _handle_message(
         self,
         message: RequestResponder[types.ClientRequest, types.ServerResult] | types.ClientNotification | Exception,
@@ -701,6 +907,9 @@ class Server(Generic[LifespanResultT, RequestT]):
         with warnings.catch_warnings(record=True) as w:
             match message:
                 case RequestResponder() as responder:
+                    if responder.cancelled:
+                        # Cancelled before its task got here; cancel() has already answered it
+                        return
                     with responder:
                         await self._handle_request(
                             message, responder.request, session, lifespan_context, raise_exceptions
@@ -816,8 +1025,24 @@ class Server(Generic[LifespanResultT, RequestT]):
         auth_server_provider: OAuthAuthorizationServerProvider[Any, Any, Any] | None = None,
         custom_starlette_routes: list[Route] | None = None,
         debug: bool = False,
+        codec: Codec = DEFAULT_CODEC,
     ) -> Starlette:
         """Return an instance of the StreamableHTTP server app."""
+        from starlette.applications import Starlette
+        from starlette.middleware import Middleware
+        from starlette.middleware.authentication import AuthenticationMiddleware
+        from starlette.routing import Mount, Route
+
+        from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
+        from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend, RequireAuthMiddleware
+        from mcp.server.auth.routes import (
+            build_resource_metadata_url,
+            create_auth_routes,
+            create_protected_resource_routes,
+        )
+        from mcp.server.streamable_http_manager import StreamableHTTPASGIApp, StreamableHTTPSessionManager
+        from mcp.server.transport_security import TransportSecuritySettings
+
         # Auto-enable DNS rebinding protection for localhost (IPv4 and IPv6)
         if transport_security is None and host in ("127.0.0.1", "localhost", "::1"):
             transport_security = TransportSecuritySettings(
@@ -833,6 +1058,7 @@ class Server(Generic[LifespanResultT, RequestT]):
             json_response=json_response,
             stateless=stateless_http,
             security_settings=transport_security,
+            codec=codec,
         )
         self._session_manager = session_manager
 
@@ -916,3 +1142,27 @@ class Server(Generic[LifespanResultT, RequestT]):
 
 async def _ping_handler(request: types.PingRequest) -> types.ServerResult:
     return types.EmptyResult()
+
+
+async def _reject_busy(responder: RequestResponder[types.ClientRequest, types.ServerResult]) -> None:
+    with responder:
+        await responder.respond(
+            types.ErrorData(code=types.SERVER_BUSY, message="Server busy: too many requests queued, retry later")
+        )
+
+
+def _base64_encode(data: bytes | memoryview) -> str:
+    """Base64-encode `data` a chunk at a time into one output buffer.
+
+    Encoding a memoryview of a mapped file this way reads it straight from the page
+    cache, so the blob is never copied into memory whole before being encoded.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) <= _BASE64_CHUNK_SIZE:
+        return binascii.b2a_base64(view, newline=False).decode("ascii")
+    encoded = bytearray((len(view) + 2) // 3 * 4)
+    for start in range(0, len(view), _BASE64_CHUNK_SIZE):
+        chunk = binascii.b2a_base64(view[start : start + _BASE64_CHUNK_SIZE], newline=False)
+        position = start // 3 * 4
+        encoded[position : position + len(chunk)] = chunk
+    return encoded.decode("ascii")
@@ -2,7 +2,7 @@
 
 from mcp.types import Icon
 
-from .server import Context, MCPServer
+from .server import Context, MCPServer, PerformanceSettings
 from .utilities.types import Audio, Image
 
-__all__ = ["MCPServer", "Context", "Image", "Audio", "Icon"]
+__all__ = ["MCPServer", "Context", "PerformanceSettings", "Image", "Audio", "Icon"]
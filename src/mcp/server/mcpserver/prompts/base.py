@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 from collections.abc import Awaitable, Callable, Sequence
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import pydantic_core
-from pydantic import BaseModel, Field, TypeAdapter, validate_call
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, validate_call
 
 from mcp.server.mcpserver.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.mcpserver.utilities.executors import Executor, ProcessExecutor, is_async_callable, run_sync
 from mcp.server.mcpserver.utilities.func_metadata import func_metadata
 from mcp.types import ContentBlock, Icon, TextContent
 
@@ -63,7 +65,10 @@ class PromptArgument(BaseModel):
 
 
 class Prompt(BaseModel):
-    """A prompt template that can be rendered with parameters."""
+    """A prompt template that can be rendered with parameters.
+
+    A sync function runs on `executor`, so that it does not block the event loop.
+    """
 
     name: str = Field(description="Name of the prompt")
     title: str | None = Field(None, description="Human-readable title of the prompt")
@@ -72,6 +77,18 @@ class Prompt(BaseModel):
     fn: Callable[..., PromptResult | Awaitable[PromptResult]] = Field(exclude=True)
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this prompt")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context", exclude=True)
+    executor: Executor | None = Field(
+        default=None, exclude=True, description="Where a sync function runs; None uses anyio's default thread pool"
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _is_async: bool = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        if isinstance(self.executor, ProcessExecutor):
+            raise ValueError(f"Prompt {self.name} cannot run in a worker process: only tools can")
+        self._is_async = is_async_callable(self.fn)
 
     @classmethod
     def from_function(
@@ -82,6 +99,7 @@ class Prompt(BaseModel):
         description: str | None = None,
         icons: list[Icon] | None = None,
         context_kwarg: str | None = None,
+        executor: Executor | None = None,
     ) -> Prompt:
         """Create a Prompt from a function.
 
@@ -131,6 +149,7 @@ class Prompt(BaseModel):
             fn=fn,
             icons=icons,
             context_kwarg=context_kwarg,
+            executor=executor,
         )
 
     async def render(
@@ -151,8 +170,12 @@ class Prompt(BaseModel):
             # Add context to arguments if needed
             call_args = inject_context(self.fn, arguments or {}, context, self.context_kwarg)
 
-            # Call function and check if result is a coroutine
-            result = self.fn(**call_args)
+            result: Any
+            if self._is_async:
+                result = await cast(Awaitable[PromptResult], self.fn(**call_args))
+            else:
+                result = await run_sync(functools.partial(self.fn, **call_args), self.executor)
+            # A sync callable may still hand back a coroutine
             if inspect.iscoroutine(result):
                 result = await result
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from mcp.server.mcpserver.prompts.base import Message, Prompt
 from mcp.server.mcpserver.utilities.logging import get_logger
+from mcp.server.mcpserver.utilities.pagination import Paginator
 
 if TYPE_CHECKING:
     from mcp.server.context import LifespanContextT, RequestT
@@ -17,9 +18,12 @@ logger = get_logger(__name__)
 class PromptManager:
     """Manages MCPServer prompts."""
 
-    def __init__(self, warn_on_duplicate_prompts: bool = True):
+    def __init__(self, warn_on_duplicate_prompts: bool = True, *, page_size: int | None = None):
         self._prompts: dict[str, Prompt] = {}
+        self._paginator: Paginator[Prompt] = Paginator(page_size)
         self.warn_on_duplicate_prompts = warn_on_duplicate_prompts
+        # Bumped whenever a prompt is added, so listings can be cached until then.
+        self.version = 0
 
     def get_prompt(self, name: str) -> Prompt | None:
         """Get prompt by name."""
@@ -29,6 +33,14 @@ class PromptManager:
         """List all registered prompts."""
         return list(self._prompts.values())
 
+    def list_prompts_page(self, cursor: str | None = None) -> tuple[list[Prompt], str | None]:
+        """List a page of prompts after `cursor`, with the cursor for the next page if there is one.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        return self._paginator.page(self._prompts, self.version, cursor)
+
     def add_prompt(
         self,
         prompt: Prompt,
@@ -43,6 +55,8 @@ class PromptManager:
             return existing
 
         self._prompts[prompt.name] = prompt
+        self._paginator.added(prompt.name)
+        self.version += 1
         return prompt
 
     async def render_prompt(
@@ -1,4 +1,7 @@
 from .base import Resource
+from .directory_index import DirectoryIndex, DirectoryIndexMetrics, DirectoryWatcher
+from .file_cache import FileCache, FileCacheMetrics
+from .read_cache import ResourceCacheConfig, ResourceCacheMetrics
 from .resource_manager import ResourceManager
 from .templates import ResourceTemplate
 from .types import (
@@ -18,6 +21,13 @@ __all__ = [
     "FileResource",
     "HttpResource",
     "DirectoryResource",
+    "DirectoryIndex",
+    "DirectoryIndexMetrics",
+    "DirectoryWatcher",
     "ResourceTemplate",
     "ResourceManager",
+    "ResourceCacheConfig",
+    "ResourceCacheMetrics",
+    "FileCache",
+    "FileCacheMetrics",
 ]
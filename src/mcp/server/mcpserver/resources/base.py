@@ -11,6 +11,7 @@ from pydantic import (
     field_validator,
 )
 
+from mcp.shared.resource_ranges import content_length, slice_content
 from mcp.types import Annotations, Icon
 
 
@@ -42,7 +43,25 @@ class Resource(BaseModel, abc.ABC):
             return str(uri)
         raise ValueError("Either name or uri must be provided")
 
+    @property
+    def reads_ranges(self) -> bool:
+        """Whether `read_range` reads just the range, rather than reading the whole content to slice it.
+
+        A server reads the whole content of resources that do not once for a chunked
+        read, and slices it for each chunk (see `MCPServer.read_resource`).
+        """
+        return type(self).read_range is not Resource.read_range
+
     @abc.abstractmethod
-    async def read(self) -> str | bytes:
+    async def read(self) -> str | bytes | memoryview:
         """Read the resource content."""
         pass  # pragma: no cover
+
+    async def read_range(self, offset: int, length: int) -> tuple[str | bytes | memoryview, int | None]:
+        """Read `length` bytes, or characters of text, from `offset`, and the size of the whole content if known.
+
+        This reads the whole content and slices it; resources that can read part of
+        their content directly override it, and `reads_ranges`.
+        """
+        content = await self.read()
+        return slice_content(content, offset, length), content_length(content)
@@ -0,0 +1,335 @@
+"""An index of the files under a directory, kept up to date without listing the whole tree again.
+
+Listing a large tree with `glob` costs a system call for every entry. The index lists
+it once, remembering the modification time of every directory it listed. Creating,
+deleting or renaming an entry changes the modification time of the directory holding
+it, so a refresh only has to stat each directory, and lists again just those that
+changed. On Linux, `DirectoryWatcher` goes further: inotify reports which directories
+changed, so a refresh lists those without statting the others.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import math
+import os
+import re
+import select
+import struct
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# A directory modified this soon before it was listed may have changed again within
+# the resolution of its modification time, so it is listed again until it is older.
+_RACY_NS = 2_000_000_000
+
+
+@dataclass
+class _Directory:
+    mtime_ns: int
+    listed_at_ns: int
+    files: set[str] = field(default_factory=set[str])
+    subdirectories: set[str] = field(default_factory=set[str])
+
+
+@dataclass
+class DirectoryIndexMetrics:
+    """Counters for a `DirectoryIndex`."""
+
+    refreshes: int = 0
+    """Refreshes, including the first listing."""
+
+    directories_listed: int = 0
+    """Directories listed, by the first listing and by refreshes that found them changed."""
+
+    changes: int = 0
+    """Refreshes that found files added or removed."""
+
+
+def _join(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+def compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Return a test of whether a relative path matches the glob `pattern`.
+
+    The pattern matches from the right, component by component, as `PurePath.match`
+    and `Path.rglob` do: `*.py` matches Python files at any depth, `tests/*.py` those
+    directly in a `tests` directory.
+    """
+    regexes = [re.compile(fnmatch.translate(part)) for part in pattern.split("/")]
+    if len(regexes) == 1:
+        regex = regexes[0]
+        return lambda path: regex.match(path.rpartition("/")[2]) is not None
+
+    def match(path: str) -> bool:
+        names = path.split("/")
+        if len(names) < len(regexes):
+            return False
+        return all(regex.match(name) for regex, name in zip(regexes, names[-len(regexes) :]))
+
+    return match
+
+
+class DirectoryIndex:
+    """The sorted relative paths of the files in a directory, or in its whole tree.
+
+    `refresh` lists the directory the first time, and afterwards lists again only the
+    directories whose modification time changed, or those it is told changed. Symbolic
+    links to files are listed as files; symbolic links to directories are not followed.
+
+    Refreshes run in worker threads, so they are serialized by a lock. `files` is never
+    changed in place: a refresh that finds changes replaces it, so readers can keep
+    the list they got.
+    """
+
+    def __init__(self, path: Path, recursive: bool = False) -> None:
+        self.path = path
+        self.recursive = recursive
+        self.version = 0
+        self.metrics = DirectoryIndexMetrics()
+        self._directories: dict[str, _Directory] = {}
+        self._files: list[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def files(self) -> list[str]:
+        """The relative paths of the files found by the last refresh, with `/` separators, in sorted order."""
+        return self._files
+
+    @property
+    def directories(self) -> list[str]:
+        """The relative paths of the directories indexed, the directory itself being `""`."""
+        with self._lock:
+            return list(self._directories)
+
+    def refresh(self, changed: Iterable[str] | None = None) -> bool:
+        """Bring the index up to date, and return whether files were added or removed.
+
+        Args:
+            changed: Relative paths of the directories known to have changed, as reported
+                by a watcher, to list again without checking any other. None checks the
+                modification time of every directory.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+            NotADirectoryError: If the path is not a directory.
+        """
+        with self._lock:
+            self.metrics.refreshes += 1
+            # The first and last change seen for each path: a path can be dropped with
+            # its directory and found again when the directory is listed anew.
+            changes: dict[str, tuple[bool, bool]] = {}
+            if "" not in self._directories:
+                if not self.path.exists():
+                    raise FileNotFoundError(f"Directory not found: {self.path}")
+                if not self.path.is_dir():
+                    raise NotADirectoryError(f"Not a directory: {self.path}")
+                self._list("", changes)
+            elif changed is None:
+                for directory, entry in list(self._directories.items()):
+                    if directory not in self._directories:
+                        continue  # Dropped with a parent listed before it
+                    try:
+                        mtime_ns = os.stat(self.path / directory).st_mtime_ns
+                    except (FileNotFoundError, NotADirectoryError):
+                        if not directory:
+                            raise
+                        continue  # Its parent changed too, and listing it drops this one  # pragma: lax no cover
+                    if mtime_ns != entry.mtime_ns or entry.listed_at_ns - entry.mtime_ns < _RACY_NS:
+                        self._list(directory, changes)
+            else:
+                for directory in changed:
+                    if directory in self._directories:
+                        self._list(directory, changes)
+
+            added = sorted(path for path, (first, last) in changes.items() if first and last)
+            removed = {path for path, (first, last) in changes.items() if not first and not last}
+            if not added and not removed:
+                return False
+            files = [path for path in self._files if path not in removed] if removed else self._files
+            # Both lists are sorted, which sorting their concatenation takes advantage of
+            self._files = sorted(files + added) if added else files
+            self.version += 1
+            self.metrics.changes += 1
+            return True
+
+    def page(
+        self, after: str | None = None, limit: int | None = None, match: Callable[[str], bool] | None = None
+    ) -> tuple[list[str], bool]:
+        """Return the files after `after` that `match`, at most `limit` of them, and whether more follow.
+
+        Starting after a path rather than at a position keeps pages consistent while
+        files are added or removed between them.
+        """
+        files = self._files
+        candidates: Iterator[str] = iter(files[bisect_right(files, after) :] if after is not None else files)
+        if match is not None:
+            candidates = filter(match, candidates)
+        page: list[str] = []
+        for path in candidates:
+            if len(page) == limit:
+                return page, True
+            page.append(path)
+        return page, False
+
+    def _list(self, directory: str, changes: dict[str, tuple[bool, bool]]) -> None:
+        """List `directory` and the subdirectories that appeared in it, noting the files added and removed."""
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            listed_at_ns = time.time_ns()
+            files: set[str] = set()
+            subdirectories: set[str] = set()
+            try:
+                mtime_ns = os.stat(self.path / current).st_mtime_ns
+                with os.scandir(self.path / current) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            files.add(entry.name)
+                        elif self.recursive and entry.is_dir(follow_symlinks=False):
+                            subdirectories.add(entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                if not current:
+                    raise
+                self._drop(current, changes)
+                continue
+            self.metrics.directories_listed += 1
+
+            previous = self._directories.get(current) or _Directory(0, 0)
+            self._directories[current] = _Directory(mtime_ns, listed_at_ns, files, subdirectories)
+            for name in files - previous.files:
+                _note(changes, _join(current, name), True)
+            for name in previous.files - files:
+                _note(changes, _join(current, name), False)
+            for name in previous.subdirectories - subdirectories:
+                self._drop(_join(current, name), changes)
+            pending.extend(_join(current, name) for name in subdirectories - previous.subdirectories)
+
+    def _drop(self, directory: str, changes: dict[str, tuple[bool, bool]]) -> None:
+        """Forget `directory` and everything indexed under it, noting its files as removed."""
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            entry = self._directories.pop(current, None)
+            if entry is None:  # pragma: lax no cover
+                continue  # Removed before it could be listed
+            for name in entry.files:
+                _note(changes, _join(current, name), False)
+            pending.extend(_join(current, name) for name in entry.subdirectories)
+
+
+def _note(changes: dict[str, tuple[bool, bool]], path: str, present: bool) -> None:
+    first = changes[path][0] if path in changes else present
+    changes[path] = (first, present)
+
+
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_WATCH_MASK = (
+    _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+)
+_EVENT = struct.Struct("iIII")
+
+
+class DirectoryWatcher:
+    """Reports which directories of a `DirectoryIndex` changed, with Linux's inotify.
+
+    Call `sync` after every refresh of the index to watch the directories it found
+    and stop watching those it dropped, then `wait` for changes.
+
+    Raises:
+        OSError: If inotify is not available, as on other systems than Linux.
+    """
+
+    def __init__(self, index: DirectoryIndex) -> None:
+        self.index = index
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):  # pragma: no cover
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc = libc
+        self._fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:  # pragma: no cover
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # poll rather than select, which cannot wait on descriptors numbered 1024 or higher
+        self._poll = select.poll()
+        self._poll.register(self._fd, select.POLLIN)
+        self._directories: dict[int, str] = {}
+        self._watches: dict[str, int] = {}
+
+    def sync(self) -> set[str]:
+        """Watch the directories the index holds that are not watched yet, and return them.
+
+        A directory may change between being listed and being watched, so the index
+        should list those returned again.
+
+        Raises:
+            OSError: If a directory cannot be watched, e.g. for lack of inotify watches.
+        """
+        directories = set(self.index.directories)
+        for directory in set(self._watches) - directories:
+            self._libc.inotify_rm_watch(self._fd, self._watches.pop(directory))
+        added: set[str] = set()
+        for directory in directories - set(self._watches):
+            path = os.fsencode(self.index.path / directory)
+            wd: int = self._libc.inotify_add_watch(self._fd, path, _WATCH_MASK)
+            if wd < 0:  # pragma: lax no cover
+                error = ctypes.get_errno()
+                if error in (errno.ENOENT, errno.ENOTDIR):
+                    continue  # Removed since; the next refresh drops it
+                raise OSError(error, f"Cannot watch {self.index.path / directory}: {os.strerror(error)}")
+            # The kernel hands back the same descriptor for a directory already watched under another name
+            if (previous := self._directories.get(wd)) is not None:  # pragma: no cover
+                del self._watches[previous]
+            self._directories[wd] = directory
+            self._watches[directory] = wd
+            added.add(directory)
+        return added
+
+    def wait(self, timeout: float) -> set[str] | None:
+        """Wait up to `timeout` seconds for changes, and return the directories that changed.
+
+        Returns an empty set if nothing changed in time, and None if the kernel dropped
+        events, in which case every directory must be checked.
+        """
+        changed: set[str] = set()
+        if not self._poll.poll(math.ceil(timeout * 1000)):
+            return changed
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:  # pragma: no cover
+                    return None
+                # Events still queued for directories no longer watched are ignored
+                if (directory := self._directories.get(wd)) is not None:  # pragma: lax no cover
+                    changed.add(directory)
+
+    def close(self) -> None:
+        os.close(self._fd)
@@ -0,0 +1,103 @@
+"""A cache of file contents shared by `FileResource`s, kept while the files are unchanged.
+
+Without it every read of a `FileResource` loads the whole file again, so concurrent
+readers of a large file each hold their own copy of it. With it, readers share the
+contents loaded by the first, for as long as the file's modification time, size
+and inode stay the same.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+FileContents = str | bytes | memoryview
+
+# What identifies one version of a file: its modification time, size and inode
+_Version = tuple[int, int, int]
+
+
+def _version(stat: os.stat_result) -> _Version:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+@dataclass
+class FileCacheMetrics:
+    """Counters for a `FileCache`."""
+
+    hits: int = 0
+    """Reads answered from the cache."""
+
+    misses: int = 0
+    """Reads that loaded the file, because it was not cached or had changed."""
+
+    evictions: int = 0
+    """Contents dropped to stay within the size limit."""
+
+
+class FileCache:
+    """A least-recently-used cache of file contents, bounded by the total size of the files.
+
+    Pass one instance to every `FileResource` that should share it. Each read stats
+    the file and serves the cached contents only if its modification time, size and
+    inode are those of the file the contents were loaded from, so a file that is
+    rewritten or replaced is loaded again. Mapped contents count towards `max_bytes`
+    too, as they keep the file's pages mapped for as long as they are cached.
+
+    Reads run in worker threads, so the cache is safe to use from several at once.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.metrics = FileCacheMetrics()
+        self._entries: OrderedDict[Hashable, tuple[_Version, FileContents]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, path: os.PathLike[str], load: Callable[[], tuple[os.stat_result, FileContents]]
+    ) -> FileContents:
+        """Return the contents cached under `key` if `path` is unchanged since, or `load()` them.
+
+        `load` returns the contents together with the stat of the file they were read
+        from, taken from the open file so the two agree.
+        """
+        version = _version(os.stat(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.metrics.hits += 1
+                return entry[1]
+            self.metrics.misses += 1
+
+        stat, contents = load()
+        with self._lock:
+            self._put(key, _version(stat), contents)
+        return contents
+
+    def clear(self) -> None:
+        """Forget every cached file."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _put(self, key: Hashable, version: _Version, contents: FileContents) -> None:
+        if (previous := self._entries.pop(key, None)) is not None:
+            self.size -= previous[0][1]
+        size = version[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (version, contents)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, ((_, evicted_size, _), _) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.metrics.evictions += 1
@@ -0,0 +1,156 @@
+"""Opt-in caching of resource contents, with concurrent reads of a URI coalesced.
+
+When many sessions open the same resource at once, each `resources/read` would run
+the function behind it again. A resource or template that opts in has its contents
+kept for a while under the URI that was read, and reads of a URI that is already
+being read wait for that read instead of starting their own.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+import anyio
+
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ResourceCacheConfig:
+    """How long the contents of one resource, or of each URI a template expands to, are kept."""
+
+    ttl: float = 60.0
+    """Seconds contents are served before the resource is read again."""
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+
+@dataclass
+class ResourceCacheMetrics:
+    """Counters for a server's resource read cache."""
+
+    hits: int = 0
+    """Reads answered from the cache."""
+
+    misses: int = 0
+    """Reads of cacheable resources that had to read them."""
+
+    coalesced: int = 0
+    """Reads that waited for a read of the same URI already in progress."""
+
+    evictions: int = 0
+    """Contents dropped to stay within the size limit."""
+
+    expirations: int = 0
+    """Contents found too old to serve."""
+
+
+Contents = Sequence[ReadResourceContents]
+
+
+def contents_size(contents: Contents) -> int:
+    """The bytes `contents` take up, counting text as UTF-8."""
+    return sum(
+        len(item.content.encode()) if isinstance(item.content, str) else memoryview(item.content).nbytes
+        for item in contents
+    )
+
+
+class _Read:
+    """A read in progress, which other reads of the same URI wait for."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.contents: Contents | None = None
+        self.error: Exception | None = None
+        # Set when the resource was updated while this read ran, so its contents may be outdated
+        self.stale = False
+
+
+class ResourceReadCache:
+    """A least-recently-used cache of resource contents by URI, bounded by their total size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.metrics = ResourceCacheMetrics()
+        self._entries: OrderedDict[str, tuple[float, int, Contents]] = OrderedDict()
+        self._reads: dict[str, _Read] = {}
+
+    async def get(self, uri: str, config: ResourceCacheConfig, read: Callable[[], Awaitable[Contents]]) -> Contents:
+        """Return the contents cached for `uri`, or those of a read in progress, or `read()` them."""
+        while True:
+            if (contents := self._fresh(uri)) is not None:
+                self.metrics.hits += 1
+                return contents
+            in_progress = self._reads.get(uri)
+            if in_progress is None:
+                break
+            self.metrics.coalesced += 1
+            await in_progress.done.wait()
+            if in_progress.error is not None:
+                raise in_progress.error
+            if in_progress.contents is not None:
+                return in_progress.contents
+            # The read was cancelled, so start another
+
+        self.metrics.misses += 1
+        current = self._reads[uri] = _Read()
+        try:
+            contents = current.contents = await read()
+        except Exception as e:
+            current.error = e
+            raise
+        finally:
+            if self._reads.get(uri) is current:
+                del self._reads[uri]
+            current.done.set()
+        if not current.stale:
+            self._put(uri, config, contents)
+        return contents
+
+    def invalidate(self, uri: str | None = None) -> None:
+        """Forget the contents cached for `uri`, or for every URI.
+
+        Reads already in progress still complete, but their contents are not kept, and
+        later reads do not wait for them.
+        """
+        for key in [uri] if uri is not None else list(self._entries):
+            if (entry := self._entries.pop(key, None)) is not None:
+                self.size -= entry[1]
+        for key in [uri] if uri is not None else list(self._reads):
+            if (in_progress := self._reads.pop(key, None)) is not None:
+                in_progress.stale = True
+
+    def _fresh(self, uri: str) -> Contents | None:
+        entry = self._entries.get(uri)
+        if entry is None:
+            return None
+        expires_at, size, contents = entry
+        if expires_at <= time.monotonic():
+            del self._entries[uri]
+            self.size -= size
+            self.metrics.expirations += 1
+            return None
+        self._entries.move_to_end(uri)
+        return contents
+
+    def _put(self, uri: str, config: ResourceCacheConfig, contents: Contents) -> None:
+        size = contents_size(contents)
+        if size > self.max_bytes:
+            return
+        self._entries[uri] = (time.monotonic() + config.ttl, size, contents)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.metrics.evictions += 1
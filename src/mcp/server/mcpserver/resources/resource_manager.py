@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from pydantic import AnyUrl
 
 from mcp.server.mcpserver.resources.base import Resource
+from mcp.server.mcpserver.resources.read_cache import (
+    DEFAULT_MAX_BYTES,
+    Contents,
+    ResourceCacheConfig,
+    ResourceCacheMetrics,
+    ResourceReadCache,
+)
 from mcp.server.mcpserver.resources.templates import ResourceTemplate
+from mcp.server.mcpserver.resources.types import DirectoryResource
+from mcp.server.mcpserver.resources.uri_template import UriTemplateRouter
+from mcp.server.mcpserver.utilities.executors import Executor
 from mcp.server.mcpserver.utilities.logging import get_logger
+from mcp.server.mcpserver.utilities.pagination import Paginator
 from mcp.types import Annotations, Icon
 
 if TYPE_CHECKING:
@@ -18,20 +29,43 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+RANGED_READ_TTL = 30.0
+
+_RANGED_READ_CACHE = ResourceCacheConfig(ttl=RANGED_READ_TTL)
+
 
 class ResourceManager:
-    """Manages MCPServer resources."""
+    """Manages MCPServer resources.
+
+    Resources and templates added with a `cache` configuration have their contents
+    kept in a read cache shared by the manager, holding at most `cache_max_bytes`.
+    """
 
-    def __init__(self, warn_on_duplicate_resources: bool = True):
+    def __init__(
+        self,
+        warn_on_duplicate_resources: bool = True,
+        *,
+        page_size: int | None = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
+        self._template_router: UriTemplateRouter[ResourceTemplate] = UriTemplateRouter()
+        self._resource_paginator: Paginator[Resource] = Paginator(page_size)
+        self._template_paginator: Paginator[ResourceTemplate] = Paginator(page_size)
+        # Cache configurations by resource URI or URI template
+        self._cache_configs: dict[str, ResourceCacheConfig] = {}
+        self._read_cache = ResourceReadCache(cache_max_bytes)
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
+        # Bumped whenever a resource or template is added, so listings can be cached until then.
+        self.version = 0
 
-    def add_resource(self, resource: Resource) -> Resource:
+    def add_resource(self, resource: Resource, cache: ResourceCacheConfig | None = None) -> Resource:
         """Add a resource to the manager.
 
         Args:
             resource: A Resource instance to add
+            cache: Keep the resource's contents in the read cache, for `cache.ttl` seconds
 
         Returns:
             The added resource. If a resource with the same URI already exists,
@@ -51,6 +85,9 @@ class ResourceManager:
                 logger.warning(f"Resource already exists: {resource.uri}")
             return existing
         self._resources[str(resource.uri)] = resource
+        self._resource_paginator.added(str(resource.uri))
+        self._configure_cache(str(resource.uri), cache)
+        self.version += 1
         return resource
 
     def add_template(
@@ -64,8 +101,14 @@ class ResourceManager:
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
+        cache: ResourceCacheConfig | None = None,
+        executor: Executor | None = None,
     ) -> ResourceTemplate:
-        """Add a template from a function."""
+        """Add a template from a function.
+
+        With `cache`, the contents of each URI the template matches are kept in the
+        read cache, for `cache.ttl` seconds.
+        """
         template = ResourceTemplate.from_function(
             fn,
             uri_template=uri_template,
@@ -76,8 +119,13 @@ class ResourceManager:
             icons=icons,
             annotations=annotations,
             meta=meta,
+            executor=executor,
         )
         self._templates[template.uri_template] = template
+        self._template_router.add(template.parsed_uri_template, template)
+        self._configure_cache(template.uri_template, cache, template=True)
+        self._template_paginator.added(template.uri_template)
+        self.version += 1
         return template
 
     async def get_resource(
@@ -91,16 +139,76 @@ class ResourceManager:
         if resource := self._resources.get(uri_str):
             return resource
 
+        # A directory listing's URI with a query asks for a page of it
+        base, _, query = uri_str.partition("?")
+        if query and isinstance(directory := self._resources.get(base), DirectoryResource):
+            return directory.page_resource(uri_str, query)
+
         # Then check templates
-        for template in self._templates.values():
-            if params := template.matches(uri_str):
-                try:
-                    return await template.create_resource(uri_str, params, context=context)
-                except Exception as e:  # pragma: no cover
-                    raise ValueError(f"Error creating resource from template: {e}")
+        if match := self._template_router.match(uri_str):
+            template, params = match
+            try:
+                return await template.create_resource(uri_str, params, context=context)
+            except Exception as e:  # pragma: no cover
+                raise ValueError(f"Error creating resource from template: {e}")
 
         raise ValueError(f"Unknown resource: {uri}")
 
+    async def read_cached(self, uri: AnyUrl | str, read: Callable[[], Awaitable[Contents]]) -> Contents:
+        """Return `read()`, through the read cache if `uri` is of a resource or template that is cached.
+
+        Concurrent reads of a cached URI share one call of `read`.
+        """
+        config = self._cache_config(str(uri))
+        if config is None:
+            return await read()
+        return await self._read_cache.get(str(uri), config, read)
+
+    def caches(self, uri: AnyUrl | str) -> bool:
+        """Whether reads of `uri` go through the read cache."""
+        return self._cache_config(str(uri)) is not None
+
+    def reads_ranges(self, uri: AnyUrl | str) -> bool:
+        """Whether `uri` is of a resource that reads a range without reading its whole content.
+
+        Resources created by templates never do: the template's function returns it whole.
+        """
+        resource = self._resources.get(str(uri))
+        return resource is not None and resource.reads_ranges
+
+    async def read_for_ranges(self, uri: AnyUrl | str, read: Callable[[], Awaitable[Contents]]) -> Contents:
+        """Return `read()` through the read cache, to be sliced into ranges.
+
+        Contents of resources that are not cached otherwise are kept for
+        `RANGED_READ_TTL` seconds, so a client reading them chunk by chunk has them
+        read once rather than once per chunk.
+        """
+        config = self._cache_config(str(uri)) or _RANGED_READ_CACHE
+        return await self._read_cache.get(str(uri), config, read)
+
+    @property
+    def cache_metrics(self) -> ResourceCacheMetrics:
+        """Counters for the read cache."""
+        return self._read_cache.metrics
+
+    def invalidate_cache(self, uri: AnyUrl | str | None = None) -> None:
+        """Forget cached contents of `uri`, or of every resource."""
+        self._read_cache.invalidate(str(uri) if uri is not None else None)
+
+    def _cache_config(self, uri: str) -> ResourceCacheConfig | None:
+        key = uri if uri in self._resources else None
+        if key is None and (match := self._template_router.match(uri)):
+            key = match[0].uri_template
+        return self._cache_configs.get(key) if key is not None else None
+
+    def _configure_cache(self, key: str, cache: ResourceCacheConfig | None, *, template: bool = False) -> None:
+        if cache is not None:
+            self._cache_configs[key] = cache
+        else:
+            self._cache_configs.pop(key, None)
+        # A new template may take over URIs cached under another one
+        self._read_cache.invalidate(None if template else key)
+
     def list_resources(self) -> list[Resource]:
         """List all registered resources."""
         logger.debug("Listing resources", extra={"count": len(self._resources)})
@@ -110,3 +218,19 @@ class ResourceManager:
         """List all registered templates."""
         logger.debug("Listing templates", extra={"count": len(self._templates)})
         return list(self._templates.values())
+
+    def list_resources_page(self, cursor: str | None = None) -> tuple[list[Resource], str | None]:
+        """List a page of resources after `cursor`, with the cursor for the next page if there is one.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        return self._resource_paginator.page(self._resources, self.version, cursor)
+
+    def list_templates_page(self, cursor: str | None = None) -> tuple[list[ResourceTemplate], str | None]:
+        """List a page of templates after `cursor`, with the cursor for the next page if there is one.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        return self._template_paginator.page(self._templates, self.version, cursor)
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
-import re
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
-from urllib.parse import unquote
 
-from pydantic import BaseModel, Field, validate_call
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, validate_call
 
 from mcp.server.mcpserver.resources.types import FunctionResource, Resource
+from mcp.server.mcpserver.resources.uri_template import UriTemplate
 from mcp.server.mcpserver.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.mcpserver.utilities.executors import (
+    Executor,
+    InlineExecutor,
+    ProcessExecutor,
+    is_async_callable,
+    run_sync,
+)
 from mcp.server.mcpserver.utilities.func_metadata import func_metadata
 from mcp.types import Annotations, Icon
 
@@ -20,8 +27,15 @@ if TYPE_CHECKING:
     from mcp.server.mcpserver.server import Context
 
 
+# Resources created from a template only return what the template function already produced
+_created = InlineExecutor()
+
+
 class ResourceTemplate(BaseModel):
-    """A template for dynamically creating resources."""
+    """A template for dynamically creating resources.
+
+    A sync function runs on `executor`, so that it does not block the event loop.
+    """
 
     uri_template: str = Field(description="URI template with parameters (e.g. weather://{city}/current)")
     name: str = Field(description="Name of the resource")
@@ -34,6 +48,25 @@ class ResourceTemplate(BaseModel):
     fn: Callable[..., Any] = Field(exclude=True)
     parameters: dict[str, Any] = Field(description="JSON schema for function parameters")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
+    executor: Executor | None = Field(
+        default=None, exclude=True, description="Where a sync function runs; None uses anyio's default thread pool"
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _parsed_uri_template: UriTemplate = PrivateAttr()
+    _is_async: bool = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        if isinstance(self.executor, ProcessExecutor):
+            raise ValueError(f"Resource template {self.uri_template} cannot run in a worker process: only tools can")
+        self._parsed_uri_template = UriTemplate(self.uri_template)
+        self._is_async = is_async_callable(self.fn)
+
+    @property
+    def parsed_uri_template(self) -> UriTemplate:
+        """`uri_template`, parsed and compiled once."""
+        return self._parsed_uri_template
 
     @classmethod
     def from_function(
@@ -48,6 +81,7 @@ class ResourceTemplate(BaseModel):
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
         context_kwarg: str | None = None,
+        executor: Executor | None = None,
     ) -> ResourceTemplate:
         """Create a template from a function."""
         func_name = name or fn.__name__
@@ -80,6 +114,7 @@ class ResourceTemplate(BaseModel):
             fn=fn,
             parameters=parameters,
             context_kwarg=context_kwarg,
+            executor=executor,
         )
 
     def matches(self, uri: str) -> dict[str, Any] | None:
@@ -87,13 +122,7 @@ class ResourceTemplate(BaseModel):
 
         Extracted parameters are URL-decoded to handle percent-encoded characters.
         """
-        # Convert template to regex pattern
-        pattern = self.uri_template.replace("{", "(?P<").replace("}", ">[^/]+)")
-        match = re.match(f"^{pattern}$", uri)
-        if match:
-            # URL-decode all extracted parameter values
-            return {key: unquote(value) for key, value in match.groupdict().items()}
-        return None
+        return self._parsed_uri_template.match(uri)
 
     async def create_resource(
         self,
@@ -106,8 +135,11 @@ class ResourceTemplate(BaseModel):
             # Add context to params if needed
             params = inject_context(self.fn, params, context, self.context_kwarg)
 
-            # Call function and check if result is a coroutine
-            result = self.fn(**params)
+            if self._is_async:
+                result = await self.fn(**params)
+            else:
+                result = await run_sync(functools.partial(self.fn, **params), self.executor)
+            # A sync callable may still hand back a coroutine
             if inspect.iscoroutine(result):
                 result = await result
 
@@ -121,6 +153,7 @@ class ResourceTemplate(BaseModel):
                 annotations=self.annotations,
                 meta=self.meta,
                 fn=lambda: result,  # Capture result in closure
+                executor=_created,
             )
         except Exception as e:
             raise ValueError(f"Error creating resource from template: {e}")
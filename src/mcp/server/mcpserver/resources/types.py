@@ -1,21 +1,32 @@
 """Concrete resource implementations."""
 
+import base64
+import binascii
+import functools
 import inspect
 import json
-from collections.abc import Callable
+import mmap
+import os
+import urllib.parse
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
 import anyio
 import anyio.to_thread
-import httpx
 import pydantic
 import pydantic_core
-from pydantic import Field, ValidationInfo, validate_call
+from pydantic import ConfigDict, Field, PrivateAttr, ValidationInfo, validate_call
 
 from mcp.server.mcpserver.resources.base import Resource
+from mcp.server.mcpserver.resources.directory_index import DirectoryIndex, DirectoryWatcher, compile_pattern
+from mcp.server.mcpserver.resources.file_cache import FileCache, FileContents
+from mcp.server.mcpserver.utilities.executors import Executor, ProcessExecutor, is_async_callable, run_sync
+from mcp.server.mcpserver.utilities.logging import get_logger
 from mcp.types import Annotations, Icon
 
+logger = get_logger(__name__)
+
 
 class TextResource(Resource):
     """A resource that reads from a string."""
@@ -48,16 +59,29 @@ class FunctionResource(Resource):
     - str for text content (default)
     - bytes for binary content
     - other types will be converted to JSON
+
+    A sync function runs on `executor`, so that it does not block the event loop.
     """
 
     fn: Callable[[], Any] = Field(exclude=True)
+    executor: Executor | None = Field(
+        default=None, exclude=True, description="Where a sync function runs; None uses anyio's default thread pool"
+    )
 
-    async def read(self) -> str | bytes:
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _is_async: bool = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        if isinstance(self.executor, ProcessExecutor):
+            raise ValueError(f"Resource {self.uri} cannot run in a worker process: only tools can")
+        self._is_async = is_async_callable(self.fn)
+
+    async def read(self) -> str | bytes | memoryview:
         """Read the resource by calling the wrapped function."""
         try:
-            # Call the function first to see if it returns a coroutine
-            result = self.fn()
-            # If it's a coroutine, await it
+            result = await self.fn() if self._is_async else await run_sync(self.fn, self.executor)
+            # A sync callable may still hand back a coroutine
             if inspect.iscoroutine(result):
                 result = await result
 
@@ -84,6 +108,7 @@ class FunctionResource(Resource):
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
+        executor: Executor | None = None,
     ) -> "FunctionResource":
         """Create a FunctionResource from a function."""
         func_name = name or fn.__name__
@@ -103,6 +128,7 @@ class FunctionResource(Resource):
             icons=icons,
             annotations=annotations,
             meta=meta,
+            executor=executor,
         )
 
 
@@ -110,6 +136,14 @@ class FileResource(Resource):
     """A resource that reads from a file.
 
     Set is_binary=True to read file as binary data instead of text.
+
+    Set use_mmap=True to map a binary file into memory instead of reading it: the
+    contents are then a `memoryview` of the file's pages, which the server encodes
+    straight from the page cache, so large files are not copied into memory whole.
+    The file must not be truncated while mapped. Text is always read into a str.
+
+    Resources given the same `cache` share the contents of their files while the
+    files are unchanged.
     """
 
     path: Path = Field(description="Path to the file")
@@ -121,6 +155,12 @@ class FileResource(Resource):
         default="text/plain",
         description="MIME type of the resource content",
     )
+    use_mmap: bool = Field(default=False, description="Whether to map a binary file into memory instead of reading it")
+    cache: FileCache | None = Field(
+        default=None, exclude=True, description="Cache of file contents, shared with other resources given it"
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @pydantic.field_validator("path")
     @classmethod
@@ -139,15 +179,52 @@ class FileResource(Resource):
         mime_type = info.data.get("mime_type", "text/plain")
         return not mime_type.startswith("text/")
 
-    async def read(self) -> str | bytes:
+    async def read(self) -> FileContents:
         """Read the file content."""
         try:
-            if self.is_binary:
-                return await anyio.to_thread.run_sync(self.path.read_bytes)
-            return await anyio.to_thread.run_sync(self.path.read_text)
+            return await anyio.to_thread.run_sync(self._read_file)
         except Exception as e:
             raise ValueError(f"Error reading file {self.path}: {e}")
 
+    @property
+    def reads_ranges(self) -> bool:
+        """Only binary files that are not cached are read from an offset; text is decoded from the start."""
+        return self.is_binary and self.cache is None
+
+    async def read_range(self, offset: int, length: int) -> tuple[FileContents, int | None]:
+        """Read part of the file.
+
+        Binary files that are not cached are read from `offset` on, so only the part
+        is loaded. Text is decoded from the start, and cached contents are sliced.
+        """
+        if not self.is_binary or self.cache is not None:
+            return await super().read_range(offset, length)
+        try:
+            return await anyio.to_thread.run_sync(self._read_file_range, offset, length)
+        except Exception as e:
+            raise ValueError(f"Error reading file {self.path}: {e}")
+
+    def _read_file_range(self, offset: int, length: int) -> tuple[bytes, int]:
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length), os.fstat(f.fileno()).st_size
+
+    def _read_file(self) -> FileContents:
+        if self.cache is None:
+            return self._load()[1]
+        return self.cache.get((self.path, self.is_binary, self.use_mmap), self.path, self._load)
+
+    def _load(self) -> tuple[os.stat_result, FileContents]:
+        if not self.is_binary:
+            with open(self.path) as f:
+                return os.fstat(f.fileno()), f.read()
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            # Empty files cannot be mapped
+            if self.use_mmap and stat.st_size:
+                return stat, memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return stat, f.read()
+
 
 class HttpResource(Resource):
     """A resource that reads from an HTTP endpoint."""
@@ -157,6 +234,8 @@ class HttpResource(Resource):
 
     async def read(self) -> str | bytes:
         """Read the HTTP content."""
+        import httpx  # pragma: no cover
+
         async with httpx.AsyncClient() as client:  # pragma: no cover
             response = await client.get(self.url)
             response.raise_for_status()
@@ -164,13 +243,30 @@ class HttpResource(Resource):
 
 
 class DirectoryResource(Resource):
-    """A resource that lists files in a directory."""
+    """A resource that lists files in a directory.
+
+    The listing is built once and kept in an index, which later reads refresh by
+    listing again only the directories that changed (see `DirectoryIndex`). Reading the
+    resource returns every file as JSON, `{"files": [...]}`; reading its URI with a
+    query returns a page of them, filtered by a glob pattern, without listing again:
+
+        dir://repo?pattern=*.py&limit=100
+        dir://repo?pattern=*.py&limit=100&cursor=<nextCursor of the previous page>
+
+    Pages also hold `nextCursor` when more files follow. Run `watch` to keep the index
+    up to date in the background and be told when it changes.
+    """
 
     path: Path = Field(description="Path to the directory")
     recursive: bool = Field(default=False, description="Whether to list files recursively")
     pattern: str | None = Field(default=None, description="Optional glob pattern to filter files")
     mime_type: str = Field(default="application/json", description="MIME type of the resource content")
 
+    _index: DirectoryIndex = PrivateAttr()
+    _match: Callable[[str], bool] | None = PrivateAttr()
+    _listing: tuple[int, str] | None = PrivateAttr(default=None)
+    _watchers: int = PrivateAttr(default=0)
+
     @pydantic.field_validator("path")
     @classmethod
     def validate_absolute_path(cls, path: Path) -> Path:  # pragma: no cover
@@ -179,25 +275,162 @@ class DirectoryResource(Resource):
             raise ValueError("Path must be absolute")
         return path
 
-    def list_files(self) -> list[Path]:  # pragma: no cover
-        """List files in the directory."""
-        if not self.path.exists():
-            raise FileNotFoundError(f"Directory not found: {self.path}")
-        if not self.path.is_dir():
-            raise NotADirectoryError(f"Not a directory: {self.path}")
+    def model_post_init(self, context: Any, /) -> None:
+        self._index = DirectoryIndex(self.path, self.recursive)
+        self._match = compile_pattern(self.pattern) if self.pattern else None
 
+    @property
+    def index(self) -> DirectoryIndex:
+        """The index of the directory's files, shared by every read."""
+        return self._index
+
+    def list_files(self) -> list[Path]:
+        """Refresh the index and list the files in the directory that match `pattern`."""
+        self._index.refresh()
+        return [self.path / file for file in self._index.page(match=self._match)[0]]
+
+    async def read(self) -> str:
+        """Read the directory listing."""
         try:
-            if self.pattern:
-                return list(self.path.glob(self.pattern)) if not self.recursive else list(self.path.rglob(self.pattern))
-            return list(self.path.glob("*")) if not self.recursive else list(self.path.rglob("*"))
+            await self._refresh()
+            version = self._index.version
+            if self._listing is None or self._listing[0] != version:
+                files = self._index.page(match=self._match)[0]
+                self._listing = (version, json.dumps({"files": files}, separators=(",", ":")))
+            return self._listing[1]
         except Exception as e:
-            raise ValueError(f"Error listing directory {self.path}: {e}")
+            raise ValueError(f"Error reading directory {self.path}: {e}")
 
-    async def read(self) -> str:  # Always returns JSON string  # pragma: no cover
-        """Read the directory listing."""
+    async def read_page(self, cursor: str | None = None, limit: int | None = None, pattern: str | None = None) -> str:
+        """Read a page of the directory listing, as JSON: `{"files": [...], "nextCursor": ...}`.
+
+        Args:
+            cursor: The `nextCursor` of the previous page; None starts at the first file
+            limit: The most files on the page; None puts every file after `cursor` on it
+            pattern: A glob pattern files must match besides `pattern`, matched from the
+                right as `Path.rglob` does
+
+        Raises:
+            ValueError: If the cursor or limit is invalid, or the directory cannot be listed.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        after = _decode_path_cursor(cursor) if cursor is not None else None
         try:
-            files = await anyio.to_thread.run_sync(self.list_files)
-            file_list = [str(f.relative_to(self.path)) for f in files if f.is_file()]
-            return json.dumps({"files": file_list}, indent=2)
+            await self._refresh()
         except Exception as e:
             raise ValueError(f"Error reading directory {self.path}: {e}")
+        tests = [test for test in (self._match, compile_pattern(pattern) if pattern else None) if test is not None]
+
+        def match(path: str) -> bool:
+            return all(test(path) for test in tests)
+
+        files, more = self._index.page(after, limit, match if tests else None)
+        result: dict[str, Any] = {"files": files}
+        if more:
+            result["nextCursor"] = _encode_path_cursor(files[-1])
+        return json.dumps(result, separators=(",", ":"))
+
+    def page_resource(self, uri: str, query: str) -> Resource:
+        """The resource for `uri`, this resource's URI with a query asking for a page of the listing.
+
+        The query takes `cursor`, `limit` and `pattern`, the arguments of `read_page`.
+        """
+        return FunctionResource(
+            uri=uri,
+            name=self.name,
+            title=self.title,
+            description=self.description,
+            mime_type=self.mime_type,
+            icons=self.icons,
+            annotations=self.annotations,
+            meta=self.meta,
+            fn=functools.partial(self._read_query, query),
+        )
+
+    async def watch(
+        self, on_change: Callable[[str], Awaitable[Any]], *, interval: float = 1.0, use_inotify: bool = True
+    ) -> None:
+        """Keep the index up to date until cancelled, calling `on_change` with the URI whenever files change.
+
+        On Linux, inotify reports changed directories as they change; elsewhere, or
+        without inotify watches to spare, every directory's modification time is checked
+        every `interval` seconds. While a watch runs, reads serve the index it keeps
+        instead of refreshing it themselves. To tell a client, pass a session's
+        `send_resource_updated`, which also drops the server's cached contents:
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(listing.watch, ctx.session.send_resource_updated)
+        """
+        await anyio.to_thread.run_sync(self._index.refresh)
+        watcher: DirectoryWatcher | None = None
+        if use_inotify:
+            try:
+                watcher = DirectoryWatcher(self._index)
+                watcher.sync()
+            except OSError as e:  # pragma: no cover
+                logger.warning(f"Watching {self.path} by polling, as inotify is not available: {e}")
+                if watcher is not None:
+                    watcher.close()
+                watcher = None
+            else:
+                # Catch up with what changed before the directories were watched
+                await anyio.to_thread.run_sync(self._index.refresh)
+        self._watchers += 1
+        try:
+            while True:
+                if watcher is None:
+                    await anyio.sleep(interval)
+                    changed = await anyio.to_thread.run_sync(self._index.refresh)
+                else:
+                    try:
+                        changed = await self._refresh_watched(watcher, interval)
+                    except OSError as e:
+                        # Polling checks every directory, so it catches up with what was missed
+                        logger.warning(f"Watching {self.path} by polling, as inotify failed: {e}")
+                        watcher.close()
+                        watcher = None
+                        continue
+                if changed:
+                    await on_change(self.uri)
+        finally:
+            self._watchers -= 1
+            if watcher is not None:
+                watcher.close()
+
+    async def _refresh_watched(self, watcher: DirectoryWatcher, timeout: float) -> bool:
+        directories = await anyio.to_thread.run_sync(watcher.wait, timeout)
+        if directories is not None and not directories:
+            return False
+        changed = await anyio.to_thread.run_sync(self._index.refresh, directories)
+        # Directories the refresh found may have changed before they were watched
+        while directories := watcher.sync():
+            changed = await anyio.to_thread.run_sync(self._index.refresh, directories) or changed
+        return changed
+
+    async def _refresh(self) -> None:
+        # Without a watch, every read refreshes the index; it lists the directory only the first time
+        if not self._watchers:
+            await anyio.to_thread.run_sync(self._index.refresh)
+
+    async def _read_query(self, query: str) -> str:
+        params = urllib.parse.parse_qs(query, keep_blank_values=True)
+        if unknown := set(params) - {"cursor", "limit", "pattern"}:
+            raise ValueError(f"Unknown query parameters: {', '.join(sorted(unknown))}")
+        cursor, limit, pattern = (
+            params[name][-1] if name in params else None for name in ("cursor", "limit", "pattern")
+        )
+        if limit is not None and not limit.isdigit():
+            raise ValueError(f"Invalid limit: {limit}")
+        return await self.read_page(cursor, int(limit) if limit is not None else None, pattern)
+
+
+def _encode_path_cursor(path: str) -> str:
+    return base64.urlsafe_b64encode(path.encode(errors="surrogateescape")).decode()
+
+
+def _decode_path_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode(errors="surrogateescape")
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
@@ -0,0 +1,240 @@
+"""URI templates, and a router that matches a URI against many of them at once.
+
+Templates support the RFC 6570 expressions resource URIs need: simple `{var}`
+expansion for one path segment, with any query or fragment in it unless the template
+has a query expression to match them, reserved `{+var}` expansion for a value that may
+span segments, and form-style query `{?var,...}` and continuation `{&var,...}`
+expansion for optional query parameters. Extracted values are percent-decoded.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+from urllib.parse import unquote
+
+T = TypeVar("T")
+
+_EXPRESSION = re.compile(r"\{([^{}]*)\}")
+
+# The value patterns of single-variable expressions. A simple value cannot contain
+# `/`, but may contain `?` and `#` as it always could; both take as little as they
+# can, so that any `{?query}` after them still matches.
+_VALUE_PATTERNS = {"": "([^/]+?)", "+": "(.+?)"}
+_QUERY_PATTERNS = {"?": r"(?:\?([^#]*))?", "&": r"(?:&([^#]*))?"}
+
+
+@dataclass(frozen=True)
+class _Expression:
+    operator: str
+    names: tuple[str, ...]
+
+
+def _parse(template: str) -> list[str | _Expression]:
+    """Split `template` into literal text and expressions.
+
+    Raises:
+        ValueError: If the template is malformed or uses an unsupported expression.
+    """
+    parts: list[str | _Expression] = []
+    position = 0
+    for match in _EXPRESSION.finditer(template):
+        parts.append(template[position : match.start()])
+        body = match.group(1)
+        operator = body[0] if body and body[0] in "+?&" else ""
+        names = tuple(body[len(operator) :].split(","))
+        if not all(name.isidentifier() for name in names) or (operator in _VALUE_PATTERNS and len(names) > 1):
+            raise ValueError(f"Unsupported expression {{{body}}} in URI template: {template}")
+        parts.append(_Expression(operator, names))
+        position = match.end()
+    parts.append(template[position:])
+
+    if any(isinstance(part, str) and ("{" in part or "}" in part) for part in parts):
+        raise ValueError(f"Unbalanced braces in URI template: {template}")
+    return [part for part in parts if part != ""]
+
+
+class _Pattern:
+    """Literal text and expressions compiled into one regex that must match a whole string."""
+
+    def __init__(self, parts: list[str | _Expression]) -> None:
+        self._expressions = [part for part in parts if isinstance(part, _Expression)]
+        self._query_names = {
+            name
+            for expression in self._expressions
+            if expression.operator in _QUERY_PATTERNS
+            for name in expression.names
+        }
+        self._regex = re.compile(
+            "".join(
+                re.escape(part)
+                if isinstance(part, str)
+                else _VALUE_PATTERNS.get(part.operator) or _QUERY_PATTERNS[part.operator]
+                for part in parts
+            )
+        )
+
+    def match(self, text: str) -> dict[str, str] | None:
+        match = self._regex.fullmatch(text)
+        if match is None:
+            return None
+        params: dict[str, str] = {}
+        for expression, value in zip(self._expressions, match.groups()):
+            if value is None:
+                continue
+            if expression.operator in _QUERY_PATTERNS:
+                for pair in value.split("&"):
+                    name, _, item = pair.partition("=")
+                    # Query parameters may come in any order, and unknown ones are ignored
+                    if name in self._query_names:
+                        params[name] = unquote(item)
+            else:
+                params[expression.names[0]] = unquote(value)
+        return params
+
+
+class UriTemplate:
+    """A URI template, parsed and compiled once.
+
+    Raises:
+        ValueError: If the template is malformed, uses an unsupported expression or
+            repeats a variable.
+    """
+
+    def __init__(self, template: str) -> None:
+        parts = _parse(template)
+        self.template = template
+        self.variables = tuple(name for part in parts if isinstance(part, _Expression) for name in part.names)
+        if len(set(self.variables)) != len(self.variables):
+            raise ValueError(f"Repeated variable in URI template: {template}")
+        self._pattern = _Pattern(parts)
+
+    def match(self, uri: str) -> dict[str, str] | None:
+        """Return the variables `uri` gives the template, or None if it does not match.
+
+        Optional query variables that `uri` leaves out are not included.
+        """
+        return self._pattern.match(uri)
+
+    def __repr__(self) -> str:
+        return f"UriTemplate({self.template!r})"
+
+
+@dataclass
+class _Route(Generic[T]):
+    value: T
+    # Names of the whole-segment variables on the way to this route, in order
+    segment_names: tuple[str, ...]
+
+    def bind(self, segment_values: list[str], params: dict[str, str]) -> dict[str, str]:
+        return {**params, **{name: unquote(value) for name, value in zip(self.segment_names, segment_values)}}
+
+
+class _Node(Generic[T]):
+    __slots__ = ("literals", "patterns", "variable", "routes", "tails")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _Node[T]] = {}
+        self.patterns: dict[str, tuple[_Pattern, _Node[T]]] = {}
+        self.variable: _Node[T] | None = None
+        # Routes of templates that end here, and of templates whose tail starts here,
+        # with the pattern of that tail, keyed by template
+        self.routes: dict[str, _Route[T]] = {}
+        self.tails: dict[str, tuple[_Pattern, _Route[T]]] = {}
+
+
+def _spans_segments(segment: str) -> bool:
+    """Whether a template segment may match text across `/`, so cannot be matched segment by segment."""
+    return "?" in segment or "#" in segment or "{+" in segment or "{&" in segment
+
+
+class UriTemplateRouter(Generic[T]):
+    """Finds the template matching a URI by walking a trie of template path segments.
+
+    Each template is split at `/` once, when it is added, so matching a URI costs
+    a lookup per segment rather than a regex per template. Literal segments are
+    looked up in a dict, segments mixing literals and variables use their compiled
+    pattern, and a whole-segment variable matches any non-empty segment. From the
+    first segment with a `{+var}` or query expression on, the rest of the template
+    is matched as one pattern.
+
+    Where several templates match, the most specific one wins, segment by segment
+    from the left: a literal beats a mix of literals and variables, which beats a
+    whole-segment variable, which beats a `{+var}` or query expression. A segment
+    holding `?` or `#` is the exception: a query expression matching it beats a
+    whole-segment variable, which takes the query along only if none does. Templates
+    that tie win in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        self._root: _Node[T] = _Node()
+
+    def add(self, template: UriTemplate, value: T) -> None:
+        """Route URIs matching `template` to `value`, replacing any value `template` had."""
+        node = self._root
+        segment_names: list[str] = []
+        segments = template.template.split("/")
+        for index, segment in enumerate(segments):
+            if _spans_segments(segment):
+                tail = _Pattern(_parse("/".join(segments[index:])))
+                node.tails[template.template] = (tail, _Route(value, tuple(segment_names)))
+                return
+
+            parts = _parse(segment)
+            if not any(isinstance(part, _Expression) for part in parts):
+                node = node.literals.setdefault(segment, _Node())
+            elif len(parts) == 1 and isinstance(expression := parts[0], _Expression):
+                segment_names.append(expression.names[0])
+                if node.variable is None:
+                    node.variable = _Node()
+                node = node.variable
+            else:
+                if segment not in node.patterns:
+                    node.patterns[segment] = (_Pattern(parts), _Node())
+                node = node.patterns[segment][1]
+        node.routes[template.template] = _Route(value, tuple(segment_names))
+
+    def match(self, uri: str) -> tuple[T, dict[str, str]] | None:
+        """Return the value of the template matching `uri` and the variables it gives, if any matches."""
+        return self._match(self._root, uri.split("/"), 0, [], {})
+
+    def _match(
+        self, node: _Node[T], segments: list[str], index: int, segment_values: list[str], params: dict[str, str]
+    ) -> tuple[T, dict[str, str]] | None:
+        if index == len(segments):
+            route = next(iter(node.routes.values()), None)
+            return (route.value, route.bind(segment_values, params)) if route is not None else None
+
+        segment = segments[index]
+        if (child := node.literals.get(segment)) is not None:
+            if found := self._match(child, segments, index + 1, segment_values, params):
+                return found
+
+        for pattern, child in node.patterns.values():
+            if (matched := pattern.match(segment)) is not None:
+                if found := self._match(child, segments, index + 1, segment_values, {**params, **matched}):
+                    return found
+
+        # A segment holding a query or fragment goes to a whole-segment variable only if no
+        # template with a query expression matches it
+        plain = "?" not in segment and "#" not in segment
+        if plain and (found := self._match_variable(node, segments, index, segment_values, params)):
+            return found
+
+        if node.tails:
+            rest = "/".join(segments[index:])
+            for tail, route in node.tails.values():
+                if (matched := tail.match(rest)) is not None:
+                    return route.value, route.bind(segment_values, {**params, **matched})
+        return None if plain else self._match_variable(node, segments, index, segment_values, params)
+
+    def _match_variable(
+        self, node: _Node[T], segments: list[str], index: int, segment_values: list[str], params: dict[str, str]
+    ) -> tuple[T, dict[str, str]] | None:
+        if node.variable is None or not segments[index]:
+            return None
+        segment_values.append(segments[index])
+        found = self._match(node.variable, segments, index + 1, segment_values, params)
+        segment_values.pop()
+        return found
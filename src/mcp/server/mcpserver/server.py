@@ -3,55 +3,96 @@
 from __future__ import annotations
 
 import inspect
-import re
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from typing import Any, Generic, Literal, TypeVar, overload
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, overload
 
 import anyio
 import pydantic_core
 from pydantic import BaseModel
 from pydantic.networks import AnyUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from starlette.applications import Starlette
-from starlette.middleware import Middleware
-from starlette.middleware.authentication import AuthenticationMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.routing import Mount, Route
-from starlette.types import Receive, Scope, Send
-
-from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
-from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend, RequireAuthMiddleware
-from mcp.server.auth.provider import OAuthAuthorizationServerProvider, ProviderTokenVerifier, TokenVerifier
+
 from mcp.server.auth.settings import AuthSettings
 from mcp.server.context import LifespanContextT, RequestT, ServerRequestContext
 from mcp.server.elicitation import ElicitationResult, ElicitSchemaModelT, UrlElicitationResult, elicit_with_validation
 from mcp.server.elicitation import elicit_url as _elicit_url
 from mcp.server.lowlevel.helper_types import ReadResourceContents
-from mcp.server.lowlevel.server import LifespanResultT, Server
+from mcp.server.lowlevel.request_queue import RequestQueueMetrics
+from mcp.server.lowlevel.server import DEFAULT_MAX_QUEUED_REQUESTS, LifespanResultT, Server
 from mcp.server.lowlevel.server import lifespan as default_lifespan
 from mcp.server.mcpserver.exceptions import ResourceError
 from mcp.server.mcpserver.prompts import Prompt, PromptManager
-from mcp.server.mcpserver.resources import FunctionResource, Resource, ResourceManager
-from mcp.server.mcpserver.tools import Tool, ToolManager
+from mcp.server.mcpserver.resources import (
+    FunctionResource,
+    Resource,
+    ResourceCacheConfig,
+    ResourceCacheMetrics,
+    ResourceManager,
+    ResourceTemplate,
+)
+from mcp.server.mcpserver.resources.read_cache import DEFAULT_MAX_BYTES
+from mcp.server.mcpserver.resources.uri_template import UriTemplate
+from mcp.server.mcpserver.tools import Tool, ToolManager, ToolResultCacheConfig, ToolResultCacheMetrics
 from mcp.server.mcpserver.utilities.context_injection import find_context_parameter
+from mcp.server.mcpserver.utilities.executors import Executor, ExecutorMetrics, ProcessExecutor
 from mcp.server.mcpserver.utilities.logging import configure_logging, get_logger
-from mcp.server.sse import SseServerTransport
+from mcp.server.mcpserver.utilities.pagination import decode_cursor
 from mcp.server.stdio import stdio_server
-from mcp.server.streamable_http import EventStore
-from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
-from mcp.server.transport_security import TransportSecuritySettings
-from mcp.types import Annotations, ContentBlock, GetPromptResult, Icon, ToolAnnotations
+from mcp.shared.codec import DEFAULT_CODEC, Codec
+from mcp.shared.exceptions import MCPError
+from mcp.shared.message import EncodedResult
+from mcp.shared.resource_ranges import (
+    RESOURCE_RANGE_META_KEY,
+    ResourceRange,
+    content_length,
+    range_meta,
+    requested_range,
+    slice_content,
+)
+from mcp.types import (
+    INVALID_PARAMS,
+    Annotations,
+    CallToolResult,
+    ContentBlock,
+    GetPromptResult,
+    Icon,
+    ListPromptsRequest,
+    ListPromptsResult,
+    ListResourcesRequest,
+    ListResourcesResult,
+    ListResourceTemplatesRequest,
+    ListResourceTemplatesResult,
+    ListToolsRequest,
+    ListToolsResult,
+    PaginatedRequestParams,
+    PaginatedResult,
+    ToolAnnotations,
+)
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
 from mcp.types import Resource as MCPResource
 from mcp.types import ResourceTemplate as MCPResourceTemplate
 from mcp.types import Tool as MCPTool
 
+if TYPE_CHECKING:
+    # The HTTP stack (starlette, auth, SSE and streamable HTTP) is only imported once an
+    # HTTP app is built, so stdio servers do not pay for it at startup.
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    from mcp.server.auth.provider import OAuthAuthorizationServerProvider, TokenVerifier
+    from mcp.server.streamable_http import EventStore
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from mcp.server.transport_security import TransportSecuritySettings
+
 logger = get_logger(__name__)
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
+PaginatedResultT = TypeVar("PaginatedResultT", bound=PaginatedResult)
 
 
 class Settings(BaseSettings, Generic[LifespanResultT]):
@@ -88,6 +129,26 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     auth: AuthSettings | None
 
 
+@dataclass(frozen=True)
+class PerformanceSettings:
+    """How much work an MCPServer takes on at once, and what it keeps in memory to answer faster."""
+
+    max_concurrent_requests: int | None = None
+    """The most requests each session handles at once; None handles each as soon as it arrives."""
+
+    max_queued_requests: int = DEFAULT_MAX_QUEUED_REQUESTS
+    """How many requests per session may wait for a slot before new ones are rejected as busy."""
+
+    tool_result_cache: ToolResultCacheConfig | None = None
+    """Caching of the results of tools annotated read-only or idempotent; None caches none."""
+
+    list_page_size: int | None = None
+    """Tools, resources, templates or prompts on each page of a listing; None lists them all at once."""
+
+    resource_cache_max_bytes: int = DEFAULT_MAX_BYTES
+    """Total size of the contents kept for resources registered with `cache`."""
+
+
 def lifespan_wrapper(
     app: MCPServer[LifespanResultT],
     lifespan: Callable[[MCPServer[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]],
@@ -100,6 +161,80 @@ def lifespan_wrapper(
     return wrap
 
 
+def start_executors(
+    executors: Iterable[Executor],
+    lifespan: Callable[[Server[LifespanResultT, Request]], AbstractAsyncContextManager[LifespanResultT]],
+) -> Callable[[Server[LifespanResultT, Request]], AbstractAsyncContextManager[LifespanResultT]]:
+    @asynccontextmanager
+    async def wrap(server: Server[LifespanResultT, Request]) -> AsyncIterator[LifespanResultT]:
+        for executor in executors:
+            await executor.start()
+        async with lifespan(server) as context:
+            yield context
+
+    return wrap
+
+
+def _mcp_tool(info: Tool) -> MCPTool:
+    return MCPTool(
+        name=info.name,
+        title=info.title,
+        description=info.description,
+        input_schema=info.parameters,
+        output_schema=info.output_schema,
+        annotations=info.annotations,
+        icons=info.icons,
+        _meta=info.meta,
+    )
+
+
+def _mcp_resource(resource: Resource) -> MCPResource:
+    return MCPResource(
+        uri=resource.uri,
+        name=resource.name or "",
+        title=resource.title,
+        description=resource.description,
+        mime_type=resource.mime_type,
+        icons=resource.icons,
+        annotations=resource.annotations,
+        _meta=resource.meta,
+    )
+
+
+def _mcp_resource_template(template: ResourceTemplate) -> MCPResourceTemplate:
+    return MCPResourceTemplate(
+        uri_template=template.uri_template,
+        name=template.name,
+        title=template.title,
+        description=template.description,
+        mime_type=template.mime_type,
+        icons=template.icons,
+        annotations=template.annotations,
+        _meta=template.meta,
+    )
+
+
+def _content_part(
+    item: ReadResourceContents, offset: int, part: str | bytes | memoryview, total: int | None
+) -> ReadResourceContents:
+    """`item` with its content replaced by `part`, read from `offset`, and the range noted in its meta."""
+    meta = {**(item.meta or {}), RESOURCE_RANGE_META_KEY: range_meta(offset, part, total)}
+    return ReadResourceContents(content=part, mime_type=item.mime_type, meta=meta)
+
+
+def _mcp_prompt(prompt: Prompt) -> MCPPrompt:
+    return MCPPrompt(
+        name=prompt.name,
+        title=prompt.title,
+        description=prompt.description,
+        arguments=[
+            MCPPromptArgument(name=arg.name, description=arg.description, required=arg.required)
+            for arg in (prompt.arguments or [])
+        ],
+        icons=prompt.icons,
+    )
+
+
 class MCPServer(Generic[LifespanResultT]):
     def __init__(
         self,
@@ -121,6 +256,10 @@ class MCPServer(Generic[LifespanResultT]):
         warn_on_duplicate_prompts: bool = True,
         lifespan: Callable[[MCPServer[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]] | None = None,
         auth: AuthSettings | None = None,
+        codec: Codec = DEFAULT_CODEC,
+        executors: Mapping[str, Executor] | None = None,
+        default_executor: str = "thread",
+        performance: PerformanceSettings | None = None,
     ):
         self.settings = Settings(
             debug=debug,
@@ -131,6 +270,17 @@ class MCPServer(Generic[LifespanResultT]):
             lifespan=lifespan,
             auth=auth,
         )
+        self.performance = performance if performance is not None else PerformanceSettings()
+        list_page_size = self.performance.list_page_size
+
+        self._tool_manager = ToolManager(
+            tools=tools,
+            warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools,
+            result_cache=self.performance.tool_result_cache,
+            executors=executors,
+            default_executor=default_executor,
+            page_size=list_page_size,
+        )
 
         self._lowlevel_server = Server(
             name=name or "mcp-server",
@@ -142,11 +292,26 @@ class MCPServer(Generic[LifespanResultT]):
             version=version,
             # TODO(Marcelo): It seems there's a type mismatch between the lifespan type from an MCPServer and Server.
             # We need to create a Lifespan type that is a generic on the server type, like Starlette does.
-            lifespan=(lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan),  # type: ignore
+            lifespan=start_executors(
+                self._tool_manager.executors.values(),
+                lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan,  # type: ignore
+            ),
+            max_concurrent_requests=self.performance.max_concurrent_requests,
+            max_queued_requests=self.performance.max_queued_requests,
+        )
+        self._resource_manager = ResourceManager(
+            warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources,
+            page_size=list_page_size,
+            cache_max_bytes=self.performance.resource_cache_max_bytes,
+        )
+        self._lowlevel_server.add_resource_updated_callback(self._resource_manager.invalidate_cache)
+        self._list_page_size = list_page_size
+        # Encoded listing pages by cursor, with the manager version they were built from.
+        # A cursor that was issued but whose page has not been built yet maps to None.
+        self._listings: dict[type, tuple[int, dict[str | None, EncodedResult[Any] | None]]] = {}
+        self._prompt_manager = PromptManager(
+            warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts, page_size=list_page_size
         )
-        self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
-        self._resource_manager = ResourceManager(warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources)
-        self._prompt_manager = PromptManager(warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts)
         # Validate auth configuration
         if self.settings.auth is not None:
             if auth_server_provider and token_verifier:  # pragma: no cover
@@ -158,9 +323,12 @@ class MCPServer(Generic[LifespanResultT]):
 
         self._auth_server_provider = auth_server_provider
         self._token_verifier = token_verifier
+        self._codec = codec
 
         # Create token verifier from provider if needed (backwards compatibility)
         if auth_server_provider and not token_verifier:  # pragma: no cover
+            from mcp.server.auth.provider import ProviderTokenVerifier
+
             self._token_verifier = ProviderTokenVerifier(auth_server_provider)
         self._custom_starlette_routes: list[Route] = []
 
@@ -198,6 +366,36 @@ class MCPServer(Generic[LifespanResultT]):
     def version(self) -> str | None:
         return self._lowlevel_server.version
 
+    @property
+    def request_metrics(self) -> RequestQueueMetrics:
+        """Queue depth and wait time for requests held back by `max_concurrent_requests`."""
+        return self._lowlevel_server.request_metrics
+
+    @property
+    def executor_metrics(self) -> dict[str, ExecutorMetrics]:
+        """Active and queued calls for each named executor that runs sync tools, resources and prompts."""
+        return {name: executor.metrics for name, executor in self._tool_manager.executors.items()}
+
+    def tool_cache_metrics(self, name: str) -> ToolResultCacheMetrics | None:
+        """Hits and misses of a tool's result cache, or None if its results are not cached."""
+        return self._tool_manager.result_cache_metrics(name)
+
+    def clear_tool_cache(self, name: str | None = None) -> None:
+        """Forget cached results of the named tool, or of every tool, e.g. after the data behind them changed."""
+        self._tool_manager.clear_result_cache(name)
+
+    @property
+    def resource_cache_metrics(self) -> ResourceCacheMetrics:
+        """Hits, misses and coalesced reads of the cache of resources registered with `cache`."""
+        return self._resource_manager.cache_metrics
+
+    def clear_resource_cache(self, uri: AnyUrl | str | None = None) -> None:
+        """Forget cached contents of the resource at `uri`, or of every resource.
+
+        Sending `resources/updated` for a URI from a session does this for that URI.
+        """
+        self._resource_manager.invalidate_cache(uri)
+
     @property
     def session_manager(self) -> StreamableHTTPSessionManager:
         """Get the StreamableHTTP session manager.
@@ -265,33 +463,121 @@ class MCPServer(Generic[LifespanResultT]):
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._lowlevel_server.list_tools()(self.list_tools)
+        self._lowlevel_server.list_tools()(self._list_tools_snapshot)
         # Note: we disable the lowlevel server's input validation.
         # MCPServer does ad hoc conversion of incoming data before validating -
         # for now we preserve this for backwards compatibility.
         self._lowlevel_server.call_tool(validate_input=False)(self.call_tool)
-        self._lowlevel_server.list_resources()(self.list_resources)
-        self._lowlevel_server.read_resource()(self.read_resource)
-        self._lowlevel_server.list_prompts()(self.list_prompts)
+        self._lowlevel_server.list_resources()(self._list_resources_snapshot)
+        self._lowlevel_server.read_resource()(self._read_resource_request)
+        self._lowlevel_server.list_prompts()(self._list_prompts_snapshot)
         self._lowlevel_server.get_prompt()(self.get_prompt)
-        self._lowlevel_server.list_resource_templates()(self.list_resource_templates)
+        self._lowlevel_server.list_resource_templates()(self._list_resource_templates_snapshot)
+
+    def _overrides(self, method: str) -> bool:
+        """Whether a subclass overrides the listing `method`.
+
+        Its answers may change without the managers changing, so they are neither kept
+        nor paged: every request gets what the override returns.
+        """
+        return getattr(type(self), method) is not getattr(MCPServer, method)
+
+    async def _listing(
+        self,
+        result_type: type[PaginatedResultT],
+        version: int,
+        params: PaginatedRequestParams | None,
+        build: Callable[[str | None], Awaitable[PaginatedResultT]],
+    ) -> EncodedResult[PaginatedResultT]:
+        """Serve a listing page from memory until the manager behind it changes `version`."""
+        # Without a page size everything is on the first page, whatever the cursor
+        cursor = params.cursor if params is not None and self._list_page_size is not None else None
+        if cursor is not None:
+            try:
+                decode_cursor(cursor)
+            except ValueError as e:
+                raise MCPError(INVALID_PARAMS, str(e))
+
+        cached = self._listings.get(result_type)
+        if cached is None or cached[0] != version:
+            cached = self._listings[result_type] = (version, {})
+        pages = cached[1]
+        page = pages.get(cursor)
+        if page is None:
+            page = EncodedResult(await build(cursor))
+            # Only pages reached through cursors this server issued are kept, so the
+            # cache holds at most one entry per page however clients make up cursors
+            if cursor is None or cursor in pages:
+                pages[cursor] = page
+                if page.result.next_cursor is not None:
+                    pages.setdefault(page.result.next_cursor, None)
+        return page
+
+    async def _list_tools_snapshot(
+        self, request: ListToolsRequest | None
+    ) -> ListToolsResult | EncodedResult[ListToolsResult]:
+        # The lowlevel server lists tools without a request to refresh its cache of them, and needs every one
+        if request is None or self._overrides("list_tools"):
+            return ListToolsResult(tools=await self.list_tools())
+
+        async def build(cursor: str | None) -> ListToolsResult:
+            if self._list_page_size is None:
+                return ListToolsResult(tools=await self.list_tools())
+            tools, next_cursor = self._tool_manager.list_tools_page(cursor)
+            return ListToolsResult(tools=[_mcp_tool(tool) for tool in tools], next_cursor=next_cursor)
+
+        return await self._listing(ListToolsResult, self._tool_manager.version, request.params, build)
+
+    async def _list_resources_snapshot(
+        self, request: ListResourcesRequest
+    ) -> ListResourcesResult | EncodedResult[ListResourcesResult]:
+        if self._overrides("list_resources"):
+            return ListResourcesResult(resources=await self.list_resources())
+
+        async def build(cursor: str | None) -> ListResourcesResult:
+            if self._list_page_size is None:
+                return ListResourcesResult(resources=await self.list_resources())
+            resources, next_cursor = self._resource_manager.list_resources_page(cursor)
+            return ListResourcesResult(
+                resources=[_mcp_resource(resource) for resource in resources], next_cursor=next_cursor
+            )
+
+        return await self._listing(ListResourcesResult, self._resource_manager.version, request.params, build)
+
+    async def _list_resource_templates_snapshot(
+        self, request: ListResourceTemplatesRequest
+    ) -> ListResourceTemplatesResult | EncodedResult[ListResourceTemplatesResult]:
+        if self._overrides("list_resource_templates"):
+            return ListResourceTemplatesResult(resource_templates=await self.list_resource_templates())
+
+        async def build(cursor: str | None) -> ListResourceTemplatesResult:
+            if self._list_page_size is None:
+                return ListResourceTemplatesResult(resource_templates=await self.list_resource_templates())
+            templates, next_cursor = self._resource_manager.list_templates_page(cursor)
+            return ListResourceTemplatesResult(
+                resource_templates=[_mcp_resource_template(template) for template in templates],
+                next_cursor=next_cursor,
+            )
+
+        return await self._listing(ListResourceTemplatesResult, self._resource_manager.version, request.params, build)
+
+    async def _list_prompts_snapshot(
+        self, request: ListPromptsRequest
+    ) -> ListPromptsResult | EncodedResult[ListPromptsResult]:
+        if self._overrides("list_prompts"):
+            return ListPromptsResult(prompts=await self.list_prompts())
+
+        async def build(cursor: str | None) -> ListPromptsResult:
+            if self._list_page_size is None:
+                return ListPromptsResult(prompts=await self.list_prompts())
+            prompts, next_cursor = self._prompt_manager.list_prompts_page(cursor)
+            return ListPromptsResult(prompts=[_mcp_prompt(prompt) for prompt in prompts], next_cursor=next_cursor)
+
+        return await self._listing(ListPromptsResult, self._prompt_manager.version, request.params, build)
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
-        tools = self._tool_manager.list_tools()
-        return [
-            MCPTool(
-                name=info.name,
-                title=info.title,
-                description=info.description,
-                input_schema=info.parameters,
-                output_schema=info.output_schema,
-                annotations=info.annotations,
-                icons=info.icons,
-                _meta=info.meta,
-            )
-            for info in tools
-        ]
+        return [_mcp_tool(info) for info in self._tool_manager.list_tools()]
 
     def get_context(self) -> Context[LifespanResultT, Request]:
         """Returns a Context object. Note that the context will only be valid
@@ -303,61 +589,79 @@ class MCPServer(Generic[LifespanResultT]):
             request_context = None
         return Context(request_context=request_context, mcp_server=self)
 
-    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Sequence[ContentBlock] | dict[str, Any]:
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any] | CallToolResult:
         """Call a tool by name with arguments."""
         context = self.get_context()
         return await self._tool_manager.call_tool(name, arguments, context=context, convert_result=True)
 
     async def list_resources(self) -> list[MCPResource]:
         """List all available resources."""
-
-        resources = self._resource_manager.list_resources()
-        return [
-            MCPResource(
-                uri=resource.uri,
-                name=resource.name or "",
-                title=resource.title,
-                description=resource.description,
-                mime_type=resource.mime_type,
-                icons=resource.icons,
-                annotations=resource.annotations,
-                _meta=resource.meta,
-            )
-            for resource in resources
-        ]
+        return [_mcp_resource(resource) for resource in self._resource_manager.list_resources()]
 
     async def list_resource_templates(self) -> list[MCPResourceTemplate]:
-        templates = self._resource_manager.list_templates()
-        return [
-            MCPResourceTemplate(
-                uri_template=template.uri_template,
-                name=template.name,
-                title=template.title,
-                description=template.description,
-                mime_type=template.mime_type,
-                icons=template.icons,
-                annotations=template.annotations,
-                _meta=template.meta,
-            )
-            for template in templates
-        ]
+        return [_mcp_resource_template(template) for template in self._resource_manager.list_templates()]
 
-    async def read_resource(self, uri: AnyUrl | str) -> Iterable[ReadResourceContents]:
-        """Read a resource by URI."""
+    async def _read_resource_request(self, uri: str) -> Iterable[ReadResourceContents]:
+        """Handle `resources/read`, reading only the range the request's `_meta` asks for, if any."""
+        try:
+            content_range = requested_range(self._lowlevel_server.request_context.meta)
+        except ValueError as e:
+            raise MCPError(INVALID_PARAMS, str(e))
+        return await self.read_resource(uri, content_range)
+
+    async def read_resource(
+        self, uri: AnyUrl | str, content_range: ResourceRange | None = None
+    ) -> Iterable[ReadResourceContents]:
+        """Read a resource by URI.
+
+        Reads of resources registered with `cache` are served from the read cache, and
+        concurrent reads of the same URI share one read.
+
+        With `content_range`, only that part of the content is returned, and its meta
+        holds the range returned under `RESOURCE_RANGE_META_KEY`. Resources that can read
+        just the range do (see `Resource.reads_ranges`). Others are read whole, through
+        the read cache even if not registered with `cache`, for `RANGED_READ_TTL` seconds,
+        so the chunks of one chunked read are sliced from a single read.
+        """
 
         context = self.get_context()
-        try:
-            resource = await self._resource_manager.get_resource(uri, context=context)
-        except ValueError:
-            raise ResourceError(f"Unknown resource: {uri}")
 
+        async def get_resource() -> Resource:
+            try:
+                return await self._resource_manager.get_resource(uri, context=context)
+            except ValueError:
+                raise ResourceError(f"Unknown resource: {uri}")
+
+        async def read() -> list[ReadResourceContents]:
+            resource = await get_resource()
+            try:
+                content = await resource.read()
+                return [ReadResourceContents(content=content, mime_type=resource.mime_type, meta=resource.meta)]
+            except Exception as exc:
+                logger.exception(f"Error getting resource {uri}")
+                # If an exception happens when reading the resource, we should not leak the exception to the client.
+                raise ResourceError(f"Error reading resource {uri}") from exc
+
+        if content_range is None:
+            return await self._resource_manager.read_cached(uri, read)
+
+        offset, length = content_range.offset, content_range.length
+        if self._resource_manager.caches(uri) or not self._resource_manager.reads_ranges(uri):
+            return [
+                _content_part(item, offset, slice_content(item.content, offset, length), content_length(item.content))
+                for item in await self._resource_manager.read_for_ranges(uri, read)
+            ]
+
+        resource = await get_resource()
         try:
-            content = await resource.read()
-            return [ReadResourceContents(content=content, mime_type=resource.mime_type, meta=resource.meta)]
+            content, total = await resource.read_range(offset, length)
         except Exception as exc:
             logger.exception(f"Error getting resource {uri}")
-            # If an exception happens when reading the resource, we should not leak the exception to the client.
             raise ResourceError(f"Error reading resource {uri}") from exc
+        item = ReadResourceContents(content=content, mime_type=resource.mime_type, meta=resource.meta)
+        return [_content_part(item, offset, content, total)]
 
     def add_tool(
         self,
@@ -369,6 +673,8 @@ class MCPServer(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        cache: ToolResultCacheConfig | None = None,
+        executor: str | Executor | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -385,6 +691,15 @@ class MCPServer(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            cache: Cache the tool's results with this configuration. Without it, results are
+                cached only if the server has a `performance.tool_result_cache` and the
+                annotations mark the tool read-only or idempotent
+            executor: Where a sync tool runs: an executor, or the name of one passed in
+                `executors`, `"thread"` (anyio's default thread limiter), `"inline"` (the
+                event loop, for functions too cheap to be worth a thread) or `"process"`
+                (worker processes, for CPU-bound functions that take no Context; pass
+                `executors={"process": ProcessExecutor(...)}` to size and warm up the pool).
+                Defaults to the server's `default_executor`
         """
         self._tool_manager.add_tool(
             fn,
@@ -395,7 +710,10 @@ class MCPServer(Generic[LifespanResultT]):
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            cache=cache,
+            executor=executor,
         )
+        self._lowlevel_server.invalidate_tool_cache()
 
     def remove_tool(self, name: str) -> None:
         """Remove a tool from the server by name.
@@ -407,6 +725,7 @@ class MCPServer(Generic[LifespanResultT]):
             ToolError: If the tool does not exist
         """
         self._tool_manager.remove_tool(name)
+        self._lowlevel_server.invalidate_tool_cache()
 
     def tool(
         self,
@@ -417,6 +736,8 @@ class MCPServer(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        cache: ToolResultCacheConfig | None = None,
+        executor: str | Executor | None = None,
     ) -> Callable[[_CallableT], _CallableT]:
         """Decorator to register a tool.
 
@@ -433,6 +754,15 @@ class MCPServer(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            cache: Cache the tool's results with this configuration. Without it, results are
+                cached only if the server has a `performance.tool_result_cache` and the
+                annotations mark the tool read-only or idempotent
+            executor: Where a sync tool runs: an executor, or the name of one passed in
+                `executors`, `"thread"` (anyio's default thread limiter), `"inline"` (the
+                event loop, for functions too cheap to be worth a thread) or `"process"`
+                (worker processes, for CPU-bound functions that take no Context; pass
+                `executors={"process": ProcessExecutor(...)}` to size and warm up the pool).
+                Defaults to the server's `default_executor`
 
         Example:
             @server.tool()
@@ -465,6 +795,8 @@ class MCPServer(Generic[LifespanResultT]):
                 icons=icons,
                 meta=meta,
                 structured_output=structured_output,
+                cache=cache,
+                executor=executor,
             )
             return fn
 
@@ -488,13 +820,14 @@ class MCPServer(Generic[LifespanResultT]):
         """
         return self._lowlevel_server.completion()
 
-    def add_resource(self, resource: Resource) -> None:
+    def add_resource(self, resource: Resource, cache: ResourceCacheConfig | None = None) -> None:
         """Add a resource to the server.
 
         Args:
             resource: A Resource instance to add
+            cache: Optional configuration for keeping the resource's contents between reads
         """
-        self._resource_manager.add_resource(resource)
+        self._resource_manager.add_resource(resource, cache=cache)
 
     def resource(
         self,
@@ -507,6 +840,8 @@ class MCPServer(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
+        cache: ResourceCacheConfig | None = None,
+        executor: str | Executor | None = None,
     ) -> Callable[[_CallableT], _CallableT]:
         """Decorator to register a function as a resource.
 
@@ -517,7 +852,9 @@ class MCPServer(Generic[LifespanResultT]):
         - other types will be converted to JSON
 
         If the URI contains parameters (e.g. "resource://{param}") or the function
-        has parameters, it will be registered as a template resource.
+        has parameters, it will be registered as a template resource. Besides
+        `{param}`, which matches one path segment, templates can use `{+path}` for a
+        value spanning several segments and `{?name,...}` for optional query parameters.
 
         Args:
             uri: URI for the resource (e.g. "resource://my-resource" or "resource://{param}")
@@ -526,6 +863,12 @@ class MCPServer(Generic[LifespanResultT]):
             description: Optional description of the resource
             mime_type: Optional MIME type for the resource
             meta: Optional metadata dictionary for the resource
+            cache: Optional configuration for keeping the contents read from each URI for
+                `cache.ttl` seconds, for resources whose contents change rarely. Sending
+                `resources/updated` for a URI drops its cached contents.
+            executor: Where a sync function runs: an executor, or the name of one passed
+                in `executors`, `"thread"` or `"inline"`. Defaults to the server's
+                `default_executor`, or `"thread"` if that runs tools in worker processes
 
         Example:
             @server.resource("resource://my-resource")
@@ -564,7 +907,7 @@ class MCPServer(Generic[LifespanResultT]):
                 context_param = find_context_parameter(fn)
 
                 # Validate that URI params match function params (excluding context)
-                uri_params = set(re.findall(r"{(\w+)}", uri))
+                uri_params = set(UriTemplate(uri).variables)
                 # We need to remove the context_param from the resource function if
                 # there is any.
                 func_params = {p for p in sig.parameters.keys() if p != context_param}
@@ -585,6 +928,8 @@ class MCPServer(Generic[LifespanResultT]):
                     icons=icons,
                     annotations=annotations,
                     meta=meta,
+                    cache=cache,
+                    executor=self._function_executor(executor),
                 )
             else:
                 # Register as regular resource
@@ -598,8 +943,9 @@ class MCPServer(Generic[LifespanResultT]):
                     icons=icons,
                     annotations=annotations,
                     meta=meta,
+                    executor=self._function_executor(executor),
                 )
-                self.add_resource(resource)
+                self.add_resource(resource, cache=cache)
             return fn
 
         return decorator
@@ -618,6 +964,7 @@ class MCPServer(Generic[LifespanResultT]):
         title: str | None = None,
         description: str | None = None,
         icons: list[Icon] | None = None,
+        executor: str | Executor | None = None,
     ) -> Callable[[_CallableT], _CallableT]:
         """Decorator to register a prompt.
 
@@ -625,6 +972,9 @@ class MCPServer(Generic[LifespanResultT]):
             name: Optional name for the prompt (defaults to function name)
             title: Optional human-readable title for the prompt
             description: Optional description of what the prompt does
+            executor: Where a sync function runs: an executor, or the name of one passed
+                in `executors`, `"thread"` or `"inline"`. Defaults to the server's
+                `default_executor`, or `"thread"` if that runs tools in worker processes
 
         Example:
             @server.prompt()
@@ -661,12 +1011,30 @@ class MCPServer(Generic[LifespanResultT]):
             )
 
         def decorator(func: _CallableT) -> _CallableT:
-            prompt = Prompt.from_function(func, name=name, title=title, description=description, icons=icons)
+            prompt = Prompt.from_function(
+                func,
+                name=name,
+                title=title,
+                description=description,
+                icons=icons,
+                executor=self._function_executor(executor),
+            )
             self.add_prompt(prompt)
             return func
 
         return decorator
 
+    def _function_executor(self, executor: str | Executor | None) -> Executor:
+        """Resolve the executor for a sync resource, template or prompt function.
+
+        Their functions are wrapped for argument validation and cannot be pickled, so
+        a server that runs tools in worker processes runs them in threads by default.
+        """
+        if executor is not None:
+            return self._tool_manager.get_executor(executor)
+        default = self._tool_manager.default_executor
+        return self._tool_manager.executors["thread"] if isinstance(default, ProcessExecutor) else default
+
     def custom_route(
         self,
         path: str,
@@ -698,6 +1066,8 @@ class MCPServer(Generic[LifespanResultT]):
                 return JSONResponse({"status": "ok"})
         """
 
+        from starlette.routing import Route
+
         def decorator(  # pragma: no cover
             func: Callable[[Request], Awaitable[Response]],
         ) -> Callable[[Request], Awaitable[Response]]:
@@ -710,7 +1080,7 @@ class MCPServer(Generic[LifespanResultT]):
 
     async def run_stdio_async(self) -> None:
         """Run the server using stdio transport."""
-        async with stdio_server() as (read_stream, write_stream):
+        async with stdio_server(codec=self._codec) as (read_stream, write_stream):
             await self._lowlevel_server.run(
                 read_stream,
                 write_stream,
@@ -788,6 +1158,18 @@ class MCPServer(Generic[LifespanResultT]):
         host: str = "127.0.0.1",
     ) -> Starlette:
         """Return an instance of the SSE server app."""
+        from starlette.applications import Starlette
+        from starlette.middleware import Middleware
+        from starlette.middleware.authentication import AuthenticationMiddleware
+        from starlette.responses import Response
+        from starlette.routing import Mount, Route
+        from starlette.types import Receive, Scope, Send
+
+        from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
+        from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend, RequireAuthMiddleware
+        from mcp.server.sse import SseServerTransport
+        from mcp.server.transport_security import TransportSecuritySettings
+
         # Auto-enable DNS rebinding protection for localhost (IPv4 and IPv6)
         if transport_security is None and host in ("127.0.0.1", "localhost", "::1"):
             transport_security = TransportSecuritySettings(
@@ -796,7 +1178,7 @@ class MCPServer(Generic[LifespanResultT]):
                 allowed_origins=["http://127.0.0.1:*", "http://localhost:*", "http://[::1]:*"],
             )
 
-        sse = SseServerTransport(message_path, security_settings=transport_security)
+        sse = SseServerTransport(message_path, security_settings=transport_security, codec=self._codec)
 
         async def handle_sse(scope: Scope, receive: Receive, send: Send):  # pragma: no cover
             # Add client ID from auth context into request context if available
@@ -930,28 +1312,12 @@ class MCPServer(Generic[LifespanResultT]):
             auth_server_provider=self._auth_server_provider,
             custom_starlette_routes=self._custom_starlette_routes,
             debug=self.settings.debug,
+            codec=self._codec,
         )
 
     async def list_prompts(self) -> list[MCPPrompt]:
         """List all available prompts."""
-        prompts = self._prompt_manager.list_prompts()
-        return [
-            MCPPrompt(
-                name=prompt.name,
-                title=prompt.title,
-                description=prompt.description,
-                arguments=[
-                    MCPPromptArgument(
-                        name=arg.name,
-                        description=arg.description,
-                        required=arg.required,
-                    )
-                    for arg in (prompt.arguments or [])
-                ],
-                icons=prompt.icons,
-            )
-            for prompt in prompts
-        ]
+        return [_mcp_prompt(prompt) for prompt in self._prompt_manager.list_prompts()]
 
     async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
         """Get a prompt by name with arguments."""
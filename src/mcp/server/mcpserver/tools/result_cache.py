@@ -0,0 +1,134 @@
+"""Opt-in caching of tool results for read-only and idempotent tools.
+
+Agents often repeat the same lookup several times in one conversation. A tool whose
+annotations promise that calling it again changes nothing can have its results
+kept for a while and served straight from memory: a hit skips argument
+validation, the tool function and result conversion altogether.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from mcp.types import CallToolResult, ToolAnnotations
+
+
+@dataclass(frozen=True)
+class ToolResultCacheConfig:
+    """How long, how many and for whom results of one tool are kept."""
+
+    ttl: float = 60.0
+    """Seconds a result is served before the tool runs again."""
+
+    max_size: int = 128
+    """Results kept before the least recently used one is evicted."""
+
+    per_session: bool | None = None
+    """Keep separate results for each client session, for tools whose answer depends on who asks.
+
+    Results are then only cached for calls made within a session, and each session
+    gets its own `max_size` results. None does so for tools that take a `Context`,
+    and shares the results of other tools between sessions. Shared or not, results
+    are only served to the authenticated client whose call produced them.
+    """
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if self.max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+
+@dataclass
+class ToolResultCacheMetrics:
+    """Counters for one tool's result cache."""
+
+    hits: int = 0
+    """Calls answered from the cache."""
+
+    misses: int = 0
+    """Cacheable calls that had to run the tool."""
+
+    evictions: int = 0
+    """Results dropped to make room for newer ones."""
+
+    expirations: int = 0
+    """Results found too old to serve."""
+
+
+def is_cacheable(annotations: ToolAnnotations | None) -> bool:
+    """Whether `annotations` mark a tool as safe to answer from a cache."""
+    return annotations is not None and bool(annotations.read_only_hint or annotations.idempotent_hint)
+
+
+def cache_key(arguments: dict[str, Any]) -> str | None:
+    """Canonical JSON for `arguments`, so equal arguments share a key; None if they are not JSON."""
+    try:
+        return json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+
+_Entries = OrderedDict[str, tuple[float, CallToolResult]]
+
+
+class ToolResultCache:
+    """A least-recently-used cache of one tool's results, keyed by `cache_key`.
+
+    Results are copied on the way in and out, so callers are free to modify them.
+    """
+
+    def __init__(self, config: ToolResultCacheConfig, per_session: bool = False) -> None:
+        self.config = config
+        self.per_session = per_session if config.per_session is None else config.per_session
+        self.metrics = ToolResultCacheMetrics()
+        self._shared: _Entries = OrderedDict()
+        self._by_session: WeakKeyDictionary[Any, _Entries] = WeakKeyDictionary()
+
+    def get(self, key: str, session: Any = None) -> CallToolResult | None:
+        """Return a copy of the fresh result stored for `key`, counting a hit or a miss."""
+        entries = self._entries(session)
+        if entries is None:
+            return None
+        entry = entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                entries.move_to_end(key)
+                self.metrics.hits += 1
+                return result.model_copy(deep=True)
+            del entries[key]
+            self.metrics.expirations += 1
+        self.metrics.misses += 1
+        return None
+
+    def put(self, key: str, result: CallToolResult, session: Any = None) -> None:
+        """Store a copy of `result` for `key`, evicting the least recently used result if full."""
+        entries = self._entries(session)
+        if entries is None:
+            return
+        entries[key] = (time.monotonic() + self.config.ttl, result.model_copy(deep=True))
+        entries.move_to_end(key)
+        while len(entries) > self.config.max_size:
+            entries.popitem(last=False)
+            self.metrics.evictions += 1
+
+    def clear(self) -> None:
+        """Forget every stored result."""
+        self._shared.clear()
+        self._by_session.clear()
+
+    def _entries(self, session: Any) -> _Entries | None:
+        if not self.per_session:
+            return self._shared
+        if session is None:
+            return None
+        entries = self._by_session.get(session)
+        if entries is None:
+            entries = self._by_session[session] = OrderedDict()
+        return entries
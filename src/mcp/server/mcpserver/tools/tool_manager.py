@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+import hashlib
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, cast
 
 from mcp.server.mcpserver.exceptions import ToolError
 from mcp.server.mcpserver.tools.base import Tool
+from mcp.server.mcpserver.tools.result_cache import (
+    ToolResultCache,
+    ToolResultCacheConfig,
+    ToolResultCacheMetrics,
+    cache_key,
+    is_cacheable,
+)
+from mcp.server.mcpserver.utilities.executors import Executor, default_executors
 from mcp.server.mcpserver.utilities.logging import get_logger
-from mcp.types import Icon, ToolAnnotations
+from mcp.server.mcpserver.utilities.pagination import Paginator
+from mcp.types import CallToolResult, ContentBlock, Icon, ToolAnnotations
 
 if TYPE_CHECKING:
     from mcp.server.context import LifespanContextT, RequestT
@@ -16,20 +27,44 @@ logger = get_logger(__name__)
 
 
 class ToolManager:
-    """Manages MCPServer tools."""
+    """Manages MCPServer tools.
+
+    With a `result_cache` configuration, results of tools annotated `readOnlyHint` or
+    `idempotentHint` are cached; `add_tool(cache=...)` configures any single tool.
+    Only calls made with `convert_result=True` use the cache.
+
+    Sync tools run on the executor named by `default_executor` unless `add_tool` picks
+    another. `executors` adds named executors to the built-in `"thread"` (anyio's
+    default thread limiter) and `"inline"` (the event loop).
+    """
 
     def __init__(
         self,
         warn_on_duplicate_tools: bool = True,
         *,
         tools: list[Tool] | None = None,
+        result_cache: ToolResultCacheConfig | None = None,
+        executors: Mapping[str, Executor] | None = None,
+        default_executor: str = "thread",
+        page_size: int | None = None,
     ):
         self._tools: dict[str, Tool] = {}
+        self._result_caches: dict[str, ToolResultCache] = {}
+        self._paginator: Paginator[Tool] = Paginator(page_size)
+        # Bumped whenever a tool is added or removed, so listings can be cached until then.
+        self.version = 0
+        self.result_cache = result_cache
+        self.executors = default_executors() | dict(executors or {})
+        self.default_executor = self.get_executor(default_executor)
         if tools is not None:
             for tool in tools:
                 if warn_on_duplicate_tools and tool.name in self._tools:
                     logger.warning(f"Tool already exists: {tool.name}")
+                if tool.executor is None:
+                    tool.executor = self.default_executor
                 self._tools[tool.name] = tool
+                self._paginator.added(tool.name)
+                self._configure_result_cache(tool, None)
 
         self.warn_on_duplicate_tools = warn_on_duplicate_tools
 
@@ -37,10 +72,26 @@ class ToolManager:
         """Get tool by name."""
         return self._tools.get(name)
 
+    def get_executor(self, executor: str | Executor) -> Executor:
+        """Resolve an executor name; executors themselves are returned as is."""
+        if isinstance(executor, Executor):
+            return executor
+        if executor not in self.executors:
+            raise ValueError(f"Unknown executor: {executor}")
+        return self.executors[executor]
+
     def list_tools(self) -> list[Tool]:
         """List all registered tools."""
         return list(self._tools.values())
 
+    def list_tools_page(self, cursor: str | None = None) -> tuple[list[Tool], str | None]:
+        """List a page of tools after `cursor`, with the cursor for the next page if there is one.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        return self._paginator.page(self._tools, self.version, cursor)
+
     def add_tool(
         self,
         fn: Callable[..., Any],
@@ -51,8 +102,15 @@ class ToolManager:
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        cache: ToolResultCacheConfig | None = None,
+        executor: str | Executor | None = None,
     ) -> Tool:
-        """Add a tool to the server."""
+        """Add a tool to the server.
+
+        `cache` caches the tool's results whatever its annotations say; without it the
+        manager's `result_cache` applies if the tool is annotated read-only or idempotent.
+        `executor` is an executor or the name of one; it defaults to `default_executor`.
+        """
         tool = Tool.from_function(
             fn,
             name=name,
@@ -62,6 +120,7 @@ class ToolManager:
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            executor=self.default_executor if executor is None else self.get_executor(executor),
         )
         existing = self._tools.get(tool.name)
         if existing:
@@ -69,6 +128,9 @@ class ToolManager:
                 logger.warning(f"Tool already exists: {tool.name}")
             return existing
         self._tools[tool.name] = tool
+        self._paginator.added(tool.name)
+        self._configure_result_cache(tool, cache)
+        self.version += 1
         return tool
 
     def remove_tool(self, name: str) -> None:
@@ -76,6 +138,9 @@ class ToolManager:
         if name not in self._tools:
             raise ToolError(f"Unknown tool: {name}")
         del self._tools[name]
+        self._paginator.removed(name)
+        self.version += 1
+        self._result_caches.pop(name, None)
 
     async def call_tool(
         self,
@@ -89,4 +154,73 @@ class ToolManager:
         if not tool:
             raise ToolError(f"Unknown tool: {name}")
 
-        return await tool.run(arguments, context=context, convert_result=convert_result)
+        cache = self._result_caches.get(name) if convert_result else None
+        key = cache_key(arguments) if cache is not None else None
+        if cache is None or key is None:
+            return await tool.run(arguments, context=context, convert_result=convert_result)
+
+        principal = _principal()
+        if principal is not None:
+            # Results are never served to another authenticated client, whatever the session
+            key = f"{principal}:{key}"
+        session = _session_of(context)
+        cached = cache.get(key, session)
+        if cached is not None:
+            return cached
+
+        # Store the final CallToolResult so a hit needs no conversion or output validation;
+        # structured output has already been validated against the tool's output model here.
+        result = _as_call_tool_result(await tool.run(arguments, context=context, convert_result=True))
+        if not result.is_error:
+            cache.put(key, result, session)
+        return result
+
+    def result_cache_metrics(self, name: str) -> ToolResultCacheMetrics | None:
+        """Counters for a tool's result cache, or None if its results are not cached."""
+        cache = self._result_caches.get(name)
+        return cache.metrics if cache is not None else None
+
+    def clear_result_cache(self, name: str | None = None) -> None:
+        """Forget cached results of the named tool, or of every tool."""
+        for tool_name, cache in self._result_caches.items():
+            if name is None or tool_name == name:
+                cache.clear()
+
+    def _configure_result_cache(self, tool: Tool, cache: ToolResultCacheConfig | None) -> None:
+        if cache is None and is_cacheable(tool.annotations):
+            cache = self.result_cache
+        if cache is not None:
+            # Tools that take a Context may answer each session differently
+            self._result_caches[tool.name] = ToolResultCache(cache, per_session=tool.context_kwarg is not None)
+        else:
+            self._result_caches.pop(tool.name, None)
+
+
+def _principal() -> str | None:
+    """A digest of the access token the current request was authenticated with, if any."""
+    # Only the auth middleware sets a token, so there is none until the HTTP stack is imported
+    if "mcp.server.auth.middleware.auth_context" not in sys.modules:  # pragma: lax no cover
+        return None
+    from mcp.server.auth.middleware.auth_context import get_access_token
+
+    token = get_access_token()
+    return hashlib.sha256(token.token.encode()).hexdigest() if token is not None else None
+
+
+def _session_of(context: Context[Any, Any] | None) -> Any:
+    if context is None:
+        return None
+    try:
+        return context.session
+    except ValueError:
+        return None
+
+
+def _as_call_tool_result(result: Any) -> CallToolResult:
+    """Build the CallToolResult the low-level server would make from a converted tool result."""
+    if isinstance(result, CallToolResult):
+        return result
+    if isinstance(result, tuple):
+        unstructured_content, structured_content = cast(tuple[Sequence[ContentBlock], dict[str, Any]], result)
+        return CallToolResult(content=list(unstructured_content), structured_content=structured_content, is_error=False)
+    return CallToolResult(content=list(cast(Sequence[ContentBlock], result)), is_error=False)
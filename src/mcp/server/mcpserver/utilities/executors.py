@@ -0,0 +1,210 @@
+"""Where MCPServer runs synchronous functions.
+
+Synchronous tools, resources, resource templates and prompts never run on the event
+loop unless asked to, since a blocking call there stalls every session. By default
+a synchronous function runs in a worker thread under anyio's default thread
+limiter, which is shared with everything else that calls `anyio.to_thread.run_sync`.
+A few slow blocking tools can use up its tokens and stall unrelated work, so tools
+can instead be given a dedicated thread limit, share a named `CapacityLimiter`, run
+on the event loop when they are cheap enough not to block it, or run in worker
+processes when they are CPU-bound. Only tools can run in worker processes.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import anyio
+import anyio.to_thread
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorMetrics:
+    """Saturation counters for one executor."""
+
+    active: int = 0
+    """Calls currently running."""
+
+    queued: int = 0
+    """Calls waiting for a free worker."""
+
+    max_queued: int = 0
+    """The most calls that have been waiting at once."""
+
+    completed: int = 0
+    """Calls that have finished, successfully or not."""
+
+
+class Executor(ABC):
+    """Runs synchronous functions for MCPServer and keeps `metrics` about them."""
+
+    def __init__(self) -> None:
+        self.metrics = ExecutorMetrics()
+
+    async def start(self) -> None:
+        """Prepare workers ahead of the first call; called when the server starts."""
+
+    @abstractmethod
+    async def run(self, fn: Callable[[], T]) -> T:
+        """Call `fn` and return its result."""
+
+
+class InlineExecutor(Executor):
+    """Calls functions directly on the event loop.
+
+    Only suitable for functions that return almost immediately: while one runs,
+    nothing else in the server makes progress.
+    """
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        self.metrics.active += 1
+        try:
+            return fn()
+        finally:
+            self.metrics.active -= 1
+            self.metrics.completed += 1
+
+
+class _LimitedExecutor(Executor):
+    """Runs calls on workers, at most as many at once as its limiter allows."""
+
+    def __init__(self, max_workers: int | None = None, *, limiter: anyio.CapacityLimiter | None = None) -> None:
+        super().__init__()
+        if max_workers is not None and limiter is not None:
+            raise ValueError("Cannot specify both max_workers and limiter")
+        if max_workers is not None:
+            if max_workers < 1:
+                raise ValueError("max_workers must be at least 1")
+            limiter = anyio.CapacityLimiter(max_workers)
+        self._limiter = limiter
+        # Calls already hold a token of `limiter` when they hand work to anyio
+        self._unlimited = anyio.CapacityLimiter(math.inf)
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        """The limiter that bounds how many calls run at once."""
+        return self._limiter if self._limiter is not None else self._default_limiter()
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        metrics = self.metrics
+        limiter = self.limiter
+        try:
+            limiter.acquire_nowait()
+        except anyio.WouldBlock:
+            metrics.queued += 1
+            metrics.max_queued = max(metrics.max_queued, metrics.queued)
+            try:
+                await limiter.acquire()
+            finally:
+                metrics.queued -= 1
+        metrics.active += 1
+        try:
+            return await self._call(fn)
+        finally:
+            metrics.active -= 1
+            metrics.completed += 1
+            limiter.release()
+
+    @abstractmethod
+    def _default_limiter(self) -> anyio.CapacityLimiter:
+        """The limiter to use when given neither `max_workers` nor `limiter`."""
+
+    @abstractmethod
+    async def _call(self, fn: Callable[[], T]) -> T:
+        """Call `fn` on a worker; the caller already holds a token of `limiter`."""
+
+
+class ThreadExecutor(_LimitedExecutor):
+    """Calls functions in worker threads, at most as many at once as its limiter allows.
+
+    Args:
+        max_workers: Give this executor its own limit of concurrent threads.
+        limiter: Share an existing `CapacityLimiter`, e.g. between executors of related tools.
+
+    With neither, anyio's default thread limiter is used, as `anyio.to_thread.run_sync` does.
+    """
+
+    def _default_limiter(self) -> anyio.CapacityLimiter:
+        return anyio.to_thread.current_default_thread_limiter()
+
+    async def _call(self, fn: Callable[[], T]) -> T:
+        return await anyio.to_thread.run_sync(fn, limiter=self._unlimited)
+
+
+class ProcessExecutor(_LimitedExecutor):
+    """Calls functions in worker processes, for CPU-bound work that would hold the GIL.
+
+    Functions and their arguments are pickled, so they must be importable at module
+    level, and a tool running here cannot take a `Context`. Cancelling a call kills
+    the worker process running it. Worker processes come from anyio's process pool,
+    which keeps idle workers for a few minutes before retiring them.
+
+    Args:
+        max_workers: Give this executor its own limit of concurrent processes.
+        limiter: Share an existing `CapacityLimiter`.
+        warm_up: Worker processes to start in `start`, so the first calls do not pay
+            for starting an interpreter.
+
+    With neither `max_workers` nor `limiter`, anyio's default process limiter (one
+    process per CPU) is used.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, *, limiter: anyio.CapacityLimiter | None = None, warm_up: int = 0
+    ) -> None:
+        super().__init__(max_workers, limiter=limiter)
+        if warm_up < 0:
+            raise ValueError("warm_up must not be negative")
+        self.warm_up = warm_up
+        self._warmed_up = False
+
+    async def start(self) -> None:
+        if self._warmed_up or not self.warm_up:
+            return
+        self._warmed_up = True
+        # Concurrent calls each need a worker, so the pool grows to `warm_up` processes
+        workers = min(self.warm_up, int(self.limiter.total_tokens))
+        async with anyio.create_task_group() as tg:
+            for _ in range(workers):
+                tg.start_soon(self._call, os.getpid)
+
+    def _default_limiter(self) -> anyio.CapacityLimiter:
+        import anyio.to_process
+
+        return anyio.to_process.current_default_process_limiter()
+
+    async def _call(self, fn: Callable[[], T]) -> T:
+        import anyio.to_process
+
+        return await anyio.to_process.run_sync(fn, cancellable=True, limiter=self._unlimited)
+
+
+def is_async_callable(obj: Any) -> bool:
+    """Whether calling `obj` returns a coroutine, so it can run on the event loop."""
+    while isinstance(obj, functools.partial):  # pragma: lax no cover
+        obj = obj.func
+
+    return inspect.iscoroutinefunction(obj) or (
+        callable(obj) and inspect.iscoroutinefunction(getattr(obj, "__call__", None))
+    )
+
+
+async def run_sync(fn: Callable[[], T], executor: Executor | None = None) -> T:
+    """Call the synchronous `fn` on `executor`, or in anyio's default thread pool without one."""
+    if executor is not None:
+        return await executor.run(fn)
+    return await anyio.to_thread.run_sync(fn)
+
+
+def default_executors() -> dict[str, Executor]:
+    """The executors every MCPServer can refer to by name."""
+    return {"thread": ThreadExecutor(), "inline": InlineExecutor(), "process": ProcessExecutor()}
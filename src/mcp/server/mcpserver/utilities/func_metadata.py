@@ -6,11 +6,8 @@ from itertools import chain
 from types import GenericAlias
 from typing import Annotated, Any, cast, get_args, get_origin, get_type_hints
 
-import anyio
-import anyio.to_thread
 import pydantic_core
-from pydantic import BaseModel, ConfigDict, Field, WithJsonSchema, create_model
-from pydantic.fields import FieldInfo
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, WithJsonSchema, create_model
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaWarningKind
 from typing_extensions import is_typeddict
 from typing_inspection.introspection import (
@@ -22,6 +19,7 @@ from typing_inspection.introspection import (
 )
 
 from mcp.server.mcpserver.exceptions import InvalidSignature
+from mcp.server.mcpserver.utilities.executors import Executor, run_sync
 from mcp.server.mcpserver.utilities.logging import get_logger
 from mcp.server.mcpserver.utilities.types import Audio, Image
 from mcp.types import CallToolResult, ContentBlock, TextContent
@@ -59,11 +57,70 @@ class ArgModelBase(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class ArgumentBinder:
+    """Turns raw tool arguments into keyword arguments for a function.
+
+    Everything that depends only on the argument model is worked out once: which
+    input keys may carry JSON inside a string, and which keyword each field is
+    passed as.
+    """
+
+    __slots__ = ("_arg_model", "_json_keys", "_kwarg_names", "_renamed")
+
+    def __init__(self, arg_model: type[ArgModelBase]) -> None:
+        self._arg_model = arg_model
+        json_keys: set[str] = set()
+        kwarg_names: list[tuple[str, str]] = []
+        for field_name, field_info in arg_model.model_fields.items():
+            # Arguments are accepted under both the field name and its alias
+            if field_info.annotation is not str:
+                json_keys.add(field_name)
+                if field_info.alias:
+                    json_keys.add(field_info.alias)
+            kwarg_names.append((field_name, field_info.alias or field_name))
+        self._json_keys = frozenset(json_keys)
+        self._kwarg_names = tuple(kwarg_names)
+        self._renamed = any(field_name != kwarg for field_name, kwarg in kwarg_names)
+
+    def pre_parse_json(self, data: dict[str, Any]) -> dict[str, Any]:
+        """See `FuncMetadata.pre_parse_json`; returns `data` itself when nothing needs parsing."""
+        new_data: dict[str, Any] | None = None
+        for data_key, data_value in data.items():
+            # Parsed strings and numbers are discarded (`"hello"` should stay `'"hello"'`), so only
+            # strings that could hold an array, an object or null are worth parsing
+            if not (
+                isinstance(data_value, str)
+                and data_key in self._json_keys
+                and data_value.lstrip(" \t\n\r")[:1] in ("[", "{", "n")
+            ):
+                continue
+            try:
+                pre_parsed = json.loads(data_value)
+            except json.JSONDecodeError:
+                continue  # Not JSON - skip
+            if new_data is None:
+                new_data = data.copy()
+            new_data[data_key] = pre_parsed
+        return data if new_data is None else new_data
+
+    def bind(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Pre-parse and validate `arguments`, returning the keyword arguments for the function."""
+        model = self._arg_model.model_validate(self.pre_parse_json(arguments))
+        if not self._renamed:
+            # Without aliases the model's fields are exactly the function's keyword arguments
+            return model.__dict__.copy()
+        return {kwarg: getattr(model, field_name) for field_name, kwarg in self._kwarg_names}
+
+
 class FuncMetadata(BaseModel):
     arg_model: Annotated[type[ArgModelBase], WithJsonSchema(None)]
     output_schema: dict[str, Any] | None = None
     output_model: Annotated[type[BaseModel], WithJsonSchema(None)] | None = None
     wrap_output: bool = False
+    _binder: ArgumentBinder = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._binder = ArgumentBinder(self.arg_model)
 
     async def call_fn_with_arg_validation(
         self,
@@ -71,22 +128,22 @@ class FuncMetadata(BaseModel):
         fn_is_async: bool,
         arguments_to_validate: dict[str, Any],
         arguments_to_pass_directly: dict[str, Any] | None,
+        executor: Executor | None = None,
     ) -> Any:
         """Call the given function with arguments validated and injected.
 
         Arguments are first attempted to be parsed from JSON, then validated against
-        the argument model, before being passed to the function.
+        the argument model, before being passed to the function. A sync function runs
+        on `executor`, or in anyio's default thread pool without one.
         """
-        arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
-        arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
-        arguments_parsed_dict = arguments_parsed_model.model_dump_one_level()
-
-        arguments_parsed_dict |= arguments_to_pass_directly or {}
+        arguments_parsed_dict = self._binder.bind(arguments_to_validate)
+        if arguments_to_pass_directly:
+            arguments_parsed_dict |= arguments_to_pass_directly
 
         if fn_is_async:
             return await fn(**arguments_parsed_dict)
         else:
-            return await anyio.to_thread.run_sync(functools.partial(fn, **arguments_parsed_dict))
+            return await run_sync(functools.partial(fn, **arguments_parsed_dict), executor)
 
     def convert_result(self, result: Any) -> Any:
         """Convert the result of a function call to the appropriate format for
@@ -134,34 +191,7 @@ class FuncMetadata(BaseModel):
         it seems incapable of NOT doing this. For sub-models, it tends to pass
         dicts (JSON objects) as JSON strings, which can be pre-parsed here.
         """
-        new_data = data.copy()  # Shallow copy
-
-        # Build a mapping from input keys (including aliases) to field info
-        key_to_field_info: dict[str, FieldInfo] = {}
-        for field_name, field_info in self.arg_model.model_fields.items():
-            # Map both the field name and its alias (if any) to the field info
-            key_to_field_info[field_name] = field_info
-            if field_info.alias:
-                key_to_field_info[field_info.alias] = field_info
-
-        for data_key, data_value in data.items():
-            if data_key not in key_to_field_info:  # pragma: no cover
-                continue
-
-            field_info = key_to_field_info[data_key]
-            if isinstance(data_value, str) and field_info.annotation is not str:
-                try:
-                    pre_parsed = json.loads(data_value)
-                except json.JSONDecodeError:
-                    continue  # Not JSON - skip
-                if isinstance(pre_parsed, str | int | float):
-                    # This is likely that the raw value is e.g. `"hello"` which we
-                    # Should really be parsed as '"hello"' in Python - but if we parse
-                    # it as JSON it'll turn into just 'hello'. So we skip it.
-                    continue
-                new_data[data_key] = pre_parsed
-        assert new_data.keys() == data.keys()
-        return new_data
+        return self._binder.pre_parse_json(data)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -0,0 +1,79 @@
+"""Cursor pagination over MCPServer's registries of tools, resources and prompts."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from bisect import bisect_right
+from collections.abc import Mapping
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def encode_cursor(position: int) -> str:
+    return base64.urlsafe_b64encode(str(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Return the position a cursor points after.
+
+    Raises:
+        ValueError: If the cursor was not issued by `encode_cursor`.
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+class Paginator(Generic[T]):
+    """Pages through a registry in the order its entries were added.
+
+    Every key gets a position when it is first added, and positions are never reused.
+    A cursor records the position of the last entry on its page, so the next page
+    starts right after it even if entries were added or removed in between: nothing
+    is skipped or repeated, and new entries show up on the last page.
+
+    Args:
+        page_size: Entries per page. None puts everything on one page.
+    """
+
+    def __init__(self, page_size: int | None = None) -> None:
+        if page_size is not None and page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.page_size = page_size
+        self._positions: dict[str, int] = {}
+        self._next_position = 0
+        self._index: tuple[int, list[int], list[T]] | None = None
+
+    def added(self, key: str) -> None:
+        """Record that `key` was added; a key that is only replaced keeps its position."""
+        if key not in self._positions:
+            self._positions[key] = self._next_position
+            self._next_position += 1
+
+    def removed(self, key: str) -> None:
+        self._positions.pop(key, None)
+
+    def page(self, entries: Mapping[str, T], version: int, cursor: str | None = None) -> tuple[list[T], str | None]:
+        """Return the page of `entries` after `cursor`, and the cursor for the page after it.
+
+        `entries` must iterate in the order its keys were added, as a dict does, and
+        `version` must change whenever it does, so the index can be reused until then.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        start_after = decode_cursor(cursor) if cursor is not None else -1
+        if self.page_size is None and cursor is None:
+            return list(entries.values()), None
+
+        if self._index is None or self._index[0] != version:
+            self._index = (version, [self._positions[key] for key in entries], list(entries.values()))
+        _, positions, values = self._index
+
+        start = bisect_right(positions, start_after)
+        end = len(values) if self.page_size is None else start + self.page_size
+        next_cursor = encode_cursor(positions[end - 1]) if end < len(values) else None
+        return values[start:end], next_cursor
@@ -36,6 +36,7 @@ The ServerSession class is typically used internally by the Server class and sho
 be instantiated directly by users of the MCP framework.
 """
 
+from collections.abc import Callable
 from enum import Enum
 from typing import Any, TypeVar, overload
 
@@ -99,6 +100,8 @@ class ServerSession(
         )
 
         self._init_options = init_options
+        self._tool_list_changed_callbacks: list[Callable[[], None]] = []
+        self._resource_updated_callbacks: list[Callable[[str], None]] = []
         self._incoming_message_stream_writer, self._incoming_message_stream_reader = anyio.create_memory_object_stream[
             ServerRequestResponder
         ](0)
@@ -230,8 +233,10 @@ class ServerSession(
             related_request_id,
         )
 
-    async def send_resource_updated(self, uri: str | AnyUrl) -> None:  # pragma: no cover
+    async def send_resource_updated(self, uri: str | AnyUrl) -> None:
         """Send a resource updated notification."""
+        for callback in self._resource_updated_callbacks:
+            callback(str(uri))
         await self.send_notification(
             types.ResourceUpdatedNotification(
                 params=types.ResourceUpdatedNotificationParams(uri=str(uri)),
@@ -486,8 +491,24 @@ class ServerSession(
         """Send a resource list changed notification."""
         await self.send_notification(types.ResourceListChangedNotification())
 
-    async def send_tool_list_changed(self) -> None:  # pragma: no cover
+    def add_tool_list_changed_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback that `send_tool_list_changed` runs before notifying the client.
+
+        The low-level server uses this to drop its cached tool definitions.
+        """
+        self._tool_list_changed_callbacks.append(callback)
+
+    def add_resource_updated_callback(self, callback: Callable[[str], None]) -> None:
+        """Register a callback that `send_resource_updated` runs with the URI before notifying the client.
+
+        MCPServer uses this to drop cached contents of the resource.
+        """
+        self._resource_updated_callbacks.append(callback)
+
+    async def send_tool_list_changed(self) -> None:
         """Send a tool list changed notification."""
+        for callback in self._tool_list_changed_callbacks:
+            callback()
         await self.send_notification(types.ToolListChangedNotification())
 
     async def send_prompt_list_changed(self) -> None:  # pragma: no cover
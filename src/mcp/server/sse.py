@@ -44,17 +44,16 @@ from uuid import UUID, uuid4
 
 import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
-from mcp import types
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -75,7 +74,12 @@ class SseServerTransport:
     _read_stream_writers: dict[UUID, MemoryObjectSendStream[SessionMessage | Exception]]
     _security: TransportSecurityMiddleware
 
-    def __init__(self, endpoint: str, security_settings: TransportSecuritySettings | None = None) -> None:
+    def __init__(
+        self,
+        endpoint: str,
+        security_settings: TransportSecuritySettings | None = None,
+        codec: Codec = DEFAULT_CODEC,
+    ) -> None:
         """Creates a new SSE server transport, which will direct the client to POST
         messages to the relative path given.
 
@@ -83,6 +87,7 @@ class SseServerTransport:
             endpoint: A relative path where messages should be posted
                     (e.g., "/messages/").
             security_settings: Optional security settings for DNS rebinding protection.
+            codec: Codec used to encode and decode messages on the wire.
 
         Note:
             We use relative paths instead of full URLs for several reasons:
@@ -113,6 +118,7 @@ class SseServerTransport:
         self._endpoint = endpoint
         self._read_stream_writers = {}
         self._security = TransportSecurityMiddleware(security_settings)
+        self._codec = codec
         logger.debug(f"SseServerTransport initialized with endpoint: {endpoint}")
 
     @asynccontextmanager
@@ -157,7 +163,7 @@ class SseServerTransport:
         # This is the URI (path + query) the client will use to POST messages.
         client_post_uri_data = f"{quote(full_message_path_for_client)}?session_id={session_id.hex}"
 
-        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, Any]](0)
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, Any] | bytes](0)
 
         async def sse_writer():
             logger.debug("Starting SSE writer")
@@ -166,13 +172,8 @@ class SseServerTransport:
                 logger.debug(f"Sent endpoint event: {client_post_uri_data}")
 
                 async for session_message in write_stream_reader:
-                    logger.debug(f"Sending message via SSE: {session_message}")
-                    await sse_stream_writer.send(
-                        {
-                            "event": "message",
-                            "data": session_message.message.model_dump_json(by_alias=True, exclude_none=True),
-                        }
-                    )
+                    logger.debug("Sending message via SSE: %s", session_message)
+                    await sse_stream_writer.send(_message_event(self._codec.encode_session_message(session_message)))
 
         async with anyio.create_task_group() as tg:
 
@@ -224,12 +225,12 @@ class SseServerTransport:
             return await response(scope, receive, send)
 
         body = await request.body()
-        logger.debug(f"Received JSON: {body}")
+        logger.debug("Received JSON: %s", body)
 
         try:
-            message = types.jsonrpc_message_adapter.validate_json(body, by_name=False)
-            logger.debug(f"Validated client message: {message}")
-        except ValidationError as err:
+            message = self._codec.decode(body)
+            logger.debug("Validated client message: %s", message)
+        except ValueError as err:
             logger.exception("Failed to parse message")
             response = Response("Could not parse message", status_code=400)
             await response(scope, receive, send)
@@ -239,7 +240,15 @@ class SseServerTransport:
         # Pass the ASGI scope for framework-agnostic access to request data
         metadata = ServerMessageMetadata(request_context=request)
         session_message = SessionMessage(message, metadata=metadata)
-        logger.debug(f"Sending session message to writer: {session_message}")
+        logger.debug("Sending session message to writer: %s", session_message)
         response = Response("Accepted", status_code=202)
         await response(scope, receive, send)
         await writer.send(session_message)
+
+
+def _message_event(data: bytes) -> dict[str, Any] | bytes:
+    """Frame an encoded message as a `message` event, writing its bytes as they are."""
+    if b"\r" in data or b"\n" in data:
+        # A codec that pretty-prints needs each line sent as a `data:` field of its own
+        return {"event": "message", "data": data.decode()}
+    return b"event: message\r\ndata: " + data + b"\r\n\r\n"
@@ -25,12 +25,16 @@ import anyio
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
-from mcp import types
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import SessionMessage
 
 
 @asynccontextmanager
-async def stdio_server(stdin: anyio.AsyncFile[str] | None = None, stdout: anyio.AsyncFile[str] | None = None):
+async def stdio_server(
+    stdin: anyio.AsyncFile[str] | None = None,
+    stdout: anyio.AsyncFile[str] | None = None,
+    codec: Codec = DEFAULT_CODEC,
+):
     """Server transport for stdio: this communicates with an MCP client by reading
     from the current process' stdin and writing to stdout.
     """
@@ -40,8 +44,9 @@ async def stdio_server(stdin: anyio.AsyncFile[str] | None = None, stdout: anyio.
     # re-wrap the underlying binary stream to ensure UTF-8.
     if not stdin:
         stdin = anyio.wrap_file(TextIOWrapper(sys.stdin.buffer, encoding="utf-8"))
-    if not stdout:
-        stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+    # Codecs encode to UTF-8 already, so messages go to stdout's binary buffer as they
+    # are; only a text stream passed in has them decoded.
+    binary_stdout = anyio.wrap_file(sys.stdout.buffer) if not stdout else None
 
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
@@ -57,7 +62,7 @@ async def stdio_server(stdin: anyio.AsyncFile[str] | None = None, stdout: anyio.
             async with read_stream_writer:
                 async for line in stdin:
                     try:
-                        message = types.jsonrpc_message_adapter.validate_json(line, by_name=False)
+                        message = codec.decode(line)
                     except Exception as exc:  # pragma: no cover
                         await read_stream_writer.send(exc)
                         continue
@@ -71,9 +76,14 @@ async def stdio_server(stdin: anyio.AsyncFile[str] | None = None, stdout: anyio.
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await stdout.write(json + "\n")
-                    await stdout.flush()
+                    line = codec.encode_session_message(session_message) + b"\n"
+                    if binary_stdout is not None:
+                        await binary_stdout.write(line)
+                        await binary_stdout.flush()
+                    else:
+                        assert stdout is not None
+                        await stdout.write(line.decode())
+                        await stdout.flush()
         except anyio.ClosedResourceError:  # pragma: no cover
             await anyio.lowlevel.checkpoint()
 
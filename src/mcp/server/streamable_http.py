@@ -16,7 +16,6 @@ from http import HTTPStatus
 from typing import Any
 
 import anyio
-import pydantic_core
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
@@ -25,7 +24,8 @@ from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
 from mcp.server.transport_security import TransportSecurityMiddleware, TransportSecuritySettings
-from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.codec import DEFAULT_CODEC, Codec, is_batch
+from mcp.shared.message import EncodedSessionMessage, ServerMessageMetadata, SessionMessage
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types import (
     DEFAULT_NEGOTIATED_VERSION,
@@ -39,7 +39,6 @@ from mcp.types import (
     JSONRPCRequest,
     JSONRPCResponse,
     RequestId,
-    jsonrpc_message_adapter,
 )
 
 logger = logging.getLogger(__name__)
@@ -74,6 +73,41 @@ class EventMessage:
     event_id: str | None = None
 
 
+class _EncodedEventMessage(EventMessage):
+    """An EventMessage for a response encoded straight from its result model.
+
+    The response model is only built if something asks for it.
+    """
+
+    def __init__(self, source: EncodedSessionMessage, event_id: str | None = None) -> None:
+        self.source = source
+        self.event_id = event_id
+
+    @property
+    def message(self) -> JSONRPCResponse:  # type: ignore[reportIncompatibleVariableOverride]
+        return self.source.message
+
+
+def _is_response(event_message: EventMessage) -> bool:
+    return isinstance(event_message, _EncodedEventMessage) or isinstance(
+        event_message.message, JSONRPCResponse | JSONRPCError
+    )
+
+
+def _wire_payload(codec: Codec, event_message: EventMessage) -> bytes:
+    """Encode the message of an event, a response straight from its result model."""
+    if isinstance(event_message, _EncodedEventMessage):
+        return codec.encode_session_message(event_message.source)
+    return codec.encode(event_message.message)
+
+
+def _is_parse_error(exc: ValueError) -> bool:
+    """Whether a codec failed because the body was not JSON, rather than not a JSON-RPC message."""
+    if isinstance(exc, ValidationError):
+        return any(error["type"] == "json_invalid" for error in exc.errors())
+    return True
+
+
 EventCallback = Callable[[EventMessage], Awaitable[None]]
 
 
@@ -132,6 +166,7 @@ class StreamableHTTPServerTransport:
         event_store: EventStore | None = None,
         security_settings: TransportSecuritySettings | None = None,
         retry_interval: int | None = None,
+        codec: Codec = DEFAULT_CODEC,
     ) -> None:
         """Initialize a new StreamableHTTP server transport.
 
@@ -148,6 +183,7 @@ class StreamableHTTPServerTransport:
                            retry field. When set, the server will send a retry field in
                            SSE priming events to control client reconnection timing for
                            polling behavior. Only used when event_store is provided.
+            codec: Codec used to encode and decode messages on the wire.
 
         Raises:
             ValueError: If the session ID contains invalid characters.
@@ -160,6 +196,7 @@ class StreamableHTTPServerTransport:
         self._event_store = event_store
         self._security = TransportSecurityMiddleware(security_settings)
         self._retry_interval = retry_interval
+        self._codec = codec
         self._request_streams: dict[
             RequestId,
             tuple[
@@ -303,18 +340,18 @@ class StreamableHTTPServerTransport:
         )
 
         return Response(
-            error_response.model_dump_json(by_alias=True, exclude_none=True),
+            self._codec.encode(error_response),
             status_code=status_code,
             headers=response_headers,
         )
 
     def _create_json_response(
         self,
-        response_message: JSONRPCMessage | None,
+        response_message: JSONRPCMessage | bytes | None,
         status_code: HTTPStatus = HTTPStatus.OK,
         headers: dict[str, str] | None = None,
     ) -> Response:
-        """Create a JSON response from a JSONRPCMessage"""
+        """Create a JSON response from a JSONRPCMessage or its pre-encoded bytes"""
         response_headers = {"Content-Type": CONTENT_TYPE_JSON}
         if headers:  # pragma: lax no cover
             response_headers.update(headers)
@@ -322,25 +359,28 @@ class StreamableHTTPServerTransport:
         if self.mcp_session_id:  # pragma: lax no cover
             response_headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
 
-        return Response(
-            response_message.model_dump_json(by_alias=True, exclude_none=True) if response_message else None,
-            status_code=status_code,
-            headers=response_headers,
-        )
+        if isinstance(response_message, bytes):
+            content = response_message
+        else:
+            content = self._codec.encode(response_message) if response_message else None
+        return Response(content, status_code=status_code, headers=response_headers)
+
+    def _create_decode_error_response(self, exc: ValueError) -> Response:
+        """Create the error response for a body the codec could not decode."""
+        if _is_parse_error(exc):
+            return self._create_error_response(f"Parse error: {str(exc)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
+        return self._create_error_response(f"Validation error: {str(exc)}", HTTPStatus.BAD_REQUEST, INVALID_PARAMS)
 
     def _get_session_id(self, request: Request) -> str | None:  # pragma: no cover
         """Extract the session ID from request headers."""
         return request.headers.get(MCP_SESSION_ID_HEADER)
 
-    def _create_event_data(self, event_message: EventMessage) -> dict[str, str]:  # pragma: no cover
+    def _create_event_data(self, event_message: EventMessage) -> dict[str, str]:
         """Create event data dictionary from an EventMessage."""
-        event_data = {
-            "event": "message",
-            "data": event_message.message.model_dump_json(by_alias=True, exclude_none=True),
-        }
+        event_data = {"event": "message", "data": _wire_payload(self._codec, event_message).decode()}
 
         # If an event ID was provided, include it
-        if event_message.event_id:
+        if event_message.event_id:  # pragma: lax no cover
             event_data["id"] = event_message.event_id
 
         return event_data
@@ -449,21 +489,14 @@ class StreamableHTTPServerTransport:
             # Parse the body - only read it once
             body = await request.body()
 
-            try:
-                raw_message = pydantic_core.from_json(body)
-            except ValueError as e:
-                response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
-                await response(scope, receive, send)
+            if is_batch(body):
+                await self._handle_batch_post_request(scope, request, body, writer, send)
                 return
 
             try:
-                message = jsonrpc_message_adapter.validate_python(raw_message, by_name=False)
-            except ValidationError as e:  # pragma: no cover
-                response = self._create_error_response(
-                    f"Validation error: {str(e)}",
-                    HTTPStatus.BAD_REQUEST,
-                    INVALID_PARAMS,
-                )
+                message = self._codec.decode(body)
+            except ValueError as e:
+                response = self._create_decode_error_response(e)
                 await response(scope, receive, send)
                 return
 
@@ -526,17 +559,17 @@ class StreamableHTTPServerTransport:
                 try:
                     # Process messages from the request-specific stream
                     # We need to collect all messages until we get a response
-                    response_message = None
+                    response_message: JSONRPCMessage | bytes | None = None
 
                     # Use similar approach to SSE writer for consistency
                     async for event_message in request_stream_reader:  # pragma: no branch
                         # If it's a response, this is what we're waiting for
-                        if isinstance(event_message.message, JSONRPCResponse | JSONRPCError):
-                            response_message = event_message.message
+                        if _is_response(event_message):
+                            response_message = _wire_payload(self._codec, event_message)
                             break
                         # For notifications and request, keep waiting
                         else:  # pragma: no cover
-                            logger.debug(f"received: {event_message.message.method}")
+                            logger.debug("received: %s", event_message.message)
 
                     # At this point we should have a response
                     if response_message:
@@ -582,7 +615,7 @@ class StreamableHTTPServerTransport:
                                 await sse_stream_writer.send(event_data)
 
                                 # If response, remove from pending streams and close
-                                if isinstance(event_message.message, JSONRPCResponse | JSONRPCError):
+                                if _is_response(event_message):
                                     break
                     except anyio.ClosedResourceError:
                         # Expected when close_sse_stream() is called
@@ -635,6 +668,172 @@ class StreamableHTTPServerTransport:
                 await writer.send(Exception(err))
             return
 
+    async def _handle_batch_post_request(
+        self,
+        scope: Scope,
+        request: Request,
+        body: bytes,
+        writer: MemoryObjectSendStream[SessionMessage | Exception],
+        send: Send,
+    ) -> None:
+        """Handle a POST whose body is a JSON-RPC batch.
+
+        Every message in the batch is handed to the server before any response is
+        awaited, so the requests are processed concurrently. The responses are sent
+        back as one JSON array in request order, or multiplexed onto a single SSE stream.
+        """
+        try:
+            messages = self._codec.decode_batch(body)
+        except ValueError as e:
+            response = self._create_decode_error_response(e)
+            await response(scope, request.receive, send)
+            return
+
+        if any(isinstance(message, JSONRPCRequest) and message.method == "initialize" for message in messages):
+            response = self._create_error_response(
+                "Invalid Request: initialize must not be part of a batch",
+                HTTPStatus.BAD_REQUEST,
+            )
+            await response(scope, request.receive, send)
+            return
+
+        if not await self._validate_request_headers(request, send):  # pragma: no cover
+            return
+
+        request_ids = [str(message.id) for message in messages if isinstance(message, JSONRPCRequest)]
+        if len(set(request_ids)) != len(request_ids) or any(rid in self._request_streams for rid in request_ids):
+            response = self._create_error_response(
+                "Invalid Request: request IDs in a batch must be unique",
+                HTTPStatus.BAD_REQUEST,
+            )
+            await response(scope, request.receive, send)
+            return
+
+        metadata = ServerMessageMetadata(request_context=request)
+
+        async def dispatch() -> None:
+            for message in messages:
+                await writer.send(SessionMessage(message, metadata=metadata))
+
+        # A batch of notifications and responses only gets 202 Accepted, like a single one
+        if not request_ids:
+            response = self._create_json_response(None, HTTPStatus.ACCEPTED)
+            await response(scope, request.receive, send)
+            await dispatch()
+            return
+
+        for request_id in request_ids:
+            self._request_streams[request_id] = anyio.create_memory_object_stream[EventMessage](0)
+
+        if self.is_json_response_enabled:
+            await self._send_batch_json_response(scope, request, request_ids, dispatch, send)
+        else:
+            ids = {str(message.id): message.id for message in messages if isinstance(message, JSONRPCRequest)}
+            await self._send_batch_sse_response(scope, request, ids, dispatch, send)
+
+    async def _send_batch_json_response(
+        self,
+        scope: Scope,
+        request: Request,
+        request_ids: list[str],
+        dispatch: Callable[[], Awaitable[None]],
+        send: Send,
+    ) -> None:
+        """Wait for the response to every request in a batch and send them as one JSON array."""
+        responses: dict[str, JSONRPCMessage | bytes] = {}
+
+        async def collect(request_id: str) -> None:
+            async for event_message in self._request_streams[request_id][1]:  # pragma: no branch
+                if _is_response(event_message):
+                    responses[request_id] = _wire_payload(self._codec, event_message)
+                    break
+                logger.debug("received: %s", event_message.message)  # pragma: no cover
+
+        try:
+            async with anyio.create_task_group() as tg:
+                for request_id in request_ids:
+                    tg.start_soon(collect, request_id)
+                await dispatch()
+        finally:
+            for request_id in request_ids:
+                await self._clean_up_memory_streams(request_id)
+
+        if len(responses) == len(request_ids):
+            response = self._create_json_response(self._codec.encode_batch([responses[rid] for rid in request_ids]))
+        else:  # pragma: no cover
+            logger.error("Batch request streams closed before every response was received")
+            response = self._create_error_response(
+                "Error processing request: No response received",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+        await response(scope, request.receive, send)
+
+    async def _send_batch_sse_response(
+        self,
+        scope: Scope,
+        request: Request,
+        request_ids: dict[str, RequestId],
+        dispatch: Callable[[], Awaitable[None]],
+        send: Send,
+    ) -> None:
+        """Multiplex the events of every request in a batch onto one SSE stream.
+
+        The stream ends once every request has been answered. A request that cannot be
+        answered, because the batch could not be handed to the server in full or its
+        events could not be sent, gets an error response of its own rather than none.
+        Priming events are not sent, so batched requests cannot be resumed individually
+        with Last-Event-ID.
+        """
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+
+        async def send_error(request_id: str, message: str) -> None:
+            error = JSONRPCError(
+                jsonrpc="2.0", id=request_ids[request_id], error=ErrorData(code=INTERNAL_ERROR, message=message)
+            )
+            await sse_stream_writer.send(self._create_event_data(EventMessage(error)))
+
+        async def forward(request_id: str) -> None:
+            request_stream_reader = self._request_streams[request_id][1]
+            try:
+                async with request_stream_reader:
+                    async for event_message in request_stream_reader:
+                        await sse_stream_writer.send(self._create_event_data(event_message))
+                        if _is_response(event_message):
+                            return
+                await send_error(request_id, "Error processing request: No response received")
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):  # pragma: no cover
+                logger.debug("Batch SSE stream closed")
+            except Exception as e:
+                logger.exception(f"Error sending events for batched request {request_id}")
+                await send_error(request_id, f"Error processing request: {e}")
+            finally:
+                await self._clean_up_memory_streams(request_id)
+
+        async def sse_writer():
+            async with sse_stream_writer, anyio.create_task_group() as tg:
+                for request_id in request_ids:
+                    tg.start_soon(forward, request_id)
+
+        headers = {
+            "Cache-Control": "no-cache, no-transform",
+            "Connection": "keep-alive",
+            "Content-Type": CONTENT_TYPE_SSE,
+            **({MCP_SESSION_ID_HEADER: self.mcp_session_id} if self.mcp_session_id else {}),
+        }
+        response = EventSourceResponse(content=sse_stream_reader, data_sender_callable=sse_writer, headers=headers)
+
+        async with sse_stream_reader, anyio.create_task_group() as tg:
+            tg.start_soon(response, scope, request.receive, send)
+            try:
+                await dispatch()
+            except Exception:
+                logger.exception("Error handing batch to the server")
+                # The server stopped taking messages, so responses may never come: ending
+                # the streams of requests not answered yet has each answered with an error
+                for request_id in request_ids:
+                    if (streams := self._request_streams.get(request_id)) is not None:  # pragma: no branch
+                        streams[0].close()
+
     async def _handle_get_request(self, request: Request, send: Send) -> None:  # pragma: no cover
         """Handle GET request to establish SSE.
 
@@ -971,11 +1170,13 @@ class StreamableHTTPServerTransport:
                 try:
                     async for session_message in write_stream_reader:  # pragma: no branch
                         # Determine which request stream(s) should receive this message
-                        message = session_message.message
                         target_request_id = None
-                        # Check if this is a response
-                        if isinstance(message, JSONRPCResponse | JSONRPCError):
-                            response_id = str(message.id)
+                        # Check if this is a response; pre-encoded responses carry their ID
+                        # alongside the bytes so routing does not have to decode them.
+                        if isinstance(session_message, EncodedSessionMessage):
+                            target_request_id = str(session_message.request_id)
+                        elif isinstance(session_message.message, JSONRPCResponse | JSONRPCError):
+                            response_id = str(session_message.message.id)
                             # If this response is for an existing request stream,
                             # send it there
                             target_request_id = response_id
@@ -997,13 +1198,17 @@ class StreamableHTTPServerTransport:
                         # messages will be replayed on the re-connect
                         event_id = None
                         if self._event_store:  # pragma: lax no cover
-                            event_id = await self._event_store.store_event(request_stream_id, message)
+                            event_id = await self._event_store.store_event(request_stream_id, session_message.message)
                             logger.debug(f"Stored {event_id} from {request_stream_id}")
 
                         if request_stream_id in self._request_streams:
                             try:
                                 # Send both the message and the event ID
-                                await self._request_streams[request_stream_id][0].send(EventMessage(message, event_id))
+                                if isinstance(session_message, EncodedSessionMessage):
+                                    event_message = _EncodedEventMessage(session_message, event_id)
+                                else:
+                                    event_message = EventMessage(session_message.message, event_id)
+                                await self._request_streams[request_stream_id][0].send(event_message)
                             except (  # pragma: no cover
                                 anyio.BrokenResourceError,
                                 anyio.ClosedResourceError,
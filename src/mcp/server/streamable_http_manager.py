@@ -21,6 +21,7 @@ from mcp.server.streamable_http import (
     StreamableHTTPServerTransport,
 )
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.types import INVALID_REQUEST, ErrorData, JSONRPCError
 
 if TYPE_CHECKING:
@@ -56,6 +57,7 @@ class StreamableHTTPSessionManager:
         security_settings: Optional transport security settings.
         retry_interval: Retry interval in milliseconds to suggest to clients in SSE
                        retry field. Used for SSE polling behavior.
+        codec: Codec used by every transport the manager creates.
     """
 
     def __init__(
@@ -66,6 +68,7 @@ class StreamableHTTPSessionManager:
         stateless: bool = False,
         security_settings: TransportSecuritySettings | None = None,
         retry_interval: int | None = None,
+        codec: Codec = DEFAULT_CODEC,
     ):
         self.app = app
         self.event_store = event_store
@@ -73,6 +76,7 @@ class StreamableHTTPSessionManager:
         self.stateless = stateless
         self.security_settings = security_settings
         self.retry_interval = retry_interval
+        self.codec = codec
 
         # Session tracking (only used if not stateless)
         self._session_creation_lock = anyio.Lock()
@@ -147,6 +151,7 @@ class StreamableHTTPSessionManager:
             is_json_response_enabled=self.json_response,
             event_store=None,  # No event store in stateless mode
             security_settings=self.security_settings,
+            codec=self.codec,
         )
 
         # Start server in a new task
@@ -198,6 +203,7 @@ class StreamableHTTPSessionManager:
                     event_store=self.event_store,  # May be None (no resumability)
                     security_settings=self.security_settings,
                     retry_interval=self.retry_interval,
+                    codec=self.codec,
                 )
 
                 assert http_transport.mcp_session_id is not None
@@ -248,7 +254,7 @@ class StreamableHTTPSessionManager:
                 error=ErrorData(code=INVALID_REQUEST, message="Session not found"),
             )
             response = Response(
-                content=error_response.model_dump_json(by_alias=True, exclude_none=True),
+                content=self.codec.encode(error_response),
                 status_code=HTTPStatus.NOT_FOUND,
                 media_type="application/json",
             )
@@ -2,16 +2,15 @@ from contextlib import asynccontextmanager
 
 import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from pydantic_core import ValidationError
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket
 
-from mcp import types
+from mcp.shared.codec import DEFAULT_CODEC, Codec
 from mcp.shared.message import SessionMessage
 
 
 @asynccontextmanager  # pragma: no cover
-async def websocket_server(scope: Scope, receive: Receive, send: Send):
+async def websocket_server(scope: Scope, receive: Receive, send: Send, codec: Codec = DEFAULT_CODEC):
     """WebSocket server transport for MCP. This is an ASGI application, suitable to be
     used with a framework like Starlette and a server like Hypercorn.
     """
@@ -33,8 +32,8 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
             async with read_stream_writer:
                 async for msg in websocket.iter_text():
                     try:
-                        client_message = types.jsonrpc_message_adapter.validate_json(msg, by_name=False)
-                    except ValidationError as exc:
+                        client_message = codec.decode(msg)
+                    except ValueError as exc:
                         await read_stream_writer.send(exc)
                         continue
 
@@ -47,7 +46,7 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    obj = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    obj = codec.encode_session_message(session_message).decode()
                     await websocket.send_text(obj)
         except anyio.ClosedResourceError:
             await websocket.close()
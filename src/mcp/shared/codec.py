@@ -0,0 +1,116 @@
+"""Wire codecs for JSON-RPC messages.
+
+Every transport encodes outgoing messages and decodes incoming ones through a
+`Codec`, so the JSON backend can be swapped per server or client without
+touching the transports themselves.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, cast
+
+import pydantic_core
+
+from mcp.shared.message import EncodedResult, EncodedSessionMessage, SessionMessage
+from mcp.types import JSONRPCMessage, JSONRPCResponse, RequestId, Result, jsonrpc_message_adapter
+
+
+class Codec(ABC):
+    """Translates JSON-RPC messages to and from their wire representation.
+
+    Example:
+        class OrjsonCodec(Codec):
+            def encode(self, message):
+                return orjson.dumps(message.model_dump(by_alias=True, mode="json", exclude_none=True))
+
+            def decode(self, data):
+                return jsonrpc_message_adapter.validate_python(orjson.loads(data), by_name=False)
+    """
+
+    @abstractmethod
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        """Encode a message to UTF-8 JSON."""
+
+    @abstractmethod
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        """Decode a message from JSON.
+
+        Raises:
+            ValueError: If `data` is not valid JSON or not a valid JSON-RPC message.
+                `pydantic.ValidationError` is a subclass, so codecs built on pydantic
+                can let it propagate.
+        """
+
+    def encode_session_message(self, session_message: SessionMessage) -> bytes:
+        """Encode a session message, responses straight from their result."""
+        if isinstance(session_message, EncodedSessionMessage):
+            return self.encode_response(session_message.request_id, session_message.result)
+        return self.encode(session_message.message)
+
+    def encode_response(self, request_id: RequestId, result: Result | EncodedResult[Any]) -> bytes:
+        """Encode the successful response to a request.
+
+        The default implementation builds the `JSONRPCResponse` and hands it to `encode`;
+        codecs that can serialize result models directly should override it, so each
+        result is serialized once.
+        """
+        model: Result = result.result if isinstance(result, EncodedResult) else result
+        dumped = model.model_dump(by_alias=True, mode="json", exclude_none=True)
+        return self.encode(JSONRPCResponse(jsonrpc="2.0", id=request_id, result=dumped))
+
+    def encode_batch(self, payloads: Sequence[JSONRPCMessage | bytes]) -> bytes:
+        """Encode a JSON-RPC batch from messages and already encoded messages."""
+        return b"[" + b",".join(p if isinstance(p, bytes) else self.encode(p) for p in payloads) + b"]"
+
+    def decode_batch(self, data: bytes | str) -> list[JSONRPCMessage]:
+        """Decode a JSON-RPC batch, a non-empty JSON array of messages.
+
+        The default implementation re-encodes each item and hands it to `decode`; codecs
+        that can validate parsed objects directly should override it.
+
+        Raises:
+            ValueError: If `data` is not a non-empty JSON array of valid JSON-RPC messages.
+        """
+        return [self.decode(pydantic_core.to_json(item)) for item in _batch_items(pydantic_core.from_json(data))]
+
+
+class JSONCodec(Codec):
+    """The default codec, built on pydantic's JSON support."""
+
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        return pydantic_core.to_json(message, by_alias=True, exclude_none=True)
+
+    def encode_response(self, request_id: RequestId, result: Result | EncodedResult[Any]) -> bytes:
+        if type(self).encode is not JSONCodec.encode:
+            # A subclass changed how messages are encoded, which responses must follow
+            return super().encode_response(request_id, result)
+        if isinstance(result, EncodedResult):
+            return b'{"jsonrpc":"2.0","id":%b,"result":%b}' % (pydantic_core.to_json(request_id), result.encoded)
+        # Encode the envelope straight from the result model, so the payload is serialized once
+        envelope = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        return pydantic_core.to_json(envelope, by_alias=True, exclude_none=True)
+
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        # Parsing first and validating the Python objects is several times faster than `validate_json`
+        # for the free-form `params`/`result` dicts that make up most of a large message.
+        return jsonrpc_message_adapter.validate_python(pydantic_core.from_json(data), by_name=False)
+
+    def decode_batch(self, data: bytes | str) -> list[JSONRPCMessage]:
+        items = _batch_items(pydantic_core.from_json(data))
+        return [jsonrpc_message_adapter.validate_python(item, by_name=False) for item in items]
+
+
+def is_batch(data: bytes | str) -> bool:
+    """Whether a JSON payload is a JSON-RPC batch rather than a single message."""
+    stripped = data.lstrip()
+    return stripped[:1] in (b"[", "[")
+
+
+def _batch_items(parsed: Any) -> list[Any]:
+    if not isinstance(parsed, list) or not parsed:
+        raise ValueError("A JSON-RPC batch must be a non-empty array")
+    return cast(list[Any], parsed)
+
+
+DEFAULT_CODEC: Codec = JSONCodec()
+"""The codec transports use when none is given."""
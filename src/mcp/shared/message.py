@@ -6,8 +6,13 @@ to support transport-specific features like resumability.
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
 
-from mcp.types import JSONRPCMessage, RequestId
+import pydantic_core
+
+from mcp.types import JSONRPCMessage, JSONRPCResponse, RequestId, Result
+
+ResultT = TypeVar("ResultT", bound=Result)
 
 ResumptionToken = str
 
@@ -47,3 +52,63 @@ class SessionMessage:
 
     message: JSONRPCMessage
     metadata: MessageMetadata = None
+
+
+class EncodedResult(Generic[ResultT]):
+    """A result encoded once, for responses that are sent many times unchanged.
+
+    Request handlers may return one in place of the result model: the default codec
+    then writes `encoded` into each response instead of serializing `result` again.
+    Neither may be modified afterwards.
+    """
+
+    __slots__ = ("result", "_encoded")
+
+    def __init__(self, result: ResultT) -> None:
+        self.result = result
+        self._encoded: bytes | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.result!r})"
+
+    @property
+    def encoded(self) -> bytes:
+        """`result` encoded as JSON, on first use."""
+        if self._encoded is None:
+            self._encoded = pydantic_core.to_json(self.result, by_alias=True, exclude_none=True)
+        return self._encoded
+
+
+class EncodedSessionMessage(SessionMessage):
+    """A JSON-RPC response that the transport's codec encodes straight from the result model.
+
+    Transports pass it to `Codec.encode_session_message` like any other message, which
+    serializes the result once without building a `JSONRPCResponse` around it first.
+    `message` is only built when something in-process asks for the model, e.g. a peer
+    session on the in-memory transport.
+    """
+
+    request_id: RequestId
+    result: Result | EncodedResult[Any]
+
+    def __init__(
+        self, request_id: RequestId, result: Result | EncodedResult[Any], metadata: MessageMetadata = None
+    ) -> None:
+        self.request_id = request_id
+        self.result = result
+        self.metadata = metadata
+        self._message: JSONRPCResponse | None = None
+
+    @property
+    def message(self) -> JSONRPCResponse:  # type: ignore[reportIncompatibleVariableOverride]
+        if self._message is None:
+            result: Result = self.result.result if isinstance(self.result, EncodedResult) else self.result
+            dumped = result.model_dump(by_alias=True, mode="json", exclude_none=True)
+            self._message = JSONRPCResponse(jsonrpc="2.0", id=self.request_id, result=dumped)
+        return self._message
+
+    def __repr__(self) -> str:
+        # Unlike the dataclass repr of SessionMessage, this does not build `message`
+        return (
+            f"{type(self).__name__}(request_id={self.request_id!r}, result={self.result!r}, metadata={self.metadata!r})"
+        )
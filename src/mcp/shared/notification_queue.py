@@ -0,0 +1,152 @@
+"""Ordered, bounded handling of incoming notifications off a session's receive loop."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+import anyio
+
+from mcp.types import ProgressToken
+
+logger = logging.getLogger(__name__)
+
+NotificationOverflowPolicy = Literal["block", "drop_oldest_progress"]
+"""What happens when a notification arrives and the queue is full.
+
+- `"block"`: the receive loop waits for the handlers to catch up, so nothing is lost.
+- `"drop_oldest_progress"`: a progress notification replaces the oldest queued progress
+  notification with the same token; other notifications still wait.
+"""
+
+
+@dataclass
+class NotificationQueueMetrics:
+    """Counters for a session's notification queue."""
+
+    queued: int = 0
+    """Notifications currently waiting for their handlers."""
+
+    max_queued: int = 0
+    """The deepest the queue has been."""
+
+    dispatched: int = 0
+    """Notifications whose handlers have run."""
+
+    dropped: int = 0
+    """Progress notifications dropped in favour of a newer one for the same token."""
+
+    blocked: int = 0
+    """Notifications that had to wait for room in the queue."""
+
+
+@dataclass
+class _Entry:
+    position: int
+    handler: Callable[[], Awaitable[None]]
+    progress_token: ProgressToken | None
+
+
+class NotificationQueue:
+    """Runs notification handlers one at a time, in arrival order, in a worker task.
+
+    The receive loop only has to `put` a notification, so a slow callback delays later
+    notifications but not responses. Every notification gets a position; callers that
+    need to observe the effects of earlier notifications wait on
+    `wait_until_handled(position)`, for example with the position `progress_position`
+    reports for a request's progress token.
+    """
+
+    def __init__(self, max_queued: int, overflow: NotificationOverflowPolicy = "block") -> None:
+        if max_queued < 1:
+            raise ValueError("max_queued_notifications must be at least 1")
+        self._max_queued = max_queued
+        self._overflow = overflow
+        self._entries: deque[_Entry] = deque()
+        self._last_position = 0
+        self._handled_position = 0
+        self._changed = anyio.Event()
+        self._running: _Entry | None = None
+        self._worker_id: int | None = None
+        self.metrics = NotificationQueueMetrics()
+
+    @property
+    def last_position(self) -> int:
+        """Position of the most recently queued notification."""
+        return self._last_position
+
+    def progress_position(self, progress_token: ProgressToken) -> int:
+        """Position of the newest pending progress notification for `progress_token`, or 0 if none is pending."""
+        for entry in reversed(self._entries):
+            if entry.progress_token == progress_token:
+                return entry.position
+        if self._running is not None and self._running.progress_token == progress_token:
+            return self._running.position
+        return 0
+
+    async def put(self, handler: Callable[[], Awaitable[None]], progress_token: ProgressToken | None = None) -> None:
+        """Queue `handler` to run after every notification queued before it, waiting for room if needed."""
+        blocked = False
+        while len(self._entries) >= self._max_queued:
+            if self._overflow == "drop_oldest_progress" and self._drop_progress(progress_token):
+                break
+            if not blocked:
+                blocked = True
+                self.metrics.blocked += 1
+            await self._wait_for_change()
+
+        self._last_position += 1
+        self._entries.append(_Entry(self._last_position, handler, progress_token))
+        self.metrics.queued = len(self._entries)
+        self.metrics.max_queued = max(self.metrics.max_queued, self.metrics.queued)
+        self._notify()
+
+    async def wait_until_handled(self, position: int) -> None:
+        """Wait until every notification up to `position` has been handled or dropped.
+
+        Returns immediately when called from a notification handler, which would otherwise
+        wait on itself.
+        """
+        if self._worker_id == anyio.get_current_task().id:
+            return
+        while self._handled_position < position:
+            await self._wait_for_change()
+
+    async def run(self) -> None:
+        """Handle queued notifications until cancelled."""
+        self._worker_id = anyio.get_current_task().id
+        while True:
+            while not self._entries:
+                await self._wait_for_change()
+            entry = self._running = self._entries.popleft()
+            self.metrics.queued = len(self._entries)
+            self._notify()
+            try:
+                await entry.handler()
+            except Exception:
+                logger.exception("Notification handler raised an exception")
+            finally:
+                self._running = None
+                self._handled_position = entry.position
+                self.metrics.dispatched += 1
+                self._notify()
+
+    def _drop_progress(self, progress_token: ProgressToken | None) -> bool:
+        if progress_token is None:
+            return False
+        for entry in self._entries:
+            if entry.progress_token == progress_token:
+                self._entries.remove(entry)
+                self.metrics.dropped += 1
+                return True
+        return False
+
+    async def _wait_for_change(self) -> None:
+        await self._changed.wait()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = anyio.Event()
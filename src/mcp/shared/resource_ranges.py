@@ -0,0 +1,96 @@
+"""Reading part of a resource, through an extension of `resources/read` carried in `_meta`.
+
+A client asks for part of a resource by putting a range under `RESOURCE_RANGE_META_KEY`
+in the `_meta` of its request:
+
+    {"offset": 0, "length": 1048576}
+
+Offsets and lengths count bytes of binary contents and characters of text. A server
+that supports ranges returns only that part of each content item, and puts the range
+it returned under the same key in the item's `_meta`, with the size of the whole item
+if it knows it:
+
+    {"offset": 0, "length": 1048576, "total": 209715200}
+
+A server that does not support ranges ignores the request's key and returns whole
+contents without it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+RESOURCE_RANGE_META_KEY = "mcp-python-sdk/resource-range"
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ResourceRange(BaseModel):
+    """The part of a resource's contents a client asks for."""
+
+    model_config = ConfigDict(frozen=True)
+
+    offset: int = Field(ge=0)
+    """Where the part starts, in bytes of binary contents or characters of text."""
+
+    length: int = Field(ge=1)
+    """The most bytes or characters to return."""
+
+
+def requested_range(meta: Mapping[str, Any] | None) -> ResourceRange | None:
+    """Return the range requested in the `_meta` of a `resources/read` request, if any.
+
+    Raises:
+        ValueError: If the range is malformed.
+    """
+    if not meta or (value := meta.get(RESOURCE_RANGE_META_KEY)) is None:
+        return None
+    try:
+        return ResourceRange.model_validate(value)
+    except ValidationError:
+        raise ValueError(f"Invalid resource range: {value!r}") from None
+
+
+class ReturnedRange(BaseModel):
+    """The part of a content item a server returned, and the size of the whole item if known."""
+
+    model_config = ConfigDict(frozen=True)
+
+    offset: int = Field(ge=0)
+    length: int = Field(ge=0)
+    total: int | None = Field(default=None, ge=0)
+
+
+def returned_range(meta: Mapping[str, Any] | None) -> ReturnedRange | None:
+    """Return the range a server put in the `_meta` of a content item it read, if any.
+
+    Raises:
+        ValueError: If the range is malformed.
+    """
+    if not meta or (value := meta.get(RESOURCE_RANGE_META_KEY)) is None:
+        return None
+    try:
+        return ReturnedRange.model_validate(value)
+    except ValidationError:
+        raise ValueError(f"Invalid resource range: {value!r}") from None
+
+
+def content_length(content: str | bytes | memoryview) -> int:
+    """The length of `content` in the units ranges count: characters of text, bytes of binary content."""
+    return len(content) if isinstance(content, str) else memoryview(content).nbytes
+
+
+def slice_content(content: str | bytes | memoryview, offset: int, length: int) -> str | memoryview:
+    """Return `length` characters of text or bytes of binary content from `offset`, without copying binary content."""
+    if isinstance(content, str):
+        return content[offset : offset + length]
+    # Slice bytes, whatever the format of the view
+    return memoryview(content).cast("B")[offset : offset + length]
+
+
+def range_meta(offset: int, content: str | bytes | memoryview, total: int | None) -> dict[str, Any]:
+    """The value a server puts under `RESOURCE_RANGE_META_KEY` for `content` read from `offset`."""
+    return {"offset": offset, "length": content_length(content), "total": total}
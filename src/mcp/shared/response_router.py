@@ -1,11 +1,11 @@
 """ResponseRouter - Protocol for pluggable response routing.
 
 This module defines a protocol for routing JSON-RPC responses to alternative
-handlers before falling back to the default response stream mechanism.
+handlers when they do not answer a request sent with `BaseSession.send_request`.
 
 The primary use case is task-augmented requests: when a TaskSession enqueues
 a request (like elicitation), the response needs to be routed back to the
-waiting resolver instead of the normal response stream.
+waiting resolver instead of a pending `send_request` call.
 
 Design:
 - Protocol-based for testability and flexibility
@@ -0,0 +1,62 @@
+"""Compiled JSON Schema validators for tool inputs and outputs.
+
+`jsonschema.validate` checks the schema and builds a fresh validator on every call,
+which for large schemas costs more than the validation itself. These helpers do
+that work once per schema and report the same error `jsonschema.validate` would.
+jsonschema itself is only imported once something is validated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from mcp import types
+
+if TYPE_CHECKING:
+    from jsonschema.exceptions import ValidationError
+    from jsonschema.protocols import Validator
+
+
+def compile_schema(schema: dict[str, Any]) -> Validator:
+    """Check `schema` and build a reusable validator for it.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    from jsonschema.validators import validator_for
+
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    # The protocol spells the keyword-only `registry` default as `...`, which pyright reads as required
+    return cls(schema)  # pyright: ignore[reportCallIssue]
+
+
+def validate(validator: Validator, instance: Any) -> None:
+    """Validate `instance`, raising the `jsonschema.ValidationError` that `jsonschema.validate` would."""
+    from jsonschema.exceptions import best_match  # pyright: ignore[reportUnknownVariableType]
+
+    error = cast("ValidationError | None", best_match(validator.iter_errors(instance)))
+    if error is not None:
+        raise error
+
+
+@dataclass
+class ToolValidators:
+    """Validators for one tool definition, each compiled the first time it is needed."""
+
+    tool: types.Tool
+    _input: Validator | None = field(default=None, init=False, repr=False)
+    _output: Validator | None = field(default=None, init=False, repr=False)
+
+    def validate_input(self, arguments: dict[str, Any]) -> None:
+        if self._input is None:
+            self._input = compile_schema(self.tool.input_schema)
+        validate(self._input, arguments)
+
+    def validate_output(self, structured_content: dict[str, Any]) -> None:
+        """Validate against the tool's output schema, which the caller has checked is set."""
+        if self._output is None:
+            assert self.tool.output_schema is not None
+            self._output = compile_schema(self.tool.output_schema)
+        validate(self._output, structured_content)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from contextlib import AsyncExitStack
+from functools import partial
 from types import TracebackType
 from typing import Any, Generic, Protocol, TypeVar
 
@@ -12,7 +13,14 @@ from pydantic import BaseModel, TypeAdapter
 from typing_extensions import Self
 
 from mcp.shared.exceptions import MCPError
-from mcp.shared.message import MessageMetadata, ServerMessageMetadata, SessionMessage
+from mcp.shared.message import (
+    EncodedResult,
+    EncodedSessionMessage,
+    MessageMetadata,
+    ServerMessageMetadata,
+    SessionMessage,
+)
+from mcp.shared.notification_queue import NotificationOverflowPolicy, NotificationQueue, NotificationQueueMetrics
 from mcp.shared.response_router import ResponseRouter
 from mcp.types import (
     CONNECTION_CLOSED,
@@ -45,6 +53,24 @@ ReceiveNotificationT = TypeVar("ReceiveNotificationT", ClientNotification, Serve
 RequestId = str | int
 
 
+def _typed_payload(message: JSONRPCRequest | JSONRPCNotification) -> dict[str, Any]:
+    """Build the input for the typed request/notification adapters from a JSON-RPC envelope.
+
+    The envelope's `params` were already decoded from the wire by the transport, so they are
+    handed to the typed adapter as-is. This avoids dumping the envelope back to JSON-compatible
+    Python only to validate it a second time.
+
+    Messages are still checked twice, first as an envelope by the transport and then here
+    as a typed request or notification. This is deliberate: transports are shared by clients
+    and servers and do not know which typed union applies. Neither check walks payloads,
+    such as tool arguments, that are typed as free-form dicts, so each costs a few
+    microseconds however large the message is. Parsing the JSON dominates.
+    """
+    if message.params is None:
+        return {"method": message.method}
+    return {"method": message.method, "params": message.params}
+
+
 class ProgressFnT(Protocol):
     """Protocol for progress notification callbacks."""
 
@@ -91,7 +117,7 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
     def __enter__(self) -> RequestResponder[ReceiveRequestT, SendResultT]:
         """Enter the context manager, enabling request cancellation tracking."""
         self._entered = True
-        self._cancel_scope = anyio.CancelScope()
+        # The scope made in __init__, so a cancellation that came first still applies
         self._cancel_scope.__enter__()
         return self
 
@@ -111,7 +137,7 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
                 raise RuntimeError("No active cancel scope")
             self._cancel_scope.__exit__(exc_type, exc_val, exc_tb)
 
-    async def respond(self, response: SendResultT | ErrorData) -> None:
+    async def respond(self, response: SendResultT | EncodedResult[Any] | ErrorData) -> None:
         """Send a response for this request.
 
         Must be called within a context manager block.
@@ -131,14 +157,19 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
             )
 
     async def cancel(self) -> None:
-        """Cancel this request and mark it as completed."""
-        if not self._entered:  # pragma: no cover
-            raise RuntimeError("RequestResponder must be used as a context manager")
+        """Cancel this request and mark it as completed.
+
+        A request that is not being handled yet, such as one waiting in a server's
+        request queue, is answered and forgotten right away; entering it later runs
+        nothing, as its cancel scope is already cancelled.
+        """
         if not self._cancel_scope:  # pragma: no cover
             raise RuntimeError("No active cancel scope")
 
         self._cancel_scope.cancel()
         self._completed = True  # Mark as completed so it's removed from in_flight
+        if not self._entered:
+            self._on_complete(self)
         # Send an error response to indicate cancellation
         await self._session._send_response(  # type: ignore[reportPrivateUsage]
             request_id=self.request_id,
@@ -154,6 +185,34 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
         return self._cancel_scope.cancel_called
 
 
+class _PendingResponse:
+    """A single-shot slot that a `send_request` call waits on for its response.
+
+    Much cheaper to create than a memory stream pair, which matters for clients
+    issuing many short requests.
+    """
+
+    __slots__ = ("_event", "_response", "notification_position")
+
+    def __init__(self) -> None:
+        self._event = anyio.Event()
+        self._response: JSONRPCResponse | JSONRPCError | None = None
+        # Position of the last progress notification for this request queued before the response
+        self.notification_position = 0
+
+    def resolve(self, response: JSONRPCResponse | JSONRPCError, notification_position: int = 0) -> None:
+        """Deliver the response; later calls are ignored."""
+        if self._response is None:
+            self._response = response
+            self.notification_position = notification_position
+            self._event.set()
+
+    async def wait(self) -> JSONRPCResponse | JSONRPCError:
+        await self._event.wait()
+        assert self._response is not None
+        return self._response
+
+
 class BaseSession(
     Generic[
         SendRequestT,
@@ -170,11 +229,12 @@ class BaseSession(
     messages when entered.
     """
 
-    _response_streams: dict[RequestId, MemoryObjectSendStream[JSONRPCResponse | JSONRPCError]]
+    _pending_responses: dict[RequestId, _PendingResponse]
     _request_id: int
     _in_flight: dict[RequestId, RequestResponder[ReceiveRequestT, SendResultT]]
     _progress_callbacks: dict[RequestId, ProgressFnT]
     _response_routers: list[ResponseRouter]
+    _response_routes: dict[RequestId, ResponseRouter]
 
     def __init__(
         self,
@@ -182,23 +242,38 @@ class BaseSession(
         write_stream: MemoryObjectSendStream[SessionMessage],
         # If none, reading will never time out
         read_timeout_seconds: float | None = None,
+        *,
+        # If none, notifications and other messages for `_handle_incoming` are handled inline by the receive loop
+        max_queued_notifications: int | None = None,
+        notification_overflow: NotificationOverflowPolicy = "block",
     ) -> None:
         self._read_stream = read_stream
         self._write_stream = write_stream
-        self._response_streams = {}
+        self._pending_responses = {}
         self._request_id = 0
         self._session_read_timeout_seconds = read_timeout_seconds
         self._in_flight = {}
         self._progress_callbacks = {}
         self._response_routers = []
+        self._response_routes = {}
+        self._notification_queue = (
+            NotificationQueue(max_queued_notifications, notification_overflow)
+            if max_queued_notifications is not None
+            else None
+        )
         self._exit_stack = AsyncExitStack()
 
+    @property
+    def notification_metrics(self) -> NotificationQueueMetrics | None:
+        """Counters for the notification queue, or None if notifications are handled inline."""
+        return self._notification_queue.metrics if self._notification_queue is not None else None
+
     def add_response_router(self, router: ResponseRouter) -> None:
         """Register a response router to handle responses for non-standard requests.
 
-        Response routers are checked in order before falling back to the default
-        response stream mechanism. This is used by TaskResultHandler to route
-        responses for queued task requests back to their resolvers.
+        Response routers are checked in order for responses whose ID does not
+        belong to a request sent with `send_request`, nor to one registered with
+        `add_response_route`.
 
         !!! warning
             This is an experimental API that may change without notice.
@@ -208,10 +283,28 @@ class BaseSession(
         """
         self._response_routers.append(router)
 
+    def add_response_route(self, request_id: RequestId, router: ResponseRouter) -> None:
+        """Hand the response to `request_id` straight to `router`, without asking other routers.
+
+        Routers call this for each request they send, so their responses are found with
+        one lookup however many routers and requests there are. This is used by
+        TaskResultHandler to route responses for queued task requests back to their resolvers.
+
+        !!! warning
+            This is an experimental API that may change without notice.
+
+        Args:
+            request_id: The ID of the request sent
+            router: The router to deliver its response or error to
+        """
+        self._response_routes[request_id] = router
+
     async def __aenter__(self) -> Self:
         self._task_group = anyio.create_task_group()
         await self._task_group.__aenter__()
         self._task_group.start_soon(self._receive_loop)
+        if self._notification_queue is not None:
+            self._task_group.start_soon(self._notification_queue.run)
         return self
 
     async def __aexit__(
@@ -245,8 +338,8 @@ class BaseSession(
         request_id = self._request_id
         self._request_id = request_id + 1
 
-        response_stream, response_stream_reader = anyio.create_memory_object_stream[JSONRPCResponse | JSONRPCError](1)
-        self._response_streams[request_id] = response_stream
+        pending = _PendingResponse()
+        self._pending_responses[request_id] = pending
 
         # Set up progress token if progress callback is provided
         request_data = request.model_dump(by_alias=True, mode="json", exclude_none=True)
@@ -269,22 +362,25 @@ class BaseSession(
 
             try:
                 with anyio.fail_after(timeout):
-                    response_or_error = await response_stream_reader.receive()
+                    response_or_error = await pending.wait()
             except TimeoutError:
                 class_name = request.__class__.__name__
                 message = f"Timed out while waiting for response to {class_name}. Waited {timeout} seconds."
                 raise MCPError(code=REQUEST_TIMEOUT, message=message)
 
+            # Progress for this request that arrived before the response reaches the progress
+            # callback before the caller sees the result
+            if self._notification_queue is not None:
+                await self._notification_queue.wait_until_handled(pending.notification_position)
+
             if isinstance(response_or_error, JSONRPCError):
                 raise MCPError.from_jsonrpc_error(response_or_error)
             else:
                 return result_type.model_validate(response_or_error.result, by_name=False)
 
         finally:
-            self._response_streams.pop(request_id, None)
+            self._pending_responses.pop(request_id, None)
             self._progress_callbacks.pop(request_id, None)
-            await response_stream.aclose()
-            await response_stream_reader.aclose()
 
     async def send_notification(
         self,
@@ -304,19 +400,16 @@ class BaseSession(
         )
         await self._write_stream.send(session_message)
 
-    async def _send_response(self, request_id: RequestId, response: SendResultT | ErrorData) -> None:
+    async def _send_response(
+        self, request_id: RequestId, response: SendResultT | EncodedResult[Any] | ErrorData
+    ) -> None:
         if isinstance(response, ErrorData):
             jsonrpc_error = JSONRPCError(jsonrpc="2.0", id=request_id, error=response)
             session_message = SessionMessage(message=jsonrpc_error)
             await self._write_stream.send(session_message)
         else:
-            jsonrpc_response = JSONRPCResponse(
-                jsonrpc="2.0",
-                id=request_id,
-                result=response.model_dump(by_alias=True, mode="json", exclude_none=True),
-            )
-            session_message = SessionMessage(message=jsonrpc_response)
-            await self._write_stream.send(session_message)
+            # The transport's codec encodes the response straight from the result model
+            await self._write_stream.send(EncodedSessionMessage(request_id=request_id, result=response))
 
     @property
     def _receive_request_adapter(self) -> TypeAdapter[ReceiveRequestT]:
@@ -332,12 +425,11 @@ class BaseSession(
             try:
                 async for message in self._read_stream:
                     if isinstance(message, Exception):  # pragma: no cover
-                        await self._handle_incoming(message)
+                        await self._dispatch_incoming(message)
                     elif isinstance(message.message, JSONRPCRequest):
                         try:
                             validated_request = self._receive_request_adapter.validate_python(
-                                message.message.model_dump(by_alias=True, mode="json", exclude_none=True),
-                                by_name=False,
+                                _typed_payload(message.message), by_name=False
                             )
                             responder = RequestResponder(
                                 request_id=message.message.id,
@@ -350,8 +442,9 @@ class BaseSession(
                             self._in_flight[responder.request_id] = responder
                             await self._received_request(responder)
 
-                            if not responder._completed:  # type: ignore[reportPrivateUsage]
-                                await self._handle_incoming(responder)
+                            # A responder that is still entered has been handed to another task
+                            if not responder._completed and not responder._entered:  # type: ignore[reportPrivateUsage]
+                                await self._dispatch_incoming(responder)
                         except Exception:
                             # For request validation errors, send a proper JSON-RPC error
                             # response instead of crashing the server
@@ -368,32 +461,24 @@ class BaseSession(
                     elif isinstance(message.message, JSONRPCNotification):
                         try:
                             notification = self._receive_notification_adapter.validate_python(
-                                message.message.model_dump(by_alias=True, mode="json", exclude_none=True),
-                                by_name=False,
+                                _typed_payload(message.message), by_name=False
                             )
                             # Handle cancellation notifications
                             if isinstance(notification, CancelledNotification):
                                 cancelled_id = notification.params.request_id
                                 if cancelled_id in self._in_flight:  # pragma: no branch
                                     await self._in_flight[cancelled_id].cancel()
+                            elif self._notification_queue is None:
+                                await self._handle_notification(notification)
                             else:
-                                # Handle progress notifications callback
-                                if isinstance(notification, ProgressNotification):
-                                    progress_token = notification.params.progress_token
-                                    # If there is a progress callback for this token,
-                                    # call it with the progress information
-                                    if progress_token in self._progress_callbacks:
-                                        callback = self._progress_callbacks[progress_token]
-                                        try:
-                                            await callback(
-                                                notification.params.progress,
-                                                notification.params.total,
-                                                notification.params.message,
-                                            )
-                                        except Exception:
-                                            logging.exception("Progress callback raised an exception")
-                                await self._received_notification(notification)
-                                await self._handle_incoming(notification)
+                                progress_token = (
+                                    notification.params.progress_token
+                                    if isinstance(notification, ProgressNotification)
+                                    else None
+                                )
+                                await self._notification_queue.put(
+                                    partial(self._handle_notification, notification), progress_token
+                                )
                         except Exception:
                             # For other validation errors, log and continue
                             logging.warning(  # pragma: no cover
@@ -415,15 +500,10 @@ class BaseSession(
             finally:
                 # after the read stream is closed, we need to send errors
                 # to any pending requests
-                for id, stream in self._response_streams.items():
-                    error = ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
-                    try:
-                        await stream.send(JSONRPCError(jsonrpc="2.0", id=id, error=error))
-                        await stream.aclose()
-                    except Exception:  # pragma: no cover
-                        # Stream might already be closed
-                        pass
-                self._response_streams.clear()
+                error = ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
+                for id, pending in self._pending_responses.items():
+                    pending.resolve(JSONRPCError(jsonrpc="2.0", id=id, error=error))
+                self._pending_responses.clear()
 
     def _normalize_request_id(self, response_id: RequestId) -> RequestId:
         """Normalize a response ID to match how request IDs are stored.
@@ -448,8 +528,9 @@ class BaseSession(
     async def _handle_response(self, message: SessionMessage) -> None:
         """Handle an incoming response or error message.
 
-        Checks response routers first (e.g., for task-related responses),
-        then falls back to the normal response stream mechanism.
+        Responses to requests sent with `send_request` are resolved with a single
+        dict lookup, as are those routed with `add_response_route` (e.g., for
+        task-related responses); anything else is offered to the response routers in order.
         """
         # This check is always true at runtime: the caller (_receive_loop) only invokes
         # this method in the else branch after checking for JSONRPCRequest and
@@ -461,32 +542,63 @@ class BaseSession(
         # Normalize response ID to handle type mismatches (e.g., "0" vs 0)
         response_id = self._normalize_request_id(message.message.id)
 
-        # First, check response routers (e.g., TaskResultHandler)
+        pending = self._pending_responses.pop(response_id, None)
+        if pending is not None:
+            position = 0
+            if self._notification_queue is not None and response_id in self._progress_callbacks:
+                position = self._notification_queue.progress_position(response_id)
+            pending.resolve(message.message, position)
+            return
+
+        route = self._response_routes.pop(response_id, None)
+        routers = [route] if route is not None else self._response_routers
         if isinstance(message.message, JSONRPCError):
-            # Route error to routers
-            for router in self._response_routers:
+            for router in routers:
                 if router.route_error(response_id, message.message.error):
                     return  # Handled
         else:
-            # Route success response to routers
             response_data: dict[str, Any] = message.message.result or {}
-            for router in self._response_routers:
+            for router in routers:
                 if router.route_response(response_id, response_data):
                     return  # Handled
 
-        # Fall back to normal response streams
-        stream = self._response_streams.pop(response_id, None)
-        if stream:
-            await stream.send(message.message)
+        await self._dispatch_incoming(RuntimeError(f"Received response with an unknown request ID: {message}"))
+
+    async def _dispatch_incoming(
+        self, req: RequestResponder[ReceiveRequestT, SendResultT] | ReceiveNotificationT | Exception
+    ) -> None:
+        """Pass `req` to `_handle_incoming` in turn with the queued notifications, so it sees messages in order."""
+        if self._notification_queue is None:
+            await self._handle_incoming(req)
         else:
-            await self._handle_incoming(RuntimeError(f"Received response with an unknown request ID: {message}"))
+            await self._notification_queue.put(partial(self._handle_incoming, req))
+
+    async def _handle_notification(self, notification: ReceiveNotificationT) -> None:
+        # Handle progress notifications callback
+        if isinstance(notification, ProgressNotification):
+            progress_token = notification.params.progress_token
+            # If there is a progress callback for this token,
+            # call it with the progress information
+            if progress_token in self._progress_callbacks:
+                callback = self._progress_callbacks[progress_token]
+                try:
+                    await callback(
+                        notification.params.progress,
+                        notification.params.total,
+                        notification.params.message,
+                    )
+                except Exception:
+                    logging.exception("Progress callback raised an exception")
+        await self._received_notification(notification)
+        await self._handle_incoming(notification)
 
     async def _received_request(self, responder: RequestResponder[ReceiveRequestT, SendResultT]) -> None:
         """Can be overridden by subclasses to handle a request without needing to
         listen on the message stream.
 
-        If the request is responded to within this method, it will not be
-        forwarded on to the message stream.
+        If the request is responded to within this method, or handed to a task
+        that has entered the responder before this method returns, it will not
+        be forwarded on to the message stream.
         """
 
     async def _received_notification(self, notification: ReceiveNotificationT) -> None:
@@ -193,6 +193,7 @@ from mcp.types.jsonrpc import (
     METHOD_NOT_FOUND,
     PARSE_ERROR,
     REQUEST_TIMEOUT,
+    SERVER_BUSY,
     URL_ELICITATION_REQUIRED,
     ErrorData,
     JSONRPCError,
@@ -402,6 +403,7 @@ __all__ = [
     "METHOD_NOT_FOUND",
     "PARSE_ERROR",
     "REQUEST_TIMEOUT",
+    "SERVER_BUSY",
     "URL_ELICITATION_REQUIRED",
     "ErrorData",
     "JSONRPCError",
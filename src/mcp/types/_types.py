@@ -1610,7 +1610,9 @@ ClientRequest = (
     | ListTasksRequest
     | CancelTaskRequest
 )
-client_request_adapter = TypeAdapter[ClientRequest](ClientRequest)
+# The request and notification adapters are tagged on `method`, so validation dispatches straight to the matching
+# model instead of trying each union member in turn. Results carry no tag and keep pydantic's smart union mode.
+client_request_adapter = TypeAdapter[ClientRequest](Annotated[ClientRequest, Field(discriminator="method")])
 
 
 ClientNotification = (
@@ -1620,7 +1622,9 @@ ClientNotification = (
     | RootsListChangedNotification
     | TaskStatusNotification
 )
-client_notification_adapter = TypeAdapter[ClientNotification](ClientNotification)
+client_notification_adapter = TypeAdapter[ClientNotification](
+    Annotated[ClientNotification, Field(discriminator="method")]
+)
 
 
 # Type for elicitation schema - a JSON Schema dict
@@ -1739,7 +1743,7 @@ ServerRequest = (
     | ListTasksRequest
     | CancelTaskRequest
 )
-server_request_adapter = TypeAdapter[ServerRequest](ServerRequest)
+server_request_adapter = TypeAdapter[ServerRequest](Annotated[ServerRequest, Field(discriminator="method")])
 
 
 ServerNotification = (
@@ -1753,7 +1757,9 @@ ServerNotification = (
     | ElicitCompleteNotification
     | TaskStatusNotification
 )
-server_notification_adapter = TypeAdapter[ServerNotification](ServerNotification)
+server_notification_adapter = TypeAdapter[ServerNotification](
+    Annotated[ServerNotification, Field(discriminator="method")]
+)
 
 
 ServerResult = (
@@ -43,6 +43,8 @@ URL_ELICITATION_REQUIRED = -32042
 # SDK error codes
 CONNECTION_CLOSED = -32000
 REQUEST_TIMEOUT = -32001
+SERVER_BUSY = -32003
+"""Error code for a request rejected because the server's request queue is full; it may be retried later."""
 
 # Standard JSON-RPC error codes
 PARSE_ERROR = -32700
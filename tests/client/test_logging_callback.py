@@ -1,5 +1,6 @@
 from typing import Any, Literal
 
+import anyio
 import pytest
 
 from mcp import Client, types
@@ -114,3 +115,36 @@ async def test_logging_callback():
             "extra_string": "example",
             "extra_dict": {"a": 1, "b": 2, "c": 3},
         }
+
+
+@pytest.mark.anyio
+async def test_slow_logging_callback_does_not_delay_responses():
+    server = MCPServer("test")
+    release = anyio.Event()
+    handled = anyio.Event()
+    log_messages: list[LoggingMessageNotificationParams] = []
+
+    async def logging_callback(params: LoggingMessageNotificationParams) -> None:
+        await release.wait()
+        log_messages.append(params)
+        handled.set()
+
+    @server.tool("log")
+    async def log_tool() -> bool:
+        await server.get_context().log(level="info", message="hello")
+        return True
+
+    async with Client(server, logging_callback=logging_callback) as client:
+        with anyio.fail_after(5):
+            # The logging callback is stuck, yet responses keep arriving
+            result = await client.call_tool("log", {})
+            assert result.is_error is False
+            assert log_messages == []
+
+            release.set()
+            await handled.wait()
+
+        assert [params.data for params in log_messages] == ["hello"]
+        metrics = client.session.notification_metrics
+        assert metrics is not None
+        assert metrics.max_queued >= 1
@@ -1,15 +1,17 @@
-import inspect
 import logging
+from collections.abc import Awaitable, Callable
 from contextlib import contextmanager
 from typing import Any
 from unittest.mock import patch
 
-import jsonschema
+import anyio
 import pytest
 
 from mcp import Client
 from mcp.server.lowlevel import Server
-from mcp.types import Tool
+from mcp.shared.exceptions import MCPError
+from mcp.shared.schema_validation import ToolValidators
+from mcp.types import ListToolsRequest, ListToolsResult, Tool
 
 
 @contextmanager
@@ -18,23 +20,15 @@ def bypass_server_output_validation():
     This simulates a malicious or non-compliant server that doesn't validate
     its outputs, allowing us to test client-side validation.
     """
-    # Save the original validate function
-    original_validate = jsonschema.validate
-
-    # Create a mock that tracks which module is calling it
-    def selective_mock(instance: Any = None, schema: Any = None, *args: Any, **kwargs: Any) -> None:
-        # Check the call stack to see where this is being called from
-        for frame_info in inspect.stack():
-            # If called from the server module, skip validation
-            # TODO: fix this as it's a rather gross workaround and will eventually break
-            # Normalize path separators for cross-platform compatibility
-            normalized_path = frame_info.filename.replace("\\", "/")
-            if "mcp/server/lowlevel/server.py" in normalized_path:
-                return None
-        # Otherwise, use the real validation (for client-side)
-        return original_validate(instance=instance, schema=schema, *args, **kwargs)
-
-    with patch("jsonschema.validate", selective_mock):
+
+    class WithoutOutputValidation(ToolValidators):
+        def validate_output(self, structured_content: dict[str, Any]) -> None:
+            return None
+
+    def get_tool_validators(self: Server, tool: Tool) -> ToolValidators:
+        return WithoutOutputValidation(tool)
+
+    with patch.object(Server, "_get_tool_validators", get_tool_validators):
         yield
 
 
@@ -211,3 +205,142 @@ async def test_tool_not_listed_warning(caplog: pytest.LogCaptureFixture):
 
             # Check that warning was logged
             assert "Tool mystery_tool not listed" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_paginated_tool_refresh():
+    """Test that concurrent calls to an unlisted tool share one refresh that follows every page of tools/list"""
+    server = Server("test-server")
+    list_requests: list[str | None] = []
+    pages = {
+        None: ListToolsResult(tools=[Tool(name="early", input_schema={"type": "object"})], next_cursor="page-2"),
+        "page-2": ListToolsResult(
+            tools=[
+                Tool(
+                    name="late",
+                    input_schema={"type": "object"},
+                    output_schema={"type": "object", "properties": {"result": {"type": "integer"}}},
+                )
+            ]
+        ),
+    }
+
+    @server.list_tools()
+    async def list_tools(request: ListToolsRequest) -> ListToolsResult:
+        cursor = request.params.cursor if request and request.params else None
+        if request:  # the server also lists tools internally, without a request
+            list_requests.append(cursor)
+        return pages[cursor]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]):
+        return {"result": "not_a_number"}
+
+    errors: list[str] = []
+
+    with bypass_server_output_validation():
+        async with Client(server) as client:
+
+            async def call() -> None:
+                with pytest.raises(RuntimeError) as exc_info:
+                    await client.session.call_tool("late", {})
+                errors.append(str(exc_info.value))
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(5):
+                    tg.start_soon(call)
+
+    assert list_requests == [None, "page-2"]
+    assert len(errors) == 5
+    assert all("Invalid structured content returned by tool late" in error for error in errors)
+
+
+def integer_result_server(list_tools_hook: Callable[[], Awaitable[None]]) -> Server:
+    """A server whose `counted` tool returns a string where its output schema wants an integer.
+
+    `list_tools_hook` runs before every `tools/list` request the client sends.
+    """
+    server = Server("test-server")
+    tool = Tool(
+        name="counted",
+        input_schema={"type": "object"},
+        output_schema={"type": "object", "properties": {"n": {"type": "integer"}}},
+    )
+
+    @server.list_tools()
+    async def list_tools(request: ListToolsRequest) -> ListToolsResult:
+        if request:  # the server also lists tools internally, without a request
+            await list_tools_hook()
+        return ListToolsResult(tools=[tool])
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        return {"n": "not-an-int"}
+
+    return server
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_sharing_a_failed_tool_refresh_all_fail():
+    """Test that no call sharing a failed tools/list goes on without validating its result"""
+    failures = [RuntimeError("tools unavailable")]
+    release = anyio.Event()
+
+    async def fail_once() -> None:
+        await release.wait()
+        if failures:
+            raise failures.pop()
+
+    errors: list[MCPError] = []
+
+    with bypass_server_output_validation():
+        async with Client(integer_result_server(fail_once)) as client:
+
+            async def call() -> None:
+                with pytest.raises(MCPError) as exc_info:
+                    await client.session.call_tool("counted", {})
+                errors.append(exc_info.value)
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(call)
+                await anyio.wait_all_tasks_blocked()
+                release.set()
+
+            # The failure is not kept: the next call lists the tools again and validates its result
+            with pytest.raises(RuntimeError, match="Invalid structured content returned by tool counted"):
+                await client.session.call_tool("counted", {})
+
+    assert [error.error.message for error in errors] == ["tools unavailable"] * 3
+
+
+@pytest.mark.anyio
+async def test_tool_refresh_is_run_again_when_the_call_running_it_is_cancelled():
+    """Test that calls waiting on a refresh whose caller was cancelled refresh again rather than skip validation"""
+    release = anyio.Event()
+    leader = anyio.CancelScope()
+    errors: list[str] = []
+
+    with bypass_server_output_validation():
+        async with Client(integer_result_server(release.wait)) as client:
+
+            async def cancelled_call() -> None:
+                with leader:
+                    await client.session.call_tool("counted", {})
+
+            async def call() -> None:
+                with pytest.raises(RuntimeError) as exc_info:
+                    await client.session.call_tool("counted", {})
+                errors.append(str(exc_info.value))
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(cancelled_call)
+                await anyio.wait_all_tasks_blocked()
+                tg.start_soon(call)
+                tg.start_soon(call)
+                await anyio.wait_all_tasks_blocked()
+                leader.cancel()
+                release.set()
+
+    assert len(errors) == 2
+    assert all("Invalid structured content returned by tool counted" in error for error in errors)
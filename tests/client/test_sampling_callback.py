@@ -1,10 +1,13 @@
+import anyio
 import pytest
 
 from mcp import Client
 from mcp.client.session import ClientSession
 from mcp.server.mcpserver import MCPServer
 from mcp.shared._context import RequestContext
+from mcp.shared.message import SessionMessage
 from mcp.types import (
+    CallToolResult,
     CreateMessageRequestParams,
     CreateMessageResult,
     CreateMessageResultWithTools,
@@ -129,3 +132,85 @@ async def test_create_message_result_with_tools_type():
     assert len(content_list_array) == 2
     assert content_list_array[0].type == "text"
     assert content_list_array[1].type == "tool_use"
+
+
+def sampling_server() -> MCPServer:
+    server = MCPServer("test")
+
+    @server.tool("sample")
+    async def sample_tool(message: str) -> str:
+        result = await server.get_context().session.create_message(
+            messages=[SamplingMessage(role="user", content=TextContent(type="text", text=message))],
+            max_tokens=100,
+        )
+        assert isinstance(result.content, TextContent)
+        return result.content.text
+
+    @server.tool("echo")
+    async def echo_tool(message: str) -> str:
+        return message
+
+    return server
+
+
+@pytest.mark.anyio
+async def test_slow_sampling_callback_does_not_block_other_responses():
+    release = anyio.Event()
+
+    async def sampling_callback(
+        context: RequestContext[ClientSession], params: CreateMessageRequestParams
+    ) -> CreateMessageResult:
+        await release.wait()
+        return CreateMessageResult(role="assistant", content=TextContent(type="text", text="sampled"), model="m")
+
+    async with Client(sampling_server(), sampling_callback=sampling_callback) as client:
+        sampled: list[CallToolResult] = []
+
+        async def call_sample() -> None:
+            sampled.append(await client.call_tool("sample", {"message": "hi"}))
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(call_sample)
+                await anyio.wait_all_tasks_blocked()
+
+                # The sampling callback is still waiting, yet the session keeps reading responses
+                result = await client.call_tool("echo", {"message": "still responsive"})
+                assert isinstance(result.content[0], TextContent)
+                assert result.content[0].text == "still responsive"
+                release.set()
+
+        assert isinstance(sampled[0].content[0], TextContent)
+        assert sampled[0].content[0].text == "sampled"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("limit", "expected_peak"), [(1, 1), (None, 3)])
+async def test_max_concurrent_server_requests(limit: int | None, expected_peak: int):
+    running = [0, 0]  # current, peak
+
+    async def sampling_callback(
+        context: RequestContext[ClientSession], params: CreateMessageRequestParams
+    ) -> CreateMessageResult:
+        running[0] += 1
+        running[1] = max(running)
+        await anyio.sleep(0.01)
+        running[0] -= 1
+        return CreateMessageResult(role="assistant", content=TextContent(type="text", text="sampled"), model="m")
+
+    async with Client(
+        sampling_server(), sampling_callback=sampling_callback, max_concurrent_server_requests=limit
+    ) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(client.call_tool, "sample", {"message": "hi"})
+
+    assert running[1] == expected_peak
+
+
+def test_invalid_max_concurrent_server_requests():
+    read_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception]()
+    write_stream, write_reader = anyio.create_memory_object_stream[SessionMessage]()
+    with read_writer, read_stream, write_stream, write_reader:
+        with pytest.raises(ValueError, match="max_concurrent_server_requests must be at least 1"):
+            ClientSession(read_stream, write_stream, max_concurrent_server_requests=0)
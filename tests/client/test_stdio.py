@@ -71,6 +71,22 @@ async def test_stdio_client():
         assert read_messages[1] == JSONRPCResponse(jsonrpc="2.0", id=2, result={})
 
 
+@pytest.mark.anyio
+@pytest.mark.skipif(tee is None, reason="could not find tee command")
+async def test_stdio_client_encodes_messages_for_the_server_encoding():
+    assert tee is not None
+    message = JSONRPCRequest(jsonrpc="2.0", id=1, method="ping", params={"name": "café"})
+
+    async with stdio_client(StdioServerParameters(command=tee, encoding="latin-1")) as (read_stream, write_stream):
+        async with write_stream:
+            await write_stream.send(SessionMessage(message))
+        async with read_stream:
+            received = await read_stream.receive()
+
+    assert isinstance(received, SessionMessage)
+    assert received.message == message
+
+
 @pytest.mark.anyio
 async def test_stdio_client_bad_path():
     """Check that the connection doesn't hang if process errors."""
@@ -937,3 +937,65 @@ async def test_error_routing_skips_non_matching_routers() -> None:
         await server_to_client_receive.aclose()
         await client_to_server_send.aclose()
         await client_to_server_receive.aclose()
+
+
+@pytest.mark.anyio
+async def test_routed_responses_skip_the_other_routers() -> None:
+    """Test that responses to requests registered with add_response_route go straight to their router."""
+    server_to_client_send, server_to_client_receive = anyio.create_memory_object_stream[SessionMessage](10)
+    client_to_server_send, client_to_server_receive = anyio.create_memory_object_stream[SessionMessage](10)
+
+    router_calls: list[str] = []
+    both_routed = anyio.Event()
+
+    class UnregisteredRouter(ResponseRouter):
+        def route_response(self, request_id: str | int, response: dict[str, Any]) -> bool:
+            raise NotImplementedError
+
+        def route_error(self, request_id: str | int, error: ErrorData) -> bool:
+            raise NotImplementedError
+
+    class RegisteredRouter(ResponseRouter):
+        def route_response(self, request_id: str | int, response: dict[str, Any]) -> bool:
+            router_calls.append(f"response {request_id}")
+            return True
+
+        def route_error(self, request_id: str | int, error: ErrorData) -> bool:
+            router_calls.append(f"error {request_id}")
+            both_routed.set()
+            return True
+
+    try:
+        async with ServerSession(
+            client_to_server_receive,
+            server_to_client_send,
+            InitializationOptions(
+                server_name="test-server",
+                server_version="1.0.0",
+                capabilities=ServerCapabilities(),
+            ),
+        ) as server_session:
+            router = RegisteredRouter()
+            server_session.add_response_router(UnregisteredRouter())
+            server_session.add_response_router(router)
+            server_session.add_response_route("task-req-1", router)
+            server_session.add_response_route("task-req-2", router)
+
+            error = ErrorData(code=INVALID_REQUEST, message="Test error")
+            await client_to_server_send.send(
+                SessionMessage(message=JSONRPCResponse(jsonrpc="2.0", id="task-req-1", result={}))
+            )
+            await client_to_server_send.send(
+                SessionMessage(message=JSONRPCError(jsonrpc="2.0", id="task-req-2", error=error))
+            )
+
+            with anyio.fail_after(5):
+                await both_routed.wait()
+
+            # The router registered first was never asked
+            assert router_calls == ["response task-req-1", "error task-req-2"]
+    finally:  # pragma: lax no cover
+        await server_to_client_send.aclose()
+        await server_to_client_receive.aclose()
+        await client_to_server_send.aclose()
+        await client_to_server_receive.aclose()
@@ -2,6 +2,7 @@ import pytest
 
 from mcp import types
 from mcp.server.mcpserver import MCPServer
+from mcp.shared.message import EncodedResult
 
 
 @pytest.mark.anyio
@@ -22,10 +23,12 @@ async def test_resource_templates():
 
     # Get the list of resource templates using the underlying server
     # Note: list_resource_templates() returns a decorator that wraps the handler
-    # The handler returns a ServerResult with a ListResourceTemplatesResult inside
-    result = await mcp._lowlevel_server.request_handlers[types.ListResourceTemplatesRequest](
+    # The handler returns a pre-encoded snapshot of a ListResourceTemplatesResult
+    snapshot = await mcp._lowlevel_server.request_handlers[types.ListResourceTemplatesRequest](
         types.ListResourceTemplatesRequest(params=None)
     )
+    assert isinstance(snapshot, EncodedResult)
+    result = snapshot.result
     assert isinstance(result, types.ListResourceTemplatesResult)
     templates = result.resource_templates
 
@@ -21,7 +21,6 @@ from mcp.types import (
     ReadResourceRequest,
     ReadResourceRequestParams,
     ReadResourceResult,
-    ServerResult,
 )
 
 
@@ -57,7 +56,7 @@ async def test_server_base64_encoding_issue():
     )
 
     # Call the handler to get the response
-    result: ServerResult = await handler(request)
+    result = await handler(request)
 
     # After (fixed code):
     read_result: ReadResourceResult = cast(ReadResourceResult, result)
@@ -290,3 +290,20 @@ async def test_mixed_params_with_typed_request() -> None:
 
     with pytest.raises(TypeError, match="missing 1 required positional argument: 'a'"):
         await wrapper(request)
+
+
+@pytest.mark.anyio
+async def test_optional_request_param_passes_request() -> None:
+    """Test: def foo(req: ListToolsRequest | None) - should pass the request, or None, through."""
+    received: list[ListToolsRequest | None] = []
+
+    async def handler(req: ListToolsRequest | None) -> list[str]:
+        received.append(req)
+        return ["test"]
+
+    wrapper = create_call_wrapper(handler, ListToolsRequest)
+
+    request = ListToolsRequest(method="tools/list", params=None)
+    await wrapper(request)
+    await wrapper(None)  # type: ignore[arg-type]
+    assert received == [request, None]
@@ -0,0 +1,215 @@
+"""Tests for the per-session concurrency limit of the low-level server."""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from mcp import Client, types
+from mcp.client.session import ClientSession
+from mcp.server.lowlevel.server import Server
+from mcp.server.mcpserver import Context, MCPServer, PerformanceSettings
+from mcp.server.session import ServerSession
+from mcp.shared._context import RequestContext
+from mcp.shared.exceptions import MCPError
+from mcp.types import (
+    SERVER_BUSY,
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    CancelledNotification,
+    CancelledNotificationParams,
+    CreateMessageRequestParams,
+    CreateMessageResult,
+    SamplingMessage,
+    TextContent,
+)
+
+
+def blocking_server(**kwargs: Any) -> tuple[Server, anyio.Event, list[int]]:
+    """A server whose tool blocks until the returned event is set, recording how many calls overlap."""
+    server = Server("test-server", **kwargs)
+    release = anyio.Event()
+    running: list[int] = [0, 0]  # current, peak
+
+    @server.call_tool()
+    async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[types.TextContent]:
+        running[0] += 1
+        running[1] = max(running)
+        await release.wait()
+        running[0] -= 1
+        return [types.TextContent(type="text", text=name)]
+
+    return server, release, running
+
+
+async def call_tool(client: Client, name: str) -> CallToolResult:
+    return await client.session.send_request(
+        CallToolRequest(params=CallToolRequestParams(name=name, arguments={})), CallToolResult
+    )
+
+
+@pytest.mark.anyio
+async def test_max_concurrent_requests_bounds_running_handlers():
+    server, release, running = blocking_server(max_concurrent_requests=2)
+    results: list[str] = []
+
+    async with Client(server) as client:
+
+        async def call(i: int) -> None:
+            result = await call_tool(client, f"tool-{i}")
+            assert isinstance(result.content[0], types.TextContent)
+            results.append(result.content[0].text)
+
+        async with anyio.create_task_group() as tg:
+            for i in range(6):
+                tg.start_soon(call, i)
+            await anyio.wait_all_tasks_blocked()
+
+            assert running[0] == 2
+            assert server.request_metrics.running == 2
+            assert server.request_metrics.queued == 4
+            release.set()
+
+    assert sorted(results) == [f"tool-{i}" for i in range(6)]
+    assert running[1] == 2
+    metrics = server.request_metrics
+    assert (metrics.queued, metrics.running) == (0, 0)
+    assert metrics.max_queued == 4
+    assert metrics.max_wait_time > 0
+    assert 0 < metrics.average_wait_time <= metrics.max_wait_time
+
+
+@pytest.mark.anyio
+async def test_full_queue_rejects_new_requests():
+    server, release, _ = blocking_server(max_concurrent_requests=1, max_queued_requests=1)
+    errors: list[MCPError] = []
+
+    async def call(client: Client, name: str) -> None:
+        try:
+            await call_tool(client, name)
+        except MCPError as e:
+            errors.append(e)
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            for i in range(4):
+                tg.start_soon(call, client, f"tool-{i}")
+            await anyio.wait_all_tasks_blocked()
+
+            # One request runs and one waits in the queue; the others are turned away
+            assert server.request_metrics.running == 1
+            assert server.request_metrics.queued == 1
+            assert server.request_metrics.rejected == 2
+            release.set()
+
+    assert [(e.code, e.message) for e in errors] == [
+        (SERVER_BUSY, "Server busy: too many requests queued, retry later")
+    ] * 2
+    assert server.request_metrics.dispatched == 2
+
+
+@pytest.mark.anyio
+async def test_queued_requests_can_be_cancelled():
+    server, release, running = blocking_server(max_concurrent_requests=1)
+    errors: list[MCPError] = []
+
+    async with Client(server) as client:
+
+        async def cancelled_call() -> None:
+            with pytest.raises(MCPError) as exc_info:
+                await call_tool(client, "queued")
+            errors.append(exc_info.value)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call_tool, client, "running")
+            await anyio.wait_all_tasks_blocked()
+            request_id = client.session._request_id  # pyright: ignore[reportPrivateUsage]
+            tg.start_soon(cancelled_call)
+            await anyio.wait_all_tasks_blocked()
+            assert server.request_metrics.queued == 1
+
+            await client.session.send_notification(
+                CancelledNotification(params=CancelledNotificationParams(request_id=request_id))
+            )
+            await anyio.wait_all_tasks_blocked()
+            assert [e.message for e in errors] == ["Request cancelled"]
+            release.set()
+
+    # The cancelled request left the queue without running
+    assert running[1] == 1
+    assert server.request_metrics.dispatched == 2
+    assert server.request_metrics.queued == 0
+
+
+@pytest.mark.anyio
+async def test_requests_waiting_on_the_client_finish_while_the_queue_is_full():
+    mcp = MCPServer(performance=PerformanceSettings(max_concurrent_requests=1, max_queued_requests=1))
+
+    @mcp.tool()
+    async def ask(ctx: Context[ServerSession, None]) -> str:
+        result = await ctx.session.create_message(
+            messages=[SamplingMessage(role="user", content=TextContent(type="text", text="hi"))], max_tokens=10
+        )
+        assert isinstance(result.content, TextContent)
+        return result.content.text
+
+    async def sampling_callback(
+        context: RequestContext[ClientSession], params: CreateMessageRequestParams
+    ) -> CreateMessageResult:
+        await anyio.sleep(0.01)
+        return CreateMessageResult(role="assistant", content=TextContent(type="text", text="hello"), model="m")
+
+    outcomes: list[str] = []
+
+    async with Client(mcp, sampling_callback=sampling_callback) as client:
+
+        async def call() -> None:
+            try:
+                result = await client.call_tool("ask", {})
+            except MCPError as e:
+                outcomes.append(str(e.code))
+            else:
+                assert isinstance(result.content[0], TextContent)
+                outcomes.append(result.content[0].text)
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                for _ in range(10):
+                    tg.start_soon(call)
+
+    assert len(outcomes) == 10
+    assert "hello" in outcomes
+    assert set(outcomes) <= {"hello", str(SERVER_BUSY)}
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError, match="max_concurrent_requests must be at least 1"):
+        Server("test-server", max_concurrent_requests=0)
+    with pytest.raises(ValueError, match="max_queued_requests must not be negative"):
+        Server("test-server", max_queued_requests=-1)
+
+
+@pytest.mark.anyio
+async def test_mcpserver_passes_limits_to_lowlevel_server():
+    mcp = MCPServer(performance=PerformanceSettings(max_concurrent_requests=1))
+    finished = 0
+
+    @mcp.tool()
+    async def slow() -> str:
+        nonlocal finished
+        await anyio.sleep(0.01)
+        finished += 1
+        return "done"
+
+    async with Client(mcp) as client:
+
+        async def call() -> None:
+            await client.call_tool("slow", {})
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call)
+
+    assert finished == 3
+    assert mcp.request_metrics.max_queued >= 1
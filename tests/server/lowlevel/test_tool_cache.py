@@ -0,0 +1,219 @@
+"""Tests for the low-level server's cache of tool definitions."""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from mcp import Client, types
+from mcp.server.lowlevel.server import Server
+from mcp.server.mcpserver import MCPServer
+from mcp.shared.exceptions import MCPError
+
+
+def counting_server(tools: list[types.Tool], **kwargs: Any) -> tuple[Server, list[int]]:
+    """A server whose list_tools handler returns `tools` and counts how often it runs."""
+    server = Server("test-server", **kwargs)
+    listed = [0]
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        listed[0] += 1
+        return list(tools)
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+        if name == "change_tools":
+            tools.append(types.Tool(name="added", input_schema={"type": "object", "required": ["x"]}))
+            await server.request_context.session.send_tool_list_changed()
+        return [types.TextContent(type="text", text=name)]
+
+    return server, listed
+
+
+async def call(client: Client, name: str, arguments: dict[str, Any] | None = None) -> types.CallToolResult:
+    return await client.session.send_request(
+        types.CallToolRequest(params=types.CallToolRequestParams(name=name, arguments=arguments or {})),
+        types.CallToolResult,
+    )
+
+
+@pytest.mark.anyio
+async def test_missing_tool_is_remembered():
+    server, listed = counting_server([])
+
+    async with Client(server) as client:
+        for _ in range(3):
+            result = await call(client, "unlisted")
+            assert not result.is_error
+
+    assert listed[0] == 1
+
+
+@pytest.mark.anyio
+async def test_missing_tool_is_looked_up_again_without_ttl():
+    server, listed = counting_server([], tool_cache_miss_ttl=0)
+
+    async with Client(server) as client:
+        for _ in range(3):
+            await call(client, "unlisted")
+
+    assert listed[0] == 3
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_refresh():
+    server = Server("test-server")
+    release = anyio.Event()
+    listed = [0]
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        listed[0] += 1
+        await release.wait()
+        return [types.Tool(name="slow_listed", input_schema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text=name)]
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(call, client, "slow_listed")
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+    assert listed[0] == 1
+
+
+@pytest.mark.anyio
+async def test_failed_refresh_fails_every_call_sharing_it():
+    server = Server("test-server")
+    release = anyio.Event()
+    failures = [RuntimeError("tools unavailable")]
+    called: list[str] = []
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        await release.wait()
+        if failures:
+            raise failures.pop()
+        return [types.Tool(name="flaky", input_schema={"type": "object", "required": ["x"]})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+        called.append(name)
+        return [types.TextContent(type="text", text=name)]
+
+    results: list[types.CallToolResult] = []
+
+    async def call_flaky(client: Client) -> None:
+        results.append(await call(client, "flaky"))
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call_flaky, client)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+        # None of the calls went ahead without the tool's schema
+        assert [result.is_error for result in results] == [True] * 3
+        assert all(
+            isinstance(content := result.content[0], types.TextContent) and content.text == "tools unavailable"
+            for result in results
+        )
+        assert called == []
+
+        # The failure is not remembered as a missing tool: the next call lists the tools again
+        result = await call(client, "flaky")
+        assert result.is_error
+        assert isinstance(result.content[0], types.TextContent)
+        assert "'x' is a required property" in result.content[0].text
+
+
+@pytest.mark.anyio
+async def test_refresh_is_run_again_when_the_call_running_it_is_cancelled():
+    server = Server("test-server")
+    release = anyio.Event()
+    listed = [0]
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        listed[0] += 1
+        await release.wait()
+        return [types.Tool(name="strict", input_schema={"type": "object", "required": ["x"]})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text=name)]
+
+    results: list[types.CallToolResult] = []
+
+    async def call_strict(client: Client) -> None:
+        results.append(await call(client, "strict"))
+
+    async def cancelled_call(client: Client) -> None:
+        with pytest.raises(MCPError, match="Request cancelled"):
+            await call(client, "strict")
+
+    async with Client(server) as client:
+        async with anyio.create_task_group() as tg:
+            request_id = client.session._request_id  # pyright: ignore[reportPrivateUsage]
+            tg.start_soon(cancelled_call, client)
+            await anyio.wait_all_tasks_blocked()
+            for _ in range(2):
+                tg.start_soon(call_strict, client)
+            await anyio.wait_all_tasks_blocked()
+            await client.session.send_notification(
+                types.CancelledNotification(params=types.CancelledNotificationParams(request_id=request_id))
+            )
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+
+    # The calls left waiting listed the tools again and validated their arguments
+    assert listed[0] == 2
+    assert [result.is_error for result in results] == [True, True]
+    assert all(
+        isinstance(content := result.content[0], types.TextContent) and "'x' is a required property" in content.text
+        for result in results
+    )
+
+
+@pytest.mark.anyio
+async def test_tool_list_changed_invalidates_the_cache():
+    server, listed = counting_server([types.Tool(name="change_tools", input_schema={"type": "object"})])
+
+    async with Client(server) as client:
+        # "added" does not exist yet, so it is remembered as missing and not validated
+        result = await call(client, "added")
+        assert not result.is_error
+
+        await call(client, "change_tools")
+
+        # The notification dropped the cache, so the new tool's schema is enforced right away
+        result = await call(client, "added")
+        assert result.is_error
+        assert isinstance(result.content[0], types.TextContent)
+        assert "'x' is a required property" in result.content[0].text
+
+    assert listed[0] == 2
+
+
+@pytest.mark.anyio
+async def test_mcpserver_add_tool_invalidates_the_cache():
+    mcp = MCPServer()
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("late", {"x": 1})
+        assert result.is_error
+
+        def late(x: int) -> int:
+            return x
+
+        mcp.add_tool(late)
+        assert mcp._lowlevel_server._tool_cache_misses == {}
+
+        result = await client.call_tool("late", {"x": 1})
+        assert not result.is_error
@@ -0,0 +1,210 @@
+"""Tests for indexed directory listings."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import anyio
+import pytest
+
+from mcp import Client
+from mcp.server.mcpserver import MCPServer
+from mcp.server.mcpserver.resources import DirectoryIndex, DirectoryResource, DirectoryWatcher
+from mcp.shared.exceptions import MCPError
+from mcp.types import TextResourceContents
+
+pytestmark = pytest.mark.anyio
+
+
+def make_tree(root: Path, *files: str) -> None:
+    for file in files:
+        (root / file).parent.mkdir(parents=True, exist_ok=True)
+        (root / file).write_text(file)
+    # Directories modified just before they are listed are listed again until they are
+    # older, in case they change within the resolution of their modification times.
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(0, 0))
+
+
+def listing(text: str | bytes | memoryview) -> dict[str, object]:
+    assert isinstance(text, str)
+    return json.loads(text)
+
+
+async def test_lists_files_once_and_then_only_changed_directories(tmp_path: Path):
+    make_tree(tmp_path, "README.md", "src/app.py", "src/lib/util.py", "docs/index.md")
+    resource = DirectoryResource(uri="dir://repo", path=tmp_path, recursive=True)
+
+    assert listing(await resource.read()) == {"files": ["README.md", "docs/index.md", "src/app.py", "src/lib/util.py"]}
+    assert resource.index.metrics.directories_listed == 4
+    assert await resource.read() == '{"files":["README.md","docs/index.md","src/app.py","src/lib/util.py"]}'
+    assert resource.index.metrics.directories_listed == 4
+
+    (tmp_path / "src" / "lib" / "new.py").write_text("")
+    (tmp_path / "README.md").unlink()
+    shutil.rmtree(tmp_path / "docs")
+    assert listing(await resource.read()) == {"files": ["src/app.py", "src/lib/new.py", "src/lib/util.py"]}
+    # The directory itself and src/lib changed; docs was dropped without being listed
+    assert resource.index.metrics.directories_listed == 6
+
+
+async def test_pattern_and_depth(tmp_path: Path):
+    make_tree(tmp_path, "a.py", "b.txt", "pkg/c.py", "pkg/tests/d.py")
+
+    top = DirectoryResource(uri="dir://top", path=tmp_path, pattern="*.py")
+    assert listing(await top.read()) == {"files": ["a.py"]}
+    assert top.list_files() == [tmp_path / "a.py"]
+    assert listing(await top.read_page(pattern="b*")) == {"files": []}
+
+    tests = DirectoryResource(uri="dir://tests", path=tmp_path, recursive=True, pattern="tests/*.py")
+    assert listing(await tests.read()) == {"files": ["pkg/tests/d.py"]}
+
+
+async def test_refreshing_directories_reported_changed(tmp_path: Path):
+    make_tree(tmp_path, "a/one", "a/b/two", "c/three")
+    index = DirectoryIndex(tmp_path, recursive=True)
+    assert index.refresh()
+    assert sorted(index.directories) == ["", "a", "a/b", "c"]
+
+    (tmp_path / "a" / "b").rename(tmp_path / "c" / "b")
+    (tmp_path / "c" / "b" / "four").write_text("")
+    # Only the directories reported are listed, whatever their modification times
+    assert not index.refresh(["c/b-gone"])
+    assert index.refresh(["a"])
+    assert index.files == ["a/one", "c/three"]
+    assert index.refresh(["c", "c/b"])
+    assert index.files == ["a/one", "c/b/four", "c/b/two", "c/three"]
+    assert not index.refresh()
+    assert index.version == 3
+
+    shutil.rmtree(tmp_path / "c")
+    assert index.refresh(["c/b", ""])
+    assert index.files == ["a/one"]
+    shutil.rmtree(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        index.refresh([""])
+
+
+async def test_pages_are_read_through_the_uri_query(tmp_path: Path):
+    make_tree(tmp_path, *(f"src/m{i}.py" for i in range(5)), "src/notes.txt", "setup.py")
+    mcp = MCPServer()
+    mcp.add_resource(DirectoryResource(uri="dir://repo", path=tmp_path, recursive=True))
+
+    async def read(uri: str) -> dict[str, object]:
+        result = await client.read_resource(uri)
+        content = result.contents[0]
+        assert isinstance(content, TextResourceContents)
+        return json.loads(content.text)
+
+    async with Client(mcp) as client:
+        first = await read("dir://repo?pattern=src/*.py&limit=2")
+        assert first["files"] == ["src/m0.py", "src/m1.py"]
+        # Files added between pages neither shift nor repeat the following pages
+        (tmp_path / "src" / "a.py").write_text("")
+        second = await read(f"dir://repo?pattern=src/*.py&limit=2&cursor={first['nextCursor']}")
+        assert second["files"] == ["src/m2.py", "src/m3.py"]
+        assert await read(f"dir://repo?pattern=src/*.py&limit=2&cursor={second['nextCursor']}") == {
+            "files": ["src/m4.py"]
+        }
+        assert (await read("dir://repo?pattern=*.txt")) == {"files": ["src/notes.txt"]}
+
+        for query in ("limit=0", "limit=ten", "cursor=YQ", "sort=name"):
+            with pytest.raises(MCPError, match="Error reading resource dir://repo"):
+                await read(f"dir://repo?{query}")
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+async def test_watch_reports_changes(tmp_path: Path, use_inotify: bool):
+    make_tree(tmp_path, "a/one")
+    resource = DirectoryResource(uri="dir://repo", path=tmp_path, recursive=True)
+    updates: list[str] = []
+    updated = anyio.Event()
+
+    async def on_change(uri: str) -> None:
+        updates.append(uri)
+        updated.set()
+
+    async def changed_to(*files: str) -> None:
+        nonlocal updated
+        # A change may be seen in several steps, each reported
+        with anyio.fail_after(5):
+            while listing(await resource.read()) != {"files": list(files)}:
+                await updated.wait()
+                updated = anyio.Event()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(lambda: resource.watch(on_change, interval=0.01, use_inotify=use_inotify))
+        while not resource.index.version:
+            await anyio.sleep(0.01)
+
+        (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+        (tmp_path / "a" / "b" / "c" / "two").write_text("")
+        await changed_to("a/b/c/two", "a/one")
+        shutil.rmtree(tmp_path / "a")
+        await changed_to()
+        tg.cancel_scope.cancel()
+
+    assert set(updates) == {"dir://repo"}
+
+
+async def test_watcher_waits_on_descriptors_past_select_limit(tmp_path: Path):
+    make_tree(tmp_path, "a/one")
+    index = DirectoryIndex(tmp_path, recursive=True)
+    index.refresh()
+    # Hold descriptors until the watcher's lands above what select() can wait on
+    held: list[int] = []
+    try:
+        while not held or held[-1] < 1024:
+            held.append(os.open(os.devnull, os.O_RDONLY))
+        watcher = DirectoryWatcher(index)
+    finally:
+        for fd in held:
+            os.close(fd)
+    try:
+        watcher.sync()
+        assert watcher.wait(0.01) == set()
+        (tmp_path / "a" / "two").write_text("")
+        assert watcher.wait(5) == {"a"}
+    finally:
+        watcher.close()
+
+
+async def test_watch_falls_back_to_polling_when_inotify_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    make_tree(tmp_path, "one")
+    resource = DirectoryResource(uri="dir://repo", path=tmp_path)
+    updated = anyio.Event()
+
+    def broken_wait(self: DirectoryWatcher, timeout: float) -> set[str] | None:
+        raise OSError("inotify is broken")
+
+    async def on_change(uri: str) -> None:
+        updated.set()
+
+    monkeypatch.setattr(DirectoryWatcher, "wait", broken_wait)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(lambda: resource.watch(on_change, interval=0.01))
+        # The first listing, then the one catching up once directories are watched
+        while resource.index.metrics.refreshes < 2:
+            await anyio.sleep(0.01)
+        (tmp_path / "two").write_text("")
+        with anyio.fail_after(5):
+            await updated.wait()
+        tg.cancel_scope.cancel()
+
+    assert listing(await resource.read()) == {"files": ["one", "two"]}
+
+
+async def test_missing_directories(tmp_path: Path):
+    missing = DirectoryResource(uri="dir://missing", path=tmp_path / "missing")
+    with pytest.raises(ValueError, match="Directory not found"):
+        await missing.read()
+    (tmp_path / "file").write_text("")
+    with pytest.raises(ValueError, match="Not a directory"):
+        await DirectoryResource(uri="dir://file", path=tmp_path / "file").read_page()
+
+    resource = DirectoryResource(uri="dir://gone", path=tmp_path)
+    await resource.read()
+    shutil.rmtree(tmp_path)
+    with pytest.raises(ValueError, match="Error reading directory"):
+        await resource.read()
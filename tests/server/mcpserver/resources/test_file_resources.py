@@ -1,10 +1,14 @@
+import base64
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
 
-from mcp.server.mcpserver.resources import FileResource
+from mcp import Client
+from mcp.server.mcpserver import MCPServer
+from mcp.server.mcpserver.resources import FileCache, FileResource
+from mcp.types import BlobResourceContents
 
 
 @pytest.fixture
@@ -114,3 +118,103 @@ class TestFileResource:
                 await resource.read()
         finally:
             temp_file.chmod(0o644)  # Restore permissions
+
+
+class TestMappedAndCachedReads:
+    """Test memory-mapped reads and the shared file cache."""
+
+    @pytest.mark.anyio
+    async def test_mapped_binary_read(self, tmp_path: Path):
+        path = tmp_path / "model.bin"
+        path.write_bytes(b"\x00\x01weights")
+        resource = FileResource(uri=path.as_uri(), path=path, is_binary=True, use_mmap=True)
+
+        content = await resource.read()
+
+        assert isinstance(content, memoryview)
+        assert content == b"\x00\x01weights"
+
+    @pytest.mark.anyio
+    async def test_mapping_is_skipped_for_empty_and_text_files(self, tmp_path: Path):
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+        text = tmp_path / "notes.txt"
+        text.write_text("notes")
+
+        assert await FileResource(uri=empty.as_uri(), path=empty, is_binary=True, use_mmap=True).read() == b""
+        assert await FileResource(uri=text.as_uri(), path=text, use_mmap=True).read() == "notes"
+
+    @pytest.mark.anyio
+    async def test_cache_is_shared_until_the_file_changes(self, tmp_path: Path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"v1")
+        cache = FileCache()
+        first = FileResource(uri=path.as_uri(), path=path, is_binary=True, cache=cache)
+        second = FileResource(uri="data://alias", path=path, is_binary=True, cache=cache)
+
+        content = await first.read()
+        assert await second.read() is content
+        assert (cache.metrics.hits, cache.metrics.misses) == (1, 1)
+
+        # Rewritten in place with a different size
+        path.write_bytes(b"v2 longer")
+        assert await first.read() == b"v2 longer"
+
+        # Replaced by a file of the same size, which has another inode
+        replacement = tmp_path / "replacement.bin"
+        replacement.write_bytes(b"v3 longer")
+        os.replace(replacement, path)
+        assert await second.read() == b"v3 longer"
+        assert (cache.metrics.hits, cache.metrics.misses) == (1, 3)
+        assert cache.size == len(b"v3 longer")
+
+    @pytest.mark.anyio
+    async def test_cache_evicts_least_recently_used_files(self, tmp_path: Path):
+        cache = FileCache(max_bytes=10)
+        resources: dict[str, FileResource] = {}
+        for name, size in (("a", 4), ("b", 4), ("c", 4), ("huge", 11)):
+            path = tmp_path / name
+            path.write_text("x" * size)
+            resources[name] = FileResource(uri=path.as_uri(), path=path, cache=cache)
+
+        for name in ("a", "b", "a", "c", "huge", "a", "b"):
+            await resources[name].read()
+
+        # b was evicted for c, and huge never fit
+        assert (cache.metrics.hits, cache.metrics.misses, cache.metrics.evictions) == (2, 5, 2)
+        assert cache.size <= 10
+
+        cache.clear()
+        assert cache.size == 0
+        with pytest.raises(ValueError, match="max_bytes must be at least 1"):
+            FileCache(max_bytes=0)
+
+    @pytest.mark.anyio
+    async def test_mapped_file_is_served_as_a_base64_blob(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Encode a few bytes at a time, so the blob spans several chunks
+        monkeypatch.setattr("mcp.server.lowlevel.server._BASE64_CHUNK_SIZE", 3)
+        data = bytes(range(256)) * 4 + b"tail"
+        path = tmp_path / "artifact.bin"
+        path.write_bytes(data)
+        mcp = MCPServer()
+        mcp.add_resource(FileResource(uri=path.as_uri(), path=path, is_binary=True, use_mmap=True))
+
+        async with Client(mcp) as client:
+            result = await client.read_resource(path.as_uri())
+
+        content = result.contents[0]
+        assert isinstance(content, BlobResourceContents)
+        assert base64.b64decode(content.blob) == data
+
+    @pytest.mark.anyio
+    async def test_ranged_reads(self, tmp_path: Path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+        uncached = FileResource(uri=path.as_uri(), path=path, is_binary=True)
+        cached = FileResource(uri=path.as_uri(), path=path, is_binary=True, cache=FileCache())
+        missing = FileResource(uri="file:///missing.bin", path=tmp_path / "missing.bin", is_binary=True)
+
+        assert await uncached.read_range(2, 3) == (b"234", 10)
+        assert await cached.read_range(8, 5) == (b"89", 10)
+        with pytest.raises(ValueError, match="Error reading file"):
+            await missing.read_range(0, 1)
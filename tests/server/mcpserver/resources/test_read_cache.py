@@ -0,0 +1,244 @@
+"""Tests for caching and coalescing of resource reads."""
+
+import time
+
+import anyio
+import pytest
+
+from mcp import Client
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.mcpserver import Context, MCPServer
+from mcp.server.mcpserver.exceptions import ResourceError
+from mcp.server.mcpserver.resources import ResourceCacheConfig
+from mcp.server.mcpserver.resources.read_cache import ResourceReadCache
+from mcp.server.session import ServerSession
+from mcp.types import TextResourceContents
+
+pytestmark = pytest.mark.anyio
+
+
+def contents(text: str) -> list[ReadResourceContents]:
+    return [ReadResourceContents(content=text, mime_type="text/plain")]
+
+
+async def test_expired_contents_are_read_again():
+    cache = ResourceReadCache()
+    reads: list[str] = []
+
+    async def read() -> list[ReadResourceContents]:
+        reads.append("read")
+        return contents(f"v{len(reads)}")
+
+    config = ResourceCacheConfig(ttl=0.01)
+    assert (await cache.get("data://a", config, read))[0].content == "v1"
+    assert (await cache.get("data://a", config, read))[0].content == "v1"
+    time.sleep(0.02)
+    assert (await cache.get("data://a", config, read))[0].content == "v2"
+
+    assert (cache.metrics.hits, cache.metrics.misses, cache.metrics.expirations) == (1, 2, 1)
+
+
+async def test_least_recently_used_contents_are_evicted_to_fit_the_size_limit():
+    cache = ResourceReadCache(max_bytes=10)
+    config = ResourceCacheConfig()
+    reads: list[str] = []
+
+    def reader(uri: str, text: str):
+        async def read() -> list[ReadResourceContents]:
+            reads.append(uri)
+            return contents(text)
+
+        return read
+
+    await cache.get("data://a", config, reader("data://a", "aaaa"))
+    await cache.get("data://b", config, reader("data://b", "bbbb"))
+    await cache.get("data://a", config, reader("data://a", "aaaa"))
+    # b was the least recently used, and c does not fit beside both
+    await cache.get("data://c", config, reader("data://c", "cccc"))
+    await cache.get("data://a", config, reader("data://a", "aaaa"))
+    await cache.get("data://b", config, reader("data://b", "bbbb"))
+    # Contents larger than the whole cache are never kept
+    await cache.get("data://big", config, reader("data://big", "x" * 11))
+
+    assert reads == ["data://a", "data://b", "data://c", "data://b", "data://big"]
+    assert cache.size <= 10
+    assert cache.metrics.evictions == 2
+
+
+async def test_concurrent_reads_of_a_uri_share_one_read():
+    mcp = MCPServer()
+    calls: list[str] = []
+    release = anyio.Event()
+
+    @mcp.resource("reports://{year}", cache=ResourceCacheConfig())
+    async def report(year: str) -> str:
+        calls.append(year)
+        await release.wait()
+        return f"Report for {year}"
+
+    results: list[object] = []
+
+    async def read() -> None:
+        results.append(await mcp.read_resource("reports://2024"))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(50):
+            tg.start_soon(read)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert calls == ["2024"]
+    assert all(result == results[0] for result in results)
+    metrics = mcp.resource_cache_metrics
+    assert (metrics.misses, metrics.coalesced) == (1, 49)
+
+    # Another URI the template matches is read and cached on its own
+    await mcp.read_resource("reports://2025")
+    await mcp.read_resource("reports://2025")
+    assert calls == ["2024", "2025"]
+
+
+async def test_errors_are_shared_but_not_cached():
+    mcp = MCPServer()
+    attempts: list[int] = []
+    release = anyio.Event()
+
+    @mcp.resource("data://flaky", cache=ResourceCacheConfig())
+    async def flaky() -> str:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            await release.wait()
+            raise ValueError("not yet")
+        return "ok"
+
+    errors: list[ResourceError] = []
+
+    async def read() -> None:
+        try:
+            await mcp.read_resource("data://flaky")
+        except ResourceError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(read)
+        tg.start_soon(read)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert len(errors) == 2
+    assert list(await mcp.read_resource("data://flaky")) == contents("ok")
+    assert len(attempts) == 2
+
+
+async def test_uncached_resources_are_read_every_time():
+    mcp = MCPServer()
+    calls: list[str] = []
+
+    @mcp.resource("data://live")
+    def live() -> str:
+        calls.append("live")
+        return "live"
+
+    await mcp.read_resource("data://live")
+    await mcp.read_resource("data://live")
+
+    assert len(calls) == 2
+    assert mcp.resource_cache_metrics.misses == 0
+
+
+async def test_resource_updated_notification_drops_cached_contents():
+    mcp = MCPServer()
+    version = [1]
+
+    @mcp.resource("config://app", cache=ResourceCacheConfig(ttl=3600))
+    def app_config() -> str:
+        return f"version {version[0]}"
+
+    @mcp.tool()
+    async def bump(ctx: Context[ServerSession, None]) -> str:
+        version[0] += 1
+        await ctx.session.send_resource_updated("config://app")
+        return "bumped"
+
+    async with Client(mcp) as client:
+
+        async def read_text() -> str:
+            result = await client.read_resource("config://app")
+            content = result.contents[0]
+            assert isinstance(content, TextResourceContents)
+            return content.text
+
+        assert await read_text() == "version 1"
+        version[0] += 1
+        # Still cached, as nothing announced the change
+        assert await read_text() == "version 1"
+        await client.call_tool("bump", {})
+        assert await read_text() == "version 3"
+
+    mcp.clear_resource_cache()
+    version[0] += 1
+    assert list(await mcp.read_resource("config://app")) == [
+        ReadResourceContents(content="version 4", mime_type="text/plain")
+    ]
+
+
+async def test_invalidating_during_a_read_keeps_its_contents_out_of_the_cache():
+    cache = ResourceReadCache()
+    config = ResourceCacheConfig()
+    release = anyio.Event()
+    reads: list[str] = []
+
+    async def slow_read() -> list[ReadResourceContents]:
+        reads.append("slow")
+        await release.wait()
+        return contents("old")
+
+    async def fast_read() -> list[ReadResourceContents]:
+        reads.append("fast")
+        return contents("new")
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(cache.get, "data://a", config, slow_read)
+        await anyio.wait_all_tasks_blocked()
+        cache.invalidate("data://a")
+        # Does not wait for the outdated read
+        assert (await cache.get("data://a", config, fast_read))[0].content == "new"
+        release.set()
+
+    assert (await cache.get("data://a", config, fast_read))[0].content == "new"
+    assert reads == ["slow", "fast"]
+
+
+async def test_reads_waiting_on_a_cancelled_read_start_another():
+    cache = ResourceReadCache()
+    config = ResourceCacheConfig()
+    reads: list[str] = []
+
+    async def read() -> list[ReadResourceContents]:
+        reads.append("read")
+        if len(reads) == 1:
+            await anyio.sleep_forever()
+        return contents("done")
+
+    results: list[object] = []
+
+    async def waiter() -> None:
+        results.append(await cache.get("data://a", config, read))
+
+    async with anyio.create_task_group() as tg:
+        async with anyio.create_task_group() as leader:
+            leader.start_soon(cache.get, "data://a", config, read)
+            await anyio.wait_all_tasks_blocked()
+            tg.start_soon(waiter)
+            await anyio.wait_all_tasks_blocked()
+            leader.cancel_scope.cancel()
+
+    assert results == [contents("done")]
+    assert reads == ["read", "read"]
+
+
+def test_invalid_cache_configuration():
+    with pytest.raises(ValueError, match="ttl must be positive"):
+        ResourceCacheConfig(ttl=0)
+    with pytest.raises(ValueError, match="max_bytes must be at least 1"):
+        ResourceReadCache(max_bytes=0)
@@ -4,7 +4,7 @@ from tempfile import NamedTemporaryFile
 import pytest
 from pydantic import AnyUrl
 
-from mcp.server.mcpserver.resources import FileResource, FunctionResource, ResourceManager, ResourceTemplate
+from mcp.server.mcpserver.resources import FileResource, FunctionResource, ResourceManager
 
 
 @pytest.fixture
@@ -97,18 +97,30 @@ class TestResourceManager:
         def greet(name: str) -> str:
             return f"Hello, {name}!"
 
-        template = ResourceTemplate.from_function(
-            fn=greet,
-            uri_template="greet://{name}",
-            name="greeter",
-        )
-        manager._templates[template.uri_template] = template
+        manager.add_template(fn=greet, uri_template="greet://{name}", name="greeter")
 
         resource = await manager.get_resource(AnyUrl("greet://world"))
         assert isinstance(resource, FunctionResource)
         content = await resource.read()
         assert content == "Hello, world!"
 
+    @pytest.mark.anyio
+    async def test_most_specific_template_wins(self):
+        """Test that a literal segment takes precedence over a variable, whatever the order of registration."""
+        manager = ResourceManager()
+
+        def user(user_id: str) -> str:  # pragma: no cover
+            return f"user {user_id}"
+
+        def me() -> str:
+            return "me"
+
+        manager.add_template(fn=user, uri_template="users://{user_id}/profile")
+        manager.add_template(fn=me, uri_template="users://me/profile")
+
+        resource = await manager.get_resource("users://me/profile")
+        assert await resource.read() == "me"
+
     @pytest.mark.anyio
     async def test_get_unknown_resource(self):
         """Test getting a non-existent resource."""
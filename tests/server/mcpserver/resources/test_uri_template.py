@@ -0,0 +1,118 @@
+"""Tests for URI templates and the router that matches resource template URIs."""
+
+import pytest
+
+from mcp.server.mcpserver.resources.uri_template import UriTemplate, UriTemplateRouter
+
+
+def route(*templates: str) -> UriTemplateRouter[str]:
+    router: UriTemplateRouter[str] = UriTemplateRouter()
+    for template in templates:
+        router.add(UriTemplate(template), template)
+    return router
+
+
+class TestUriTemplate:
+    def test_simple_variables_match_one_segment(self):
+        template = UriTemplate("files://{folder}/{name}.txt")
+        assert template.variables == ("folder", "name")
+        assert template.match("files://docs/readme.txt") == {"folder": "docs", "name": "readme"}
+        assert template.match("files://docs/sub/readme.txt") is None
+        assert template.match("files://docs/readme.md") is None
+
+    def test_simple_variables_keep_queries_unless_the_template_has_a_query_expression(self):
+        assert UriTemplate("res://users/{id}").match("res://users/a?b#c") == {"id": "a?b#c"}
+        assert UriTemplate("res://users/{id}.json").match("res://users/a?b.json") == {"id": "a?b"}
+        assert UriTemplate("res://users/{id}{?fields}").match("res://users/a?fields=name") == {
+            "id": "a",
+            "fields": "name",
+        }
+
+    def test_literals_are_not_patterns(self):
+        template = UriTemplate("data://v1.0/{id}")
+        assert template.match("data://v1.0/7") == {"id": "7"}
+        assert template.match("data://v1x0/7") is None
+
+    def test_reserved_variable_spans_segments(self):
+        template = UriTemplate("files://{+path}")
+        assert template.match("files://a/b/c%20d.txt") == {"path": "a/b/c d.txt"}
+
+    def test_query_variables_are_optional_and_unordered(self):
+        template = UriTemplate("search://{+query}{?limit,offset}")
+        assert template.variables == ("query", "limit", "offset")
+        assert template.match("search://a/b") == {"query": "a/b"}
+        assert template.match("search://a/b?offset=5&limit=10&other=1") == {
+            "query": "a/b",
+            "limit": "10",
+            "offset": "5",
+        }
+
+    def test_query_continuation(self):
+        template = UriTemplate("search://items?sort=name{&page}")
+        assert template.match("search://items?sort=name&page=2") == {"page": "2"}
+        assert template.match("search://items?sort=name") == {}
+
+    @pytest.mark.parametrize(
+        "template",
+        ["bad://{a", "bad://a}", "bad://{#fragment}", "bad://{a,b}", "bad://{a-b}", "bad://{a}/{a}"],
+    )
+    def test_invalid_templates(self, template: str):
+        with pytest.raises(ValueError, match="URI template"):
+            UriTemplate(template)
+
+
+class TestUriTemplateRouter:
+    def test_routes_to_the_matching_template(self):
+        router = route("users://{user_id}", "users://{user_id}/posts/{post_id}", "orgs://{org}")
+        assert router.match("users://42/posts/7") == (
+            "users://{user_id}/posts/{post_id}",
+            {"user_id": "42", "post_id": "7"},
+        )
+        assert router.match("orgs://acme") == ("orgs://{org}", {"org": "acme"})
+        assert router.match("users://42/posts") is None
+        assert router.match("teams://a") is None
+
+    def test_values_are_percent_decoded(self):
+        router = route("search://{query}")
+        assert router.match("search://caf%C3%A9+cr%C3%A8me") == ("search://{query}", {"query": "café+crème"})
+
+    def test_most_specific_template_wins(self):
+        router = route(
+            "docs://{+path}",
+            "docs://{section}/{page}",
+            "docs://{section}/page-{number}",
+            "docs://guide/{page}",
+        )
+        assert router.match("docs://guide/intro") == ("docs://guide/{page}", {"page": "intro"})
+        assert router.match("docs://api/page-3") == (
+            "docs://{section}/page-{number}",
+            {"section": "api", "number": "3"},
+        )
+        assert router.match("docs://api/intro") == ("docs://{section}/{page}", {"section": "api", "page": "intro"})
+        assert router.match("docs://api/v1/intro") == ("docs://{+path}", {"path": "api/v1/intro"})
+
+    def test_falls_back_when_a_more_specific_branch_dead_ends(self):
+        router = route("repo://main/{file}/raw", "repo://{branch}/{file}")
+        assert router.match("repo://main/readme") == ("repo://{branch}/{file}", {"branch": "main", "file": "readme"})
+
+    def test_ties_go_to_the_first_template_added(self):
+        router = route("items://{id}", "items://{name}")
+        assert router.match("items://x") == ("items://{id}", {"id": "x"})
+
+    def test_adding_a_template_again_replaces_its_value(self):
+        router: UriTemplateRouter[int] = UriTemplateRouter()
+        router.add(UriTemplate("items://{id}"), 1)
+        router.add(UriTemplate("items://{id}"), 2)
+        assert router.match("items://x") == (2, {"id": "x"})
+
+    def test_query_templates(self):
+        router = route("search://{query}{?limit}", "search://{query}/{page}")
+        assert router.match("search://cats?limit=5") == ("search://{query}{?limit}", {"query": "cats", "limit": "5"})
+        assert router.match("search://cats/2") == ("search://{query}/{page}", {"query": "cats", "page": "2"})
+        assert router.match("search://cats") == ("search://{query}{?limit}", {"query": "cats"})
+
+    def test_queries_go_to_simple_variables_when_no_query_template_matches(self):
+        router = route("users://{id}", "users://{id}/posts", "search://{query}{?limit}", "search://{query}")
+        assert router.match("users://a?b") == ("users://{id}", {"id": "a?b"})
+        assert router.match("users://a#b/posts") == ("users://{id}/posts", {"id": "a#b"})
+        assert router.match("search://cats?limit=5") == ("search://{query}{?limit}", {"query": "cats", "limit": "5"})
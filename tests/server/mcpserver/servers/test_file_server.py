@@ -93,6 +93,7 @@ async def test_read_resource_dir(mcp: MCPServer):
     assert len(res_list) == 1
     res = res_list[0]
     assert res.mime_type == "text/plain"
+    assert isinstance(res.content, str)
 
     files = json.loads(res.content)
 
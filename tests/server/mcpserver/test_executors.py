@@ -0,0 +1,238 @@
+"""Tests for the executors that run MCPServer's synchronous tools, resources and prompts."""
+
+import functools
+import os
+import threading
+import time
+
+import anyio
+import anyio.to_thread
+import pytest
+
+from mcp import Client
+from mcp.server.mcpserver import Context, MCPServer
+from mcp.server.mcpserver.resources import FunctionResource
+from mcp.server.mcpserver.utilities.executors import InlineExecutor, ProcessExecutor, ThreadExecutor
+from mcp.server.session import ServerSession
+
+
+def sum_of_squares(n: int) -> dict[str, int]:
+    """Module level, so worker processes can unpickle it."""
+    return {"pid": os.getpid(), "total": sum(i * i for i in range(n))}
+
+
+@pytest.mark.anyio
+async def test_thread_executor_limits_its_own_calls():
+    executor = ThreadExecutor(max_workers=1)
+    release = threading.Event()
+    results: list[int] = []
+
+    async def call(value: int) -> None:
+        results.append(await executor.run(lambda: release.wait() and value))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(call, 1)
+        tg.start_soon(call, 2)
+        await anyio.wait_all_tasks_blocked()
+
+        assert (executor.metrics.active, executor.metrics.queued) == (1, 1)
+        # The dedicated limit leaves anyio's default thread limiter alone
+        assert anyio.to_thread.current_default_thread_limiter().borrowed_tokens == 0
+        release.set()
+
+    assert sorted(results) == [1, 2]
+    assert (executor.metrics.active, executor.metrics.queued) == (0, 0)
+    assert (executor.metrics.max_queued, executor.metrics.completed) == (1, 2)
+
+
+@pytest.mark.anyio
+async def test_thread_executors_can_share_a_limiter():
+    limiter = anyio.CapacityLimiter(1)
+    first, second = ThreadExecutor(limiter=limiter), ThreadExecutor(limiter=limiter)
+    release = threading.Event()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(first.run, release.wait)
+        tg.start_soon(second.run, release.wait)
+        await anyio.wait_all_tasks_blocked()
+
+        assert first.metrics.active + second.metrics.active == 1
+        assert first.metrics.queued + second.metrics.queued == 1
+        release.set()
+
+
+@pytest.mark.anyio
+async def test_inline_executor_runs_on_the_event_loop():
+    executor = InlineExecutor()
+    assert await executor.run(threading.get_ident) == threading.get_ident()
+    assert executor.metrics.completed == 1
+
+
+@pytest.mark.anyio
+async def test_slow_tools_on_their_own_executor_do_not_stall_others():
+    release = threading.Event()
+    mcp = MCPServer(executors={"slow": ThreadExecutor(max_workers=1)})
+
+    @mcp.tool(executor="slow")
+    def slow() -> str:
+        release.wait()
+        return "slow"
+
+    @mcp.tool()
+    def fast() -> str:
+        return "fast"
+
+    @mcp.tool(executor="inline")
+    def thread_id() -> int:
+        return threading.get_ident()
+
+    async with Client(mcp) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(client.call_tool, "slow", None)
+            await anyio.wait_all_tasks_blocked()
+
+            slow_metrics = mcp.executor_metrics["slow"]
+            assert (slow_metrics.active, slow_metrics.queued) == (1, 2)
+
+            with anyio.fail_after(5):
+                result = await client.call_tool("fast", {})
+            assert result.structured_content == {"result": "fast"}
+            assert mcp.executor_metrics["thread"].completed == 1
+
+            result = await client.call_tool("thread_id", {})
+            assert result.structured_content == {"result": threading.get_ident()}
+            release.set()
+
+    assert mcp.executor_metrics["slow"].completed == 3
+
+
+@pytest.mark.anyio
+async def test_sync_resources_templates_and_prompts_run_off_the_event_loop():
+    release = threading.Event()
+    mcp = MCPServer(executors={"slow": ThreadExecutor(max_workers=1)})
+    threads: list[int] = []
+
+    @mcp.resource("data://blocking", executor="slow")
+    def blocking() -> str:
+        release.wait()
+        return "blocking"
+
+    @mcp.resource("data://thread")
+    def thread() -> str:
+        threads.append(threading.get_ident())
+        return "thread"
+
+    @mcp.resource("data://{name}")
+    def named(name: str) -> str:
+        threads.append(threading.get_ident())
+        return name
+
+    @mcp.prompt()
+    def greeting(name: str) -> str:
+        threads.append(threading.get_ident())
+        return f"Hello {name}"
+
+    @mcp.resource("data://inline/{name}", executor="inline")
+    def inline(name: str) -> str:
+        threads.append(threading.get_ident())
+        return name
+
+    async with Client(mcp) as client:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(client.read_resource, "data://blocking")
+            await anyio.wait_all_tasks_blocked()
+            assert mcp.executor_metrics["slow"].active == 1
+
+            # The blocked read holds a worker thread, not the event loop
+            with anyio.fail_after(5):
+                await client.read_resource("data://thread")
+                await client.read_resource("data://template")
+                await client.get_prompt("greeting", {"name": "World"})
+                await client.read_resource("data://inline/x")
+            release.set()
+
+    assert threading.get_ident() not in threads[:3]
+    assert threads[3] == threading.get_ident()
+    assert mcp.executor_metrics["thread"].completed == 3
+    assert mcp.executor_metrics["slow"].completed == 1
+
+
+@pytest.mark.anyio
+async def test_process_tools_run_in_warmed_up_worker_processes():
+    mcp = MCPServer(executors={"process": ProcessExecutor(max_workers=2, warm_up=2)})
+    mcp.add_tool(sum_of_squares, executor="process")
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("sum_of_squares", {"n": 4})
+
+    assert result.structured_content is not None
+    assert result.structured_content["total"] == 14
+    assert result.structured_content["pid"] != os.getpid()
+    # The warm-up calls are not counted
+    assert mcp.executor_metrics["process"].completed == 1
+
+
+@pytest.mark.anyio
+async def test_cancelling_a_process_call_kills_the_worker():
+    executor = ProcessExecutor(max_workers=1)
+    start = time.monotonic()
+
+    with anyio.move_on_after(1):
+        await executor.run(functools.partial(time.sleep, 60))
+
+    assert time.monotonic() - start < 30
+    assert (executor.metrics.active, executor.metrics.completed) == (0, 1)
+
+
+def test_process_tools_must_be_sync_and_take_no_context():
+    mcp = MCPServer()
+
+    async def async_tool() -> None:  # pragma: no cover
+        pass
+
+    def context_tool(ctx: Context[ServerSession, None]) -> None:  # pragma: no cover
+        pass
+
+    with pytest.raises(ValueError, match="cannot run in a worker process"):
+        mcp.add_tool(async_tool, executor="process")
+    with pytest.raises(ValueError, match="cannot run in a worker process"):
+        mcp.add_tool(context_tool, executor="process")
+
+
+def test_only_tools_run_in_worker_processes():
+    mcp = MCPServer(default_executor="process")
+
+    def data() -> str:  # pragma: no cover
+        return "data"
+
+    def item(name: str) -> str:  # pragma: no cover
+        return name
+
+    # Resources and prompts fall back to threads when tools default to worker processes
+    mcp.resource("data://default")(data)
+    mcp.prompt()(data)
+    resource = mcp._resource_manager._resources["data://default"]
+    assert isinstance(resource, FunctionResource)
+    assert resource.executor is mcp._tool_manager.executors["thread"]
+
+    with pytest.raises(ValueError, match="cannot run in a worker process"):
+        mcp.resource("data://process", executor="process")(data)
+    with pytest.raises(ValueError, match="cannot run in a worker process"):
+        mcp.resource("data://{name}", executor="process")(item)
+    with pytest.raises(ValueError, match="cannot run in a worker process"):
+        mcp.prompt(executor="process")(data)
+
+
+def test_invalid_executor_configuration():
+    mcp = MCPServer()
+    with pytest.raises(ValueError, match="Unknown executor: missing"):
+        mcp.add_tool(lambda: None, name="tool", executor="missing")
+    with pytest.raises(ValueError, match="Unknown executor: missing"):
+        MCPServer(default_executor="missing")
+    with pytest.raises(ValueError, match="Cannot specify both max_workers and limiter"):
+        ThreadExecutor(max_workers=1, limiter=anyio.CapacityLimiter(1))
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        ThreadExecutor(max_workers=0)
+    with pytest.raises(ValueError, match="warm_up must not be negative"):
+        ProcessExecutor(warm_up=-1)
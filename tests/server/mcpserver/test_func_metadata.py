@@ -1173,6 +1173,24 @@ def test_basemodel_reserved_names_with_json_preparsing():
     assert result["normal"] == "plain string"
 
 
+@pytest.mark.anyio
+async def test_call_fn_with_reserved_names_and_json_strings():
+    def func_with_reserved_json(json: dict[str, Any], items: list[int], text: str, count: int = 0) -> dict[str, Any]:
+        return {"json": json, "items": items, "text": text, "count": count}
+
+    meta = func_metadata(func_with_reserved_json)
+
+    async def call(arguments: dict[str, Any]) -> Any:
+        return await meta.call_fn_with_arg_validation(func_with_reserved_json, False, arguments, None, executor=None)
+
+    result = await call({"json": '{"a": 1}', "items": " [1, 2]", "text": '["kept"]', "count": "3"})
+    assert result == {"json": {"a": 1}, "items": [1, 2], "text": '["kept"]', "count": 3}
+
+    # Arguments with nothing to parse are passed through without a copy
+    arguments: dict[str, Any] = {"json": {}, "items": [], "text": "x", "count": "true"}
+    assert meta.pre_parse_json(arguments) is arguments
+
+
 def test_disallowed_type_qualifier():
     def func_disallowed_qualifier() -> Final[int]:  # type: ignore
         pass  # pragma: no cover
@@ -0,0 +1,79 @@
+"""Tests for MCPServer's cached tools, resources and prompts listings."""
+
+import pytest
+
+from mcp import Client
+from mcp.server.mcpserver import MCPServer
+from mcp.types import Tool
+
+
+def counting_list_tools(mcp: MCPServer) -> list[int]:
+    """Count how often `mcp` builds its tools listing."""
+    built = [0]
+    list_tools = mcp.list_tools
+
+    async def counted() -> list[Tool]:
+        built[0] += 1
+        return await list_tools()
+
+    mcp.list_tools = counted
+    return built
+
+
+@pytest.mark.anyio
+async def test_unchanged_tools_listing_is_served_from_memory():
+    mcp = MCPServer()
+
+    @mcp.tool()
+    def first() -> str:  # pragma: no cover
+        return "first"
+
+    built = counting_list_tools(mcp)
+
+    async with Client(mcp) as client:
+        for _ in range(3):
+            result = await client.list_tools()
+            assert [tool.name for tool in result.tools] == ["first"]
+        assert built[0] == 1
+
+        @mcp.tool()
+        def second() -> str:  # pragma: no cover
+            return "second"
+
+        result = await client.list_tools()
+        assert [tool.name for tool in result.tools] == ["first", "second"]
+
+        mcp.remove_tool("first")
+        result = await client.list_tools()
+        assert [tool.name for tool in result.tools] == ["second"]
+        assert built[0] == 3
+
+
+@pytest.mark.anyio
+async def test_resources_templates_and_prompts_listings_follow_changes():
+    mcp = MCPServer()
+
+    @mcp.resource("data://one")
+    def one() -> str:  # pragma: no cover
+        return "one"
+
+    @mcp.prompt()
+    def greet() -> str:  # pragma: no cover
+        return "hello"
+
+    async with Client(mcp) as client:
+        assert [str(r.uri) for r in (await client.list_resources()).resources] == ["data://one"]
+        assert (await client.list_resource_templates()).resource_templates == []
+        assert [p.name for p in (await client.list_prompts()).prompts] == ["greet"]
+
+        @mcp.resource("data://items/{item}")
+        def item(item: str) -> str:  # pragma: no cover
+            return item
+
+        @mcp.prompt()
+        def farewell() -> str:  # pragma: no cover
+            return "bye"
+
+        templates = (await client.list_resource_templates()).resource_templates
+        assert [t.uri_template for t in templates] == ["data://items/{item}"]
+        assert [p.name for p in (await client.list_prompts()).prompts] == ["greet", "farewell"]
@@ -0,0 +1,215 @@
+"""Tests for cursor pagination of MCPServer's tools, resources and prompts."""
+
+import pytest
+
+from mcp import Client
+from mcp.server.mcpserver import MCPServer, PerformanceSettings
+from mcp.server.mcpserver.utilities.pagination import Paginator
+from mcp.shared.exceptions import MCPError
+from mcp.types import INVALID_PARAMS, Prompt, Resource, ResourceTemplate, Tool
+
+
+class Registry:
+    """A dict with a paginator and version kept up to date, as the managers keep them."""
+
+    def __init__(self, page_size: int | None) -> None:
+        self.entries: dict[str, str] = {}
+        self.paginator: Paginator[str] = Paginator(page_size)
+        self.version = 0
+
+    def add(self, key: str) -> None:
+        self.entries[key] = key
+        self.paginator.added(key)
+        self.version += 1
+
+    def remove(self, key: str) -> None:
+        del self.entries[key]
+        self.paginator.removed(key)
+        self.version += 1
+
+    def page(self, cursor: str | None) -> tuple[list[str], str | None]:
+        return self.paginator.page(self.entries, self.version, cursor)
+
+
+def test_pages_cover_every_entry_once():
+    registry = Registry(page_size=2)
+    for key in "abcde":
+        registry.add(key)
+
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        page, cursor = registry.page(cursor)
+        pages.append(page)
+        if cursor is None:
+            break
+
+    assert pages == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_cursors_stay_valid_across_adds_and_removes():
+    registry = Registry(page_size=2)
+    for key in "abcd":
+        registry.add(key)
+    first, cursor = registry.page(None)
+    assert first == ["a", "b"]
+
+    # The entry the cursor points after is gone, an earlier one is replaced and new ones are added
+    registry.remove("b")
+    registry.remove("a")
+    registry.add("a")
+    registry.add("e")
+
+    page, cursor = registry.page(cursor)
+    assert page == ["c", "d"]
+    page, cursor = registry.page(cursor)
+    assert (page, cursor) == (["a", "e"], None)
+
+
+def test_replacing_an_entry_keeps_its_place():
+    registry = Registry(page_size=1)
+    registry.add("a")
+    registry.add("b")
+    _, cursor = registry.page(None)
+    registry.add("a")
+
+    assert registry.page(cursor) == (["b"], None)
+
+
+def test_without_a_page_size_everything_is_on_one_page():
+    registry = Registry(page_size=None)
+    for key in "abc":
+        registry.add(key)
+
+    assert registry.page(None) == (["a", "b", "c"], None)
+
+
+def test_invalid_pagination_configuration():
+    with pytest.raises(ValueError, match="page_size must be at least 1"):
+        Paginator(page_size=0)
+    with pytest.raises(ValueError, match="Invalid cursor: not-a-cursor"):
+        Registry(page_size=1).page("not-a-cursor")
+
+
+@pytest.mark.anyio
+async def test_client_follows_cursors_through_every_listing():
+    mcp = MCPServer(performance=PerformanceSettings(list_page_size=2))
+
+    def data() -> str:  # pragma: no cover
+        return "data"
+
+    def item(item: str) -> str:  # pragma: no cover
+        return item
+
+    for i in range(5):
+        mcp.add_tool(data, name=f"tool_{i}")
+        mcp.resource(f"data://{i}")(data)
+        mcp.resource(f"data://{i}/{{item}}")(item)
+        mcp.prompt(name=f"prompt_{i}")(data)
+
+    async with Client(mcp) as client:
+        tools: list[str] = []
+        resources: list[str] = []
+        templates: list[str] = []
+        prompts: list[str] = []
+        cursors: list[str | None] = [None, None, None, None]
+        for _ in range(3):
+            tools_result = await client.list_tools(cursor=cursors[0])
+            resources_result = await client.list_resources(cursor=cursors[1])
+            templates_result = await client.list_resource_templates(cursor=cursors[2])
+            prompts_result = await client.list_prompts(cursor=cursors[3])
+            tools += [tool.name for tool in tools_result.tools]
+            resources += [str(resource.uri) for resource in resources_result.resources]
+            templates += [template.uri_template for template in templates_result.resource_templates]
+            prompts += [prompt.name for prompt in prompts_result.prompts]
+            cursors = [
+                tools_result.next_cursor,
+                resources_result.next_cursor,
+                templates_result.next_cursor,
+                prompts_result.next_cursor,
+            ]
+
+        assert cursors == [None, None, None, None]
+        assert tools == [f"tool_{i}" for i in range(5)]
+        assert resources == [f"data://{i}" for i in range(5)]
+        assert templates == [f"data://{i}/{{item}}" for i in range(5)]
+        assert prompts == [f"prompt_{i}" for i in range(5)]
+
+
+@pytest.mark.anyio
+async def test_listing_pages_follow_changes_between_requests():
+    mcp = MCPServer(performance=PerformanceSettings(list_page_size=2))
+    for name in ("a", "b", "c"):
+        mcp.add_tool(lambda: None, name=name)
+
+    async with Client(mcp) as client:
+        first = await client.list_tools()
+        assert [tool.name for tool in first.tools] == ["a", "b"]
+        # Served again from memory, with the same cursor
+        assert (await client.list_tools()).next_cursor == first.next_cursor
+
+        mcp.remove_tool("b")
+        mcp.add_tool(lambda: None, name="d")
+        second = await client.list_tools(cursor=first.next_cursor)
+
+    assert [tool.name for tool in second.tools] == ["c", "d"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.anyio
+async def test_tool_calls_find_tools_listed_on_later_pages():
+    mcp = MCPServer(performance=PerformanceSettings(list_page_size=1))
+
+    def answer() -> str:
+        return "b"
+
+    mcp.add_tool(answer, name="a")
+    mcp.add_tool(answer, name="b")
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("b", {})
+
+    assert result.structured_content == {"result": "b"}
+    # The lowlevel server followed the cursor to cache every tool definition
+    assert set(mcp._lowlevel_server._tool_cache) == {"a", "b"}
+
+
+@pytest.mark.anyio
+async def test_invalid_cursor_is_an_invalid_params_error():
+    mcp = MCPServer(performance=PerformanceSettings(list_page_size=2))
+
+    async with Client(mcp) as client:
+        with pytest.raises(MCPError) as exc_info:
+            await client.list_tools(cursor="not-a-cursor")
+
+    assert exc_info.value.code == INVALID_PARAMS
+    assert exc_info.value.message == "Invalid cursor: not-a-cursor"
+
+
+@pytest.mark.anyio
+async def test_overridden_listings_are_asked_every_time():
+    class Rotating(MCPServer):
+        listed = 0
+
+        async def list_tools(self) -> list[Tool]:
+            self.listed += 1
+            return [Tool(name=f"tool_{self.listed}", input_schema={"type": "object"})]
+
+        async def list_resources(self) -> list[Resource]:
+            return [Resource(name="r", uri=f"data://{self.listed}")]
+
+        async def list_resource_templates(self) -> list[ResourceTemplate]:
+            return [ResourceTemplate(name="t", uri_template=f"data://{self.listed}/{{item}}")]
+
+        async def list_prompts(self) -> list[Prompt]:
+            return [Prompt(name=f"prompt_{self.listed}")]
+
+    mcp = Rotating(performance=PerformanceSettings(list_page_size=1))
+
+    async with Client(mcp) as client:
+        for listed in (1, 2):
+            assert [tool.name for tool in (await client.list_tools()).tools] == [f"tool_{listed}"]
+            assert [str(r.uri) for r in (await client.list_resources()).resources] == [f"data://{listed}"]
+            templates = (await client.list_resource_templates()).resource_templates
+            assert [t.uri_template for t in templates] == [f"data://{listed}/{{item}}"]
+            assert [prompt.name for prompt in (await client.list_prompts()).prompts] == [f"prompt_{listed}"]
@@ -0,0 +1,201 @@
+"""Tests for ranged reads of MCPServer resources and the client's chunked reader."""
+
+import array
+from pathlib import Path
+
+import pytest
+
+from mcp import Client
+from mcp.server.lowlevel import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.mcpserver import MCPServer
+from mcp.server.mcpserver.exceptions import ResourceError
+from mcp.server.mcpserver.resources import FileResource, Resource, ResourceCacheConfig
+from mcp.shared.exceptions import MCPError
+from mcp.shared.resource_ranges import RESOURCE_RANGE_META_KEY, ResourceRange, slice_content
+from mcp.types import INVALID_PARAMS
+
+pytestmark = pytest.mark.anyio
+
+
+async def read_all(client: Client, uri: str, chunk_size: int) -> list[str | bytes]:
+    return [chunk async for chunk in client.read_resource_chunks(uri, chunk_size)]
+
+
+async def test_binary_file_is_streamed_in_chunks(tmp_path: Path):
+    data = bytes(range(256)) * 10
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(data)
+    mcp = MCPServer()
+    mcp.add_resource(FileResource(uri=path.as_uri(), path=path, is_binary=True))
+
+    async with Client(mcp) as client:
+        chunks = await read_all(client, path.as_uri(), 1000)
+        result = await client.read_resource(
+            path.as_uri(), meta={RESOURCE_RANGE_META_KEY: {"offset": 2500, "length": 1000}}
+        )
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 560]
+    assert b"".join(chunk for chunk in chunks if isinstance(chunk, bytes)) == data
+    assert result.contents[0].meta == {RESOURCE_RANGE_META_KEY: {"offset": 2500, "length": 60, "total": 2560}}
+
+
+async def test_text_is_split_by_characters():
+    mcp = MCPServer()
+
+    @mcp.resource("text://menu", meta={"source": "kitchen"})
+    def menu() -> str:
+        return "crème brûlée"
+
+    async with Client(mcp) as client:
+        chunks = await read_all(client, "text://menu", 5)
+        first = await client.read_resource("text://menu", meta={RESOURCE_RANGE_META_KEY: {"offset": 0, "length": 5}})
+
+    assert chunks == ["crème", " brûl", "ée"]
+    # The resource's own meta is kept beside the range
+    assert first.contents[0].meta == {
+        "source": "kitchen",
+        RESOURCE_RANGE_META_KEY: {"offset": 0, "length": 5, "total": 12},
+    }
+
+
+async def test_cached_contents_are_sliced_without_reading_again():
+    mcp = MCPServer()
+    calls: list[str] = []
+
+    @mcp.resource("data://{name}", cache=ResourceCacheConfig())
+    def data(name: str) -> bytes:
+        calls.append(name)
+        return name.encode() * 4
+
+    async with Client(mcp) as client:
+        chunks = await read_all(client, "data://abc", 5)
+
+    assert chunks == [b"abcab", b"cabca", b"bc"]
+    assert calls == ["abc"]
+
+
+async def test_chunked_reads_read_the_content_once():
+    mcp = MCPServer()
+    calls: list[str] = []
+
+    @mcp.resource("data://big")
+    def big() -> bytes:
+        calls.append("big")
+        return bytes(range(256)) * 40
+
+    @mcp.resource("data://{name}")
+    def named(name: str) -> str:
+        calls.append(name)
+        return name * 10
+
+    async with Client(mcp) as client:
+        chunks = await read_all(client, "data://big", 1000)
+        assert b"".join(chunk for chunk in chunks if isinstance(chunk, bytes)) == bytes(range(256)) * 40
+        assert "".join(str(chunk) for chunk in await read_all(client, "data://abc", 7)) == "abc" * 10
+
+    assert calls == ["big", "abc"]
+    # Reads of the whole content are not served from what the chunked read kept
+    await mcp.read_resource("data://big")
+    assert calls == ["big", "abc", "big"]
+
+
+async def test_chunked_reads_of_text_files_read_the_file_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "notes.txt"
+    path.write_text("ünïcödé " * 100)
+    resource = FileResource(uri=path.as_uri(), path=path)
+    loads: list[Path] = []
+    load = FileResource._load  # pyright: ignore[reportPrivateUsage]
+
+    def counting_load(self: FileResource):
+        loads.append(self.path)
+        return load(self)
+
+    monkeypatch.setattr(FileResource, "_load", counting_load)
+    mcp = MCPServer()
+    mcp.add_resource(resource)
+
+    async with Client(mcp) as client:
+        assert "".join(str(chunk) for chunk in await read_all(client, path.as_uri(), 64)) == "ünïcödé " * 100
+
+    assert loads == [path]
+
+
+def test_memoryviews_are_sliced_by_bytes():
+    view = memoryview(array.array("i", [1, 2, 3]))
+    part = slice_content(view, 4, 4)
+    assert isinstance(part, memoryview)
+    assert part.tobytes() == array.array("i", [2]).tobytes()
+
+
+async def test_chunks_follow_ranges_of_unknown_total_size():
+    class Counter(Resource):
+        size: int
+
+        async def read(self) -> str:  # pragma: no cover
+            raise NotImplementedError
+
+        async def read_range(self, offset: int, length: int) -> tuple[bytes, int | None]:
+            return b"x" * max(0, min(length, self.size - offset)), None
+
+    mcp = MCPServer()
+    mcp.add_resource(Counter(uri="count://ten", size=10))
+    mcp.add_resource(Counter(uri="count://eight", size=8))
+
+    async with Client(mcp) as client:
+        assert await read_all(client, "count://ten", 4) == [b"xxxx", b"xxxx", b"xx"]
+        # The last full chunk is followed by an empty one
+        assert await read_all(client, "count://eight", 4) == [b"xxxx", b"xxxx"]
+
+
+async def test_servers_without_ranges_return_one_chunk():
+    server = Server("plain")
+
+    @server.read_resource()
+    async def read_resource(uri: str) -> list[ReadResourceContents]:
+        return [ReadResourceContents(content="the whole thing", mime_type="text/plain")]
+
+    async with Client(server) as client:
+        assert await read_all(client, "text://plain", 4) == ["the whole thing"]
+
+
+async def test_malformed_ranges_returned_by_servers():
+    server = Server("malformed")
+
+    @server.read_resource()
+    async def read_resource(uri: str) -> list[ReadResourceContents]:
+        return [ReadResourceContents(content="part", meta={RESOURCE_RANGE_META_KEY: {"offset": 0}})]
+
+    async with Client(server) as client:
+        with pytest.raises(RuntimeError, match=r"Invalid resource range: \{'offset': 0\} returned by the server"):
+            await read_all(client, "text://malformed", 4)
+
+
+async def test_invalid_ranges():
+    mcp = MCPServer()
+
+    @mcp.resource("text://hello")
+    def hello() -> str:  # pragma: no cover
+        return "hello"
+
+    async with Client(mcp) as client:
+        with pytest.raises(MCPError) as exc_info:
+            await client.read_resource("text://hello", meta={RESOURCE_RANGE_META_KEY: {"offset": -1, "length": 1}})
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            await read_all(client, "text://hello", 0)
+
+    assert exc_info.value.code == INVALID_PARAMS
+    assert exc_info.value.message == "Invalid resource range: {'offset': -1, 'length': 1}"
+
+
+async def test_ranged_read_errors():
+    mcp = MCPServer()
+
+    @mcp.resource("text://broken")
+    def broken() -> str:
+        raise RuntimeError("disk on fire")
+
+    with pytest.raises(ResourceError, match="Unknown resource: text://missing"):
+        await mcp.read_resource("text://missing", ResourceRange(offset=0, length=1))
+    with pytest.raises(ResourceError, match="Error reading resource text://broken"):
+        await mcp.read_resource("text://broken", ResourceRange(offset=0, length=1))
@@ -849,6 +849,23 @@ class TestServerResourceTemplates:
             assert isinstance(result.contents[0], TextResourceContents)
             assert result.contents[0].text == "Data for cursor/myrepo"
 
+    async def test_resource_reserved_and_query_params(self):
+        """Test that {+path} spans segments and {?query} parameters are optional"""
+        mcp = MCPServer()
+
+        @mcp.resource("files://{+path}{?encoding}")
+        def get_file(path: str, encoding: str = "utf-8") -> str:
+            return f"{path} as {encoding}"
+
+        async with Client(mcp) as client:
+            result = await client.read_resource("files://docs/guide/intro.md")
+            assert isinstance(result.contents[0], TextResourceContents)
+            assert result.contents[0].text == "docs/guide/intro.md as utf-8"
+
+            result = await client.read_resource("files://docs/intro.md?encoding=latin-1")
+            assert isinstance(result.contents[0], TextResourceContents)
+            assert result.contents[0].text == "docs/intro.md as latin-1"
+
     async def test_resource_multiple_mismatched_params(self):
         """Test that mismatched parameters raise an error"""
         mcp = MCPServer()
@@ -1,18 +1,23 @@
 import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any, TypedDict
 
 import pytest
 from pydantic import BaseModel
 
+from mcp import Client
+from mcp.server.auth.middleware.auth_context import auth_context_var
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.provider import AccessToken
 from mcp.server.context import LifespanContextT, RequestT
-from mcp.server.mcpserver import Context, MCPServer
+from mcp.server.mcpserver import Context, MCPServer, PerformanceSettings
 from mcp.server.mcpserver.exceptions import ToolError
-from mcp.server.mcpserver.tools import Tool, ToolManager
+from mcp.server.mcpserver.tools import Tool, ToolManager, ToolResultCacheConfig
 from mcp.server.mcpserver.utilities.func_metadata import ArgModelBase, FuncMetadata
 from mcp.server.session import ServerSessionT
-from mcp.types import TextContent, ToolAnnotations
+from mcp.types import CallToolResult, TextContent, ToolAnnotations
 
 
 class TestAddTools:
@@ -918,3 +923,172 @@ class TestRemoveTools:
         # Remove with correct case
         manager.remove_tool("test_func")
         assert manager.get_tool("test_func") is None
+
+
+class TestResultCache:
+    @staticmethod
+    def counting_lookup(calls: list[dict[str, Any]]):
+        def lookup(city: str, units: str = "metric") -> str:
+            calls.append({"city": city, "units": units})
+            return f"{city} in {units}"
+
+        return lookup
+
+    @pytest.mark.anyio
+    async def test_read_only_tool_result_is_served_from_cache(self):
+        calls: list[dict[str, Any]] = []
+        manager = ToolManager(result_cache=ToolResultCacheConfig())
+        manager.add_tool(self.counting_lookup(calls), annotations=ToolAnnotations(read_only_hint=True))
+
+        first = await manager.call_tool("lookup", {"city": "Paris", "units": "imperial"}, convert_result=True)
+        # Key order does not matter, the arguments are compared as canonical JSON
+        second = await manager.call_tool("lookup", {"units": "imperial", "city": "Paris"}, convert_result=True)
+
+        assert isinstance(first, CallToolResult)
+        assert second == first
+        # Each caller gets a copy it is free to modify
+        assert second is not first
+        first.content.clear()
+        assert await manager.call_tool("lookup", {"city": "Paris", "units": "imperial"}, convert_result=True) == second
+        assert calls == [{"city": "Paris", "units": "imperial"}]
+        metrics = manager.result_cache_metrics("lookup")
+        assert metrics is not None
+        assert (metrics.hits, metrics.misses) == (2, 1)
+
+        # Raw calls bypass the cache
+        assert await manager.call_tool("lookup", {"city": "Paris"}) == "Paris in metric"
+        assert len(calls) == 2
+
+    @pytest.mark.anyio
+    async def test_only_annotated_tools_use_the_default_cache(self):
+        calls: list[dict[str, Any]] = []
+        manager = ToolManager(result_cache=ToolResultCacheConfig())
+        manager.add_tool(self.counting_lookup(calls))
+        manager.add_tool(self.counting_lookup(calls), name="explicit", cache=ToolResultCacheConfig())
+
+        for _ in range(2):
+            await manager.call_tool("lookup", {"city": "Paris"}, convert_result=True)
+            await manager.call_tool("explicit", {"city": "Paris"}, convert_result=True)
+
+        assert len(calls) == 3
+        assert manager.result_cache_metrics("lookup") is None
+
+    @pytest.mark.anyio
+    async def test_least_recently_used_result_is_evicted(self):
+        calls: list[dict[str, Any]] = []
+        manager = ToolManager()
+        manager.add_tool(self.counting_lookup(calls), cache=ToolResultCacheConfig(max_size=2))
+
+        for city in ("Paris", "Rome", "Paris", "Oslo", "Paris", "Rome"):
+            await manager.call_tool("lookup", {"city": city}, convert_result=True)
+
+        # Rome was the least recently used when Oslo arrived
+        assert [call["city"] for call in calls] == ["Paris", "Rome", "Oslo", "Rome"]
+        metrics = manager.result_cache_metrics("lookup")
+        assert metrics is not None
+        assert (metrics.hits, metrics.misses, metrics.evictions) == (2, 4, 2)
+
+    @pytest.mark.anyio
+    async def test_expired_and_cleared_results_run_the_tool_again(self):
+        calls: list[dict[str, Any]] = []
+        manager = ToolManager()
+        manager.add_tool(self.counting_lookup(calls), cache=ToolResultCacheConfig(ttl=0.01))
+
+        await manager.call_tool("lookup", {"city": "Paris"}, convert_result=True)
+        time.sleep(0.02)
+        await manager.call_tool("lookup", {"city": "Paris"}, convert_result=True)
+        manager.clear_result_cache("lookup")
+        await manager.call_tool("lookup", {"city": "Paris"}, convert_result=True)
+
+        assert len(calls) == 3
+        metrics = manager.result_cache_metrics("lookup")
+        assert metrics is not None
+        assert metrics.expirations == 1
+
+    @pytest.mark.anyio
+    async def test_errors_are_not_cached(self):
+        attempts = [0]
+
+        def flaky() -> str:
+            attempts[0] += 1
+            if attempts[0] == 1:
+                raise ValueError("not yet")
+            return "ok"
+
+        manager = ToolManager()
+        manager.add_tool(flaky, cache=ToolResultCacheConfig())
+
+        with pytest.raises(ToolError):
+            await manager.call_tool("flaky", {}, convert_result=True)
+        await manager.call_tool("flaky", {}, convert_result=True)
+        await manager.call_tool("flaky", {}, convert_result=True)
+
+        assert attempts[0] == 2
+
+    @pytest.mark.anyio
+    async def test_structured_results_are_cached_per_session(self):
+        calls: list[str] = []
+        mcp = MCPServer(performance=PerformanceSettings(tool_result_cache=ToolResultCacheConfig(per_session=True)))
+
+        @mcp.tool(annotations=ToolAnnotations(idempotent_hint=True))
+        def whoami(name: str) -> dict[str, str]:
+            calls.append(name)
+            return {"name": name}
+
+        for _ in range(2):
+            async with Client(mcp) as client:
+                first = await client.call_tool("whoami", {"name": "alice"})
+                second = await client.call_tool("whoami", {"name": "alice"})
+                assert first.structured_content == second.structured_content == {"name": "alice"}
+                assert first.content == second.content
+
+        assert calls == ["alice", "alice"]
+        metrics = mcp.tool_cache_metrics("whoami")
+        assert metrics is not None
+        assert (metrics.hits, metrics.misses) == (2, 2)
+
+    @pytest.mark.anyio
+    async def test_tools_taking_a_context_are_cached_per_session_by_default(self):
+        calls: list[str] = []
+        mcp = MCPServer(performance=PerformanceSettings(tool_result_cache=ToolResultCacheConfig()))
+
+        @mcp.tool(annotations=ToolAnnotations(read_only_hint=True))
+        async def my_requests(ctx: Context[ServerSessionT, None]) -> str:
+            calls.append(ctx.request_id)
+            return "mine"
+
+        @mcp.tool(annotations=ToolAnnotations(read_only_hint=True))
+        def shared() -> str:
+            calls.append("shared")
+            return "everyone's"
+
+        for _ in range(2):
+            async with Client(mcp) as client:
+                for _ in range(2):
+                    await client.call_tool("my_requests", {})
+                    await client.call_tool("shared", {})
+
+        assert len(calls) == 3
+        assert calls.count("shared") == 1
+
+    @pytest.mark.anyio
+    async def test_results_are_not_shared_between_authenticated_clients(self):
+        calls: list[dict[str, Any]] = []
+        manager = ToolManager()
+        manager.add_tool(self.counting_lookup(calls), cache=ToolResultCacheConfig())
+
+        for token in ("alice-token", "bob-token", "alice-token"):
+            user = AuthenticatedUser(AccessToken(token=token, client_id="app", scopes=[]))
+            reset = auth_context_var.set(user)
+            try:
+                await manager.call_tool("lookup", {"city": "Paris"}, convert_result=True)
+            finally:
+                auth_context_var.reset(reset)
+
+        assert len(calls) == 2
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="ttl must be positive"):
+            ToolResultCacheConfig(ttl=0)
+        with pytest.raises(ValueError, match="max_size must be at least 1"):
+            ToolResultCacheConfig(max_size=0)
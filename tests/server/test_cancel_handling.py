@@ -8,12 +8,17 @@ import pytest
 from mcp import Client, types
 from mcp.server.lowlevel.server import Server
 from mcp.shared.exceptions import MCPError
+from mcp.shared.message import SessionMessage
 from mcp.types import (
     CallToolRequest,
     CallToolRequestParams,
     CallToolResult,
     CancelledNotification,
     CancelledNotificationParams,
+    JSONRPCError,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
     Tool,
 )
 
@@ -89,3 +94,36 @@ async def test_server_remains_functional_after_cancel():
         assert isinstance(content, types.TextContent)
         assert content.text == "Call number: 2"
         assert call_count == 2
+
+
+@pytest.mark.anyio
+async def test_request_cancelled_before_its_handler_starts():
+    """A cancellation read before the request's task runs answers the request once, without running it."""
+    server = Server("test-server")
+    client_writer, server_reader = anyio.create_memory_object_stream[SessionMessage | Exception](10)
+    server_writer, client_reader = anyio.create_memory_object_stream[SessionMessage](10)
+
+    # Queued together, so the session reads the cancellation before the first ping is handled
+    for message in (
+        JSONRPCRequest(jsonrpc="2.0", id=1, method="ping"),
+        JSONRPCNotification(jsonrpc="2.0", method="notifications/cancelled", params={"requestId": 1}),
+        JSONRPCRequest(jsonrpc="2.0", id=2, method="ping"),
+    ):
+        client_writer.send_nowait(SessionMessage(message))
+
+    responses: list[JSONRPCResponse | JSONRPCError] = []
+    async with anyio.create_task_group() as tg, client_writer, client_reader:
+        tg.start_soon(
+            lambda: server.run(server_reader, server_writer, server.create_initialization_options(), stateless=True)
+        )
+        with anyio.fail_after(5):
+            while len(responses) < 2:
+                response = (await client_reader.receive()).message
+                assert isinstance(response, JSONRPCResponse | JSONRPCError)
+                responses.append(response)
+        tg.cancel_scope.cancel()
+
+    assert isinstance(responses[0], JSONRPCError)
+    assert (responses[0].id, responses[0].error.message) == (1, "Request cancelled")
+    assert isinstance(responses[1], JSONRPCResponse)
+    assert responses[1].id == 2
@@ -12,6 +12,7 @@ from mcp.server import Server
 from mcp.server.lowlevel import NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
+from mcp.shared import schema_validation
 from mcp.shared.message import SessionMessage
 from mcp.shared.session import RequestResponder
 from mcp.types import CallToolResult, ClientResult, ServerNotification, ServerRequest, TextContent, Tool
@@ -309,3 +310,41 @@ async def test_tool_not_in_list_logs_warning(caplog: pytest.LogCaptureFixture):
     assert any(
         "Tool 'unknown_tool' not listed, no validation will be performed" in record.message for record in caplog.records
     )
+
+
+@pytest.mark.anyio
+async def test_validators_compiled_once_per_tool_definition(monkeypatch: pytest.MonkeyPatch):
+    """Test that input validators are reused across calls and rebuilt when list_tools changes the tool."""
+    compiled: list[dict[str, Any]] = []
+    compile_schema = schema_validation.compile_schema
+
+    def counting_compile_schema(schema: dict[str, Any]):
+        compiled.append(schema)
+        return compile_schema(schema)
+
+    monkeypatch.setattr(schema_validation, "compile_schema", counting_compile_schema)
+    tools = [create_add_tool()]
+
+    async def call_tool_handler(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=f"Result: {arguments['a'] + arguments['b']}")]
+
+    async def test_callback(client_session: ClientSession) -> CallToolResult:
+        for _ in range(3):
+            result = await client_session.call_tool("add", {"a": 1, "b": 2})
+            assert not result.is_error
+        assert len(compiled) == 1
+
+        # Redefine the tool with a stricter schema; the refresh must drop the old validator
+        stricter = create_add_tool()
+        stricter.input_schema["properties"]["b"]["maximum"] = 1
+        tools[0] = stricter
+        await client_session.list_tools()
+        return await client_session.call_tool("add", {"a": 1, "b": 2})
+
+    result = await run_tool_test(tools, call_tool_handler, test_callback)
+
+    assert result is not None
+    assert result.is_error
+    assert isinstance(result.content[0], TextContent)
+    assert "Input validation error: 2 is greater than the maximum of 1" in result.content[0].text
+    assert len(compiled) == 2
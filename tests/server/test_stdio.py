@@ -1,11 +1,20 @@
 import io
+import sys
 
 import anyio
 import pytest
 
 from mcp.server.stdio import stdio_server
-from mcp.shared.message import SessionMessage
-from mcp.types import JSONRPCMessage, JSONRPCRequest, JSONRPCResponse, jsonrpc_message_adapter
+from mcp.shared.codec import DEFAULT_CODEC
+from mcp.shared.message import EncodedSessionMessage, SessionMessage
+from mcp.types import (
+    CallToolResult,
+    JSONRPCMessage,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    TextContent,
+    jsonrpc_message_adapter,
+)
 
 
 @pytest.mark.anyio
@@ -59,3 +68,16 @@ async def test_stdio_server():
     assert len(received_responses) == 2
     assert received_responses[0] == JSONRPCRequest(jsonrpc="2.0", id=3, method="ping")
     assert received_responses[1] == JSONRPCResponse(jsonrpc="2.0", id=4, result={})
+
+
+@pytest.mark.anyio
+async def test_stdio_server_writes_encoded_messages_to_stdout_as_they_are(monkeypatch: pytest.MonkeyPatch):
+    stdout = io.BytesIO()
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(stdout, encoding="utf-8"))
+    result = CallToolResult(content=[TextContent(type="text", text="café")])
+
+    async with stdio_server(stdin=anyio.AsyncFile(io.StringIO())) as (read_stream, write_stream):
+        async with read_stream, write_stream:
+            await write_stream.send(EncodedSessionMessage(request_id=7, result=result))
+
+    assert stdout.getvalue() == DEFAULT_CODEC.encode_response(7, result) + b"\n"
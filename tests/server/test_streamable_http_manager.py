@@ -5,14 +5,16 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import anyio
+import httpx
 import pytest
 from starlette.types import Message
 
-from mcp.server import streamable_http_manager
+from mcp.server import streamable_http, streamable_http_manager
 from mcp.server.lowlevel import Server
-from mcp.server.streamable_http import MCP_SESSION_ID_HEADER, StreamableHTTPServerTransport
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER, EventMessage, StreamableHTTPServerTransport
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
-from mcp.types import INVALID_REQUEST
+from mcp.shared.message import SessionMessage
+from mcp.types import INTERNAL_ERROR, INVALID_REQUEST
 
 
 @pytest.mark.anyio
@@ -313,3 +315,84 @@ async def test_unknown_session_id_returns_404():
         assert error_data["id"] == "server-error"
         assert error_data["error"]["code"] == INVALID_REQUEST
         assert error_data["error"]["message"] == "Session not found"
+
+
+async def post_batch(manager: StreamableHTTPSessionManager, batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """POST a batch to a stateless manager and return the messages of the SSE events it answers with."""
+    transport = httpx.ASGITransport(app=manager.handle_request)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.post(
+            "/mcp",
+            json=batch,
+            headers={"Accept": "application/json, text/event-stream", "Content-Type": "application/json"},
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return [
+        json.loads(line.removeprefix("data: "))
+        for event in response.text.split("\r\n\r\n")
+        for line in event.split("\r\n")
+        if line.startswith("data: ")
+    ]
+
+
+BATCH: list[dict[str, Any]] = [
+    {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": "two", "method": "ping"},
+]
+
+
+@pytest.mark.anyio
+async def test_batch_answered_on_one_sse_stream():
+    manager = StreamableHTTPSessionManager(app=Server("test-batch"), stateless=True)
+
+    async with manager.run():
+        messages = await post_batch(manager, BATCH)
+
+    assert sorted(messages, key=lambda message: str(message["id"])) == [
+        {"jsonrpc": "2.0", "id": 1, "result": {}},
+        {"jsonrpc": "2.0", "id": "two", "result": {}},
+    ]
+
+
+@pytest.mark.anyio
+async def test_batch_requests_get_errors_when_their_events_cannot_be_sent(monkeypatch: pytest.MonkeyPatch):
+    create_event_data = StreamableHTTPServerTransport._create_event_data
+    failures = [RuntimeError("cannot encode")]
+
+    def fail_once(self: StreamableHTTPServerTransport, event_message: EventMessage) -> dict[str, str]:
+        if failures:
+            raise failures.pop()
+        return create_event_data(self, event_message)
+
+    monkeypatch.setattr(StreamableHTTPServerTransport, "_create_event_data", fail_once)
+    manager = StreamableHTTPSessionManager(app=Server("test-batch"), stateless=True)
+
+    async with manager.run():
+        messages = await post_batch(manager, BATCH)
+
+    # Only the request whose response could not be sent is answered with an error
+    failed, answered = sorted(messages, key=lambda message: "result" in message)
+    assert failed["error"] == {"code": INTERNAL_ERROR, "message": "Error processing request: cannot encode"}
+    assert answered["result"] == {}
+    assert {failed["id"], answered["id"]} == {1, "two"}
+
+
+@pytest.mark.anyio
+async def test_batch_requests_get_errors_when_the_server_stops_taking_messages(monkeypatch: pytest.MonkeyPatch):
+    class Refused(SessionMessage):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            raise anyio.BrokenResourceError
+
+    monkeypatch.setattr(streamable_http, "SessionMessage", Refused)
+    manager = StreamableHTTPSessionManager(app=Server("test-batch"), stateless=True)
+
+    async with manager.run():
+        messages = await post_batch(manager, BATCH)
+
+    error = {"code": INTERNAL_ERROR, "message": "Error processing request: No response received"}
+    assert sorted(messages, key=lambda message: str(message["id"])) == [
+        {"jsonrpc": "2.0", "id": 1, "error": error},
+        {"jsonrpc": "2.0", "id": "two", "error": error},
+    ]
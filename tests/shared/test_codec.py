@@ -0,0 +1,142 @@
+import io
+
+import anyio
+import pytest
+
+from mcp.server.stdio import stdio_server
+from mcp.shared.codec import DEFAULT_CODEC, Codec, JSONCodec, is_batch
+from mcp.shared.message import EncodedResult, EncodedSessionMessage, SessionMessage
+from mcp.types import (
+    CallToolResult,
+    EmptyResult,
+    JSONRPCMessage,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    TextContent,
+)
+
+
+def test_json_codec_round_trip():
+    codec = JSONCodec()
+    message = JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call", params={"name": "echo", "arguments": None})
+
+    encoded = codec.encode(message)
+
+    assert encoded == message.model_dump_json(by_alias=True, exclude_none=True).encode()
+    assert codec.decode(encoded) == message
+    assert codec.decode(encoded.decode()) == message
+
+
+@pytest.mark.parametrize("data", ["not json", '{"foo": "bar"}'])
+def test_json_codec_rejects_invalid_input_with_value_error(data: str):
+    with pytest.raises(ValueError):
+        DEFAULT_CODEC.decode(data)
+
+
+class PlainCodec(Codec):
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        return DEFAULT_CODEC.encode(message)
+
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        return DEFAULT_CODEC.decode(data)
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), PlainCodec()], ids=["json", "base"])
+def test_responses_are_encoded_straight_from_the_result(codec: Codec):
+    result = CallToolResult(content=[TextContent(type="text", text="hi")])
+    expected = JSONRPCResponse(jsonrpc="2.0", id=1, result=result.model_dump(by_alias=True, exclude_none=True))
+
+    for payload in (result, EncodedResult(result)):
+        encoded = codec.encode_session_message(EncodedSessionMessage(request_id=1, result=payload))
+        assert encoded == codec.encode(expected)
+    notification = JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized")
+    assert codec.encode_session_message(SessionMessage(notification)) == codec.encode(notification)
+
+
+def test_encoded_messages_are_not_decoded_to_be_logged():
+    message = EncodedSessionMessage(request_id=1, result=EncodedResult(EmptyResult()))
+
+    assert (
+        repr(message)
+        == "EncodedSessionMessage(request_id=1, result=EncodedResult(EmptyResult(meta=None)), metadata=None)"
+    )
+    assert message._message is None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), PlainCodec()], ids=["json", "base"])
+def test_batch_round_trip(codec: Codec):
+    request = JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")
+    notification = JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized")
+    pre_encoded = b'{"jsonrpc":"2.0","id":2,"result":{}}'
+
+    encoded = codec.encode_batch([request, notification, pre_encoded])
+
+    assert is_batch(encoded)
+    assert is_batch(" \n" + encoded.decode())
+    assert not is_batch(codec.encode(request))
+    assert codec.decode_batch(encoded) == [request, notification, JSONRPCResponse(jsonrpc="2.0", id=2, result={})]
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), PlainCodec()], ids=["json", "base"])
+@pytest.mark.parametrize("data", ["[", "[]", '{"jsonrpc": "2.0", "method": "ping", "id": 1}', '[{"foo": "bar"}]'])
+def test_decode_batch_rejects_invalid_input_with_value_error(codec: Codec, data: str):
+    with pytest.raises(ValueError):
+        codec.decode_batch(data)
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self) -> None:
+        self.encoded: list[JSONRPCMessage] = []
+        self.decoded: list[bytes | str] = []
+
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        self.encoded.append(message)
+        return super().encode(message)
+
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        self.decoded.append(data)
+        return super().decode(data)
+
+
+@pytest.mark.anyio
+async def test_transport_uses_given_codec():
+    codec = RecordingCodec()
+    assert isinstance(codec, Codec)
+    request = JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")
+    stdin = io.StringIO(request.model_dump_json(by_alias=True, exclude_none=True) + "\n")
+    stdout = io.StringIO()
+    response = JSONRPCResponse(jsonrpc="2.0", id=1, result={})
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout), codec=codec) as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream, write_stream:
+            received = await read_stream.receive()
+            assert isinstance(received, SessionMessage)
+            assert received.message == request
+            await write_stream.send(SessionMessage(response))
+
+    assert len(codec.decoded) == 1
+    assert codec.encoded == [response]
+    assert stdout.getvalue() == response.model_dump_json(by_alias=True, exclude_none=True) + "\n"
+
+
+@pytest.mark.anyio
+async def test_responses_are_encoded_by_the_transport_codec():
+    """A codec subclassing `JSONCodec` to change `encode` sees responses too."""
+    codec = RecordingCodec()
+    stdout = io.StringIO()
+
+    async with stdio_server(stdin=anyio.AsyncFile(io.StringIO()), stdout=anyio.AsyncFile(stdout), codec=codec) as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream, write_stream:
+            result = EncodedResult(CallToolResult(content=[]))
+            await write_stream.send(EncodedSessionMessage(request_id=1, result=result))
+
+    response = JSONRPCResponse(jsonrpc="2.0", id=1, result={"content": [], "isError": False})
+    assert codec.encoded == [response]
+    assert stdout.getvalue() == response.model_dump_json(by_alias=True, exclude_none=True) + "\n"
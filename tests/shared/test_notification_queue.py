@@ -0,0 +1,146 @@
+"""Tests for the per-session notification queue."""
+
+import anyio
+import pytest
+
+from mcp.shared.notification_queue import NotificationQueue
+
+
+def recorder(handled: list[str], name: str):
+    async def handler() -> None:
+        handled.append(name)
+
+    return handler
+
+
+@pytest.mark.anyio
+async def test_handlers_run_in_order():
+    queue = NotificationQueue(max_queued=10)
+    handled: list[str] = []
+
+    for name in ("a", "b", "c"):
+        await queue.put(recorder(handled, name))
+    assert queue.metrics.queued == 3
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(queue.run)
+        with anyio.fail_after(1):
+            await queue.wait_until_handled(queue.last_position)
+        tg.cancel_scope.cancel()
+
+    assert handled == ["a", "b", "c"]
+    assert (queue.metrics.queued, queue.metrics.max_queued, queue.metrics.dispatched) == (0, 3, 3)
+
+
+@pytest.mark.anyio
+async def test_failing_handler_does_not_stop_the_queue():
+    queue = NotificationQueue(max_queued=10)
+    handled: list[str] = []
+
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    await queue.put(fail)
+    await queue.put(recorder(handled, "after"))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(queue.run)
+        with anyio.fail_after(1):
+            await queue.wait_until_handled(queue.last_position)
+        tg.cancel_scope.cancel()
+
+    assert handled == ["after"]
+
+
+@pytest.mark.anyio
+async def test_full_queue_blocks_put():
+    queue = NotificationQueue(max_queued=1)
+    handled: list[str] = []
+    await queue.put(recorder(handled, "first"))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(queue.put, recorder(handled, "second"))
+        await anyio.wait_all_tasks_blocked()
+        assert queue.metrics.blocked == 1
+        assert queue.last_position == 1
+
+        tg.start_soon(queue.run)
+        await anyio.wait_all_tasks_blocked()
+        with anyio.fail_after(1):
+            await queue.wait_until_handled(2)
+        tg.cancel_scope.cancel()
+
+    assert handled == ["first", "second"]
+
+
+@pytest.mark.anyio
+async def test_drop_oldest_progress_replaces_progress_for_the_same_token():
+    queue = NotificationQueue(max_queued=3, overflow="drop_oldest_progress")
+    handled: list[str] = []
+
+    await queue.put(recorder(handled, "progress-1 of a"), progress_token="a")
+    await queue.put(recorder(handled, "log"))
+    await queue.put(recorder(handled, "progress-1 of b"), progress_token="b")
+    await queue.put(recorder(handled, "progress-2 of a"), progress_token="a")
+
+    assert queue.metrics.dropped == 1
+    assert queue.metrics.blocked == 0
+
+    # Nothing queued shares this token, so the put has to wait
+    with anyio.move_on_after(0.01):
+        await queue.put(recorder(handled, "progress-1 of c"), progress_token="c")
+    assert queue.metrics.blocked == 1
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(queue.run)
+        with anyio.fail_after(1):
+            await queue.wait_until_handled(queue.last_position)
+        tg.cancel_scope.cancel()
+
+    assert handled == ["log", "progress-1 of b", "progress-2 of a"]
+
+
+@pytest.mark.anyio
+async def test_progress_position_reports_pending_progress_for_a_token():
+    queue = NotificationQueue(max_queued=10)
+    handled: list[str] = []
+
+    await queue.put(recorder(handled, "progress of 1"), progress_token=1)
+    await queue.put(recorder(handled, "log"))
+
+    assert queue.progress_position(1) == 1
+    assert queue.progress_position(2) == 0
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(queue.run)
+        with anyio.fail_after(1):
+            await queue.wait_until_handled(queue.progress_position(1))
+        assert handled[0] == "progress of 1"
+        tg.cancel_scope.cancel()
+
+    assert queue.progress_position(1) == 0
+
+
+@pytest.mark.anyio
+async def test_wait_until_handled_inside_a_handler_returns():
+    queue = NotificationQueue(max_queued=10)
+    handled: list[str] = []
+
+    async def waits_on_itself() -> None:
+        await queue.wait_until_handled(queue.last_position)
+        handled.append("done")
+
+    await queue.put(waits_on_itself)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(queue.run)
+        with anyio.fail_after(1):
+            await queue.wait_until_handled(queue.last_position)
+        tg.cancel_scope.cancel()
+
+    assert handled == ["done"]
+
+
+def test_invalid_max_queued():
+    with pytest.raises(ValueError, match="max_queued_notifications must be at least 1"):
+        NotificationQueue(max_queued=0)
@@ -0,0 +1,54 @@
+from typing import Any
+
+import jsonschema
+import pytest
+
+from mcp.shared.schema_validation import ToolValidators, compile_schema, validate
+from mcp.types import Tool
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "options": {"anyOf": [{"type": "null"}, {"type": "object", "properties": {"depth": {"type": "integer"}}}]},
+    },
+    "required": ["name"],
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {},
+        {"name": ""},
+        {"name": "x", "tags": ["a", 1]},
+        {"name": "x", "options": {"depth": "deep"}},
+    ],
+)
+def test_validate_reports_the_same_error_as_jsonschema(instance: dict[str, Any]):
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance, SCHEMA)
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        validate(compile_schema(SCHEMA), instance)
+
+    assert actual.value.message == expected.value.message
+    assert actual.value.path == expected.value.path
+
+
+def test_valid_instance_passes():
+    validate(compile_schema(SCHEMA), {"name": "x", "tags": ["a"], "options": None})
+
+
+def test_invalid_schema_is_rejected():
+    with pytest.raises(jsonschema.SchemaError):
+        compile_schema({"type": "not-a-type"})
+
+
+def test_tool_validators_check_input_and_output():
+    tool = Tool(name="t", input_schema=SCHEMA, output_schema={"type": "object", "required": ["result"]})
+    validators = ToolValidators(tool)
+
+    validators.validate_input({"name": "x"})
+    with pytest.raises(jsonschema.ValidationError, match="'result' is a required property"):
+        validators.validate_output({})
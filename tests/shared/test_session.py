@@ -6,9 +6,11 @@ import pytest
 from mcp import Client, types
 from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import Server
+from mcp.shared.codec import DEFAULT_CODEC
 from mcp.shared.exceptions import MCPError
 from mcp.shared.memory import create_client_server_memory_streams
-from mcp.shared.message import SessionMessage
+from mcp.shared.message import EncodedSessionMessage, SessionMessage
+from mcp.shared.session import RequestResponder
 from mcp.types import (
     CancelledNotification,
     CancelledNotificationParams,
@@ -304,3 +306,151 @@ async def test_connection_closed():
                 await ev_closed.wait()
             with anyio.fail_after(1):  # pragma: no branch
                 await ev_response.wait()
+
+
+@pytest.mark.anyio
+async def test_incoming_messages_validated_from_envelope_params():
+    """Requests and notifications are validated straight from the envelope's decoded params,
+    with and without params present."""
+    logged: list[types.LoggingMessageNotificationParams] = []
+    ev_logged = anyio.Event()
+
+    async def logging_callback(params: types.LoggingMessageNotificationParams) -> None:
+        logged.append(params)
+        ev_logged.set()
+
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async with ClientSession(read_stream=client_read, write_stream=client_write, logging_callback=logging_callback):
+            notification = types.JSONRPCNotification(
+                jsonrpc="2.0",
+                method="notifications/message",
+                params={"level": "info", "logger": None, "data": {"nested": None}},
+            )
+            await server_write.send(SessionMessage(message=notification))
+            await server_write.send(SessionMessage(message=JSONRPCRequest(jsonrpc="2.0", id="srv-1", method="ping")))
+
+            with anyio.fail_after(2):
+                response = await server_read.receive()
+                await ev_logged.wait()
+
+    assert isinstance(response, SessionMessage)
+    assert isinstance(response.message, JSONRPCResponse)
+    assert response.message.id == "srv-1"
+    assert response.message.result == {}
+    assert logged == [types.LoggingMessageNotificationParams(level="info", data={"nested": None})]
+
+
+@pytest.mark.anyio
+async def test_responses_are_encoded_once_from_the_result_model():
+    """Successful responses carry the result model for the codec; the response model is built only on access."""
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async with ClientSession(read_stream=client_read, write_stream=client_write):
+            await server_write.send(SessionMessage(message=JSONRPCRequest(jsonrpc="2.0", id=5, method="ping")))
+            with anyio.fail_after(2):
+                response = await server_read.receive()
+
+    assert isinstance(response, EncodedSessionMessage)
+    assert response.request_id == 5
+    assert DEFAULT_CODEC.encode_session_message(response) == b'{"jsonrpc":"2.0","id":5,"result":{}}'
+    assert response.message == JSONRPCResponse(jsonrpc="2.0", id=5, result={})
+
+
+@pytest.mark.anyio
+async def test_out_of_order_responses_reach_their_requests():
+    """Each response resolves the request with its ID, and resolved requests leave the pending table."""
+    results: dict[int, str] = {}
+
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async def mock_server():
+            requests: list[JSONRPCRequest] = []
+            for _ in range(3):
+                message = await server_read.receive()
+                assert isinstance(message, SessionMessage)
+                assert isinstance(message.message, JSONRPCRequest)
+                requests.append(message.message)
+            for request in reversed(requests):
+                tool = {"name": f"tool-{request.id}", "inputSchema": {"type": "object"}}
+                response = JSONRPCResponse(jsonrpc="2.0", id=request.id, result={"tools": [tool]})
+                await server_write.send(SessionMessage(message=response))
+
+        async def make_request(client_session: ClientSession, i: int):
+            result = await client_session.send_request(types.ListToolsRequest(), types.ListToolsResult)
+            results[i] = result.tools[0].name
+
+        async with ClientSession(read_stream=client_read, write_stream=client_write) as client_session:
+            with anyio.fail_after(2):  # pragma: no branch
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(mock_server)
+                    for i in range(3):
+                        tg.start_soon(make_request, client_session, i)
+                        await anyio.wait_all_tasks_blocked()
+
+            assert client_session._pending_responses == {}
+
+    # Requests are numbered in the order they were sent, so each caller gets the tool named after its own ID.
+    assert results == {0: "tool-0", 1: "tool-1", 2: "tool-2"}
+
+
+@pytest.mark.anyio
+async def test_message_handler_sees_messages_in_order_behind_slow_callbacks():
+    """Errors reach the message handler after the notifications received before them."""
+    release = anyio.Event()
+    seen: list[str] = []
+
+    async def logging_callback(params: types.LoggingMessageNotificationParams) -> None:
+        await release.wait()
+
+    async def message_handler(
+        message: RequestResponder[types.ServerRequest, types.ClientResult] | types.ServerNotification | Exception,
+    ) -> None:
+        seen.append(str(message.params.data) if isinstance(message, types.LoggingMessageNotification) else "error")
+
+    def log(data: str) -> SessionMessage:
+        notification = types.LoggingMessageNotification(
+            params=types.LoggingMessageNotificationParams(level="info", data=data)
+        )
+        return SessionMessage(
+            message=types.JSONRPCNotification(
+                jsonrpc="2.0", **notification.model_dump(by_alias=True, exclude_none=True)
+            )
+        )
+
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async def mock_server():
+            ping = await server_read.receive()
+            assert isinstance(ping, SessionMessage) and isinstance(ping.message, JSONRPCRequest)
+            await server_write.send(log("first"))
+            await server_write.send(SessionMessage(message=JSONRPCResponse(jsonrpc="2.0", id=999, result={})))
+            await server_write.send(log("second"))
+            await server_write.send(
+                SessionMessage(message=JSONRPCResponse(jsonrpc="2.0", id=ping.message.id, result={}))
+            )
+
+        async with (
+            anyio.create_task_group() as tg,
+            ClientSession(
+                client_read, client_write, logging_callback=logging_callback, message_handler=message_handler
+            ) as session,
+        ):
+            tg.start_soon(mock_server)
+            with anyio.fail_after(5):
+                # The ping is answered once the receive loop has read everything sent before it
+                await session.send_ping()
+                assert seen == []
+                release.set()
+                while len(seen) < 3:
+                    await anyio.sleep(0.01)
+
+    assert seen == ["first", "error", "second"]
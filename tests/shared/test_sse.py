@@ -23,7 +23,7 @@ from mcp import types
 from mcp.client.session import ClientSession
 from mcp.client.sse import _extract_session_id_from_endpoint, sse_client
 from mcp.server import Server
-from mcp.server.sse import SseServerTransport
+from mcp.server.sse import SseServerTransport, _message_event
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.shared.exceptions import MCPError
 from mcp.types import (
@@ -222,6 +222,12 @@ def test_extract_session_id_from_endpoint(endpoint_url: str, expected: str | Non
     assert _extract_session_id_from_endpoint(endpoint_url) == expected
 
 
+def test_message_events_carry_encoded_messages_as_they_are() -> None:
+    assert _message_event(b'{"id":1}') == b'event: message\r\ndata: {"id":1}\r\n\r\n'
+    # A message spread over several lines is left to sse-starlette to split into data fields
+    assert _message_event(b'{\n"id":1}') == {"event": "message", "data": '{\n"id":1}'}
+
+
 @pytest.mark.anyio
 async def test_sse_client_on_session_created_not_called_when_no_session_id(
     server: None, server_url: str, monkeypatch: pytest.MonkeyPatch
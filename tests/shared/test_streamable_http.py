@@ -2239,3 +2239,115 @@ async def test_streamable_http_client_preserves_custom_with_mcp_headers(
 
                 assert "content-type" in headers_data
                 assert headers_data["content-type"] == "application/json"
+
+
+def test_json_response_batch(json_response_server: None, json_server_url: str):
+    """Test that a JSON-RPC batch is answered with one JSON array in request order."""
+    mcp_url = f"{json_server_url}/mcp"
+    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    assert response.status_code == 200
+    headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+
+    batch: list[dict[str, Any]] = [
+        {"jsonrpc": "2.0", "method": "tools/call", "id": "call-1", "params": {"name": "test_tool", "arguments": {}}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "method": "tools/list", "id": "list-1"},
+    ]
+    response = requests.post(mcp_url, headers=headers, json=batch)
+    assert response.status_code == 200
+    assert response.headers.get("Content-Type") == "application/json"
+
+    call_response, list_response = response.json()
+    assert call_response["id"] == "call-1"
+    assert call_response["result"]["content"][0]["text"] == "Called test_tool"
+    assert list_response["id"] == "list-1"
+    assert len(list_response["result"]["tools"]) == 10
+
+
+def test_batch_validation(basic_server: None, basic_server_url: str):
+    """Test that batches carrying initialize or duplicate request IDs are rejected."""
+    mcp_url = f"{basic_server_url}/mcp"
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+    response = requests.post(mcp_url, headers=headers, json=[INIT_REQUEST])
+    assert response.status_code == 400
+    assert "initialize must not be part of a batch" in response.text
+
+    response = requests.post(mcp_url, headers=headers, json=[])
+    assert response.status_code == 400
+    assert "must be a non-empty array" in response.text
+
+    response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+    duplicate = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
+    response = requests.post(mcp_url, headers=headers, json=[duplicate, duplicate])
+    assert response.status_code == 400
+    assert "request IDs in a batch must be unique" in response.text
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("server_fixture", ["basic_server", "json_response_server"])
+async def test_streamable_http_client_batches_concurrent_requests(
+    server_fixture: str, request: pytest.FixtureRequest, basic_server_port: int, json_server_port: int
+):
+    """Test that the client coalesces concurrent requests into batch POSTs when batching is enabled."""
+    request.getfixturevalue(server_fixture)
+    port = basic_server_port if server_fixture == "basic_server" else json_server_port
+    posted_batches: list[int] = []
+
+    async def record_batch(http_request: httpx.Request) -> None:
+        content = await http_request.aread()
+        if http_request.method == "POST" and content.startswith(b"["):
+            posted_batches.append(len(json.loads(content)))
+
+    results: dict[int, types.CallToolResult] = {}
+    async with httpx.AsyncClient(follow_redirects=True, event_hooks={"request": [record_batch]}) as client:
+        async with streamable_http_client(f"http://127.0.0.1:{port}/mcp", http_client=client, batch_window=0.05) as (
+            read_stream,
+            write_stream,
+        ):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+
+                async def call(i: int) -> None:
+                    results[i] = await session.call_tool("test_tool", {})
+
+                async with anyio.create_task_group() as tg:
+                    for i in range(5):
+                        tg.start_soon(call, i)
+
+    assert sorted(results) == list(range(5))
+    assert all(result.content[0] == TextContent(type="text", text="Called test_tool") for result in results.values())
+    # The concurrent tools/call requests go out as one batch; the tools/list refreshes they trigger
+    # follow as their responses arrive, so how those are grouped depends on timing
+    assert posted_batches[0] == 5
+
+
+@pytest.mark.anyio
+async def test_streamable_http_client_limits_batch_size(basic_server: None, basic_server_port: int):
+    """Test that no batch POST carries more than `max_batch_size` messages."""
+    posted_batches: list[int] = []
+
+    async def record_batch(http_request: httpx.Request) -> None:
+        content = await http_request.aread()
+        if http_request.method == "POST" and content.startswith(b"["):
+            posted_batches.append(len(json.loads(content)))
+
+    url = f"http://127.0.0.1:{basic_server_port}/mcp"
+    async with httpx.AsyncClient(follow_redirects=True, event_hooks={"request": [record_batch]}) as client:
+        async with streamable_http_client(url, http_client=client, batch_window=0.05, max_batch_size=2) as (
+            read_stream,
+            write_stream,
+        ):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                async with anyio.create_task_group() as tg:
+                    for _ in range(5):
+                        tg.start_soon(session.send_ping)
+
+    assert posted_batches
+    assert max(posted_batches) == 2
+
+    with pytest.raises(ValueError, match="max_batch_size must be at least 1"):
+        StreamableHTTPTransport(url, max_batch_size=0)
@@ -0,0 +1,65 @@
+"""Import-time regression tests.
+
+Each test imports a module in a fresh interpreter with `python -X importtime` and
+checks which modules it pulled in, so a stray top-level import of a heavy
+dependency fails here instead of slowing down every stdio server spawn.
+"""
+
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+import mcp
+import mcp.client
+import mcp.server
+
+HTTP_STACK = ("starlette", "sse_starlette", "uvicorn", "httpx", "jsonschema", "mcp.server.auth.provider")
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Run `statement` in a fresh interpreter and return the modules `-X importtime` reports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+def test_import_mcp_is_lazy():
+    modules = imported_modules("import mcp")
+
+    assert "mcp" in modules
+    assert not {"mcp.types", "mcp.client.client", "mcp.server.lowlevel", "pydantic"} & modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from mcp.server.stdio import stdio_server",
+        "from mcp.server.lowlevel import Server",
+        "from mcp.server.mcpserver import MCPServer",
+        "from mcp.client.stdio import stdio_client",
+        "from mcp import ClientSession, StdioServerParameters",
+    ],
+)
+def test_stdio_imports_skip_http_stack(statement: str):
+    modules = imported_modules(statement)
+
+    assert not [name for name in HTTP_STACK if name in modules]
+
+
+@pytest.mark.parametrize("module", [mcp, mcp.client, mcp.server])
+def test_lazy_exports_resolve(module: ModuleType):
+    names: list[str] = module.__all__
+    for name in names:
+        assert getattr(module, name) is not None
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        mcp.missing  # type: ignore[attr-defined]  # noqa: B018
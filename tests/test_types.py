@@ -1,9 +1,11 @@
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from mcp.types import (
     LATEST_PROTOCOL_VERSION,
+    CallToolRequest,
     ClientCapabilities,
     CreateMessageRequestParams,
     CreateMessageResult,
@@ -12,7 +14,9 @@ from mcp.types import (
     InitializeRequest,
     InitializeRequestParams,
     JSONRPCRequest,
+    ListRootsRequest,
     ListToolsResult,
+    ProgressNotification,
     SamplingCapability,
     SamplingMessage,
     TextContent,
@@ -20,8 +24,10 @@ from mcp.types import (
     ToolChoice,
     ToolResultContent,
     ToolUseContent,
+    client_notification_adapter,
     client_request_adapter,
     jsonrpc_message_adapter,
+    server_request_adapter,
 )
 
 
@@ -49,6 +55,19 @@ async def test_jsonrpc_request():
     assert request.params["protocolVersion"] == LATEST_PROTOCOL_VERSION
 
 
+def test_request_and_notification_adapters_dispatch_on_method():
+    call = client_request_adapter.validate_python({"method": "tools/call", "params": {"name": "echo"}})
+    assert isinstance(call, CallToolRequest)
+    assert isinstance(server_request_adapter.validate_python({"method": "roots/list"}), ListRootsRequest)
+    progress = client_notification_adapter.validate_python(
+        {"method": "notifications/progress", "params": {"progressToken": 1, "progress": 0.5}}
+    )
+    assert isinstance(progress, ProgressNotification)
+
+    with pytest.raises(ValidationError, match="union_tag_invalid"):
+        client_request_adapter.validate_python({"method": "roots/list"})
+
+
 @pytest.mark.anyio
 async def test_method_initialization():
     """Test that the method is automatically set on object creation.